@@ -0,0 +1,363 @@
+"""
+Shared message fixtures for the benchmark scripts.
+
+The messages are modelled after real-world Gy, Ro and S6a traffic and are built
+using the public python API, so that they exercise the same code paths as
+the test suite.
+"""
+from __future__ import annotations
+
+import datetime
+import gc
+import statistics
+import timeit
+import tracemalloc
+
+from typing import Callable
+
+from diameter.message import constants
+from diameter.message.avp import Avp
+from diameter.message.avp.generator import generate_avps_from_defs
+from diameter.message.avp.grouped import *
+from diameter.message.commands import (AccountingRequest,
+                                       CreditControlAnswer,
+                                       CreditControlRequest,
+                                       UpdateLocationAnswer)
+from diameter.message.constants import *
+
+
+def build_ccr() -> CreditControlRequest:
+    """A CCR-U with two MSCCs and a PS-Information tree."""
+    ccr = CreditControlRequest()
+    ccr.header.hop_by_hop_identifier = 10001
+    ccr.header.end_to_end_identifier = 20001
+    ccr.session_id = "sctp-saegwc-poz01.lte.orange.pl;221424325;287370797;65574b0c-2d02"
+    ccr.origin_host = b"dra2.gy.mno.net"
+    ccr.origin_realm = b"mno.net"
+    ccr.destination_realm = b"mvno.net"
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = 952
+    ccr.destination_host = b"dra3.mvno.net"
+    ccr.user_name = "485079163847@mno.net"
+    ccr.event_timestamp = datetime.datetime(2023, 11, 17, 14, 6, 1)
+    ccr.add_subscription_id(
+        constants.E_SUBSCRIPTION_ID_TYPE_END_USER_E164, "485089163847")
+    ccr.add_subscription_id(
+        constants.E_SUBSCRIPTION_ID_TYPE_END_USER_IMSI, "260036619905065")
+    for rating_group in (8000, 9000):
+        ccr.add_multiple_services_credit_control(
+            requested_service_unit=RequestedServiceUnit(cc_total_octets=0),
+            used_service_unit=UsedServiceUnit(
+                cc_total_octets=998415321, cc_input_octets=1000,
+                cc_output_octets=998414321, cc_time=60),
+            rating_group=rating_group,
+            avp=[Avp.new(constants.AVP_TGPP_3GPP_REPORTING_REASON,
+                         constants.VENDOR_TGPP, value=2)])
+    ccr.user_equipment_info = UserEquipmentInfo(
+        user_equipment_info_type=constants.E_USER_EQUIPMENT_INFO_TYPE_IMEISV,
+        user_equipment_info_value=b"8698920415595215")
+    ccr.service_information = ServiceInformation(
+        ps_information=PsInformation(
+            tgpp_charging_id=b"\x00\x00\x00\x01",
+            tgpp_pdp_type=0,
+            pdp_address=["10.40.93.32"],
+            sgsn_address=["10.0.0.1"],
+            ggsn_address=["10.0.0.2"],
+            tgpp_imsi_mcc_mnc="26003",
+            tgpp_ggsn_mcc_mnc="26003",
+            tgpp_nsapi=b"5",
+            called_station_id="internet",
+            tgpp_selection_mode="0",
+            tgpp_charging_characteristics="0800",
+            tgpp_sgsn_mcc_mnc="26003",
+            tgpp_ms_timezone=b"\x40\x00",
+            tgpp_user_location_info=bytes.fromhex("8262f030ffff62f030010203"),
+            tgpp_rat_type=b"\x06",
+        ))
+    ccr.route_record = [b"sctp-saegwc-poz01.lte.orange.pl",
+                        b"dsrkat01.mnc003.mcc260.3gppnetwork.org"]
+    return ccr
+
+
+def _build_charging_ccr() -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.header.hop_by_hop_identifier = 10001
+    ccr.header.end_to_end_identifier = 20001
+    ccr.session_id = "scscf1.ims.mno.net;221424325;287370797;65574b0c-2d02"
+    ccr.origin_host = b"scscf1.ims.mno.net"
+    ccr.origin_realm = b"ims.mno.net"
+    ccr.destination_realm = b"mvno.net"
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_EVENT_REQUEST
+    ccr.cc_request_number = 0
+    ccr.event_timestamp = datetime.datetime(2023, 11, 17, 14, 6, 1)
+    ccr.add_subscription_id(
+        constants.E_SUBSCRIPTION_ID_TYPE_END_USER_E164, "485089163847")
+    return ccr
+
+
+def _rate_element() -> RateElement:
+    return RateElement(
+        cc_unit_type=constants.E_CC_UNIT_TYPE_MONEY,
+        charge_reason_code=constants.E_CHARGE_REASON_CODE_USAGE,
+        unit_value=UnitValue(value_digits=12, exponent=2),
+        unit_cost=UnitCost(value_digits=12, exponent=2),
+        unit_quota_threshold=900)
+
+
+def build_ccr_ims() -> CreditControlRequest:
+    """An IMS CCR-E with an IMS-Information tree up to seven levels deep."""
+    timestamp = datetime.datetime(2023, 11, 17, 14, 6, 1)
+    media_component = SdpMediaComponent(
+        sdp_media_name="audio",
+        sdp_media_description=["c=IN IP4 10.40.93.32", "b=AS:41"],
+        media_initiator_flag=constants.E_MEDIA_INITIATOR_FLAG_CALLING_PARTY,
+        tgpp_charging_id=b"\x00\x00\x00\x01",
+        sdp_type=constants.E_SDP_TYPE_SDP_OFFER)
+
+    ccr = _build_charging_ccr()
+    ccr.service_context_id = constants.SERVICE_CONTEXT_IMS_CHARGING
+    ccr.service_information = ServiceInformation(
+        ims_information=ImsInformation(
+            event_type=EventType(sip_method="INVITE", expires=3600),
+            role_of_node=constants.E_ROLE_OF_NODE_ORIGINATING_ROLE,
+            node_functionality=constants.E_NODE_FUNCTIONALITY_S_CSCF,
+            user_session_id="a84b4c76e66710@pc33.atlanta.com",
+            calling_party_address=["sip:485089163847@ims.mno.net"],
+            called_party_address="tel:+485079163847",
+            time_stamps=TimeStamps(
+                sip_request_timestamp=timestamp,
+                sip_response_timestamp=timestamp,
+                sip_request_timestamp_fraction=34556,
+                sip_response_timestamp_fraction=23422),
+            inter_operator_identifier=[InterOperatorIdentifier(
+                originating_ioi="ims.mno.net",
+                terminating_ioi="ims.mvno.net")],
+            ims_charging_identifier="icid-value-1",
+            sdp_session_description=["v=0", "o=- 0 0 IN IP4 10.40.93.32"],
+            sdp_media_component=[media_component],
+            early_media_description=[EarlyMediaDescription(
+                sdp_timestamps=SdpTimestamps(
+                    sdp_offer_timestamp=timestamp,
+                    sdp_answer_timestamp=timestamp),
+                sdp_media_component=[media_component])],
+            real_time_tariff_information=RealTimeTariffInformation(
+                tariff_information=TariffInformation(
+                    current_tariff=CurrentTariff(
+                        currency_code=985,
+                        scale_factor=ScaleFactor(value_digits=10, exponent=2),
+                        rate_element=[_rate_element(), _rate_element()]),
+                    tariff_time_change=timestamp,
+                    next_tariff=NextTariff(
+                        currency_code=985,
+                        scale_factor=ScaleFactor(value_digits=10, exponent=2),
+                        rate_element=[_rate_element()]))),
+            access_network_information=["3GPP-E-UTRAN-FDD; utran-cell-id-3gpp=26003"],
+        ))
+    return ccr
+
+
+def build_ccr_sms() -> CreditControlRequest:
+    """An SMS CCR-E with an SMS-Information tree, for two recipients."""
+    def address_domain():
+        return AddressDomain(domain_name="mno.net", tgpp_imsi_mcc_mnc="26003")
+
+    ccr = _build_charging_ccr()
+    ccr.service_context_id = constants.SERVICE_CONTEXT_SMS_SERVICE_CHARGING
+    ccr.service_information = ServiceInformation(
+        sms_information=SmsInformation(
+            sms_node=constants.E_SMS_NODE_SMS_SC,
+            client_address="10.0.2.3",
+            originator_sccp_address="485000000001",
+            smsc_address="485000000002",
+            data_coding_scheme=8,
+            sm_discharge_time=datetime.datetime(2023, 11, 17, 14, 6, 1),
+            sm_message_type=constants.E_SM_MESSAGE_TYPE_SUBMISSION,
+            originator_interface=OriginatorInterface(
+                interface_id="id", interface_text="text",
+                interface_port="9282",
+                interface_type=constants.E_INTERFACE_TYPE_UNKNOWN),
+            number_of_messages_sent=1,
+            recipient_info=[RecipientInfo(
+                destination_interface=DestinationInterface(
+                    interface_id="id", interface_text="text",
+                    interface_port="9282",
+                    interface_type=constants.E_INTERFACE_TYPE_UNKNOWN),
+                recipient_address=[RecipientAddress(
+                    address_type=constants.E_ADDRESS_TYPE_MSISDN,
+                    address_data=msisdn,
+                    address_domain=address_domain(),
+                    addressee_type=constants.E_ADDRESSEE_TYPE_TO)],
+                recipient_received_address=[RecipientReceivedAddress(
+                    address_type=constants.E_ADDRESS_TYPE_MSISDN,
+                    address_data=msisdn,
+                    address_domain=address_domain())],
+                recipient_sccp_address="485000000003",
+            ) for msisdn in ("485079163847", "485079163848")],
+            originator_received_address=OriginatorReceivedAddress(
+                address_type=constants.E_ADDRESS_TYPE_MSISDN,
+                address_data="485089163847",
+                address_domain=address_domain()),
+            sm_service_type=constants.E_SM_SERVICE_TYPE_VAS4SMS_SHORT_MESSAGE_CONTENT_PROCESSING,
+        ))
+    return ccr
+
+
+def build_acr(container_count: int = 32) -> AccountingRequest:
+    """An offline charging ACR-Interim, reporting `container_count`
+    Service-Data-Containers.
+
+    The accounting command does not define Service-Information, so it is
+    appended as a custom AVP.
+    """
+    timestamp = datetime.datetime(2023, 11, 17, 14, 6, 1)
+    acr = AccountingRequest()
+    acr.header.hop_by_hop_identifier = 10001
+    acr.header.end_to_end_identifier = 20001
+    acr.session_id = "pgw1.epc.mno.net;221424325;287370797;65574b0c-2d02"
+    acr.origin_host = b"pgw1.epc.mno.net"
+    acr.origin_realm = b"epc.mno.net"
+    acr.destination_realm = b"cdf.mno.net"
+    acr.accounting_record_type = constants.E_ACCOUNTING_RECORD_TYPE_INTERIM_RECORD
+    acr.accounting_record_number = 3
+    acr.acct_application_id = constants.APP_DIAMETER_BASE_ACCOUNTING
+    acr.user_name = "485079163847@mno.net"
+    acr.event_timestamp = timestamp
+    service_information = ServiceInformation(
+        subscription_id=[SubscriptionId(
+            subscription_id_type=constants.E_SUBSCRIPTION_ID_TYPE_END_USER_E164,
+            subscription_id_data="485089163847")],
+        ps_information=PsInformation(
+            tgpp_charging_id=b"\x00\x00\x00\x01",
+            pdp_address=["10.40.93.32"],
+            sgsn_address=["10.0.0.1"],
+            ggsn_address=["10.0.0.2"],
+            called_station_id="internet",
+            tgpp_rat_type=b"\x06",
+            service_data_container=[ServiceDataContainer(
+                rating_group=8000 + number,
+                accounting_input_octets=1000 * number,
+                accounting_output_octets=998414321,
+                local_sequence_number=number,
+                time_first_usage=timestamp,
+                time_last_usage=timestamp,
+                time_usage=60,
+                change_condition=[constants.E_CHANGE_CONDITION_VOLUME_LIMIT],
+                change_time=timestamp,
+                tgpp_user_location_info=bytes.fromhex("8262f030ffff62f030010203"),
+                qos_information=QosInformation(
+                    qos_class_identifier=9,
+                    apn_aggregate_max_bitrate_ul=50000000,
+                    apn_aggregate_max_bitrate_dl=150000000),
+            ) for number in range(container_count)],
+        ))
+    acr.append_avp(Avp.new(
+        constants.AVP_TGPP_SERVICE_INFORMATION, constants.VENDOR_TGPP,
+        value=generate_avps_from_defs(service_information)))
+    return acr
+
+
+def build_cca() -> CreditControlAnswer:
+    """A CCA-U granting quota for two rating groups."""
+    cca = CreditControlAnswer()
+    cca.header.hop_by_hop_identifier = 10001
+    cca.header.end_to_end_identifier = 20001
+    cca.session_id = "sctp-saegwc-poz01.lte.orange.pl;221424325;287370797;65574b0c-2d02"
+    cca.origin_host = b"ocs6.mvno.net"
+    cca.origin_realm = b"mvno.net"
+    cca.cc_request_number = 952
+    cca.result_code = constants.E_RESULT_CODE_DIAMETER_SUCCESS
+    cca.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    for rating_group in (8000, 9000):
+        cca.add_multiple_services_credit_control(
+            granted_service_unit=GrantedServiceUnit(cc_total_octets=174076000),
+            rating_group=rating_group,
+            validity_time=3600,
+            result_code=constants.E_RESULT_CODE_DIAMETER_SUCCESS,
+            final_unit_indication=FinalUnitIndication(
+                final_unit_action=constants.E_FINAL_UNIT_ACTION_TERMINATE),
+            avp=[Avp.new(constants.AVP_TGPP_QUOTA_HOLDING_TIME,
+                         constants.VENDOR_TGPP, value=0)])
+    return cca
+
+
+def build_ula(apn_count: int = 8) -> UpdateLocationAnswer:
+    """An S6a ULA carrying full subscription data and `apn_count` APNs."""
+    ula = UpdateLocationAnswer()
+    ula.header.hop_by_hop_identifier = 10001
+    ula.header.end_to_end_identifier = 20001
+    ula.session_id = "hss1.epc.python-diameter.org;1;2;3"
+    ula.vendor_specific_application_id = VendorSpecificApplicationId(
+        vendor_id=constants.VENDOR_TGPP,
+        auth_application_id=constants.APP_3GPP_S6A_S6D)
+    ula.result_code = constants.E_RESULT_CODE_DIAMETER_SUCCESS
+    ula.auth_session_state = constants.E_AUTH_SESSION_STATE_NO_STATE_MAINTAINED
+    ula.origin_host = b"hss1.epc.python-diameter.org"
+    ula.origin_realm = b"epc.python-diameter.org"
+    ula.supported_features = [SupportedFeatures(
+        vendor_id=constants.VENDOR_TGPP, feature_list_id=1, feature_list=1)]
+    ula.ula_flags = 1
+
+    apns = []
+    for context_id in range(1, apn_count + 1):
+        apns.append(ApnConfiguration(
+            context_identifier=context_id,
+            pdn_type=E_PDN_TYPE_IPV4V6,
+            service_selection=f"apn{context_id}.mnc001.mcc228.gprs",
+            eps_subscribed_qos_profile=EpsSubscribedQosProfile(
+                qos_class_identifier=9,
+                allocation_retention_priority=AllocationRetentionPriority(
+                    priority_level=8,
+                    pre_emption_capability=1,
+                    pre_emption_vulnerability=0)),
+            ambr=Ambr(max_requested_bandwidth_ul=50000000,
+                      max_requested_bandwidth_dl=150000000),
+            mip6_agent_info=Mip6AgentInfo(
+                mip_home_agent_host=MipHomeAgentHost(
+                    origin_host=b"pgw1.epc.python-diameter.org",
+                    origin_realm=b"epc.python-diameter.org")),
+            tgpp_charging_characteristics="0800",
+            vplmn_dynamic_address_allowed=E_VPLMN_DYNAMIC_ADDRESS_ALLOWED_ALLOWED,
+        ))
+
+    ula.subscription_data = SubscriptionData(
+        subscriber_status=E_SUBSCRIBER_STATUS_SERVICE_GRANTED,
+        msisdn=b"41710000000",
+        network_access_mode=E_NETWORK_ACCESS_MODE_ONLY_PACKET,
+        access_restriction_data=0,
+        tgpp_charging_characteristics="0800",
+        ambr=Ambr(max_requested_bandwidth_ul=50000000,
+                  max_requested_bandwidth_dl=150000000),
+        apn_configuration_profile=ApnConfigurationProfile(
+            context_identifier=1,
+            all_apn_configurations_included_indicator=0,
+            apn_configuration=apns),
+        subscribed_periodic_rau_tau_timer=720,
+    )
+    return ula
+
+
+def measure(name: str, func: Callable[[], object], number: int = 2000,
+            repeat: int = 5) -> float:
+    """Time a callable and print the best per-call time in microseconds."""
+    gc.collect()
+    timings = timeit.repeat(func, number=number, repeat=repeat)
+    per_call = min(timings) / number * 1_000_000
+    spread = statistics.pstdev(timings) / number * 1_000_000
+    print(f"{name:<56} {per_call:>10.2f} us/msg  (+/- {spread:.2f})")
+    return per_call
+
+
+def measure_memory(name: str, func: Callable[[], object]) -> tuple[int, int]:
+    """Print the bytes retained by the result of a callable, and the peak
+    amount of bytes allocated while producing it."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    print(f"{name:<56} {retained:>10} B retained, {peak:>8} B peak")
+    return retained, peak
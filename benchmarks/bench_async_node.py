@@ -0,0 +1,234 @@
+"""
+Compare the threaded `Node` against the asyncio `AsyncNode`.
+
+Measures the requests per second that a client node gets answered by a
+server node over loopback TCP, with a number of requests in flight at the
+same time, once with two threaded nodes and applications, and once with two
+asyncio nodes and applications. Then measures the resident memory and the
+threads that a server node holds for a number of connected peers, each
+connected with a plain socket that has completed its CER/CEA.
+
+Run from package root:
+~# python3 benchmarks/bench_async_node.py
+"""
+import asyncio
+import resource
+import socket
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from diameter.message import Message, MessageHeader, constants
+from diameter.message.commands import (CapabilitiesExchangeRequest,
+                                       CreditControlRequest)
+from diameter.node import AsyncNode, Node
+from diameter.node.application import (AsyncApplication,
+                                       SimpleThreadingApplication)
+
+REQUESTS = 5000
+IN_FLIGHT = 32
+PEERS = 500
+APP_ID = constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _rss() -> int:
+    """Current resident set size, in bytes."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _ccr(node: Node, request_number: int) -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.session_id = node.session_generator.next_id()
+    ccr.origin_host = node.origin_host.encode()
+    ccr.origin_realm = node.realm_name.encode()
+    ccr.destination_realm = b"realm.net"
+    ccr.auth_application_id = APP_ID
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = request_number
+    return ccr
+
+
+def _answer(app, message: Message) -> Message:
+    return app.generate_answer(
+        message, result_code=constants.E_RESULT_CODE_DIAMETER_SUCCESS)
+
+
+class _AsyncServer(AsyncApplication):
+    async def handle_request(self, message: Message) -> Message:
+        return _answer(self, message)
+
+
+def _report(name: str, elapsed: float):
+    print(f"{name:<56} {REQUESTS / elapsed:>10.0f} req/s")
+
+
+def threaded_throughput():
+    port = _free_port()
+    server = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                  tcp_port=port)
+    server_app = SimpleThreadingApplication(
+        APP_ID, is_auth_application=True, request_handler=_answer)
+    server.add_application(
+        server_app, [server.add_peer("aaa://client.gy", "realm.net")])
+    client = Node("client.gy", "realm.net")
+    client_app = SimpleThreadingApplication(APP_ID, is_auth_application=True)
+    client.add_application(client_app, [client.add_peer(
+        f"aaa://server.gy:{port}", "realm.net", ["127.0.0.1"],
+        is_persistent=True)])
+    for node in (server, client):
+        node.wakeup_interval = 1
+        node.start()
+    client_app.wait_for_ready(5)
+
+    def send(request_number: int):
+        return client_app.send_request(_ccr(client, request_number), 10)
+
+    with ThreadPoolExecutor(IN_FLIGHT) as executor:
+        start = time.perf_counter()
+        answers = list(executor.map(send, range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+    assert len(answers) == REQUESTS
+
+    client.stop(force=True)
+    server.stop(force=True)
+    _report(f"threaded Node, {IN_FLIGHT} requests in flight", elapsed)
+
+
+async def async_throughput():
+    port = _free_port()
+    server = AsyncNode("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                       tcp_port=port)
+    server_app = _AsyncServer(APP_ID, is_auth_application=True)
+    server.add_application(
+        server_app, [server.add_peer("aaa://client.gy", "realm.net")])
+    client = AsyncNode("client.gy", "realm.net")
+    client_app = AsyncApplication(APP_ID, is_auth_application=True)
+    client.add_application(client_app, [client.add_peer(
+        f"aaa://server.gy:{port}", "realm.net", ["127.0.0.1"],
+        is_persistent=True)])
+    await server.start()
+    await client.start()
+    await client_app.wait_for_ready(5)
+
+    request_numbers = iter(range(REQUESTS))
+    answers = []
+
+    async def send():
+        for request_number in request_numbers:
+            answers.append(await client_app.send_request(
+                _ccr(client, request_number), 10))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send() for _ in range(IN_FLIGHT)))
+    elapsed = time.perf_counter() - start
+    assert len(answers) == REQUESTS
+
+    await client.stop(force=True)
+    await server.stop(force=True)
+    _report(f"AsyncNode, {IN_FLIGHT} requests in flight", elapsed)
+
+
+def _connect_peers(port: int) -> list[socket.socket]:
+    """Connect `PEERS` plain sockets and complete a CER/CEA with each."""
+    sockets = []
+    for i in range(PEERS):
+        cer = CapabilitiesExchangeRequest()
+        cer.header.hop_by_hop_identifier = i + 1
+        cer.header.end_to_end_identifier = i + 1
+        cer.origin_host = f"peer{i}.gy".encode()
+        cer.origin_realm = b"realm.net"
+        cer.host_ip_address = ["127.0.0.1"]
+        cer.vendor_id = 0
+        cer.product_name = "bench"
+        cer.auth_application_id = [APP_ID]
+
+        peer_socket = socket.create_connection(("127.0.0.1", port))
+        peer_socket.sendall(cer.as_bytes())
+        cea = b""
+        while len(cea) < 20 or len(cea) < MessageHeader.from_bytes(cea).length:
+            cea += peer_socket.recv(4096)
+        assert Message.from_bytes(cea).result_code == (
+            constants.E_RESULT_CODE_DIAMETER_SUCCESS)
+        sockets.append(peer_socket)
+    return sockets
+
+
+def _add_known_peers(node: Node, app):
+    peers = [node.add_peer(f"aaa://peer{i}.gy", "realm.net")
+             for i in range(PEERS)]
+    node.add_application(app, peers)
+
+
+def _report_memory(name: str, rss_before: int, threads_before: int):
+    rss = (_rss() - rss_before) / PEERS
+    threads = threading.active_count() - threads_before
+    print(f"{name:<56} {rss / 1024:>7.1f} KiB/peer, {threads:>5} threads")
+
+
+def threaded_memory():
+    port = _free_port()
+    rss_before = _rss()
+    threads_before = threading.active_count()
+    server = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                  tcp_port=port)
+    server.wakeup_interval = 1
+    _add_known_peers(server, SimpleThreadingApplication(
+        APP_ID, is_auth_application=True, request_handler=_answer))
+    server.start()
+
+    sockets = _connect_peers(port)
+    _report_memory(f"threaded Node, {PEERS} connected peers",
+                   rss_before, threads_before)
+
+    for peer_socket in sockets:
+        peer_socket.close()
+    server.stop(force=True)
+
+
+def async_memory():
+    port = _free_port()
+    rss_before = _rss()
+    threads_before = threading.active_count()
+    # the node runs in a thread of its own, so that the peers can connect
+    # with blocking sockets
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever)
+    loop_thread.start()
+    server = AsyncNode("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                       tcp_port=port)
+    _add_known_peers(server, _AsyncServer(APP_ID, is_auth_application=True))
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result()
+
+    sockets = _connect_peers(port)
+    _report_memory(f"AsyncNode, {PEERS} connected peers",
+                   rss_before, threads_before)
+
+    for peer_socket in sockets:
+        peer_socket.close()
+    asyncio.run_coroutine_threadsafe(server.stop(force=True), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    loop_thread.join()
+    loop.close()
+
+
+def main():
+    threaded_throughput()
+    asyncio.run(async_throughput())
+    async_memory()
+    threaded_memory()
+
+
+if __name__ == "__main__":
+    main()
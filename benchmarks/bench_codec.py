@@ -0,0 +1,57 @@
+"""
+Measure the cost of the low-level message codec.
+
+Encodes and decodes plain messages, i.e. messages that hold a list of AVPs,
+without any attribute conversion. This isolates the time spent in the packer
+and unpacker from the time spent in the command classes.
+
+Run from package root:
+~# python3 benchmarks/bench_codec.py
+"""
+from _fixtures import build_ccr, build_cca, build_ula, measure, measure_memory
+
+from diameter.message import Message
+from diameter.message.avp import AvpGrouped
+
+
+def _walk(avps):
+    for avp in avps:
+        if isinstance(avp, AvpGrouped):
+            _walk(avp.value)
+
+
+def main():
+    for name, build in (("CCR", build_ccr), ("CCA", build_cca),
+                        ("ULA", build_ula)):
+        msg_bytes = build().as_bytes()
+        plain = Message.from_bytes(msg_bytes, plain_msg=True)
+        _walk(plain.avps)
+        print(f"{name}: {len(msg_bytes)} bytes")
+
+        measure(f"  Message.as_bytes ({name}, plain)", plain.as_bytes)
+        measure(f"  Message.from_bytes ({name}, plain)",
+                lambda: Message.from_bytes(msg_bytes, plain_msg=True))
+        measure(f"  Message.from_bytes ({name}, plain, grouped walk)",
+                lambda: _walk(Message.from_bytes(msg_bytes, plain_msg=True).avps))
+        measure(f"  Message.from_bytes ({name}, zero-copy, grouped walk)",
+                lambda: _walk(Message.from_bytes(
+                    msg_bytes, plain_msg=True, zero_copy=True).avps))
+        measure(f"  Message.from_bytes ({name})",
+                lambda: Message.from_bytes(msg_bytes))
+        measure(f"  Message.from_bytes ({name}, zero-copy)",
+                lambda: Message.from_bytes(msg_bytes, zero_copy=True))
+
+        def decoded_tree(zero_copy: bool):
+            msg = Message.from_bytes(
+                msg_bytes, plain_msg=True, zero_copy=zero_copy)
+            _walk(msg.avps)
+            return msg
+
+        measure_memory(f"  decoded AVP tree ({name})",
+                       lambda: decoded_tree(False))
+        measure_memory(f"  decoded AVP tree ({name}, zero-copy)",
+                       lambda: decoded_tree(True))
+
+
+if __name__ == "__main__":
+    main()
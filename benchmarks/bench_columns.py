@@ -0,0 +1,64 @@
+"""
+Measure the cost of extracting usage per rating group from a batch of CCRs.
+
+Compares decoding every message with `Message.from_bytes` and walking the
+Multiple-Services-Credit-Control attributes in python, against extracting
+the same values with `extract_avp_columns` and summing them with numpy.
+Requires numpy.
+
+Run from package root:
+~# python3 benchmarks/bench_columns.py
+"""
+import collections
+import timeit
+
+import numpy
+
+from _fixtures import build_ccr
+
+from diameter.message import Message
+from diameter.message.columns import extract_avp_columns
+from diameter.message.constants import *
+
+BATCH_SIZE = 2000
+
+RATING_GROUP = ((AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+                (AVP_RATING_GROUP, 0))
+TOTAL_OCTETS = ((AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+                (AVP_USED_SERVICE_UNIT, 0),
+                (AVP_CC_TOTAL_OCTETS, 0))
+
+
+def _per_message(messages: list[bytes]) -> dict[int, int]:
+    usage = collections.Counter()
+    for msg_bytes in messages:
+        msg = Message.from_bytes(msg_bytes)
+        for mscc in msg.multiple_services_credit_control:
+            for usu in mscc.used_service_unit:
+                usage[mscc.rating_group] += usu.cc_total_octets or 0
+    return usage
+
+
+def _columnar(messages: list[bytes]) -> dict[int, int]:
+    rating_group, total_octets = extract_avp_columns(
+        messages, RATING_GROUP, TOTAL_OCTETS)
+    row_rating_group = numpy.zeros(rating_group.row_offsets[-1], "int64")
+    row_rating_group[rating_group.rows] = rating_group.values
+    usage = numpy.bincount(row_rating_group[total_octets.rows],
+                           weights=total_octets.values)
+    return {int(rg): int(usage[rg]) for rg in numpy.nonzero(usage)[0]}
+
+
+def main():
+    messages = [build_ccr().as_bytes() for _ in range(BATCH_SIZE)]
+    assert _per_message(messages) == _columnar(messages)
+
+    for name, func in (("from_bytes + attributes", _per_message),
+                       ("extract_avp_columns + numpy", _columnar)):
+        best = min(timeit.repeat(lambda: func(messages), number=1, repeat=5))
+        print(f"{BATCH_SIZE} CCRs, {name:<32} {best * 1000:>8.1f} ms  "
+              f"{best / BATCH_SIZE * 1_000_000:>7.2f} us/msg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Measure the cost of copying AVPs and messages.
+
+Compares `Avp.copy`, `Avp.from_avp` and `Message.copy` against copying by
+encoding to bytes and decoding again, which is what `Avp.from_avp` used to
+do, for a Service-Information AVP tree and for an entire CCR, both as
+received from the network and with every value already decoded.
+
+Run from package root:
+~# python3 benchmarks/bench_copy.py
+"""
+from _fixtures import build_ccr, measure
+
+from diameter.message import Message
+from diameter.message.avp import Avp
+from diameter.message.constants import *
+
+
+def _decode_all(avp: Avp):
+    if isinstance(avp.value, list):
+        for sub_avp in avp.value:
+            _decode_all(sub_avp)
+
+
+def main():
+    ccr = build_ccr()
+    ccr_bytes = ccr.as_bytes()
+    received = Message.from_bytes(ccr_bytes)
+    received_si = received.find_avps((AVP_TGPP_SERVICE_INFORMATION,
+                                      VENDOR_TGPP))[0]
+    decoded_si = Avp.from_bytes(received_si.as_bytes())
+    _decode_all(decoded_si)
+
+    for name, si in (("received", received_si), ("decoded", decoded_si)):
+        measure(f"Service-Information {name}, encode + decode",
+                lambda: Avp.from_bytes(si.as_bytes()))
+        measure(f"Service-Information {name}, copy(deep=True)",
+                lambda: si.copy(deep=True))
+        measure(f"Service-Information {name}, from_avp",
+                lambda: Avp.from_avp(si))
+
+    # encoding a received message decodes its attributes, the copy is
+    # measured first
+    measure("CCR received, copy(deep=True)", lambda: received.copy(deep=True))
+    measure("CCR received, encode + decode",
+            lambda: Message.from_bytes(received.as_bytes()))
+    measure("CCR built, encode + decode",
+            lambda: Message.from_bytes(ccr.as_bytes()))
+    measure("CCR built, copy()", ccr.copy)
+    measure("CCR built, copy(deep=True)", lambda: ccr.copy(deep=True))
+
+
+if __name__ == "__main__":
+    main()
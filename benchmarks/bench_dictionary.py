@@ -0,0 +1,70 @@
+"""
+Measure the cost of the AVP dictionary.
+
+Reports the time and the memory taken by importing the message package,
+which includes the AVP dictionary, both right after the import and once the
+vendor tables that a typical Gy / S6a deployment uses have been looked up, and the cost of looking up AVP dictionary entries, which
+is done for every decoded AVP.
+
+Run from package root:
+~# python3 benchmarks/bench_dictionary.py
+"""
+import subprocess
+import sys
+
+from _fixtures import build_ccr, measure
+
+from diameter.message import Message
+from diameter.message.avp.avp import get_avp_dictionary_entry
+from diameter.message.constants import *
+
+_IMPORT_TIME_SCRIPT = """
+import time
+start = time.perf_counter()
+import diameter.message
+print((time.perf_counter() - start) * 1000)
+"""
+
+_IMPORT_MEMORY_SCRIPT = """
+import tracemalloc
+tracemalloc.start()
+import diameter.message
+from diameter.message.avp.avp import get_avp_dictionary_entry
+imported = tracemalloc.get_traced_memory()[0]
+get_avp_dictionary_entry(1, 10415)
+get_avp_dictionary_entry(1, 13019)
+print(imported, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def _run(script: str) -> list[str]:
+    return subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True,
+        check=True).stdout.split()
+
+
+def measure_import(runs: int = 10):
+    elapsed = min(float(_run(_IMPORT_TIME_SCRIPT)[0]) for _ in range(runs))
+    imported, used = (int(v) for v in _run(_IMPORT_MEMORY_SCRIPT))
+    print(f"{'import diameter.message':<56} {elapsed:>10.2f} ms")
+    print(f"{'memory after import':<56} {imported:>10} B")
+    print(f"{'memory after 3GPP and ETSI lookups':<56} {used:>10} B")
+
+
+def main():
+    measure_import()
+
+    measure("lookup base AVP",
+            lambda: get_avp_dictionary_entry(AVP_SESSION_ID), number=200000)
+    measure("lookup 3GPP AVP",
+            lambda: get_avp_dictionary_entry(
+                AVP_TGPP_3GPP_USER_LOCATION_INFO, VENDOR_TGPP), number=200000)
+    measure("lookup unknown vendor AVP",
+            lambda: get_avp_dictionary_entry(1, 99999), number=200000)
+
+    msg_bytes = build_ccr().as_bytes()
+    measure("CCR from_bytes", lambda: Message.from_bytes(msg_bytes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Measure the cost of picking the message class for received messages.
+
+Decodes short requests and answers with `Message.from_bytes`, so that the
+lookup of the message class is a noticeable part of the total, and creates
+answers from requests with `Message.to_answer`.
+
+Run from package root:
+~# python3 benchmarks/bench_dispatch.py
+"""
+from _fixtures import measure
+
+from diameter.message import Message
+from diameter.message.commands import (CreditControlRequest,
+                                       DeviceWatchdogAnswer,
+                                       DeviceWatchdogRequest)
+
+
+def main():
+    dwr = DeviceWatchdogRequest()
+    dwr.origin_host = b"dra1.mno.net"
+    dwr.origin_realm = b"mno.net"
+    dwa = DeviceWatchdogAnswer()
+    dwa.origin_host = b"dra2.mno.net"
+    dwa.origin_realm = b"mno.net"
+    dwa.result_code = 2001
+
+    for name, msg in (("DWR", dwr), ("DWA", dwa)):
+        msg_bytes = msg.as_bytes()
+        measure(f"{name} from_bytes", lambda: Message.from_bytes(msg_bytes))
+
+    ccr = CreditControlRequest()
+    measure("DWR to_answer", dwr.to_answer)
+    measure("CCR to_answer", ccr.to_answer)
+
+
+if __name__ == "__main__":
+    main()
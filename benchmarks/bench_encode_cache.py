@@ -0,0 +1,75 @@
+"""
+Measure the cost of encoding messages again after few or no changes.
+
+Covers a relay that rewrites one AVP of a received CCR before forwarding it,
+compared against encoding the same CCR with every attribute decoded, which
+is what encoding a received message used to do, encoding a CCR built from
+its attributes repeatedly, unchanged and with one attribute set, and encoding
+a plain message of AVP instances repeatedly, unchanged and with one nested
+sub-AVP changed.
+
+Run from package root:
+~# python3 benchmarks/bench_encode_cache.py
+"""
+from _fixtures import build_ccr_ims, measure
+
+from diameter.message import Message
+from diameter.message.constants import *
+
+
+def _relay(msg_bytes: bytes, decode_all: bool):
+    def relay():
+        msg = Message.from_bytes(msg_bytes)
+        if decode_all:
+            for gen_def in msg.avp_def:
+                getattr(msg, gen_def.attr_name)
+        msg.route_record.append(b"dra1.mno.net")
+        return msg.as_bytes()
+
+    return relay
+
+
+def main():
+    msg_bytes = build_ccr_ims().as_bytes()
+    assert _relay(msg_bytes, False)() == _relay(msg_bytes, True)()
+
+    measure("relayed CCR, decode only, for reference",
+            lambda: Message.from_bytes(msg_bytes))
+    measure("relayed CCR, one AVP rewritten",
+            _relay(msg_bytes, False))
+    measure("relayed CCR, every attribute decoded",
+            _relay(msg_bytes, True))
+
+    ccr = build_ccr_ims()
+    ccr.as_bytes()
+    measure("built CCR, unchanged", ccr.as_bytes)
+
+    def set_attribute():
+        ccr.cc_request_number += 1
+        return ccr.as_bytes()
+
+    measure("built CCR, one attribute set", set_attribute)
+
+    plain = Message.from_bytes(msg_bytes, plain_msg=True)
+    # the deepest sub-AVP of the tree, under seven grouped levels
+    unit_quota_threshold = plain.find_avps(
+        (AVP_TGPP_SERVICE_INFORMATION, VENDOR_TGPP),
+        (AVP_TGPP_IMS_INFORMATION, VENDOR_TGPP),
+        (AVP_TGPP_REAL_TIME_TARIFF_INFORMATION, VENDOR_TGPP),
+        (AVP_TGPP_TARIFF_INFORMATION, VENDOR_TGPP),
+        (AVP_TGPP_CURRENT_TARIFF, VENDOR_TGPP),
+        (AVP_TGPP_RATE_ELEMENT, VENDOR_TGPP),
+        (AVP_TGPP_UNIT_QUOTA_THRESHOLD, VENDOR_TGPP))[0]
+    plain.as_bytes()
+
+    measure("plain CCR, unchanged", plain.as_bytes)
+
+    def change_nested():
+        unit_quota_threshold.value += 1
+        return plain.as_bytes()
+
+    measure("plain CCR, one nested sub-AVP changed", change_nested)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measure the cost of encoding command class attributes into AVPs.
+
+Compares the compiled encode plans, used by `Message.as_bytes` and
+`DefinedMessage.avps`, against producing the same AVPs through the
+`generate_avps_from_defs` object path and packing them.
+
+Run from package root:
+~# python3 benchmarks/bench_encode_plan.py
+"""
+from _fixtures import build_ccr, build_cca, build_ula, measure
+
+from diameter.message.avp.generator import generate_avps_from_defs
+from diameter.message.packer import RawPacker
+
+
+def _object_path(msg):
+    def as_bytes():
+        packer = RawPacker()
+        for avp in generate_avps_from_defs(msg) + msg._additional_avps:
+            avp.as_packed(packer)
+        msg.header.length = 20 + packer.get_position()
+        return msg.header.as_bytes() + packer.get_buffer()
+
+    return as_bytes
+
+
+def main():
+    for name, build, number in (("CCR", build_ccr, 2000),
+                                ("CCA", build_cca, 2000),
+                                ("ULA", build_ula, 500)):
+        msg = build()
+        assert _object_path(msg)() == msg.as_bytes()
+
+        measure(f"{name} as_bytes, object path", _object_path(msg),
+                number=number)
+        measure(f"{name} as_bytes, encode plan", msg.as_bytes, number=number)
+        measure(f"{name} generate_avps_from_defs",
+                lambda: generate_avps_from_defs(msg), number=number)
+        measure(f"{name} avps, encode plan", lambda: msg.avps, number=number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Measure the cost of finding AVPs with `Message.find_avps`.
+
+Compares a compiled `AvpPath` lookup, both on a freshly decoded message and
+repeated on the same message, against walking the entire AVP list of the
+message, which is what every search of a received command message used to
+cost.
+
+Run from package root:
+~# python3 benchmarks/bench_find.py
+"""
+from _fixtures import build_ccr, build_ula, measure
+
+from diameter.message import Message
+from diameter.message._base import _traverse_avp_tree
+from diameter.message.avp import AvpPath
+
+PATHS = {
+    "CCR": AvpPath("MSCC/USU/CC-Total-Octets"),
+    "ULA": AvpPath("Subscription-Data/APN-Configuration-Profile/"
+                   "APN-Configuration/Service-Selection"),
+}
+
+
+def main():
+    for name, build in (("CCR", build_ccr), ("ULA", build_ula)):
+        msg_bytes = build().as_bytes()
+        path = PATHS[name]
+        msg = Message.from_bytes(msg_bytes)
+        assert msg.find_avps(path) == msg.find_avps(path)
+        # producing the entire AVP list decodes every attribute, so the walk
+        # is measured on a message of its own
+        walked_msg = Message.from_bytes(msg_bytes)
+
+        measure(f"{name} from_bytes + walk entire AVP list",
+                lambda: _traverse_avp_tree(
+                    Message.from_bytes(msg_bytes).avps, path))
+        measure(f"{name} from_bytes + find_avps",
+                lambda: Message.from_bytes(msg_bytes).find_avps(path))
+        measure(f"{name} repeated walk entire AVP list",
+                lambda: _traverse_avp_tree(walked_msg.avps, path))
+        measure(f"{name} repeated find_avps",
+                lambda: msg.find_avps(path), number=20000)
+        measure(f"{name} repeated find_avps, string path",
+                lambda: msg.find_avps(str(path)), number=20000)
+
+
+if __name__ == "__main__":
+    main()
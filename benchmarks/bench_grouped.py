@@ -0,0 +1,29 @@
+"""
+Measure the cost of creating grouped AVP instances.
+
+Times creating empty instances of a few grouped AVP classes that have many
+list attributes, and prints the memory held by a batch of them, with their
+list attributes left untouched.
+
+Run from package root:
+~# python3 benchmarks/bench_grouped.py
+"""
+from _fixtures import measure, measure_memory
+
+from diameter.message.avp.grouped import (FromToSpec,
+                                          MultipleServicesCreditControl,
+                                          SubscriptionData, UsedServiceUnit)
+
+BATCH_SIZE = 1000
+
+
+def main():
+    for cls in (MultipleServicesCreditControl, UsedServiceUnit, FromToSpec,
+                SubscriptionData):
+        measure(f"{cls.__name__}()", cls, number=20000)
+        measure_memory(f"{BATCH_SIZE} x {cls.__name__}()",
+                       lambda: [cls() for _ in range(BATCH_SIZE)])
+
+
+if __name__ == "__main__":
+    main()
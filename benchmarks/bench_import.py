@@ -0,0 +1,81 @@
+"""
+Measure the import time of the package.
+
+Reports the import time of `diameter.message` as measured by
+`python -X importtime`, the modules that take the most time to import, and
+the time until a first message has been decoded in a new process, as
+command modules and grouped AVP classes are only loaded once they are used.
+Each figure is the best of several runs, each in a new interpreter.
+
+Run from package root:
+~# python3 benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+
+from _fixtures import build_ccr
+
+_FIRST_DECODE_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from diameter.message import Message
+Message.from_bytes(bytes.fromhex(sys.argv[1])).service_information
+print((time.perf_counter() - start) * 1000)
+"""
+
+_IMPORT_ALL_SCRIPT = """
+import time
+start = time.perf_counter()
+from diameter.message.commands import *
+from diameter.message.avp.grouped import *
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _run(args: list[str]) -> subprocess.CompletedProcess:
+    # bytecode is written once, so that every run measures a cached import
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run([sys.executable, *args], capture_output=True,
+                          text=True, check=True, env=env)
+
+
+def import_times() -> dict[str, tuple[int, int]]:
+    """Self and cumulative import times, in microseconds, by module name."""
+    result = _run(["-X", "importtime", "-c", "import diameter.message"])
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[12:].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main(runs: int = 10):
+    _run(["-c", "import diameter.message"])
+    samples = [import_times() for _ in range(runs)]
+    best = {name: (min(s[name][0] for s in samples),
+                   min(s[name][1] for s in samples))
+            for name in samples[0]}
+
+    print(f"{'import diameter.message (-X importtime)':<56} "
+          f"{best['diameter'][1] / 1000:>10.2f} ms")
+    slowest = sorted((name for name in best if name.startswith("diameter")),
+                     key=lambda name: best[name][0], reverse=True)
+    for name in slowest[:5]:
+        print(f"{'  self: ' + name:<56} {best[name][0] / 1000:>10.2f} ms")
+
+    msg_hex = build_ccr().as_bytes().hex()
+    first = min(float(_run(["-c", _FIRST_DECODE_SCRIPT, msg_hex]).stdout)
+                for _ in range(runs))
+    print(f"{'import and decode a first CCR':<56} {first:>10.2f} ms")
+    everything = min(float(_run(["-c", _IMPORT_ALL_SCRIPT]).stdout)
+                     for _ in range(runs))
+    print(f"{'import every command and grouped AVP':<56} "
+          f"{everything:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
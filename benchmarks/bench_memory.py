@@ -0,0 +1,96 @@
+"""
+Measure the memory held by decoded messages.
+
+Keeps a batch of decoded messages alive, as an application holding in-flight
+messages or per-session snapshots would, and reports the bytes retained per
+message. Each message is measured as a plain message with its entire AVP
+tree decoded, as the same message encoded again afterwards, which keeps its
+packed AVPs for re-use, and as a command message with every attribute
+read.
+
+Run from package root:
+~# python3 benchmarks/bench_memory.py
+"""
+import gc
+import sys
+import tracemalloc
+
+from typing import Callable
+
+from _fixtures import build_acr, build_ccr, build_ula
+
+from diameter.message import Message, MessageHeader
+from diameter.message.avp import Avp, AvpGrouped
+
+BATCH_SIZE = 200
+
+
+def _walk(avps) -> int:
+    count = 0
+    for avp in avps:
+        count += 1
+        if isinstance(avp, AvpGrouped):
+            count += _walk(avp.value)
+    return count
+
+
+def _read_all(msg):
+    for gen_def in msg.avp_def:
+        getattr(msg, gen_def.attr_name)
+    return msg
+
+
+def _retained_per_message(decode: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        batch = [decode() for _ in range(BATCH_SIZE)]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del batch
+    return retained // BATCH_SIZE
+
+
+def _instance_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main():
+    avp = Avp.from_bytes(
+        bytes.fromhex("000001cd40000016333232353140336770702e6f72670000"))
+    print(f"{'Avp instance':<40} {_instance_size(avp):>8} B")
+    print(f"{'MessageHeader instance':<40} "
+          f"{_instance_size(MessageHeader()):>8} B")
+
+    for name, build in (("CCR", build_ccr), ("ULA", build_ula),
+                        ("ACR", build_acr)):
+        msg_bytes = build().as_bytes()
+        avp_count = _walk(Message.from_bytes(msg_bytes, plain_msg=True).avps)
+        print(f"{name}: {len(msg_bytes)} bytes, {avp_count} AVPs")
+
+        def plain_tree():
+            msg = Message.from_bytes(msg_bytes, plain_msg=True)
+            _walk(msg.avps)
+            return msg
+
+        def plain_tree_encoded():
+            msg = plain_tree()
+            msg.as_bytes()
+            return msg
+
+        for label, decode in (
+                ("plain, AVP tree decoded", plain_tree),
+                ("plain, AVP tree decoded and encoded", plain_tree_encoded),
+                ("command, all attributes read",
+                 lambda: _read_all(Message.from_bytes(msg_bytes)))):
+            per_message = _retained_per_message(decode)
+            print(f"  {label:<38} {per_message:>8} B/msg  "
+                  f"{per_message * 1000 / 1_000_000:>7.1f} MB per 1000 in flight")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measure reading diameter messages from a packet capture.
+
+Writes a temporary pcap file of TCP segments carrying CCRs, each CCR split
+over two segments, and reads it back with `read_pcap`, both decoding the
+messages and returning them as bytes. Reports the throughput, and the peak
+memory allocated while reading captures of different sizes, which should not
+grow with the capture size.
+
+Run from package root:
+~# python3 benchmarks/bench_pcap.py
+"""
+import os
+import struct
+import tempfile
+import time
+import tracemalloc
+
+from _fixtures import build_ccr
+
+from diameter.pcap import read_pcap
+
+
+def _packet(seq: int, payload: bytes) -> bytes:
+    tcp = struct.pack(">HHLLBBHHH", 40000, 3868, seq, 0, 5 << 4, 0x18,
+                      65535, 0, 0) + payload
+    ip = struct.pack(">BBHHHBBH4s4s", 0x45, 0, 20 + len(tcp), 0, 0x4000,
+                     64, 6, 0, b"\x0a\0\0\x01", b"\x0a\0\0\x02")
+    return b"\0" * 12 + b"\x08\x00" + ip + tcp
+
+
+def _write_capture(filename: str, message_count: int):
+    msg_bytes = build_ccr().as_bytes()
+    half = len(msg_bytes) // 2
+    seq = 1
+    with open(filename, "wb") as f:
+        f.write(struct.pack("<LHHlLLL", 0xa1b2c3d4, 2, 4, 0, 0, 65535, 1))
+        for number in range(message_count):
+            for payload in (msg_bytes[:half], msg_bytes[half:]):
+                packet = _packet(seq, payload)
+                seq += len(payload)
+                f.write(struct.pack("<4L", number, 0, len(packet),
+                                    len(packet)))
+                f.write(packet)
+
+
+def _read(filename: str, decode: bool) -> tuple[int, float, int]:
+    started = time.perf_counter()
+    count = sum(1 for _ in read_pcap(filename, decode=decode))
+    elapsed = time.perf_counter() - started
+
+    # memory is traced on a separate round, as tracing slows down reading
+    tracemalloc.start()
+    for _ in read_pcap(filename, decode=decode):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for message_count in (10_000, 50_000):
+            filename = os.path.join(tmp, f"ccr_{message_count}.pcap")
+            _write_capture(filename, message_count)
+            size = os.path.getsize(filename)
+            for decode in (False, True):
+                count, elapsed, peak = _read(filename, decode)
+                label = "messages" if decode else "bytes"
+                print(f"{size / 1_000_000:>6.1f} MB capture, {label:<8} "
+                      f"{count / elapsed:>9.0f} msg/s  "
+                      f"{size / elapsed / 1_000_000:>6.1f} MB/s  "
+                      f"peak {peak / 1000:>6.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
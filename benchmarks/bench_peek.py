@@ -0,0 +1,40 @@
+"""
+Measure the cost of reading a few routing AVPs from received bytes.
+
+Compares `peek_avps` against decoding the entire message with
+`Message.from_bytes` and reading the same values as attributes, as a node
+would do when dispatching a request.
+
+Run from package root:
+~# python3 benchmarks/bench_peek.py
+"""
+from _fixtures import build_ccr, build_ula, measure
+
+from diameter.message import Message, peek_avps
+from diameter.message.constants import *
+
+ROUTING_AVPS = ((AVP_SESSION_ID, 0), (AVP_DESTINATION_REALM, 0),
+                (AVP_DESTINATION_HOST, 0), (AVP_CC_REQUEST_TYPE, 0))
+
+
+def _from_bytes(msg_bytes: bytes):
+    def decode():
+        msg = Message.from_bytes(msg_bytes)
+        return (msg.header, msg.session_id,
+                getattr(msg, "destination_realm", None),
+                getattr(msg, "destination_host", None),
+                getattr(msg, "cc_request_type", None))
+
+    return decode
+
+
+def main():
+    for name, build in (("CCR", build_ccr), ("ULA", build_ula)):
+        msg_bytes = build().as_bytes()
+        measure(f"{name} from_bytes + attributes", _from_bytes(msg_bytes))
+        measure(f"{name} peek_avps",
+                lambda: peek_avps(msg_bytes, *ROUTING_AVPS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measure the cost of a socket event in a node with many connected peers.
+
+Connects an increasing amount of idle peers to a server node over loopback,
+each with a plain socket that has completed its CER/CEA, and measures the
+round trip time of a DWR/DWA exchange with one more, active peer at each
+step. Every exchange wakes up the node for the received DWR and again for
+writing the DWA; with every socket registered once in the selector, the
+cost does not grow with the amount of idle peers. A node that polled each
+socket with `select()` could not go past 1024 file descriptors at all.
+
+Run from package root:
+~# python3 benchmarks/bench_reactor.py
+"""
+import resource
+import socket
+import time
+
+from diameter.message import Message, MessageHeader, constants
+from diameter.message.commands import (CapabilitiesExchangeRequest,
+                                       DeviceWatchdogRequest)
+from diameter.node import Node
+
+PEER_STEPS = (10, 100, 1000, 5000)
+EXCHANGES = 2000
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _exchange(peer_socket: socket.socket, msg: Message) -> Message:
+    peer_socket.sendall(msg.as_bytes())
+    answer = b""
+    while len(answer) < 20 or len(answer) < MessageHeader.from_bytes(answer).length:
+        answer += peer_socket.recv(4096)
+    return Message.from_bytes(answer)
+
+
+def _connect_peer(port: int, peer_id: int) -> socket.socket:
+    cer = CapabilitiesExchangeRequest()
+    cer.header.hop_by_hop_identifier = peer_id + 1
+    cer.header.end_to_end_identifier = peer_id + 1
+    cer.origin_host = f"peer{peer_id}.gy".encode()
+    cer.origin_realm = b"realm.net"
+    cer.host_ip_address = ["127.0.0.1"]
+    cer.vendor_id = 0
+    cer.product_name = "bench"
+    cer.auth_application_id = [constants.APP_RELAY]
+
+    peer_socket = socket.create_connection(("127.0.0.1", port))
+    cea = _exchange(peer_socket, cer)
+    assert cea.result_code == constants.E_RESULT_CODE_DIAMETER_SUCCESS
+    return peer_socket
+
+
+def _measure_dwr(peer_socket: socket.socket) -> float:
+    """Mean DWR/DWA round trip, in microseconds."""
+    dwr = DeviceWatchdogRequest()
+    dwr.origin_host = b"active.gy"
+    dwr.origin_realm = b"realm.net"
+    start = time.perf_counter()
+    for i in range(EXCHANGES):
+        dwr.header.hop_by_hop_identifier = i + 1
+        dwr.header.end_to_end_identifier = i + 1
+        _exchange(peer_socket, dwr)
+    return (time.perf_counter() - start) / EXCHANGES * 1_000_000
+
+
+def main():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    port = _free_port()
+    node = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                tcp_port=port)
+    # idle peers never answer a DWR
+    node.idle_timeout = 3600
+    node.wakeup_interval = 1
+    node.add_peer("aaa://active.gy", "realm.net")
+    for peer_id in range(PEER_STEPS[-1]):
+        node.add_peer(f"aaa://peer{peer_id}.gy", "realm.net")
+    node.start()
+
+    cer = CapabilitiesExchangeRequest()
+    cer.origin_host = b"active.gy"
+    cer.origin_realm = b"realm.net"
+    cer.host_ip_address = ["127.0.0.1"]
+    cer.vendor_id = 0
+    cer.product_name = "bench"
+    cer.auth_application_id = [constants.APP_RELAY]
+    active = socket.create_connection(("127.0.0.1", port))
+    _exchange(active, cer)
+
+    idle = []
+    for peers in PEER_STEPS:
+        while len(idle) < peers:
+            idle.append(_connect_peer(port, len(idle)))
+        round_trip = _measure_dwr(active)
+        print(f"{f'DWR/DWA round trip, {peers} idle peers':<56} "
+              f"{round_trip:>10.2f} us/msg")
+
+    for peer_socket in idle:
+        peer_socket.close()
+    active.close()
+    node.stop(force=True)
+
+
+if __name__ == "__main__":
+    main()
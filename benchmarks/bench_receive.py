@@ -0,0 +1,110 @@
+"""
+Measure the receive path of a node, for small and for large messages.
+
+Connects a plain socket to a server node over loopback and completes a
+CER/CEA. Then sends batches of small DWR messages, written to the socket
+all at once, and reads back the DWAs, to measure how many small messages
+per second the node frames and answers. Finally sends DWRs that carry a
+64 KB AVP, one at a time, to measure the round trip time of a message
+that arrives in many reads.
+
+Run from package root:
+~# python3 benchmarks/bench_receive.py
+"""
+import socket
+import time
+
+from diameter.message import Message, MessageHeader, constants
+from diameter.message.avp import Avp
+from diameter.message.commands import (CapabilitiesExchangeRequest,
+                                       DeviceWatchdogRequest)
+from diameter.node import Node
+
+SMALL_MESSAGES = 50000
+BATCH = 100
+LARGE_MESSAGES = 200
+LARGE_SIZE = 64 * 1024
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _read_answers(peer_socket: socket.socket, count: int) -> list[Message]:
+    data = b""
+    answers = []
+    while len(answers) < count:
+        data += peer_socket.recv(65536)
+        while len(data) >= 20:
+            length = MessageHeader.from_bytes(data).length
+            if len(data) < length:
+                break
+            answers.append(Message.from_bytes(data[:length]))
+            data = data[length:]
+    return answers
+
+
+def _dwr(hop_by_hop: int, padding: int = 0) -> bytes:
+    dwr = DeviceWatchdogRequest()
+    dwr.header.hop_by_hop_identifier = hop_by_hop
+    dwr.header.end_to_end_identifier = hop_by_hop
+    dwr.origin_host = b"peer.gy"
+    dwr.origin_realm = b"realm.net"
+    if padding:
+        dwr.append_avp(Avp.new(constants.AVP_CLASS, value=b"x" * padding))
+    return dwr.as_bytes()
+
+
+def small_throughput(peer_socket: socket.socket):
+    batch = b"".join(_dwr(i + 1) for i in range(BATCH))
+    start = time.perf_counter()
+    for _ in range(SMALL_MESSAGES // BATCH):
+        peer_socket.sendall(batch)
+        _read_answers(peer_socket, BATCH)
+    elapsed = time.perf_counter() - start
+    print(f"{f'DWR/DWA, {BATCH} per write':<56} "
+          f"{SMALL_MESSAGES / elapsed:>10.0f} msg/s")
+
+
+def large_latency(peer_socket: socket.socket):
+    dwr = _dwr(1, LARGE_SIZE)
+    start = time.perf_counter()
+    for _ in range(LARGE_MESSAGES):
+        peer_socket.sendall(dwr)
+        _read_answers(peer_socket, 1)
+    elapsed = time.perf_counter() - start
+    print(f"{f'DWR/DWA round trip, {len(dwr)} byte DWR':<56} "
+          f"{elapsed / LARGE_MESSAGES * 1_000_000:>10.2f} us/msg")
+
+
+def main():
+    port = _free_port()
+    node = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                tcp_port=port)
+    node.wakeup_interval = 1
+    node.add_peer("aaa://peer.gy", "realm.net")
+    node.start()
+
+    cer = CapabilitiesExchangeRequest()
+    cer.origin_host = b"peer.gy"
+    cer.origin_realm = b"realm.net"
+    cer.host_ip_address = ["127.0.0.1"]
+    cer.vendor_id = 0
+    cer.product_name = "bench"
+    cer.auth_application_id = [constants.APP_RELAY]
+    peer_socket = socket.create_connection(("127.0.0.1", port))
+    peer_socket.sendall(cer.as_bytes())
+    cea = _read_answers(peer_socket, 1)[0]
+    assert cea.result_code == constants.E_RESULT_CODE_DIAMETER_SUCCESS
+
+    small_throughput(peer_socket)
+    large_latency(peer_socket)
+
+    peer_socket.close()
+    node.stop(force=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Measure the write path of a node, for small answers and for large messages.
+
+Connects a plain socket to a server node over loopback and completes a
+CER/CEA. Then sends batches of small DWR messages, written to the socket
+all at once, and reads back the DWAs; the answers produced for one batch
+are written out together, and the amount of socket send calls made per
+answer is printed as well. Finally queues large messages for the peer
+connection all at once, which the node can only write out a part at a
+time, and measures how fast the peer receives them.
+
+Run from package root:
+~# python3 benchmarks/bench_send.py
+"""
+import socket
+import time
+
+from diameter.message import Message, MessageHeader, constants
+from diameter.message.avp import Avp
+from diameter.message.commands import (CapabilitiesExchangeRequest,
+                                       DeviceWatchdogRequest)
+from diameter.node import Node
+
+SMALL_MESSAGES = 50000
+BATCH = 100
+LARGE_MESSAGES = 500
+LARGE_SIZE = 64 * 1024
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _read_messages(peer_socket: socket.socket, count: int) -> int:
+    """Read `count` messages, return the amount of bytes read."""
+    data = b""
+    total = 0
+    while count:
+        data += peer_socket.recv(262144)
+        while len(data) >= 20 and count:
+            length = MessageHeader.from_bytes(data).length
+            if len(data) < length:
+                break
+            data = data[length:]
+            total += length
+            count -= 1
+    return total
+
+
+def _dwr(hop_by_hop: int, padding: int = 0) -> DeviceWatchdogRequest:
+    dwr = DeviceWatchdogRequest()
+    dwr.header.hop_by_hop_identifier = hop_by_hop
+    dwr.header.end_to_end_identifier = hop_by_hop
+    dwr.origin_host = b"server.gy"
+    dwr.origin_realm = b"realm.net"
+    if padding:
+        dwr.append_avp(Avp.new(constants.AVP_CLASS, value=b"x" * padding))
+    return dwr
+
+
+def small_answers(node: Node, peer_socket: socket.socket):
+    conn = next(iter(node.connections.values()))
+    calls_before = getattr(conn, "send_calls", 0)
+    sent_before = getattr(conn, "sent_messages", 0)
+
+    batch = b"".join(_dwr(i + 1).as_bytes() for i in range(BATCH))
+    start = time.perf_counter()
+    for _ in range(SMALL_MESSAGES // BATCH):
+        peer_socket.sendall(batch)
+        _read_messages(peer_socket, BATCH)
+    elapsed = time.perf_counter() - start
+    print(f"{f'DWR/DWA, {BATCH} per write':<56} "
+          f"{SMALL_MESSAGES / elapsed:>10.0f} msg/s")
+
+    if hasattr(conn, "send_calls"):
+        calls = conn.send_calls - calls_before
+        sent = conn.sent_messages - sent_before
+        print(f"{'DWA send calls per message':<56} "
+              f"{calls / sent:>10.3f} calls/msg")
+
+
+def large_messages(node: Node, peer_socket: socket.socket):
+    conn = next(iter(node.connections.values()))
+    messages = [_dwr(i + 1, LARGE_SIZE) for i in range(LARGE_MESSAGES)]
+    # encoded once, so that only writing them out is measured
+    for message in messages:
+        message.as_bytes()
+
+    start = time.perf_counter()
+    for message in messages:
+        conn.add_out_msg(message)
+    total = _read_messages(peer_socket, LARGE_MESSAGES)
+    elapsed = time.perf_counter() - start
+    print(f"{f'{LARGE_MESSAGES} queued {LARGE_SIZE // 1024} KB messages':<56} "
+          f"{total / elapsed / 1024 / 1024:>10.2f} MB/s")
+
+
+def main():
+    port = _free_port()
+    node = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                tcp_port=port)
+    node.wakeup_interval = 1
+    node.add_peer("aaa://peer.gy", "realm.net")
+    node.start()
+
+    cer = CapabilitiesExchangeRequest()
+    cer.origin_host = b"peer.gy"
+    cer.origin_realm = b"realm.net"
+    cer.host_ip_address = ["127.0.0.1"]
+    cer.vendor_id = 0
+    cer.product_name = "bench"
+    cer.auth_application_id = [constants.APP_RELAY]
+    peer_socket = socket.create_connection(("127.0.0.1", port))
+    peer_socket.sendall(cer.as_bytes())
+    _read_messages(peer_socket, 1)
+
+    small_answers(node, peer_socket)
+    large_messages(node, peer_socket)
+
+    peer_socket.close()
+    node.stop(force=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure the cost of converting messages into structured output.
+
+Compares the text rendering of `dump()` against `Message.to_dict()` and the
+compact JSON produced by `serialize.to_json()`, both for messages that have
+been built in python and for freshly decoded messages, where every attribute
+is decoded by the conversion. Also measures reading the JSON back with
+`Message.from_dict()`.
+
+Run from package root:
+~# python3 benchmarks/bench_serialize.py
+"""
+import json
+
+from _fixtures import build_ccr, build_ula, measure
+
+from diameter.message import Message, dump
+from diameter.message.serialize import to_json
+
+
+def main():
+    for name, build in (("CCR", build_ccr), ("ULA", build_ula)):
+        msg = build()
+        msg_bytes = msg.as_bytes()
+        msg_json = to_json(msg)
+        print(f"{name}: {len(msg_bytes)} bytes, dump() {len(dump(msg))} "
+              f"characters, JSON {len(msg_json)} characters")
+
+        measure(f"{name} dump", lambda: dump(msg))
+        measure(f"{name} to_dict", lambda: msg.to_dict())
+        measure(f"{name} to_json", lambda: to_json(msg))
+        measure(f"{name} from_bytes + dump",
+                lambda: dump(Message.from_bytes(msg_bytes)))
+        measure(f"{name} from_bytes + to_json",
+                lambda: to_json(Message.from_bytes(msg_bytes)))
+        measure(f"{name} json.loads + from_dict",
+                lambda: Message.from_dict(json.loads(msg_json)))
+
+
+if __name__ == "__main__":
+    main()
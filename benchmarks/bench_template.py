@@ -0,0 +1,65 @@
+"""
+Measure the cost of producing CCRs from a pre-encoded template.
+
+Compares building a new `CreditControlRequest` for every message, as load
+generators typically do, and updating the changing attributes of a single
+message and re-encoding it, against rendering a `MessageTemplate` with the
+Session-Id, CC-Request-Number, Used-Service-Unit octets and the header
+identifiers as slots.
+
+Run from package root:
+~# python3 benchmarks/bench_template.py
+"""
+import itertools
+
+from _fixtures import build_ccr, measure
+
+from diameter.message import MessageTemplate
+from diameter.message.constants import *
+
+
+def main():
+    counter = itertools.count()
+    msg = build_ccr()
+    usu = msg.multiple_services_credit_control[0].used_service_unit[0]
+    template = MessageTemplate(
+        msg,
+        session_id=(AVP_SESSION_ID, 0),
+        request_number=(AVP_CC_REQUEST_NUMBER, 0),
+        octets=((AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+                (AVP_USED_SERVICE_UNIT, 0),
+                (AVP_CC_TOTAL_OCTETS, 0)))
+    print(f"CCR: {len(msg.as_bytes())} bytes")
+
+    def rebuild():
+        n = next(counter)
+        ccr = build_ccr()
+        ccr.session_id = f"pgw.example.com;1;{n}"
+        ccr.cc_request_number = n
+        ccr.header.hop_by_hop_identifier = n
+        ccr.header.end_to_end_identifier = n
+        ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = n
+        return ccr.as_bytes()
+
+    def update():
+        n = next(counter)
+        msg.session_id = f"pgw.example.com;1;{n}"
+        msg.cc_request_number = n
+        msg.header.hop_by_hop_identifier = n
+        msg.header.end_to_end_identifier = n
+        usu.cc_total_octets = n
+        return msg.as_bytes()
+
+    def render():
+        n = next(counter)
+        return template.render(
+            session_id=f"pgw.example.com;1;{n}", request_number=n,
+            octets=n, hop_by_hop_identifier=n, end_to_end_identifier=n)
+
+    measure("CCR build and encode", rebuild, number=500)
+    measure("CCR update and encode", update)
+    measure("CCR template render", render, number=20000)
+
+
+if __name__ == "__main__":
+    main()
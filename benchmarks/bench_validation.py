@@ -0,0 +1,56 @@
+"""
+Measure the cost of validating the AVPs of received requests.
+
+Compares `find_avp_violation`, which validates the entire AVP tree of the
+message, against checking only the top-level required attributes of the
+message with `getattr`, which decodes the attributes as a side effect, and
+against decoding every attribute, which validating the AVP tree through the
+attributes would require. Each run decodes a new message from bytes, as a
+node would.
+
+Run from package root:
+~# python3 benchmarks/bench_validation.py
+"""
+from _fixtures import build_ccr, measure
+
+from diameter.message import Message
+from diameter.node import find_avp_violation
+
+
+def _required_attributes(msg_bytes: bytes):
+    def validate():
+        msg = Message.from_bytes(msg_bytes)
+        return [d for d in msg.avp_def
+                if d.is_required and getattr(msg, d.attr_name) is None]
+
+    return validate
+
+
+def _every_attribute(msg_bytes: bytes):
+    def decode():
+        msg = Message.from_bytes(msg_bytes)
+        return [getattr(msg, d.attr_name) for d in msg.avp_def]
+
+    return decode
+
+
+def _find_avp_violation(msg_bytes: bytes):
+    def validate():
+        return find_avp_violation(Message.from_bytes(msg_bytes))
+
+    return validate
+
+
+def main():
+    msg_bytes = build_ccr().as_bytes()
+    measure("CCR from_bytes", lambda: Message.from_bytes(msg_bytes))
+    measure("CCR from_bytes + required attributes",
+            _required_attributes(msg_bytes))
+    measure("CCR from_bytes + every attribute",
+            _every_attribute(msg_bytes))
+    measure("CCR from_bytes + find_avp_violation",
+            _find_avp_violation(msg_bytes))
+
+
+if __name__ == "__main__":
+    main()
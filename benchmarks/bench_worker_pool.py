@@ -0,0 +1,159 @@
+"""
+Measure a threaded node through an accept storm, and with different sizes
+of its worker pool.
+
+Connects a number of plain sockets to a server node one after another, as
+peers reconnecting after a network flap would, writes a CER to each of them
+as soon as it has connected and then waits for every CEA, measuring the
+time taken and the most threads that the process held meanwhile. Then
+measures the requests per second that a client node gets answered by a
+server node over loopback TCP, for each amount of worker threads in
+`WORKER_THREADS`.
+
+Run from package root:
+~# python3 benchmarks/bench_worker_pool.py
+"""
+import resource
+import socket
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from diameter.message import Message, MessageHeader, constants
+from diameter.message.commands import (CapabilitiesExchangeRequest,
+                                       CreditControlRequest)
+from diameter.node import Node
+from diameter.node.application import SimpleThreadingApplication
+
+PEERS = 1000
+REQUESTS = 5000
+IN_FLIGHT = 32
+WORKER_THREADS = (0, 1, 4, 16)
+APP_ID = constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _cer(peer_id: int) -> bytes:
+    cer = CapabilitiesExchangeRequest()
+    cer.header.hop_by_hop_identifier = peer_id + 1
+    cer.header.end_to_end_identifier = peer_id + 1
+    cer.origin_host = f"peer{peer_id}.gy".encode()
+    cer.origin_realm = b"realm.net"
+    cer.host_ip_address = ["127.0.0.1"]
+    cer.vendor_id = 0
+    cer.product_name = "bench"
+    cer.auth_application_id = [APP_ID]
+    return cer.as_bytes()
+
+
+def _read_cea(peer_socket: socket.socket) -> Message:
+    cea = b""
+    while len(cea) < 20 or len(cea) < MessageHeader.from_bytes(cea).length:
+        cea += peer_socket.recv(4096)
+    return Message.from_bytes(cea)
+
+
+def _answer(app, message: Message) -> Message:
+    return app.generate_answer(
+        message, result_code=constants.E_RESULT_CODE_DIAMETER_SUCCESS)
+
+
+def accept_storm():
+    port = _free_port()
+    server = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                  tcp_port=port)
+    server.wakeup_interval = 1
+    server.add_application(
+        SimpleThreadingApplication(APP_ID, is_auth_application=True,
+                                   request_handler=_answer),
+        [server.add_peer(f"aaa://peer{i}.gy", "realm.net")
+         for i in range(PEERS)])
+    server.start()
+
+    cers = [_cer(i) for i in range(PEERS)]
+    most_threads = threading.active_count()
+    start = time.perf_counter()
+    sockets = []
+    for cer in cers:
+        peer_socket = socket.create_connection(("127.0.0.1", port))
+        peer_socket.sendall(cer)
+        sockets.append(peer_socket)
+        most_threads = max(most_threads, threading.active_count())
+    for peer_socket in sockets:
+        cea = _read_cea(peer_socket)
+        assert cea.result_code == constants.E_RESULT_CODE_DIAMETER_SUCCESS
+        most_threads = max(most_threads, threading.active_count())
+    elapsed = time.perf_counter() - start
+
+    print(f"{f'accept storm, {PEERS} peers':<56} "
+          f"{elapsed * 1000:>10.0f} ms, {most_threads:>5} threads")
+
+    for peer_socket in sockets:
+        peer_socket.close()
+    server.stop(force=True)
+
+
+def _ccr(node: Node, request_number: int) -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.session_id = node.session_generator.next_id()
+    ccr.origin_host = node.origin_host.encode()
+    ccr.origin_realm = node.realm_name.encode()
+    ccr.destination_realm = b"realm.net"
+    ccr.auth_application_id = APP_ID
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = request_number
+    return ccr
+
+
+def throughput(worker_threads: int):
+    port = _free_port()
+    server = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                  tcp_port=port)
+    server_app = SimpleThreadingApplication(
+        APP_ID, is_auth_application=True, request_handler=_answer)
+    server.add_application(
+        server_app, [server.add_peer("aaa://client.gy", "realm.net")])
+    client = Node("client.gy", "realm.net")
+    client_app = SimpleThreadingApplication(APP_ID, is_auth_application=True)
+    client.add_application(client_app, [client.add_peer(
+        f"aaa://server.gy:{port}", "realm.net", ["127.0.0.1"],
+        is_persistent=True)])
+    for node in (server, client):
+        node.wakeup_interval = 1
+        node.worker_threads = worker_threads
+        node.start()
+    client_app.wait_for_ready(5)
+
+    def send(request_number: int):
+        return client_app.send_request(_ccr(client, request_number), 10)
+
+    with ThreadPoolExecutor(IN_FLIGHT) as executor:
+        start = time.perf_counter()
+        answers = list(executor.map(send, range(REQUESTS)))
+        elapsed = time.perf_counter() - start
+    assert len(answers) == REQUESTS
+
+    client.stop(force=True)
+    server.stop(force=True)
+    print(f"{f'{worker_threads} worker threads, {IN_FLIGHT} requests in flight':<56} "
+          f"{REQUESTS / elapsed:>10.0f} req/s")
+
+
+def main():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    accept_storm()
+    for worker_threads in WORKER_THREADS:
+        throughput(worker_threads)
+
+
+if __name__ == "__main__":
+    main()
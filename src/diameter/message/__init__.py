@@ -5,6 +5,8 @@ This module contains the base functions for encoding and decoding diameter
 message headers and messages.
 """
 from ._base import Message, MessageHeader, DefinedMessage, UndefinedMessage
+from ._base import peek_avps
+from .template import MessageTemplate
 from .avp import Avp, AvpGrouped
 
 
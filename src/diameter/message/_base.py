@@ -1,10 +1,55 @@
 from __future__ import annotations
 
+import struct
+
 from typing import TypeVar, Type, Any
 
-from .avp import Avp, AvpGrouped
-from .avp.generator import AvpGenType, generate_avps_from_defs
-from .packer import Packer, Unpacker
+from .avp import Avp, AvpGrouped, AvpPath
+from .avp.avp import AvpListChanges
+from .avp.generator import (AvpGenType, copy_attr_value,
+                            generate_avps_from_def, generate_avps_from_plan,
+                            pack_avps_from_defs)
+from .packer import CONVERSION_ERRORS, ConversionError, RawPacker, RawUnpacker
+
+
+_HEADER = struct.Struct(">5L")
+_AVP_HEADER = struct.Struct(">2L")
+_AVP_VENDOR_ID = struct.Struct(">L")
+
+# The request and answer classes of each command class, and the answer class
+# of each request class, recorded as the classes are defined; see
+# `Message.__init_subclass__`
+_REQUEST_ANSWER_TYPES: dict[type, dict[bool, type]] = {}
+_ANSWER_TYPES: dict[type, type] = {}
+
+
+def _answer_type_by_name(request_type: type) -> type:
+    # base scenario, it's either a Message or one of its immediate
+    # subclasses that have no python implementation yet
+    cls_name = request_type.__name__
+    if not cls_name.endswith("Request"):
+        return request_type
+
+    # going up the ancestor tree and then looking up every subclass of the
+    # first matching parent, returning the first subclass that ends with
+    # "Answer". I.e. CreditControlRequest -> CreditControl ->
+    # CreditControlAnswer. Another instance of "Request" is never returned
+    assumed_base = cls_name[:-7]
+    for cls in request_type.__mro__:
+        if cls.__name__ == assumed_base:
+            for subcls in cls.__subclasses__():
+                if subcls.__name__ == f"{assumed_base}Answer":
+                    return subcls
+            return cls
+    return Message
+
+# The attribute names of the `avp_def` of each defined message class, along
+# with the `avp_def` that they were collected from
+_DEFINED_ATTR_NAMES: dict[type, tuple[AvpGenType, frozenset[str]]] = {}
+
+# Attributes of defined messages that can be set without changing the packed
+# AVPs of the message
+_PACKING_ATTR_NAMES = frozenset(("header", "_avp_index", "_packed_avps"))
 
 
 class Message:
@@ -34,9 +79,36 @@ class Message:
             using the [as_bytes][diameter.message.Message.as_bytes] method.
         """
         self._avps: list[Avp] = avps or []
-        self.__find_cache = {}
+        self._avp_index: tuple | None = None
+        self._packed_avps: tuple[list[Avp], bytes] | None = None
+        self._avp_changes: AvpListChanges = AvpListChanges()
         self.__post_init__()
 
+    def __init_subclass__(cls, is_request: bool | None = None, **kwargs):
+        """Record the request and answer classes of a command.
+
+        A subclass that implements either the requests or the answers of a
+        command declares it with an `is_request` class keyword. The command
+        is the class that it extends:
+
+            >>> class SpecialMessageRequest(SpecialMessage, is_request=True):
+            >>>     ...
+            >>> class SpecialMessageAnswer(SpecialMessage, is_request=False):
+            >>>     ...
+
+        Received messages of the command are then created as instances of
+        these classes, and [Message.to_answer][diameter.message.Message.to_answer]
+        creates answers as instances of the answer class.
+        """
+        super().__init_subclass__(**kwargs)
+        if is_request is None:
+            return
+        command_type = cls.__mro__[1]
+        types = _REQUEST_ANSWER_TYPES.setdefault(command_type, {})
+        types[is_request] = cls
+        if True in types:
+            _ANSWER_TYPES[types[True]] = types.get(False, command_type)
+
     def __str__(self) -> str:
         return f"{self.name} {self.header}"
 
@@ -51,19 +123,56 @@ class Message:
         length is still zero. The header length is updated every time
         `as_bytes()` is called.
         """
-        header_length = 20  # constant value
-
-        # header needs to record the entire length of the message, so AVPs have
-        # to be encoded first
-        avp_packer = Packer()
-        for avp in self.avps:
-            avp.as_packed(avp_packer)
-        avp_bytes = avp_packer.get_buffer()
-        self.header.length = header_length + len(avp_bytes)
-
-        return self.header.as_bytes() + avp_bytes
-
-    def find_avps(self, *code_and_vendor: tuple[int, int],
+        # header needs to record the entire length of the message, which is
+        # known only after the AVPs have been encoded; the AVPs are packed
+        # right after the header and the length is filled in afterwards
+        packer = RawPacker()
+        try:
+            self.header.as_packed(packer)
+            self._pack_avps(packer)
+            self.header.length = packer.get_position()
+            packer.pack_uint_at(
+                0, (self.header.version << 24) | self.header.length)
+        except CONVERSION_ERRORS as e:
+            raise ConversionError(e.args[0]) from None
+
+        return packer.get_buffer()
+
+    def invalidate(self):
+        """Discard the AVPs packed by the last call to `as_bytes`.
+
+        The packed AVPs are re-used by the next call to `as_bytes`, for as
+        long as no attribute is set and no AVP in the message is changed.
+        Values that are changed in place, e.g. an item appended to a list
+        attribute, or an attribute set in a grouped AVP instance, are not
+        noticed, and the message must be told about them:
+
+            >>> ccr.multiple_services_credit_control[0].rating_group = 200
+            >>> ccr.invalidate()
+            >>> ccr_bytes = ccr.as_bytes()
+        """
+        self._packed_avps = None
+
+    def _pack_avps(self, packer: RawPacker):
+        # the packed AVPs are kept along with the list of AVPs that they were
+        # packed from, and re-used for as long as the list holds the same
+        # AVPs and none of them, or of their sub-AVPs, has marked the message
+        # as changed
+        avps = self.avps
+        changes = self._avp_changes
+        packed_avps = self._packed_avps
+        if (packed_avps is None or changes.changed or changes.shared
+                or packed_avps[0] != avps):
+            avp_packer = RawPacker()
+            for avp in avps:
+                changes.adopt(avp)
+                avp.as_packed(avp_packer)
+            changes.changed = False
+            packed_avps = self._packed_avps = (list(avps),
+                                               avp_packer.get_buffer())
+        packer.get_bytearray().extend(packed_avps[1])
+
+    def find_avps(self, *code_and_vendor: tuple[int, int] | AvpPath | str,
                   alt_list: list[Avp] = None) -> list[Avp]:
         """Find specific AVPs in the message internal AVP tree.
 
@@ -90,8 +199,18 @@ class Message:
             >>> print(avp[0])
             CC-Total-Octets <Code: 0x1a5, Flags: 0x40 (-M-), Length: 16, Val: 0>
 
-            The search is cached internally, repeating the same find operation will
-            return a cached result.
+            The same chain can also be given as a single
+            [AvpPath][diameter.message.avp.path.AvpPath], or as a string of
+            AVP names, which is converted to an `AvpPath`:
+
+            >>> path = AvpPath("MSCC/USU/CC-Total-Octets")
+            >>> avp = msg.find_avps(path)
+            >>> avp = msg.find_avps("Multiple-Services-Credit-Control/Used-Service-Unit/CC-Total-Octets")
+
+            The top-level AVPs of the message are indexed by their code and
+            vendor ID on the first search, and the index is reused by every
+            following search, until the AVPs of the message are changed. Only
+            the grouped AVPs along the chain are decoded and searched through.
 
         !!! Note
             Searching for AVPs can be somewhat resource intensive,
@@ -111,20 +230,48 @@ class Message:
         """
         if not code_and_vendor:
             return []
+        path = code_and_vendor
+        if len(path) == 1 and isinstance(path[0], (AvpPath, str)):
+            path = AvpPath(path[0])
 
-        path = "/".join(f"{c}_{v}" for c, v in code_and_vendor)
-        if path in self.__find_cache:
-            return self.__find_cache[path]
-
-        avp_list = self.avps
         if alt_list is not None:
-            avp_list = alt_list
+            return _traverse_avp_tree(alt_list, path)
 
-        result = _traverse_avp_tree(avp_list, list(code_and_vendor))
-        self.__find_cache[path] = result
+        found = self._find_top_level_avps(path[0])
+        if len(path) == 1:
+            return found
 
+        result = []
+        for avp in found:
+            if isinstance(avp, AvpGrouped):
+                result += _traverse_avp_tree(avp.value, path[1:])
+            else:
+                # cannot go further anyway
+                result.append(avp)
         return result
 
+    def _find_top_level_avps(self, code_and_vendor: tuple[int, int]
+                             ) -> list[Avp]:
+        return self._indexed_avps(self.avps, code_and_vendor)
+
+    def _indexed_avps(self, avps: list[Avp], code_and_vendor: tuple[int, int]
+                      ) -> list[Avp]:
+        # AVPs are indexed by their code and vendor ID. The index is kept
+        # along with the identities of the AVPs that it was built from, and
+        # rebuilt if the list has been replaced, or if any AVP has been
+        # added, removed, replaced or moved since. The index references the
+        # AVPs, so that their identities are not re-used meanwhile
+        avp_ids = tuple(map(id, avps))
+        index = self._avp_index
+        if index is None or index[0] is not avps or index[1] != avp_ids:
+            by_code_and_vendor = {}
+            for avp in avps:
+                by_code_and_vendor.setdefault(
+                    (avp.code, avp.vendor_id), []).append(avp)
+            index = (avps, avp_ids, by_code_and_vendor)
+            self._avp_index = index
+        return list(index[2].get(code_and_vendor, ()))
+
     @classmethod
     def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
         """Generate a type that should be used to create new instances.
@@ -135,17 +282,81 @@ class Message:
         message class to generate, e.g. in order to produce different types
         for "Request" and "Answer" messages, based on the given header.
 
-        If no type is returned, the base class type will be used.
+        By default, returns the request or the answer class declared for the
+        command with the `is_request` class keyword, if there is one. If no
+        type is returned, the base class type will be used.
+
+        !!! Note
+            Received messages of commands that do not override this method
+            are dispatched through a table of command codes, and this method
+            is not called for each message.
+        """
+        types = _REQUEST_ANSWER_TYPES.get(cls)
+        if types is None:
+            return None
+        return types.get(header.is_request)
+
+    def copy(self, deep: bool = False) -> _AnyMessageType:
+        """Create a copy of the message.
+
+        The copy has its own header, its own instance attributes and its own
+        AVP lists, and can be altered without altering the original message.
+        A shallow copy shares the AVPs and the grouped AVP instances held by
+        its attributes with the original message, a deep copy receives
+        copies of them as well:
+
+            >>> forwarded = request.copy(deep=True)
+            >>> forwarded.header.hop_by_hop_identifier = 2
+            >>> forwarded.route_record.append(b"dra.mno.net")
+
+        Nothing is encoded or decoded. AVPs are copied with
+        [Avp.copy][diameter.message.avp.Avp.copy], which shares their payload
+        bytes, and received AVPs that have not been decoded yet are copied
+        without being decoded.
         """
-        return None
+        msg = self.__class__.__new__(self.__class__)
+        attrs = msg.__dict__
+        for name, value in self.__dict__.items():
+            # the copy has not been received from anywhere
+            if name != "_received_avps":
+                attrs[name] = copy_attr_value(value, deep)
+        hdr = self.header
+        msg.header = MessageHeader(
+            hdr.version, hdr.length, hdr.command_flags, hdr.command_code,
+            hdr.application_id, hdr.hop_by_hop_identifier,
+            hdr.end_to_end_identifier)
+        msg._avp_index = None
+        msg._packed_avps = None
+        msg._avp_changes = AvpListChanges()
+        deferred = attrs.get("_deferred_attrs")
+        if deferred:
+            attrs["_deferred_attrs"] = self._copy_deferred_attrs(deferred, deep)
+        return msg
+
+    def _copy_deferred_attrs(self, deferred: dict, deep: bool) -> dict:
+        return {name: copy_attr_value(avps, deep)
+                for name, avps in deferred.items()}
+
+    def __copy__(self) -> _AnyMessageType:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> _AnyMessageType:
+        return self.copy(deep=True)
 
     def to_answer(self) -> _AnyMessageType:
         """Produce answer from a request.
 
         Copies the request message header to a new answer message, clearing all
-        the flags except the proxyable bit. Attempts to by determine if a
-        suitable python Answer class exists, if not, uses the base class and
-        returns a new instance with the copied header.
+        the flags except the proxyable bit. The answer is an instance of the
+        answer class declared for the command of the request, or of the
+        command class itself if the command has no answer class.
+
+        For commands that declare no request and answer classes, a suitable
+        python Answer class is searched for by name, i.e. an `XAnswer`
+        subclass of the `X` command class of an `XRequest`. If there is none,
+        the command class is used, or the base `Message` class, but never a
+        Request class. Messages that are not requests produce an instance of
+        their own class.
         """
         hdr = MessageHeader(
             self.header.version,
@@ -156,36 +367,21 @@ class Message:
 
         hdr.is_proxyable = self.header.is_proxyable
 
-        # base scenario, it's either a Message or one of its immediate
-        # subclasses that have no python implementation yet
-        return_type = self.__class__
-
-        cls_name = return_type.__name__
-        if cls_name.endswith("Request"):
-            # just in case the rest fails, ensure that we will not return
-            # another instance of "Request"
-            return_type = Message
-
-            # going up the ancestor tree and then looking up every subclass of
-            # the first matching parent, returning the first subclass that ends
-            # with "Answer". I.e.
-            # CreditControlRequest -> CreditControl -> CreditControlAnswer
-            assumed_base = cls_name[:-7]
-            for cls in self.__class__.__mro__:
-                if cls.__name__ == assumed_base:
-                    return_type = cls
-                    for subcls in cls.__subclasses__():
-                        if subcls.__name__ == f"{assumed_base}Answer":
-                            return_type = subcls
-                            break
-                    break
+        return_type = _ANSWER_TYPES.get(self.__class__)
+        if return_type is None and self.__class__ not in _REQUEST_ANSWER_TYPES:
+            # commands that do not declare their request and answer classes
+            # may still produce them through their own type factory
+            return_type = self.type_factory(hdr)
+        if return_type is None:
+            return_type = _answer_type_by_name(self.__class__)
         try:
             return return_type(hdr)
         except NameError:
             return Message(hdr)
 
     @classmethod
-    def from_bytes(cls, msg_data: bytes, plain_msg: bool = False) -> _AnyMessageType:
+    def from_bytes(cls, msg_data: bytes, plain_msg: bool = False,
+                   zero_copy: bool = False) -> _AnyMessageType:
         """Generate a new Message from network received bytes.
 
         Accepts a byte string containing received network data and constructs a
@@ -214,35 +410,100 @@ class Message:
             >>> session_id.value
             labocs1.gy;379;3434872354
 
+        If `zero_copy` is set to True, or if `msg_data` is already a
+        `memoryview`, the AVPs do not receive a copy of their payload. Instead,
+        every AVP, at every nesting level, holds a `memoryview` slice into
+        the original buffer, and a copy is made only when an AVP `payload` or
+        an octet string value is read. This makes decoding large messages
+        with deeply nested grouped AVPs cheaper, but the original buffer is
+        kept alive for as long as any of the AVPs are, and it must not be
+        modified after the message has been decoded.
+
+            >>> msg = Message.from_bytes(b"...", zero_copy=True)
+
         """
+        if zero_copy and msg_data.__class__ is not memoryview:
+            msg_data = memoryview(msg_data)
         header = MessageHeader.from_bytes(msg_data)
-        if header.command_code in all_commands:
-            cmd_type = all_commands[header.command_code]
-            if plain_msg:
-                msg_type = cmd_type
-            else:
-                # Each command may choose to return something else, e.g. a
-                # subclass that differentiates between a request and a
-                # response. If the command factory does nothing, the command
-                # itself will be the type of message instance.
-                msg_type = cmd_type.type_factory(header)
-                if msg_type is None:
-                    msg_type = cmd_type
+        if plain_msg:
+            msg_type = all_commands.get(header.command_code, UndefinedMessage)
         else:
-            # Fall back on just producing a generic Diameter message instance
-            msg_type = UndefinedMessage
-
-        unpacker = Unpacker(msg_data)
+            # Each command may choose to return something else, e.g. a
+            # subclass that differentiates between a request and a response;
+            # resolved once per command code and request flag
+            msg_type = all_commands.message_types.get(
+                (header.command_code, header.is_request))
+            if msg_type is None:
+                msg_type = all_commands.message_type(header)
+
+        unpacker = RawUnpacker(msg_data)
         unpacker.set_position(header.length_header)
 
         avps = []
-        while not unpacker.is_done():
-            avps.append(Avp.from_unpacker(unpacker))
+        try:
+            while not unpacker.is_done():
+                avps.append(Avp.from_unpacker(unpacker))
+        except CONVERSION_ERRORS as e:
+            raise ConversionError(e.args[0]) from None
 
         msg = msg_type(header, avps)
 
         return msg
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the message into a dictionary of JSON compatible values.
+
+        Intended for structured logging and for passing messages on to other
+        services. The dictionary contains the message header, and either the
+        message instance attributes, for messages that have a python
+        implementation, or the AVPs of the message. Received messages are
+        always converted from their AVPs, as encoded, so that the flags of
+        each received AVP are kept, and have `received` set:
+
+            >>> ccr.to_dict()
+            {'name': 'Credit-Control',
+             'header': {'version': 1, 'flags': 192, 'command_code': 272,
+                        'application_id': 4, 'hop_by_hop_identifier': 10001,
+                        'end_to_end_identifier': 20001},
+             'attributes': {'session_id': 'pgw.mno.net;1;1',
+                            'origin_host': '7067772e6d6e6f2e6e6574', ...,
+                            'multiple_services_credit_control': [
+                                {'used_service_unit': [
+                                    {'cc_total_octets': 1024}], ...}]},
+             'avps': [{'code': 9999, 'flags': 128, 'vendor': 10415,
+                       'payload': '01'}]}
+
+        Attribute values and AVPs are converted in the same way as with
+        [avp_to_dict][diameter.message.serialize.avp_to_dict]. Attributes
+        that are not set are left out. AVPs that are not part of the message
+        attributes are listed as `avps`, and the same applies to the
+        `additional_avps` of grouped AVPs.
+
+        The conversion is lossless, a message created with
+        [Message.from_dict][diameter.message.Message.from_dict] produces the
+        same bytes as the original message. See also the
+        [serialize][diameter.message.serialize] module for conversion to and
+        from JSON.
+        """
+        return message_to_dict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _AnyMessageType:
+        """Create a new message from a dictionary.
+
+        Accepts dictionaries produced by
+        [Message.to_dict][diameter.message.Message.to_dict] and returns an
+        instance of the same message type, as
+        [Message.from_bytes][diameter.message.Message.from_bytes] would.
+
+        Raises:
+            ValueError: If the dictionary contains attributes that are not
+                known for the message type, or AVPs that are not known and
+                have no payload.
+            AvpEncodeError: If an AVP value is not valid for its AVP type.
+        """
+        return message_from_dict(data)
+
     @property
     def avps(self) -> list[Avp]:
         return self._avps
@@ -250,13 +511,19 @@ class Message:
     @avps.setter
     def avps(self, new_avps: list[Avp]):
         self._avps = new_avps
+        self._avp_index = None
 
     def append_avp(self, avp: Avp):
         """Add an AVP to the internal list of AVPs."""
         self._avps.append(avp)
+        self._avp_index = None
 
 
 class MessageHeader:
+    __slots__ = ("version", "length", "length_header", "command_flags",
+                 "command_code", "application_id", "hop_by_hop_identifier",
+                 "end_to_end_identifier")
+
     command_flag_request_bit: int = 0x80
     command_flag_proxiable_bit: int = 0x40
     command_flag_error_bit: int = 0x20
@@ -286,9 +553,16 @@ class MessageHeader:
         return [f for f in checked if getattr(self, f"is_{f}")]
 
     def as_bytes(self) -> bytes:
-        return self.as_packed(Packer()).get_buffer()
-
-    def as_packed(self, packer: Packer) -> Packer:
+        try:
+            return _HEADER.pack(
+                (self.version << 24) | self.length,
+                (self.command_flags << 24) | self.command_code,
+                self.application_id, self.hop_by_hop_identifier,
+                self.end_to_end_identifier)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def as_packed(self, packer: RawPacker) -> RawPacker:
         packer.pack_uint((self.version << 24) | self.length)
         packer.pack_uint((self.command_flags << 24) | self.command_code)
         packer.pack_uint(self.application_id)
@@ -298,24 +572,21 @@ class MessageHeader:
 
     @classmethod
     def from_bytes(cls, header_data: bytes) -> MessageHeader:
-        unpacker = Unpacker(header_data)
-
-        version_msglen = unpacker.unpack_uint()
-        flags_cc = unpacker.unpack_uint()
+        try:
+            (version_msglen, flags_cc, application_id, hop_by_hop_identifier,
+             end_to_end_identifier) = _HEADER.unpack_from(header_data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
 
         version = version_msglen >> 24
         length = version_msglen & 0x00ffffff
         command_flags = flags_cc >> 24
         command_code = flags_cc & 0x00ffffff
 
-        application_id = unpacker.unpack_uint()
-        hop_by_hop_identifier = unpacker.unpack_uint()
-        end_to_end_identifier = unpacker.unpack_uint()
-
         hdr = MessageHeader(version, length, command_flags, command_code,
                             application_id, hop_by_hop_identifier,
                             end_to_end_identifier)
-        hdr.length_header = unpacker.get_position()
+        hdr.length_header = _HEADER.size
         return hdr
 
     @property
@@ -372,16 +643,36 @@ class DefinedMessage(Message):
     The attribute values can be changed. When a `DefinedMessage` instance is
     converted back to bytes, appropriate AVPs are generated based on the set
     instance attributes.
+
+    For messages parsed from network-received bytes, the attributes are
+    populated lazily; the AVPs belonging to an attribute are decoded only when
+    the attribute is accessed for the first time, or when the message is
+    converted back to AVPs or bytes.
     """
     avp_def: AvpGenType = ()
 
     def __getattr__(self, name: str) -> Any:
-        for avp_def in self.avp_def:
-            if avp_def.attr_name == name:
-                return None
+        if resolve_deferred_attr(self, name):
+            return self.__dict__[name]
+        # attributes that are defined but not set read as None; encoding a
+        # message looks up every one of them
+        avp_def = self.avp_def
+        attr_names = _DEFINED_ATTR_NAMES.get(self.__class__)
+        if attr_names is None or attr_names[0] is not avp_def:
+            attr_names = _DEFINED_ATTR_NAMES[self.__class__] = (
+                avp_def, frozenset(gen_def.attr_name for gen_def in avp_def))
+        if name in attr_names[1]:
+            return None
         raise AttributeError(
             f"{self.__class__.__name__} has no attribute {name}")
 
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        # any attribute may be one that AVPs are packed from, except for the
+        # ones that keep track of the packed AVPs themselves
+        if name not in _PACKING_ATTR_NAMES:
+            self.__dict__["_packed_avps"] = None
+
     def __post_init__(self):
         self._additional_avps: list[Avp] = []
 
@@ -396,21 +687,118 @@ class DefinedMessage(Message):
         """
         if self._avps:
             return self._avps
-        defined_avps = generate_avps_from_defs(self)
+        received = self._undecoded_avps()
+        if received:
+            for avps in received.values():
+                self._track_received_avps(avps)
+        defined_avps = generate_avps_from_plan(self, received=received)
         return defined_avps + self._additional_avps
 
     @avps.setter
     def avps(self, new_avps: list[Avp]):
         """Overwrites the list of custom AVPs."""
         self._additional_avps = new_avps
+        self._avp_index = None
 
     def append_avp(self, avp: Avp):
         """Add an individual custom AVP."""
         self._additional_avps.append(avp)
+        self._avp_index = None
+
+    def _copy_deferred_attrs(self, deferred: dict, deep: bool) -> dict:
+        # each entry holds the value that the attribute had before it was
+        # deferred, and the received AVPs with their decode steps
+        if not deep:
+            return {name: (copy_attr_value(original), avps)
+                    for name, (original, avps) in deferred.items()}
+        return {name: (copy_attr_value(original, True),
+                       [(step, avp.copy(deep=True)) for step, avp in avps])
+                for name, (original, avps) in deferred.items()}
+
+    def _find_top_level_avps(self, code_and_vendor: tuple[int, int]
+                             ) -> list[Avp]:
+        # Instead of producing the entire AVP list, only the attribute that
+        # the AVP maps to is looked at. If the attribute has not been decoded
+        # yet, its received AVPs are returned as they are, otherwise only the
+        # AVPs of that one attribute are generated. Custom AVPs are indexed.
+        if self._avps:
+            return super()._find_top_level_avps(code_and_vendor)
+
+        found = []
+        step = get_decode_plan(self).steps.get(code_and_vendor)
+        if step is not None:
+            attr_name = step.attr_name
+            deferred = self.__dict__.get("_deferred_attrs")
+            if (deferred and attr_name in deferred and
+                    attr_name not in self.__dict__):
+                found = [avp for _, avp in deferred[attr_name][1]]
+                self._track_received_avps(found)
+            else:
+                found = generate_avps_from_def(
+                    step.gen_def, getattr(self, attr_name, None))
+
+        if self._additional_avps:
+            found += self._indexed_avps(self._additional_avps, code_and_vendor)
+        return found
+
+    def _track_received_avps(self, avps: list[Avp]):
+        # Received AVPs that have not been decoded are packed as they are.
+        # Once handed out, they may be changed in place, which then has to
+        # mark the message as changed
+        changes = self._avp_changes
+        for avp in avps:
+            changes.adopt(avp)
+
+    def _undecoded_avps(self) -> dict[str, list[Avp]] | None:
+        # Received AVPs of the attributes that have been neither accessed nor
+        # set since the message was received. They are packed again as they
+        # are, so that encoding a received message costs only as much as the
+        # attributes that have been accessed or changed.
+        deferred = self.__dict__.get("_deferred_attrs")
+        if not deferred:
+            return None
+        instance_attrs = self.__dict__
+        return {name: [avp for _, avp in avps]
+                for name, (_, avps) in deferred.items()
+                if name not in instance_attrs}
+
+    def _pack_avps(self, packer: RawPacker):
+        if self._avps:
+            super()._pack_avps(packer)
+            return
+        # The packed AVPs are re-used until an attribute is set, the custom
+        # AVPs are replaced, or one of the AVPs packed as they are, i.e.
+        # custom AVPs and received AVPs that have been handed out, marks the
+        # message as changed. Values changed in place are not noticed, see
+        # `invalidate`
+        additional_avps = self._additional_avps
+        changes = self._avp_changes
+        packed_avps = self._packed_avps
+        if (packed_avps is None or changes.changed or changes.shared
+                or packed_avps[0] != additional_avps):
+            avp_packer = RawPacker()
+            pack_avps_from_defs(self, avp_packer,
+                                received=self._undecoded_avps())
+            for avp in additional_avps:
+                changes.adopt(avp)
+                avp.as_packed(avp_packer)
+            changes.changed = False
+            packed_avps = self._packed_avps = (list(additional_avps),
+                                               avp_packer.get_buffer())
+        packer.get_bytearray().extend(packed_avps[1])
 
 
 class UndefinedGroupedAvp:
-    pass
+    """A holder for the sub-AVPs of a grouped AVP in an `UndefinedMessage`.
+
+    The sub-AVPs are converted into instance attributes in the same way as
+    for `UndefinedMessage`, lazily when accessed.
+    """
+    def __init__(self, avps: list[Avp] = None):
+        _defer_undefined_attrs(self, avps or [])
+
+    def __getattr__(self, name: str) -> Any:
+        return _resolve_undefined_attr(self, name)
 
 
 class UndefinedMessage(Message):
@@ -432,6 +820,9 @@ class UndefinedMessage(Message):
     `UndefinedGroupedAvp` and its sub-AVPs are set as instance attributes as
     well.
 
+    The AVP values are decoded only when the corresponding instance attribute
+    is accessed for the first time.
+
     !!! Note
         Unlike `DefinedMessage`, instances of this class cannot be converted
         back to bytes; there is no conversion of set instance attributes into
@@ -439,7 +830,10 @@ class UndefinedMessage(Message):
 
     """
     def __post_init__(self):
-        self._assign_attr_values(self, self.avps)
+        _defer_undefined_attrs(self, self.avps)
+
+    def __getattr__(self, name: str) -> Any:
+        return _resolve_undefined_attr(self, name)
 
     def _assign_attr_values(self, parent: UndefinedMessage | UndefinedGroupedAvp,
                             avps: list[Avp]):
@@ -465,11 +859,42 @@ class UndefinedMessage(Message):
         return attr_name
 
 
+def _defer_undefined_attrs(obj: UndefinedMessage | UndefinedGroupedAvp,
+                           avps: list[Avp]):
+    """Index AVPs by their naive attribute name, without decoding them."""
+    deferred: dict[str, list[Avp]] = {}
+    for avp in avps:
+        attr_name = avp.name.replace("-", "_").lower()
+        deferred.setdefault(attr_name, []).append(avp)
+    obj.__dict__["_deferred_attrs"] = deferred
+
+
+def _resolve_undefined_attr(obj: UndefinedMessage | UndefinedGroupedAvp,
+                            name: str) -> Any:
+    """Decode and assign an attribute indexed by `_defer_undefined_attrs`."""
+    deferred = obj.__dict__.get("_deferred_attrs")
+    if not deferred or name not in deferred:
+        raise AttributeError(
+            f"{obj.__class__.__name__} has no attribute {name}")
+
+    values = []
+    for avp in deferred.pop(name):
+        if isinstance(avp, AvpGrouped):
+            values.append(UndefinedGroupedAvp(avp.value))
+        else:
+            values.append(avp.value)
+
+    value = values[0] if len(values) == 1 else values
+    setattr(obj, name, value)
+    return value
+
+
 _AnyMessageType = TypeVar("_AnyMessageType", bound=Message)
 
 
 def _traverse_avp_tree(avps: list[Avp],
-                       code_and_vendor_path: list[tuple[int, int]]) -> list[Avp]:
+                       code_and_vendor_path: tuple[tuple[int, int], ...]
+                       ) -> list[Avp]:
     """Recursively travel AVP tree until a matching code and vendor is found.
 
     Returns the AVP or AVPs at the end(s) of the travelled chain(s).
@@ -490,4 +915,72 @@ def _traverse_avp_tree(avps: list[Avp],
     return found
 
 
+def peek_avps(msg_data: bytes, *code_and_vendor: tuple[int, int]
+              ) -> tuple[MessageHeader, dict[tuple[int, int], Any]]:
+    """Read the message header and selected top-level AVPs from raw bytes.
+
+    A much cheaper alternative to
+    [Message.from_bytes][diameter.message.Message.from_bytes], for cases
+    where only a few AVPs are needed, e.g. for routing a message or deciding
+    whether to accept it, before it is fully decoded. Only the AVP headers
+    at the top level of the message are read. The value is decoded only for
+    the AVPs that are asked for, and the contents of any other AVP, grouped
+    or not, are skipped without being looked at.
+
+    The scan stops as soon as every requested AVP has been found. If an AVP
+    appears more than once, only its first occurrence is returned.
+
+        >>> header, values = peek_avps(
+        >>>     msg_bytes, (AVP_SESSION_ID, 0), (AVP_DESTINATION_REALM, 0))
+        >>> values[(AVP_DESTINATION_REALM, 0)]
+        b'mvno.net'
+
+    Args:
+        msg_data: Network received bytes of a single, entire message
+        code_and_vendor: AVP code and vendor ID pairs to look for
+
+    Returns:
+        A tuple of the message header and a dictionary of AVP values,
+            indexed by their AVP code and vendor ID pair. AVPs that are not
+            present in the message are not present in the dictionary either.
+
+    Raises:
+        ConversionError: If the message header or the AVP headers cannot be
+            parsed.
+        AvpDecodeError: If the value of a requested AVP cannot be decoded.
+    """
+    header = MessageHeader.from_bytes(msg_data)
+    wanted = set(code_and_vendor)
+    found = {}
+
+    position = header.length_header
+    end = min(header.length, len(msg_data))
+    try:
+        while position < end and len(found) < len(wanted):
+            avp_code, flags_len = _AVP_HEADER.unpack_from(msg_data, position)
+            avp_length = flags_len & 0x00ffffff
+            if avp_length < 8:
+                raise ValueError(
+                    f"AVP at position {position} has an invalid length "
+                    f"{avp_length}")
+            avp_vendor_id = 0
+            if (flags_len >> 24) & Avp.avp_flag_vendor:
+                avp_vendor_id = _AVP_VENDOR_ID.unpack_from(
+                    msg_data, position + 8)[0]
+
+            key = (avp_code, avp_vendor_id)
+            if key in wanted and key not in found:
+                unpacker = RawUnpacker(msg_data)
+                unpacker.set_position(position)
+                found[key] = Avp.from_unpacker(unpacker).value
+
+            position += (avp_length + 3) & ~3
+    except CONVERSION_ERRORS as e:
+        raise ConversionError(e.args[0]) from None
+
+    return header, found
+
+
 from .commands import all_commands
+from .commands._attributes import get_decode_plan, resolve_deferred_attr
+from .serialize import message_from_dict, message_to_dict
@@ -7,6 +7,8 @@ from . import errors
 from . import generator
 
 from .avp import (Avp, AvpAddress, AvpEnumerated, AvpFloat32, AvpFloat64,
-                  AvpGrouped, AvpInteger32, AvpInteger64, AvpUnsigned32,
-                  AvpUnsigned64, AvpOctetString, AvpTime, AvpUtf8String)
+                  AvpGrouped, AvpInteger32, AvpInteger64, AvpList,
+                  AvpUnsigned32, AvpUnsigned64, AvpOctetString, AvpTime,
+                  AvpUtf8String)
 from .errors import AvpDecodeError, AvpEncodeError
+from .path import AvpPath
@@ -7,13 +7,19 @@ import datetime
 import socket
 import struct
 
-from typing import Any, TypeVar, Type
+from typing import Any, Iterable, TypeVar, Type
 
 from ..constants import VENDORS
-from ..packer import ConversionError, Packer, Unpacker
+from ..packer import CONVERSION_ERRORS, ConversionError, RawPacker, RawUnpacker
 from .errors import AvpDecodeError, AvpEncodeError
 
 
+ZERO_COPY_MIN_LENGTH = 128
+"""When decoding from a `memoryview`, AVP payloads shorter than this are
+copied as `bytes` instead of being kept as a view, as a `memoryview` instance
+is larger than a copy of a short value."""
+
+
 class Avp:
     """A generic AVP type.
 
@@ -54,6 +60,9 @@ class Avp:
         Acct-Input-Packets <Code: 0x2f, Flags: 0x00 (---), Length: 12, Val: 17347878>
 
     """
+    __slots__ = ("_avp_code", "_avp_flags", "_payload", "_vendor_id", "_name",
+                 "_container")
+
     avp_flag_vendor = 0x80
     avp_flag_mandatory = 0x40
     avp_flag_private = 0x20
@@ -66,27 +75,21 @@ class Avp:
             code: An AVP code, does not need to be a known code
             vendor_id: A vendor ID, or zero if no vendor is set
             payload: An optional AVP payload to initialise the AVP with. Must
-                be a properly encoded value that matches the type of AVP.
+                be a properly encoded value that matches the type of AVP. May
+                also be a `memoryview`, in which case the payload is not
+                copied until it is read through the `payload` attribute.
             flags: An optional integer value for the AVP flags
         """
-        self._vendor_id: int = 0
-
-        self.code: int = code
-        """AVP code. Corresponds to `AVP_*` constant values."""
-        self.flags: int = flags
-        """AVP flags. These should not be set manually, refer to `is_mandatory`,
-        `is_private` and `vendor_id`. The flags are updated automatically as 
-        these properties are changed."""
-        self.payload: bytes = payload
-        """The actual AVP payload as encoded bytes. This should not be set 
-        directly; the `value` property should be changed instead, which will 
-        automatically encode the payload correctly based on the type of the 
-        AVP."""
-        self.name: str = "Unknown"
-        """The name of the AVP, e.g. "Session-Id". Not unique in any way."""
-
-        # Do this through the property setter as it sets also the correct flags
-        self.vendor_id = vendor_id
+        self._container: AvpListChanges | None = None
+        self._avp_code: int = code
+        # the vendor bit is set the same way as in the `vendor_id` setter
+        if vendor_id:
+            flags |= self.avp_flag_vendor
+        else:
+            flags &= ~self.avp_flag_vendor
+        self._avp_flags: int = flags
+        self._payload: bytes | memoryview = payload
+        self._vendor_id: int = vendor_id
 
     def __str__(self) -> str:
         try:
@@ -111,10 +114,12 @@ class Avp:
 
     def as_bytes(self) -> bytes:
         """Retrieve a byte-encoded AVP, including its header."""
-        packer = Packer()
-        return self.as_packed(packer).get_buffer()
+        try:
+            return self.as_packed(RawPacker()).get_buffer()
+        except CONVERSION_ERRORS as e:
+            raise ConversionError(e.args[0]) from None
 
-    def as_packed(self, packer: Packer) -> Packer:
+    def as_packed(self, packer: RawPacker) -> RawPacker:
         """Append AVP byte-encoded contents, into a Packer instance.
 
         Args:
@@ -124,20 +129,66 @@ class Avp:
         Returns:
             The modified packer instance.
         """
-        flags = self.flags
-        packer.pack_uint(self.code)
-        packer.pack_uint(self.length | (flags << 24))
-        if self.vendor_id:
-            packer.pack_uint(self.vendor_id)
-        padded_payload_length = (len(self.payload) + 3) & ~3
-        packer.pack_fopaque(padded_payload_length, self.payload)
+        payload = self._payload
+        vendor_id = self._vendor_id
+        packer.pack_uint(self._avp_code)
+        if vendor_id:
+            packer.pack_uint((12 + len(payload)) | (self._avp_flags << 24))
+            packer.pack_uint(vendor_id)
+        else:
+            packer.pack_uint((8 + len(payload)) | (self._avp_flags << 24))
+        packer.pack_padded(payload)
         return packer
 
+    def copy(self, deep: bool = False) -> _AnyAvpType:
+        """Create a copy of the AVP.
+
+        The copy is an instance of the same class, with the same code, flags
+        and vendor ID, and it shares the payload with the original AVP, as
+        the payload is never modified in place. Nothing is encoded or
+        decoded.
+
+            >>> proxy_info = request.find_avps((AVP_PROXY_INFO, 0))[0]
+            >>> answer.append_avp(proxy_info.copy(deep=True))
+
+        Args:
+            deep: For grouped AVPs whose sub-AVPs have already been decoded,
+                copy the sub-AVPs as well, instead of sharing them with the
+                original AVP. Grouped AVPs that have not been decoded yet
+                are copied as they are, without being decoded.
+
+        Returns:
+            A new AVP instance with data identical to the original.
+
+        """
+        avp = self.__class__.__new__(self.__class__)
+        avp._container = None
+        avp._avp_code = self._avp_code
+        avp._avp_flags = self._avp_flags
+        avp._payload = self._payload
+        avp._vendor_id = self._vendor_id
+        name = getattr(self, "_name", None)
+        if name is not None:
+            avp._name = name
+        return avp
+
+    def __copy__(self) -> _AnyAvpType:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> _AnyAvpType:
+        return self.copy(deep=True)
+
     @classmethod
     def from_avp(cls, another_avp: _AnyAvpType) -> _AnyAvpType:
         """Create a copy based on another AVP.
 
-        Encodes the given AVP into bytes, then constructs a new AVP instance
+        The copy is an instance of the AVP type that the AVP dictionary has
+        for the AVP code and vendor, and it is identical to an AVP decoded
+        from the bytes of the given AVP. If the given AVP is already of that
+        type, it shares the payload with the given AVP, and nothing is
+        encoded or decoded; sub-AVPs of grouped AVPs are decoded again from
+        the payload only when the value of the copy is read. Otherwise, the
+        given AVP is encoded into bytes and a new AVP instance is constructed
         using `Avp.from_bytes`.
 
         Args:
@@ -147,6 +198,15 @@ class Avp:
             A new AVP instance with data identical to the copy.
 
         """
+        entry = get_avp_dictionary_entry(another_avp.code,
+                                         another_avp.vendor_id)
+        avp_type = Avp if entry is None else entry["type"]
+        if another_avp.__class__ is avp_type:
+            # the base class copy leaves out any decoded sub-AVPs, which the
+            # payload is brought up to date with first
+            if isinstance(another_avp, AvpGrouped):
+                another_avp._refresh_payload()
+            return Avp.copy(another_avp)
         return Avp.from_bytes(another_avp.as_bytes())
 
     @classmethod
@@ -173,13 +233,13 @@ class Avp:
 
         """
         try:
-            return Avp.from_unpacker(Unpacker(avp_data))
-        except ConversionError as e:
+            return Avp.from_unpacker(RawUnpacker(avp_data))
+        except CONVERSION_ERRORS as e:
             raise AvpDecodeError(
                 f"Not possible to create AVP from byte input: {e}") from None
 
     @classmethod
-    def from_unpacker(cls, unpacker: Unpacker) -> _AnyAvpType:
+    def from_unpacker(cls, unpacker: RawUnpacker) -> _AnyAvpType:
         """Create a new AVP from an Unpacker instance.
 
         Args:
@@ -208,16 +268,20 @@ class Avp:
         avp_info = get_avp_dictionary_entry(avp_code, avp_vendor_id)
         if avp_info is not None:
             avp_type: Type[Avp] = avp_info["type"]
-            avp_name = avp_info["name"]
+            # refer to the int objects held by the dictionary entry instead
+            # of keeping a copy in every AVP
+            avp_code = avp_info.get("code", avp_code)
+            if avp_vendor_id:
+                avp_vendor_id = avp_info.get("vendor", avp_vendor_id)
         else:
             avp_type: Type[Avp] = Avp
-            avp_name = None
 
-        avp = avp_type(avp_code, avp_vendor_id, avp_payload, avp_flags)
-        if avp_name:
-            avp.name = avp_name
+        if (avp_payload.__class__ is memoryview
+                and len(avp_payload) < ZERO_COPY_MIN_LENGTH):
+            # a view into the buffer costs more than a copy of a short value
+            avp_payload = avp_payload.tobytes()
 
-        return avp
+        return avp_type(avp_code, avp_vendor_id, avp_payload, avp_flags)
 
     @classmethod
     def new(cls, avp_code: int, vendor_id: int = 0,
@@ -256,7 +320,6 @@ class Avp:
             is_mandatory = entry.get("mandatory")
 
         avp = avp_type(avp_code, vendor_id=vendor_id)
-        avp.name = entry["name"]
 
         try:
             if value is not None:
@@ -281,6 +344,28 @@ class Avp:
 
         return avp
 
+    @property
+    def code(self) -> int:
+        """AVP code. Corresponds to `AVP_*` constant values."""
+        return self._avp_code
+
+    @code.setter
+    def code(self, value: int):
+        self._avp_code = value
+        self._changed()
+
+    @property
+    def flags(self) -> int:
+        """AVP flags. These should not be set manually, refer to `is_mandatory`,
+        `is_private` and `vendor_id`. The flags are updated automatically as
+        these properties are changed."""
+        return self._avp_flags
+
+    @flags.setter
+    def flags(self, value: int):
+        self._avp_flags = value
+        self._changed()
+
     @property
     def is_vendor(self) -> bool:
         """Indicates if the AVP is vendor-specific (has non-zero vendor_id)."""
@@ -318,9 +403,53 @@ class Avp:
         hdr_length = 8
         if self.vendor_id:
             hdr_length += 4
-        if not self.payload:
+        payload = self._payload
+        if not payload:
             return hdr_length
-        return hdr_length + len(self.payload)
+        return hdr_length + len(payload)
+
+    @property
+    def name(self) -> str:
+        """The name of the AVP, e.g. "Session-Id". Not unique in any way.
+
+        Unless a name has been set explicitly, it is taken from the AVP
+        dictionary entry for the AVP code and vendor, or "Unknown" if the
+        AVP is not in the dictionary. The name is not stored in the AVP
+        instance itself.
+        """
+        try:
+            return self._name
+        except AttributeError:
+            pass
+        entry = get_avp_dictionary_entry(self.code, self._vendor_id)
+        if entry is None:
+            return "Unknown"
+        return entry["name"]
+
+    @name.setter
+    def name(self, value: str):
+        self._name = value
+
+    @property
+    def payload(self) -> bytes:
+        """The actual AVP payload as encoded bytes. This should not be set
+        directly; the `value` property should be changed instead, which will
+        automatically encode the payload correctly based on the type of the
+        AVP.
+
+        If the AVP was decoded in zero-copy mode, the payload is held as a
+        `memoryview` into the original received buffer, and converted to
+        `bytes` only when this attribute is read for the first time.
+        """
+        payload = self._payload
+        if payload.__class__ is memoryview:
+            payload = self._payload = payload.tobytes()
+        return payload
+
+    @payload.setter
+    def payload(self, new_payload: bytes):
+        self._payload = new_payload
+        self._changed()
 
     @property
     def value(self) -> Any:
@@ -343,10 +472,19 @@ class Avp:
         """Sets a new vendor ID. The AVP flags are also automatically updated
         with the vendor set bit."""
         if value:
-            self.flags |= self.avp_flag_vendor
+            self._avp_flags |= self.avp_flag_vendor
         else:
-            self.flags &= ~self.avp_flag_vendor
+            self._avp_flags &= ~self.avp_flag_vendor
         self._vendor_id = value
+        self._changed()
+
+    def _changed(self):
+        # Every grouped AVP that holds the AVP, directly or through other
+        # grouped AVPs, and the message that holds them, has to pack its
+        # AVPs again
+        container = self._container
+        if container is not None:
+            container.mark_changed()
 
 
 class AvpAddress(Avp):
@@ -357,6 +495,8 @@ class AvpAddress(Avp):
     subscriber ID. The format contains both the value and the address family
     defined by IANAADFAM.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> tuple[int, str]:
         """The address family and its value. When reading, always returns a
@@ -429,12 +569,14 @@ class AvpAddress(Avp):
 
 class AvpFloat32(Avp):
     """An AVP type that implements "Float32"."""
+    __slots__ = ()
+
     @property
     def value(self) -> float:
         """AVP value as a python float. When setting the value, it must be a
         32-bit integer. Larger intergers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!f", self.payload)[0]
+            return struct.unpack("!f", self._payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 32-bit "
@@ -452,12 +594,14 @@ class AvpFloat32(Avp):
 
 class AvpFloat64(Avp):
     """An AVP type that implements "Float64"."""
+    __slots__ = ()
+
     @property
     def value(self) -> float:
         """AVP value as a python float. When setting the value, it must be a
         64-bit integer. Larger numbers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!d", self.payload)[0]
+            return struct.unpack("!d", self._payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 64-bit "
@@ -480,13 +624,52 @@ class AvpGrouped(Avp):
     consists of a concatenated byte stream of individual AVPs, containing also
     their headers. The python value is represented as a `list` of `Avp`
     instances.
+
+    Once the sub-AVPs have been decoded or set, they are what the AVP is
+    encoded from; the payload is a cached encoding of them, which is packed
+    again only after the sub-AVPs have changed.
     """
+    __slots__ = ("_avps", "_changes")
+
+    def __init__(self, code: int = 0, vendor_id: int = 0, payload: bytes = b"",
+                 flags: int = 0):
+        super().__init__(code, vendor_id, payload, flags)
+        self._avps: AvpList | None = None
+        self._changes: AvpListChanges | None = None
+
+    @property
+    def length(self):
+        """The entire length of the AVP, including header and vendor bit."""
+        self._refresh_payload()
+        return super().length
+
+    @property
+    def payload(self) -> bytes:
+        """The actual AVP payload as encoded bytes, i.e. the sub-AVPs packed
+        one after another.
+
+        If any of the sub-AVPs has been modified, added or removed since the
+        payload was last produced, the payload is packed again, along with
+        every grouped sub-AVP that has changed; the sub-AVPs that have not
+        changed are copied as they are. Setting the payload discards any
+        decoded sub-AVPs.
+        """
+        self._refresh_payload()
+        return Avp.payload.fget(self)
+
+    @payload.setter
+    def payload(self, new_payload: bytes):
+        self._payload = new_payload
+        self._avps = None
+        self._changes = None
+        self._changed()
+
     @property
     def value(self) -> list[_AnyAvpType]:
         """Set or read the list of grouped AVPs. The actual AVPs contained
         within are not decoded until the value is read for the first time.
-        Once read, the value is cached internally and will not change, unless
-        the entire AVP list is overwritten.
+        Once read, the value is cached internally, and the sub-AVPs in it can
+        be modified in place.
 
         When setting a value, it must be set to an entire list of AVPs:
 
@@ -498,36 +681,241 @@ class AvpGrouped(Avp):
             >>> grp = AvpGrouped()
             >>> grp.value.append(AvpOctetString())
 
+        Changes made to the list or to the sub-AVPs are included in the
+        payload the next time that it is read or the AVP is encoded. The
+        value is always an `AvpList`, which records the changes; a list that
+        is set as the value is copied into one.
         """
-        if not hasattr(self, "_avps"):
-            unpacker = Unpacker(self.payload)
-            avps = []
-
-            while not unpacker.is_done():
-                try:
-                    avps.append(Avp.from_unpacker(unpacker))
-                except ConversionError as e:
-                    raise AvpDecodeError(
-                        f"{self.name} grouped value {self.payload} does not "
-                        f"contain a valid group of AVPs: {e}") from None
-
-            setattr(self, "_avps", avps)
-
-        return getattr(self, "_avps")
+        avps = getattr(self, "_avps", None)
+        if avps is not None:
+            return avps
+
+        changes = AvpListChanges(self._container, changed=False)
+        unpacker = RawUnpacker(self._payload)
+        decoded = []
+        while not unpacker.is_done():
+            try:
+                avp = Avp.from_unpacker(unpacker)
+            except CONVERSION_ERRORS as e:
+                raise AvpDecodeError(
+                    f"{self.name} grouped value {self.payload} does not "
+                    f"contain a valid group of AVPs: {e}") from None
+            avp._container = changes
+            decoded.append(avp)
+
+        avps = self._avps = AvpList(decoded, changes)
+        self._changes = changes
+        return avps
 
     @value.setter
     def value(self, new_value: list[_AnyAvpType]):
-        self._avps = new_value
-
-        packer = Packer()
-        for avp in self._avps:
+        changes = AvpListChanges(self._container)
+        avps = AvpList(new_value, changes)
+        for avp in avps:
+            changes.adopt(avp)
+        self._payload = self._pack_sub_avps(avps)
+        changes.changed = False
+        self._avps = avps
+        self._changes = changes
+        self._changed()
+
+    def _pack_sub_avps(self, avps: list[_AnyAvpType]) -> bytes:
+        packer = RawPacker()
+        for avp in avps:
             try:
                 avp.as_packed(packer)
-            except ConversionError as e:
+            except CONVERSION_ERRORS as e:
                 raise AvpEncodeError(
                     f"{self.name} grouped AVP {avp.name} with value "
                     f"{avp.payload} cannot be encoded: {e}")
-        self.payload = packer.get_buffer()
+        return packer.get_buffer()
+
+    def _refresh_payload(self):
+        # The payload is packed from the sub-AVPs only if they have been
+        # marked as changed since the payload was last packed, or if any of
+        # them is shared with another list, which does not tell about changes
+        changes = getattr(self, "_changes", None)
+        if changes is None or not (changes.changed or changes.shared):
+            return
+        self._payload = self._pack_sub_avps(self._avps)
+        changes.changed = False
+
+    def as_packed(self, packer: RawPacker) -> RawPacker:
+        self._refresh_payload()
+        return super().as_packed(packer)
+
+    def copy(self, deep: bool = False) -> AvpGrouped:
+        """Create a copy of the grouped AVP.
+
+        The copy shares the payload with the original AVP. If the sub-AVPs
+        have already been decoded, the copy receives its own list of them,
+        containing either the same sub-AVP instances, or, for a deep copy,
+        copies of them. Sub-AVPs that have not been decoded are not decoded.
+        """
+        self._refresh_payload()
+        return self._copy_refreshed(deep)
+
+    def _copy_refreshed(self, deep: bool) -> AvpGrouped:
+        # The payload, and that of every grouped sub-AVP, is up to date, so
+        # the copied payload is up to date with the copied sub-AVPs as well
+        avp = super().copy(deep)
+        avp._avps = avp._changes = None
+        avps = getattr(self, "_avps", None)
+        if avps is None:
+            return avp
+        changes = AvpListChanges(changed=False)
+        if deep:
+            avps = [sub_avp._copy_refreshed(True)
+                    if isinstance(sub_avp, AvpGrouped) else sub_avp.copy(True)
+                    for sub_avp in avps]
+            for sub_avp in avps:
+                changes.adopt(sub_avp)
+        else:
+            # the sub-AVPs remain held by the original list, which is the
+            # only one that they tell about their changes
+            changes.shared = True
+        avp._avps = AvpList(avps, changes)
+        avp._changes = changes
+        return avp
+
+
+class AvpListChanges:
+    """Records whether a list of AVPs has changed since it was last packed.
+
+    Each grouped AVP has one for its sub-AVPs, once they have been decoded or
+    set, and each message has one for its AVPs. Every AVP refers to the
+    instance of the list that holds it, and marks it as changed when the AVP
+    itself changes, along with the instance of every list above it, up to
+    the message. Only the lists marked as changed are packed again.
+
+    The instances refer only to the instance of the list above them, never
+    to AVPs or to lists, so that no reference cycles are formed and AVPs
+    are freed as soon as they are no longer used.
+    """
+    __slots__ = ("changed", "shared", "parent")
+
+    def __init__(self, parent: AvpListChanges | None = None,
+                 changed: bool = True):
+        self.changed: bool = changed
+        """Set when an AVP in the list has changed, or AVPs have been added
+        or removed, since the list was last packed."""
+        self.shared: bool = False
+        """Set permanently once the list holds an AVP that another list holds
+        as well. An AVP only marks the last list that it was added to as
+        changed, so a shared list is always packed again."""
+        self.parent: AvpListChanges | None = parent
+        """The instance of the list that holds the grouped AVP that this list
+        belongs to, if any."""
+
+    def adopt(self, avp: Avp):
+        """Record that an AVP has been added to the list.
+
+        If the AVP was held by another list before, that list may well
+        still hold it, and is marked as shared.
+        """
+        container = avp._container
+        if container is not self:
+            if container is not None:
+                container.mark_shared()
+            avp._container = self
+        if isinstance(avp, AvpGrouped):
+            changes = getattr(avp, "_changes", None)
+            if changes is not None:
+                changes.parent = self
+                if changes.shared:
+                    self.mark_shared()
+
+    def mark_changed(self):
+        """Mark the list as changed, along with every list above it."""
+        changes = self
+        while changes is not None and not changes.changed:
+            changes.changed = True
+            changes = changes.parent
+
+    def mark_shared(self):
+        """Mark the list as shared, along with every list above it."""
+        changes = self
+        while changes is not None and not changes.shared:
+            changes.shared = True
+            changes = changes.parent
+
+
+class AvpList(list):
+    """The list of sub-AVPs of a grouped AVP.
+
+    A regular `list`, which records any AVPs that are added to it or removed
+    from it, so that the grouped AVP knows to pack its payload again.
+    """
+    __slots__ = ("changes",)
+
+    def __init__(self, avps: Iterable[Avp] = (),
+                 changes: AvpListChanges | None = None):
+        super().__init__(avps)
+        if changes is None:
+            changes = AvpListChanges()
+        self.changes: AvpListChanges = changes
+
+    def _added(self, avps: Iterable[Avp]):
+        changes = self.changes
+        for avp in avps:
+            changes.adopt(avp)
+        changes.mark_changed()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            super().__setitem__(index, value)
+            self._added(value)
+        else:
+            super().__setitem__(index, value)
+            self._added((value,))
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.changes.mark_changed()
+
+    def __iadd__(self, avps: Iterable[Avp]) -> AvpList:
+        self.extend(avps)
+        return self
+
+    def __imul__(self, count: int) -> AvpList:
+        super().__imul__(count)
+        self.changes.mark_changed()
+        return self
+
+    def append(self, avp: Avp):
+        super().append(avp)
+        self._added((avp,))
+
+    def extend(self, avps: Iterable[Avp]):
+        avps = list(avps)
+        super().extend(avps)
+        self._added(avps)
+
+    def insert(self, index: int, avp: Avp):
+        super().insert(index, avp)
+        self._added((avp,))
+
+    def pop(self, index: int = -1) -> Avp:
+        avp = super().pop(index)
+        self.changes.mark_changed()
+        return avp
+
+    def remove(self, avp: Avp):
+        super().remove(avp)
+        self.changes.mark_changed()
+
+    def clear(self):
+        super().clear()
+        self.changes.mark_changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.changes.mark_changed()
+
+    def reverse(self):
+        super().reverse()
+        self.changes.mark_changed()
 
 
 class AvpInteger32(Avp):
@@ -535,13 +923,15 @@ class AvpInteger32(Avp):
 
     The "Integer32" type has a 32-bit signed value.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         """Sets or retrieves the AVP value as a python integer. When setting
         the value, it must be a 32-bit integer. Larger integers will raise
         an `AvpEncodeError`."""
         try:
-            return struct.unpack("!i", self.payload)[0]
+            return struct.unpack("!i", self._payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 32-bit "
@@ -562,13 +952,15 @@ class AvpInteger64(Avp):
 
     The "Integer64" type has a 64-bit signed value.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         """Sets or retrieves the AVP value as a python integer. When setting
         the value, it must be a 64-bit integer. Larger integers will raise
         an `AvpEncodeError`."""
         try:
-            return struct.unpack("!q", self.payload)[0]
+            return struct.unpack("!q", self._payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 64-bit "
@@ -589,6 +981,8 @@ class AvpOctetString(Avp):
 
     The "OctetString" type contains arbitrary data of variable length.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> bytes:
         """Sets or retrieves the AVP value, as python bytes. When setting
@@ -608,13 +1002,15 @@ class AvpUnsigned32(Avp):
 
     The "Unsigned32" type has a 32-bit unsigned value.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         """Sets or retrieves the AVP value as a python integer. When setting
         the value, it must be a 32-bit unsigned integer. Larger and signed
         integers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!I", self.payload)[0]
+            return struct.unpack("!I", self._payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 32-bit "
@@ -635,13 +1031,15 @@ class AvpUnsigned64(Avp):
 
     The "Unsigned64" type has a 64-bit unsigned value.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> int:
         """Sets or retrieves the AVP value as a python integer. When setting
         the value, it must be a 64-bit unsigned integer. Larger and signed
         integers will raise an `AvpEncodeError`."""
         try:
-            return struct.unpack("!Q", self.payload)[0]
+            return struct.unpack("!Q", self._payload)[0]
         except struct.error as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} is not a valid 64-bit "
@@ -666,6 +1064,8 @@ class AvpUtf8String(Avp):
     the UTF-8 transformation format. It translates to the basic python `str`
     type.
     """
+    __slots__ = ()
+
     @property
     def value(self) -> str:
         """Sets or retrieves the AVP value, as a python str. When setting
@@ -673,7 +1073,7 @@ class AvpUtf8String(Avp):
         data type, or strings that will not encode as utf-8, will raise an
         `AvpEncodeError`."""
         try:
-            return self.payload.decode("utf8")
+            return str(self._payload, "utf8")
         except (AttributeError, TypeError, UnicodeDecodeError) as e:
             raise AvpDecodeError(
                 f"{self.name} value {self.payload} cannot be decoded as "
@@ -706,6 +1106,8 @@ class AvpTime(Avp):
     As a result, the `AvpTime` type cannot represent dates before 20 January
     1968 at all.
     """
+    __slots__ = ()
+
     seconds_since_1900 = ((70 * 365) + 17) * 86400
     # 6h 28m 16s UTC, 7 February 2036, the timestamp when NTP format overflows
     overflow_timestamp = 2085974896
@@ -720,7 +1122,7 @@ class AvpTime(Avp):
         data type, or if the datetime instance contains an unsupported value,
         will raise an `AvpEncodeError`."""
         try:
-            seconds = struct.unpack("!I", self.payload)[0]
+            seconds = struct.unpack("!I", self._payload)[0]
             if seconds < self.overflow_detection_cutoff:
                 return datetime.datetime.fromtimestamp(
                     seconds + self.overflow_timestamp)
@@ -759,12 +1161,16 @@ As enumeration is a list of valid integer values, is an alias for
 _AnyAvpType = TypeVar("_AnyAvpType", bound=Avp)
 
 
-from .dictionary import AVP_DICTIONARY, AVP_VENDOR_DICTIONARY, AvpInfo
+from .dictionary import (AVP_DICTIONARY, AVP_VENDOR_DICTIONARY, AvpInfo,
+                         _AVP_INDEX, _VENDOR_LOADERS)
 
 
 def get_avp_dictionary_entry(avp_code: int, vendor_id: int = 0) -> AvpInfo | None:
     """Gets an AVP_DICTIONARY or AVP_VENDOR_DICTIONARY entry.
 
+    The AVP table of a vendor is built when an AVP of the vendor is looked up
+    for the first time.
+
     Args:
         avp_code: An AVP code to identify entry
         vendor_id: A vendor ID, or zero if AVP doesn't have one
@@ -773,16 +1179,11 @@ def get_avp_dictionary_entry(avp_code: int, vendor_id: int = 0) -> AvpInfo | Non
         An AVP definition in form of a dictionary or None if
         no entry was found.
     """
-    if avp_code in AVP_DICTIONARY and vendor_id == 0:
-        return AVP_DICTIONARY[avp_code]
-
-    elif (vendor_id != 0
-            and vendor_id in AVP_VENDOR_DICTIONARY
-            and avp_code in AVP_VENDOR_DICTIONARY[vendor_id]):
-        return AVP_VENDOR_DICTIONARY[vendor_id][avp_code]
-
-    else:
-        return None
+    entry = _AVP_INDEX.get(vendor_id << 32 | avp_code)
+    if entry is None and vendor_id in _VENDOR_LOADERS:
+        AVP_VENDOR_DICTIONARY.load(vendor_id)
+        entry = _AVP_INDEX.get(vendor_id << 32 | avp_code)
+    return entry
 
 
 def register(avp: int, name: str, type_cls: type[_AnyAvpType],
@@ -819,8 +1220,14 @@ def register(avp: int, name: str, type_cls: type[_AnyAvpType],
     """
     if vendor is None:
         AVP_DICTIONARY[avp] = {"name": name, "type": type_cls,
-                               "mandatory": mandatory}
+                               "mandatory": mandatory, "code": avp}
     else:
         vendor_dict = AVP_VENDOR_DICTIONARY.setdefault(vendor, {})
         vendor_dict[avp] = {"name": name, "type": type_cls,
-                            "mandatory": mandatory, "vendor": vendor}
+                            "mandatory": mandatory, "vendor": vendor,
+                            "code": avp}
+
+    # compiled encode plans hold AVP types and flags copied from the
+    # dictionary; imported here as the generator depends on this module
+    from .generator import clear_encode_plans
+    clear_encode_plans()
@@ -6,9 +6,13 @@ from __future__ import annotations
 
 import logging
 
-from typing import NamedTuple, Protocol
+from typing import Any, Callable, NamedTuple, Protocol
 
-from .avp import Avp
+from ..packer import _DOUBLE, _FLOAT, _HYPER, _INT, _PADDING, _UHYPER, _UINT
+from ..packer import RawPacker
+from .avp import (Avp, AvpAddress, AvpFloat32, AvpFloat64, AvpGrouped,
+                  AvpInteger32, AvpInteger64, AvpOctetString, AvpUnsigned32,
+                  AvpUnsigned64, AvpUtf8String, get_avp_dictionary_entry)
 from .errors import AvpEncodeError
 
 logger = logging.getLogger("diameter.avp")
@@ -63,45 +67,406 @@ def generate_avps_from_defs(obj: AvpGenerator, strict: bool = False) -> list[Avp
             continue
         attr_value = getattr(obj, gen_def.attr_name)
 
-        try:
-            if gen_def.type_class and isinstance(attr_value, list):
-                for value in attr_value:
-                    if value is None:
-                        continue
-                    grouped_avp = Avp.new(gen_def.avp_code, gen_def.vendor_id,
-                                          is_mandatory=gen_def.is_mandatory)
-                    sub_avps = generate_avps_from_defs(value)
-                    grouped_avp.value = sub_avps
-                    avp_list.append(grouped_avp)
-
-            elif gen_def.type_class:
+        avp_list.extend(generate_avps_from_def(gen_def, attr_value))
+
+    if hasattr(obj, "additional_avps"):
+        return avp_list + getattr(obj, "additional_avps")
+    return avp_list
+
+
+def generate_avps_from_def(gen_def: AvpGenDef, attr_value: Any) -> list[Avp]:
+    """Produce the AVPs of a single attribute definition.
+
+    Returns one AVP for a single value, one AVP for each item of a list
+    value, and no AVPs at all if the value is None. Grouped AVPs are
+    populated recursively.
+    """
+    avp_list = []
+    if attr_value is None:
+        return avp_list
+    try:
+        if gen_def.type_class and isinstance(attr_value, list):
+            for value in attr_value:
+                if value is None:
+                    continue
                 grouped_avp = Avp.new(gen_def.avp_code, gen_def.vendor_id,
                                       is_mandatory=gen_def.is_mandatory)
-                sub_avps = generate_avps_from_defs(attr_value)
+                sub_avps = generate_avps_from_defs(value)
                 grouped_avp.value = sub_avps
                 avp_list.append(grouped_avp)
 
-            elif isinstance(attr_value, list):
-                for value in attr_value:
-                    if value is None:
-                        continue
-                    single_avp = Avp.new(gen_def.avp_code, gen_def.vendor_id,
-                                         value=value,
-                                         is_mandatory=gen_def.is_mandatory)
-                    avp_list.append(single_avp)
+        elif gen_def.type_class:
+            grouped_avp = Avp.new(gen_def.avp_code, gen_def.vendor_id,
+                                  is_mandatory=gen_def.is_mandatory)
+            sub_avps = generate_avps_from_defs(attr_value)
+            grouped_avp.value = sub_avps
+            avp_list.append(grouped_avp)
 
-            else:
+        elif isinstance(attr_value, list):
+            for value in attr_value:
+                if value is None:
+                    continue
                 single_avp = Avp.new(gen_def.avp_code, gen_def.vendor_id,
-                                     value=attr_value,
+                                     value=value,
                                      is_mandatory=gen_def.is_mandatory)
                 avp_list.append(single_avp)
+
+        else:
+            single_avp = Avp.new(gen_def.avp_code, gen_def.vendor_id,
+                                 value=attr_value,
+                                 is_mandatory=gen_def.is_mandatory)
+            avp_list.append(single_avp)
+    except AvpEncodeError as e:
+        raise AvpEncodeError(
+            f"Failed to parse value for attribute `{gen_def.attr_name}`: "
+            f"{e}") from None
+
+    return avp_list
+
+
+def copy_attr_value(value: Any, deep: bool = False) -> Any:
+    """Copy the value of an AVP attribute.
+
+    Lists are always copied. For a deep copy, list items, AVPs and grouped
+    AVP instances, or any other object with an `avp_def`, are copied as
+    well, with their own `copy` method. Values of any other type, such as
+    strings, numbers and timestamps, are immutable and are returned as they
+    are.
+    """
+    if value.__class__ is list:
+        if deep:
+            return [copy_attr_value(item, True) for item in value]
+        return list(value)
+    if deep and (isinstance(value, Avp) or hasattr(value, "avp_def")):
+        return value.copy(deep=True)
+    return value
+
+
+_MISSING = object()
+
+
+def _encode_octet_string(value: bytes) -> bytes:
+    if not isinstance(value, bytes):
+        raise AvpEncodeError(f"value {value} is not bytes")
+    return value
+
+
+def _encode_utf8_string(value: str) -> bytes:
+    return value.encode("utf8")
+
+
+_VALUE_ENCODERS: dict[type[Avp], Callable[[Any], bytes]] = {
+    AvpFloat32: _FLOAT.pack,
+    AvpFloat64: _DOUBLE.pack,
+    AvpInteger32: _INT.pack,
+    AvpInteger64: _HYPER.pack,
+    AvpOctetString: _encode_octet_string,
+    AvpUnsigned32: _UINT.pack,
+    AvpUnsigned64: _UHYPER.pack,
+    AvpUtf8String: _encode_utf8_string,
+}
+"""Value encoders for AVP types, which produce a payload directly from a
+python value, without going through an AVP instance. The values are validated
+in the same way as the `value` setter of each AVP type does."""
+
+
+class EncodeStep(NamedTuple):
+    """A single compiled entry of an `EncodePlan`."""
+    gen_def: AvpGenDef
+    """The AVP generation definition that the step was compiled from."""
+    code: bytes
+    """Pre-packed AVP code."""
+    flags: int
+    """AVP flags, shifted to their place in the AVP header length field."""
+    vendor: bytes
+    """Pre-packed AVP vendor ID, or an empty byte string if no vendor."""
+    header_length: int
+    """Length of the AVP header, either 8 or 12 bytes."""
+    encode_value: Callable[[Any], bytes] | None
+    """Converts a python value into an AVP payload. If not set, the AVP is
+    generated using `Avp.new` and packed as an AVP instance instead."""
+    avp_type: type[Avp] | None = None
+    """The AVP class, as found in the AVP dictionary."""
+
+
+class EncodePlan(NamedTuple):
+    """An `avp_def` tuple of a class, compiled for encoding AVPs."""
+    avp_def: AvpGenType
+    """The `avp_def` that the plan was compiled from."""
+    steps: tuple[EncodeStep, ...]
+    """Encode steps, in the order of `avp_def`."""
+    additional_avps_attr: str | None
+    """Name of the attribute that holds additional custom AVPs, if the class
+    has one."""
+
+
+_encode_plans: dict[type, EncodePlan] = {}
+
+
+def _value_encoder_for_type(avp_type: type[Avp], avp_code: int,
+                            vendor_id: int) -> Callable[[Any], bytes]:
+    # Any other AVP type, including custom ones, is encoded through its own
+    # `value` setter, leniently in the same way as `Avp.new` does
+    def encode_value(value: Any) -> bytes:
+        avp = avp_type(avp_code, vendor_id)
+        if issubclass(avp_type, AvpAddress) and isinstance(value, tuple):
+            value = value[1]
+        elif issubclass(avp_type, AvpGrouped) and not isinstance(value, list):
+            value = [value]
+        avp.value = value
+        return avp.payload
+
+    return encode_value
+
+
+def get_value_encoder(avp_type: type[Avp], avp_code: int,
+                      vendor_id: int) -> Callable[[Any], bytes]:
+    """Retrieve a function that converts a python value into an AVP payload.
+
+    Args:
+        avp_type: The AVP class, as found in the AVP dictionary
+        avp_code: AVP code
+        vendor_id: AVP vendor ID, or zero if no vendor
+    """
+    encode_value = _VALUE_ENCODERS.get(avp_type)
+    if encode_value is None:
+        encode_value = _value_encoder_for_type(avp_type, avp_code, vendor_id)
+    return encode_value
+
+
+def compile_encode_plan(obj: AvpGenerator) -> EncodePlan:
+    """Compile the `avp_def` of an object into an encode plan.
+
+    Looks up every AVP in the AVP dictionary once, and pre-packs the AVP
+    header fields that do not depend on the AVP value.
+    """
+    avp_def = getattr(obj, "avp_def", ())
+    steps = []
+    for gen_def in avp_def:
+        # catch early cases where avp_def exists contains junk
+        if not isinstance(gen_def, AvpGenDef):
+            continue
+
+        entry = get_avp_dictionary_entry(gen_def.avp_code, gen_def.vendor_id)
+        if entry is None:
+            # Unknown AVPs fail only when there is a value to encode
+            steps.append(EncodeStep(gen_def, b"", 0, b"", 0, None))
+            continue
+
+        is_mandatory = gen_def.is_mandatory
+        if is_mandatory is None:
+            is_mandatory = entry.get("mandatory")
+
+        flags = 0
+        header_length = 8
+        vendor = b""
+        if gen_def.vendor_id:
+            flags |= Avp.avp_flag_vendor
+            header_length = 12
+            vendor = _UINT.pack(gen_def.vendor_id)
+        if is_mandatory:
+            flags |= Avp.avp_flag_mandatory
+
+        encode_value = get_value_encoder(
+            entry["type"], gen_def.avp_code, gen_def.vendor_id)
+
+        steps.append(EncodeStep(
+            gen_def, _UINT.pack(gen_def.avp_code), flags << 24, vendor,
+            header_length, encode_value, entry["type"]))
+
+    additional_avps_attr = None
+    if hasattr(obj, "additional_avps"):
+        additional_avps_attr = "additional_avps"
+
+    return EncodePlan(avp_def, tuple(steps), additional_avps_attr)
+
+
+def get_encode_plan(obj: AvpGenerator) -> EncodePlan:
+    """Retrieve the encode plan for an object's class.
+
+    The plan is compiled once per class, on first use, and recompiled only
+    if the `avp_def` of the object is no longer the one that the plan was
+    compiled from.
+    """
+    plan = _encode_plans.get(obj.__class__)
+    if plan is None or plan.avp_def is not getattr(obj, "avp_def", ()):
+        plan = compile_encode_plan(obj)
+        _encode_plans[obj.__class__] = plan
+    return plan
+
+
+def clear_encode_plans():
+    """Discard every compiled encode plan.
+
+    Must be called when the AVP dictionary changes, as the plans hold the AVP
+    types and flags as they were when the plan was compiled.
+    """
+    _encode_plans.clear()
+
+
+def pack_avps_from_defs(obj: AvpGenerator, packer: RawPacker,
+                        strict: bool = False,
+                        received: dict[str, list[Avp]] | None = None
+                        ) -> RawPacker:
+    """Go through a tree of AVP attribute definitions and pack AVPs.
+
+    Produces the same AVPs as `generate_avps_from_defs`, but writes them
+    directly into a packer, using the compiled encode plan of the object's
+    class. No `Avp` instances are created, except for custom AVPs that are
+    held in the `additional_avps` attribute, and for AVPs that are not
+    present in the AVP dictionary.
+
+    Grouped AVPs are written in a single pass; the sub-AVPs are packed
+    directly into the same buffer after the grouped AVP header, and the
+    header length is filled in once the last sub-AVP has been packed.
+
+    Args:
+        obj: The object whose attributes are packed
+        packer: A packer instance, where the AVPs are appended to
+        strict: Raise a `ValueError` if a required attribute is not set,
+            instead of only logging it
+        received: Received AVPs, by attribute name, for attributes whose
+            values have not been decoded from them yet. The AVPs of such
+            attributes are packed as they are, without reading the attribute.
+
+    Returns:
+        The modified packer instance.
+    """
+    plan = get_encode_plan(obj)
+    buf = packer.get_bytearray()
+
+    for step in plan.steps:
+        gen_def = step.gen_def
+        if received:
+            avps = received.get(gen_def.attr_name)
+            if avps is not None:
+                for avp in avps:
+                    avp.as_packed(packer)
+                continue
+        attr_value = getattr(obj, gen_def.attr_name, _MISSING)
+        if attr_value is _MISSING:
+            if gen_def.is_required:
+                msg = f"mandatory AVP attribute `{gen_def.attr_name}` is not set"
+                if strict:
+                    raise ValueError(msg)
+                logger.debug(msg)
+            continue
+        if attr_value is None:
+            continue
+
+        if step.encode_value is None:
+            for avp in generate_avps_from_def(gen_def, attr_value):
+                avp.as_packed(packer)
+            continue
+
+        if isinstance(attr_value, list):
+            values = attr_value
+        else:
+            values = (attr_value, )
+
+        try:
+            for value in values:
+                if value is None:
+                    continue
+                if gen_def.type_class:
+                    # sub-AVPs are packed in place, right after the grouped
+                    # AVP header, whose length is patched once they are done
+                    start = len(buf)
+                    buf += step.code
+                    buf += _UINT.pack(step.flags)
+                    buf += step.vendor
+                    pack_avps_from_defs(value, packer)
+                    packer.pack_uint_at(
+                        start + 4, step.flags | (len(buf) - start))
+                    continue
+
+                payload = step.encode_value(value)
+                buf += step.code
+                buf += _UINT.pack(
+                    step.flags | (step.header_length + len(payload)))
+                buf += step.vendor
+                buf += payload
+                buf += _PADDING[len(payload) & 3]
         except AvpEncodeError as e:
             raise AvpEncodeError(
                 f"Failed to parse value for attribute `{gen_def.attr_name}`: "
                 f"{e}") from None
+        except Exception as e:
+            raise AvpEncodeError(
+                f"Failed to parse value for attribute `{gen_def.attr_name}`: "
+                f"value {value} is not valid: {e}") from None
+
+    if plan.additional_avps_attr is not None:
+        for avp in getattr(obj, plan.additional_avps_attr):
+            avp.as_packed(packer)
+
+    return packer
+
+
+def generate_avps_from_plan(obj: AvpGenerator,
+                            received: dict[str, list[Avp]] | None = None
+                            ) -> list[Avp]:
+    """Produce the AVPs of an object, using its compiled encode plan.
+
+    Produces the same AVPs as `pack_avps_from_defs` packs. Each AVP instance
+    is created directly with the flags of the plan and a payload from the
+    value encoder, without going through `Avp.new`. Grouped AVPs are
+    populated recursively.
+
+    Args:
+        obj: The object whose attributes are converted to AVPs
+        received: Received AVPs, by attribute name, for attributes whose
+            values have not been decoded from them yet. Such AVPs are
+            returned as they are, without reading the attribute.
+
+    """
+    plan = get_encode_plan(obj)
+    avp_list = []
+
+    for step in plan.steps:
+        gen_def = step.gen_def
+        if received:
+            avps = received.get(gen_def.attr_name)
+            if avps is not None:
+                avp_list.extend(avps)
+                continue
+        attr_value = getattr(obj, gen_def.attr_name, None)
+        if attr_value is None:
+            continue
+
+        if step.encode_value is None:
+            avp_list.extend(generate_avps_from_def(gen_def, attr_value))
+            continue
+
+        if isinstance(attr_value, list):
+            values = attr_value
+        else:
+            values = (attr_value, )
+
+        flags = step.flags >> 24
+        try:
+            for value in values:
+                if value is None:
+                    continue
+                avp = step.avp_type(gen_def.avp_code, gen_def.vendor_id,
+                                    flags=flags)
+                if gen_def.type_class:
+                    avp.value = generate_avps_from_plan(value)
+                else:
+                    avp.payload = step.encode_value(value)
+                avp_list.append(avp)
+        except AvpEncodeError as e:
+            raise AvpEncodeError(
+                f"Failed to parse value for attribute `{gen_def.attr_name}`: "
+                f"{e}") from None
+        except Exception as e:
+            raise AvpEncodeError(
+                f"Failed to parse value for attribute `{gen_def.attr_name}`: "
+                f"value {value} is not valid: {e}") from None
+
+    if plan.additional_avps_attr is not None:
+        avp_list.extend(getattr(obj, plan.additional_avps_attr))
 
-    if hasattr(obj, "additional_avps"):
-        return avp_list + getattr(obj, "additional_avps")
     return avp_list
 
 
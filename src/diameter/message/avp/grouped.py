@@ -4,19 +4,31 @@ Python classes that represent individual grouped AVPs.
 Each grouped AVP is represented by a python dataclass. Each dataclass contains
 one special attribute named `avp_def`, which is always a tuple of `AvpGenType`
 instances, which dictate to which AVP each dataclass attribute maps to.
+
+The dataclasses are slotted, and their list attributes are allocated only
+when they are first used. Each dataclass is built only when it is first
+accessed from this module, which keeps the import time low for applications
+that use only a few grouped AVPs.
 """
 from __future__ import annotations
 
 import dataclasses
 import datetime
 import logging
+import reprlib
+import threading
 
 from ..avp import Avp
-from ..avp.generator import AvpGenDef, AvpGenType
+from ..avp.generator import AvpGenDef, AvpGenType, copy_attr_value
 from ..constants import *
 
 logger = logging.getLogger("diameter.avp")
 
+# Every grouped AVP class declared in this module, and the dataclass built
+# from it, once it has been built
+_declared: dict[type, type | None] = {}
+_build_lock = threading.RLock()
+
 
 __all__ = [
     "AccessNetworkInfoChange",
@@ -278,7 +290,159 @@ __all__ = [
 ]
 
 
-@dataclasses.dataclass
+def _lazy_list_getattr(self, name: str):
+    # only reached when a slot has never been set, i.e. for list attributes
+    # that have not been used yet
+    if name in self._lazy_lists:
+        value = []
+        setattr(self, name, value)
+        return value
+    raise AttributeError(
+        f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+
+def _grouped_init(cls):
+    """Build an `__init__` that leaves unused list attributes unallocated.
+
+    Works like the `__init__` generated by `dataclasses`, except that list
+    attributes that receive no value are not assigned at all.
+    """
+    params = []
+    lines = []
+    namespace = {}
+    for field in dataclasses.fields(cls):
+        namespace[f"_default_{field.name}"] = field.default
+        params.append(f"{field.name}=_default_{field.name}")
+        if field.name in cls._lazy_lists:
+            lines.append(f"    if {field.name} is not None:")
+            lines.append(f"        self.{field.name} = {field.name}")
+        else:
+            lines.append(f"    self.{field.name} = {field.name}")
+    # the `avp_def` init-only variable is accepted, and ignored, as before
+    params.append("avp_def=None")
+    lines.append("    pass")
+
+    source = f"def __init__(self, {', '.join(params)}):\n" + "\n".join(lines)
+    exec(source, namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+# `__repr__` and `__eq__` are shared by every grouped AVP class, instead of
+# being generated for each one of them by `dataclasses`, which makes building
+# the classes considerably cheaper
+
+@reprlib.recursive_repr()
+def _grouped_repr(self) -> str:
+    values = ", ".join(
+        f"{name}={getattr(self, name)!r}" for name in self._field_names)
+    return f"{self.__class__.__qualname__}({values})"
+
+
+def _grouped_eq(self, other) -> bool:
+    if other.__class__ is not self.__class__:
+        return NotImplemented
+    return (tuple(getattr(self, name) for name in self._field_names) ==
+            tuple(getattr(other, name) for name in self._field_names))
+
+
+def _grouped_copy(self, deep: bool = False):
+    """Create a copy of the grouped AVP instance.
+
+    The copy receives its own list attributes. A deep copy also receives
+    copies of every grouped AVP instance and AVP that it holds; otherwise
+    they are shared with the original. List attributes that have not been
+    used yet are not allocated in the copy either.
+    """
+    cls = self.__class__
+    copy = cls.__new__(cls)
+    for member in cls._field_slots:
+        try:
+            value = member.__get__(self, cls)
+        except AttributeError:
+            continue
+        if value is not None and (deep or value.__class__ is list):
+            value = copy_attr_value(value, deep)
+        member.__set__(copy, value)
+    return copy
+
+
+def _grouped_deepcopy(self, memo: dict):
+    return self.copy(deep=True)
+
+
+def _grouped_avp(cls):
+    """Declare a grouped AVP class.
+
+    The declared class is kept as it is, and it is turned into a slotted
+    dataclass by `_build_grouped_avp` only once it is first accessed from
+    this module.
+    """
+    _declared[cls] = None
+    return cls
+
+
+def _build_grouped_avp(declared: type) -> type:
+    """Turn a declared grouped AVP class into a slotted dataclass.
+
+    Every grouped AVP class that the declared class refers to, either as its
+    base class or as a `type_class` in its `avp_def`, is built first.
+
+    Fields declared with `dataclasses.field(default_factory=list)` are not
+    given an empty list when an instance is created. They still read as
+    lists, but the list is allocated only once the attribute is first used,
+    so that instances that never touch most of their list attributes do not
+    carry an empty list for each one. Such fields are marked with
+    `{"is_list": True}` in their field metadata.
+    """
+    cls = _declared[declared]
+    if cls is not None:
+        return cls
+
+    bases = tuple(_build_grouped_avp(base) if base in _declared else base
+                  for base in declared.__bases__)
+    namespace = {name: value for name, value in declared.__dict__.items()
+                 if name not in ("__dict__", "__weakref__")}
+    if "avp_def" in namespace:
+        namespace["avp_def"] = tuple(
+            gen_def._replace(type_class=_build_grouped_avp(gen_def.type_class))
+            if gen_def.type_class in _declared else gen_def
+            for gen_def in namespace["avp_def"])
+
+    lazy_lists = set()
+    for name, value in list(namespace.items()):
+        if (isinstance(value, dataclasses.Field) and
+                value.default_factory is list):
+            namespace[name] = dataclasses.field(
+                default=None, metadata={"is_list": True})
+            lazy_lists.add(name)
+
+    cls = dataclasses.dataclass(slots=True, init=False, repr=False, eq=False)(
+        type(declared.__name__, bases, namespace))
+    cls._lazy_lists = frozenset(lazy_lists.union(
+        *(getattr(base, "_lazy_lists", ()) for base in cls.__mro__[1:])))
+    cls._field_names = tuple(field.name for field in dataclasses.fields(cls))
+    cls.__init__ = _grouped_init(cls)
+    cls.__repr__ = _grouped_repr
+    cls.__eq__ = _grouped_eq
+    cls.__hash__ = None
+    cls._field_slots = tuple(getattr(cls, name) for name in cls._field_names)
+    cls.copy = _grouped_copy
+    cls.__copy__ = _grouped_copy
+    cls.__deepcopy__ = _grouped_deepcopy
+    if cls._lazy_lists:
+        cls.__getattr__ = _lazy_list_getattr
+
+    _declared[declared] = cls
+    # set back into the module, so that the annotations of other classes,
+    # which refer to this one, can be evaluated
+    for name in _declared_names[declared]:
+        globals()[name] = cls
+    return cls
+
+
+@_grouped_avp
 class GenericSpec:
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
 
@@ -288,7 +452,7 @@ class GenericSpec:
 # specific order that variables must be declared in.
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class FailedAvp:
     """A data container that represents the "Failed-AVP" (279) grouped AVP.
 
@@ -300,7 +464,7 @@ class FailedAvp:
     avp_def: dataclasses.InitVar[AvpGenType] = ()
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class VendorSpecificApplicationId:
     """A data container that represents the "Vendor-Specific-Application-ID" (260) grouped AVP."""
     vendor_id: int = None
@@ -315,7 +479,7 @@ class VendorSpecificApplicationId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ExperimentalResult:
     """A data container that represents the "Experimental-Result" (297) grouped AVP."""
     vendor_id: int = None
@@ -328,7 +492,7 @@ class ExperimentalResult:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipMnAaaAuth:
     """A data container that represents the "MIP-MN-AAA-Auth" (322) grouped AVP."""
     mip_mn_aaa_spi: int = None
@@ -346,7 +510,7 @@ class MipMnAaaAuth:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipMnToFaMsa:
     """A data container that represents the "MIP-MN-to-FA-MSA" (325) grouped AVP.
 
@@ -368,7 +532,7 @@ class MipMnToFaMsa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipFaToMnMsa:
     """A data container that represents the "MIP-FA-to-MN-MSA" (326) grouped AVP."""
     mip_fa_to_mn_spi: int = None
@@ -384,7 +548,7 @@ class MipFaToMnMsa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipFaToHaMsa:
     """A data container that represents the "MIP-FA-to-HA-MSA" (328) grouped AVP."""
     mip_fa_to_ha_spi: int = None
@@ -400,7 +564,7 @@ class MipFaToHaMsa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipHaToFaMsa:
     """A data container that represents the "MIP-HA-to-FA-MSA" (329) grouped AVP."""
     mip_ha_to_fa_spi: int = None
@@ -416,7 +580,7 @@ class MipHaToFaMsa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipMnToHaMsa:
     """A data container that represents the "MIP-MN-to-HA-MSA" (331) grouped AVP."""
     mip_mn_ha_spi: int = None
@@ -434,7 +598,7 @@ class MipMnToHaMsa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipHaToMnMsa:
     """A data container that represents the "MIP-HA-to-MN-MSA" (332) grouped AVP.
 
@@ -459,7 +623,7 @@ class MipHaToMnMsa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipOriginatingForeignAaa:
     """A data container that represents the "MIP-Originating-Foreign-AAA" (347) grouped AVP."""
     origin_realm: bytes = None
@@ -473,7 +637,7 @@ class MipOriginatingForeignAaa:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MipHomeAgentHost:
     """A data container that represents the "MIP-Home-Agent-Host" (348) grouped AVP."""
     origin_realm: bytes = None
@@ -487,7 +651,7 @@ class MipHomeAgentHost:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Mip6AgentInfo:
     """A data container that represents the "MIP6-Agent-Info" (486) grouped AVP.
 
@@ -506,7 +670,7 @@ class Mip6AgentInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UnitValue:
     """A data container that represents the "Unit-Value" grouped AVP."""
     value_digits: int = None
@@ -519,7 +683,7 @@ class UnitValue:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CcMoney:
     """A data container that represents the "CC-Money" grouped AVP."""
     unit_value: UnitValue = None
@@ -532,7 +696,7 @@ class CcMoney:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class GrantedServiceUnit:
     """A data container that represents the "Granted-Service-Unit" grouped AVP."""
     cc_time: int = None
@@ -559,7 +723,7 @@ identical.
 """
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UsedServiceUnit:
     """A data container that represents the "Used-Service-Unit" (402) grouped AVP."""
     tariff_change_usage: int = None
@@ -589,7 +753,7 @@ class UsedServiceUnit:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class GsuPoolReference:
     """A data container that represents the "G-S-U-Pool-Reference" grouped AVP."""
     g_s_u_pool_identifier: int = None
@@ -604,7 +768,7 @@ class GsuPoolReference:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RedirectServer:
     """A data container that represents the "Redirect-Server" grouped AVP."""
     redirect_address_type: int = None
@@ -617,7 +781,7 @@ class RedirectServer:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TimeOfDayCondition:
     """A data container that represents the "Time-Of-Day-Condition" grouped AVP."""
     time_of_day_start: int = None
@@ -643,7 +807,7 @@ class TimeOfDayCondition:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class FinalUnitIndication:
     """A data container that represents the "Final-Unit-Indication" grouped AVP.
 
@@ -667,7 +831,7 @@ class FinalUnitIndication:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IpAddressRange:
     """A data container that represents the "IP-Address-Range" grouped AVP."""
     ip_address_start: str = None
@@ -681,7 +845,7 @@ class IpAddressRange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IpAddressMask:
     """A data container that represents the "IP-Address-Mask" grouped AVP."""
     ip_address: str = None
@@ -695,7 +859,7 @@ class IpAddressMask:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MacAddressMask:
     """A data container that represents the "MAC-Address-Mask" grouped AVP."""
     mac_address: bytes = None
@@ -709,7 +873,7 @@ class MacAddressMask:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Eui64AddressMask:
     """A data container that represents the "EUI64-Address-Mask" grouped AVP."""
     eui64_address: bytes = None
@@ -723,7 +887,7 @@ class Eui64AddressMask:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PortRange:
     """A data container that represents the "Port-Range" grouped AVP."""
     port_start: int = None
@@ -737,7 +901,7 @@ class PortRange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class FromToSpec:
     ip_address: list[str] = dataclasses.field(default_factory=list)
     ip_address_range: list[IpAddressRange] = dataclasses.field(default_factory=list)
@@ -768,19 +932,19 @@ class FromToSpec:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class FromSpec(FromToSpec):
     """A data container that represents the From-Spec AVP."""
     pass
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ToSpec(FromToSpec):
     """A data container that represents the To-Spec AVP."""
     pass
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IpOption:
     """A data container that represents the IP-Option AVP."""
     ip_option_type: int = None
@@ -796,7 +960,7 @@ class IpOption:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TcpOption(GenericSpec):
     """A data container that represents the Tcp-Option AVP."""
     tcp_option_type: int = None
@@ -812,7 +976,7 @@ class TcpOption(GenericSpec):
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TcpFlags:
     """A data container that represents the Tcp-Flags AVP."""
     tcp_flag_type: int = None
@@ -826,7 +990,7 @@ class TcpFlags:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IcmpType:
     """A data container that represents the ICMP-Type AVP."""
     icmp_type_number: int = None
@@ -842,7 +1006,7 @@ class IcmpType:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EthProtoType:
     """A data container that represents the ETH-Proto-Type AVP."""
     eth_ether_type: list[bytes] = dataclasses.field(default_factory=list)
@@ -856,7 +1020,7 @@ class EthProtoType:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UserPriorityRange:
     """A data container that represents the User-Priority-Range AVP."""
     low_user_priority: list[int] = dataclasses.field(default_factory=list)
@@ -870,7 +1034,7 @@ class UserPriorityRange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class VlanIdRange:
     """A data container that represents the VLAN-ID-Range AVP."""
     s_vid_start: int = None
@@ -888,7 +1052,7 @@ class VlanIdRange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EthOption:
     """A data container that represents the ETH-Option AVP."""
     eth_proto_type: EthProtoType = None
@@ -904,7 +1068,7 @@ class EthOption:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Classifier:
     """A data container that represents the "Clasifier" grouped AVP."""
     classifier_id: bytes = None
@@ -938,7 +1102,7 @@ class Classifier:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class QosParameters:
     """A data container that represents the "QoS-Parameters" grouped AVP."""
     additional_avps: list[Avp] = dataclasses.field(default_factory=list)
@@ -946,7 +1110,7 @@ class QosParameters:
     avp_def: dataclasses.InitVar[AvpGenType] = ()
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class QosProfileTemplate:
     """A data container that represents the "QoS-Profile-Template" grouped AVP."""
     vendor_id: int = None
@@ -960,7 +1124,7 @@ class QosProfileTemplate:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ExcessTreatment:
     """A data container that represents the "Excess-Treatment" grouped AVP."""
     treatment_action: int = None
@@ -976,7 +1140,7 @@ class ExcessTreatment:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class FilterRule:
     """A data container that represents the "Filter-Rule" grouped AVP.
 
@@ -1005,7 +1169,7 @@ class FilterRule:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceParameterInfo:
     """A data container that represents the "Service-Parameter-Info" grouped AVP."""
     service_parameter_type: int = None
@@ -1018,7 +1182,7 @@ class ServiceParameterInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SubscriptionId:
     """A data container that represents the "Subscription-ID" grouped AVP."""
     subscription_id_type: int = None
@@ -1031,7 +1195,7 @@ class SubscriptionId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UserEquipmentInfo:
     """A data container that represents the "User-Equipment-Info" grouped AVP."""
     user_equipment_info_type: int = None
@@ -1044,7 +1208,7 @@ class UserEquipmentInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UserEquipmentInfoExtension:
     """A data container that represents the "User-Equipment-Info-Extension" grouped AVP."""
     user_equipment_info_imeisv: bytes = None
@@ -1063,7 +1227,7 @@ class UserEquipmentInfoExtension:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProxyInfo:
     """A data container that represents the "Proxy-Info" grouped AVP."""
     proxy_host: bytes = None
@@ -1076,7 +1240,7 @@ class ProxyInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CostInformation:
     """A data container that represents the "Cost-Information" grouped AVP."""
     unit_value: UnitValue = None
@@ -1091,7 +1255,7 @@ class CostInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RedirectServerExtension:
     """A data container that represents the "Redirect-Server-Extension" grouped AVP.
 
@@ -1114,7 +1278,7 @@ class RedirectServerExtension:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class QosFinalUnitIndication:
     """A data container that represents the "QoS-Final-Unit-Indication" (669) grouped AVP."""
     final_unit_action: int = None
@@ -1132,7 +1296,7 @@ class QosFinalUnitIndication:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Tunneling:
     """A data container that represents the "Tunneling" (401) grouped AVP."""
     tunnel_type: int = None
@@ -1161,7 +1325,7 @@ class Tunneling:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ChapAuth:
     """A data container that represents the "Chap-Auth" (402) grouped AVP."""
     chap_algorithm: int = None
@@ -1177,7 +1341,7 @@ class ChapAuth:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class OcSupportedFeatures:
     """A data container that represents the "OC-Supported-Features" (621) grouped AVP.
 
@@ -1192,7 +1356,7 @@ class OcSupportedFeatures:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class OcOlr:
     """A data container that represents the "OC-OLR" (623) grouped AVP.
 
@@ -1213,7 +1377,7 @@ class OcOlr:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Flows:
     """A data container that represents the "Flows" (510) grouped AVP.
 
@@ -1236,7 +1400,7 @@ class Flows:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CalleeInformation:
     """A data container that represents the "Callee-Information" (565) grouped AVP.
 
@@ -1255,7 +1419,7 @@ class CalleeInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServerCapabilities:
     """A data container that represents the "Server-Capabilities" (603) grouped AVP.
 
@@ -1274,7 +1438,7 @@ class ServerCapabilities:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Load:
     """A data container that represents the "Load" (650) AVP.
 
@@ -1293,7 +1457,7 @@ class Load:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SipDigestAuthenticate:
     """A data container that represents the "SIP-Digest-Authenticate" (635) grouped AVP.
 
@@ -1314,7 +1478,7 @@ class SipDigestAuthenticate:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SipAuthDataItem:
     """A data container that represents the "SIP-Auth-Data-Item" (612) grouped AVP.
 
@@ -1351,7 +1515,7 @@ class SipAuthDataItem:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class DeregistrationReason:
     """A data container that represents the "Deregistration-Reason" (615) grouped AVP.
 
@@ -1368,7 +1532,7 @@ class DeregistrationReason:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ChargingInformation:
     """A data container that represents the "Charging-Information" (618) grouped AVP.
 
@@ -1389,7 +1553,7 @@ class ChargingInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SupportedFeatures:
     """A data container that represents the "Supported-Features" (628) grouped AVP.
 
@@ -1408,7 +1572,7 @@ class SupportedFeatures:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AssociatedIdentities:
     """A data container that represents the "Associated-Identities" (632) grouped AVP.
 
@@ -1423,7 +1587,7 @@ class AssociatedIdentities:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SubscriptionInfo:
     """A data container that represents the "Subscription-Info" (642) grouped AVP.
 
@@ -1446,7 +1610,7 @@ class SubscriptionInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AssociatedRegisteredIdentities:
     """A data container that represents the "Associated-Registered-Identities" (647) grouped AVP.
 
@@ -1461,7 +1625,7 @@ class AssociatedRegisteredIdentities:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RestorationInfo:
     """A data container that represents the "Restoration-Info" (649) grouped AVP.
 
@@ -1484,7 +1648,7 @@ class RestorationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ScscfRestorationInfo:
     """A data container that represents the "SCSCF-Restoration-Info" (639) grouped AVP.
 
@@ -1503,7 +1667,7 @@ class ScscfRestorationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IdentityWithEmergencyRegistration:
     """A data container that represents the "Identity-with-Emergency-Registration" (651) grouped AVP.
 
@@ -1520,7 +1684,7 @@ class IdentityWithEmergencyRegistration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AllowedWafWwsfIdentities:
     """A data container that represents the "Allowed-WAF-WWSF-Identities" (656) grouped AVP.
 
@@ -1537,7 +1701,7 @@ class AllowedWafWwsfIdentities:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UserIdentity:
     """A data container that represents the "User-Identity" (700) grouped AVP."""
     public_identity: str = None
@@ -1553,7 +1717,7 @@ class UserIdentity:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RepositoryDataId:
     """A data container that represents the "Repository-Data-ID" (715) grouped AVP."""
     service_indication: bytes = None
@@ -1567,7 +1731,7 @@ class RepositoryDataId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CallReferenceInfo:
     """A data container that represents the "Call-Reference-Info" (720) grouped AVP."""
     call_reference_number: bytes = None
@@ -1581,7 +1745,7 @@ class CallReferenceInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EventType:
     """A data container that represents the "Event-Type" (823) grouped AVP.
 
@@ -1599,7 +1763,7 @@ class EventType:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TimeStamps:
     """A data container that represents the "Time-Stamps" (833) grouped AVP.
 
@@ -1619,7 +1783,7 @@ class TimeStamps:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class InterOperatorIdentifier:
     """A data container that represents the "Inter-Operator-Identifier" (838) grouped AVP.
 
@@ -1635,7 +1799,7 @@ class InterOperatorIdentifier:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SdpMediaComponent:
     """A data container that represents the "SDP-Media-Component" (843) grouped AVP.
 
@@ -1667,7 +1831,7 @@ class SdpMediaComponent:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ApplicationServerInformation:
     """A data container that represents the "Application-Server-Information" (850) grouped AVP.
 
@@ -1685,7 +1849,7 @@ class ApplicationServerInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TrunkGroupId:
     """A data container that represents the "Application-Server-Information" (850) grouped AVP.
 
@@ -1701,7 +1865,7 @@ class TrunkGroupId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Cause:
     """A data container that represents the "Cause" (860) grouped AVP.
 
@@ -1717,7 +1881,7 @@ class Cause:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PsFurnishChargingInformation:
     """A data container that represents the "PS-Furnish-Charging-Information" (865) grouped AVP.
 
@@ -1735,7 +1899,7 @@ class PsFurnishChargingInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LcsClientName:
     """A data container that represents the "LCS-Client-Name" (1235) grouped AVP.
 
@@ -1753,7 +1917,7 @@ class LcsClientName:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LcsRequestorId:
     """A data container that represents the "LCS-Requestor-ID" (1239) grouped AVP.
 
@@ -1769,7 +1933,7 @@ class LcsRequestorId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LcsClientId:
     """A data container that represents the "LCS-Client-ID" (1232) grouped AVP.
 
@@ -1793,7 +1957,7 @@ class LcsClientId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LocationType:
     """A data container that represents the "Location-Type" (1244) grouped AVP.
 
@@ -1809,7 +1973,7 @@ class LocationType:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LcsInformation:
     """A data container that represents the "LCS-Information" (878) grouped AVP.
 
@@ -1833,7 +1997,7 @@ class LcsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MessageBody:
     """A data container that represents the "Message-Body" (889) grouped AVP.
 
@@ -1853,7 +2017,7 @@ class MessageBody:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AddressDomain:
     """A data container that represents the "Address-Domain" (898) grouped AVP.
 
@@ -1869,7 +2033,7 @@ class AddressDomain:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class OriginatorAddress:
     """A data container that represents the "Originator-Address" (886) grouped AVP.
 
@@ -1887,7 +2051,7 @@ class OriginatorAddress:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class QosInformation:
     """A data container that represents the "QoS-Information" (1016) grouped AVP.
 
@@ -1915,7 +2079,7 @@ class QosInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RecipientAddress:
     """A data container that represents the "Recipient-Address" (1201) grouped AVP.
 
@@ -1935,7 +2099,7 @@ class RecipientAddress:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AdditionalContentInformation:
     """A data container that represents the "Additional-Content-Information" (1207) grouped AVP.
 
@@ -1953,7 +2117,7 @@ class AdditionalContentInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MmContentType:
     """A data container that represents the "MM-Content-Type" (1203) grouped AVP.
 
@@ -1973,7 +2137,7 @@ class MmContentType:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MessageClass:
     """A data container that represents the "Message-Class" (1213) grouped AVP.
 
@@ -1989,7 +2153,7 @@ class MessageClass:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceSpecificInfo:
     """A data container that represents the "Service-Specific-Info" (1249) grouped AVP.
 
@@ -2005,7 +2169,7 @@ class ServiceSpecificInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PocUserRole:
     """A data container that represents the "PoC-User-Role" (1252) grouped AVP.
 
@@ -2021,7 +2185,7 @@ class PocUserRole:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TalkBurstExchange:
     """A data container that represents the "Talk-Burst-Exchange" (1255) grouped AVP.
 
@@ -2051,7 +2215,7 @@ class TalkBurstExchange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ParticipantGroup:
     """A data container that represents the "Participant-Group" (1260) grouped AVP.
 
@@ -2069,7 +2233,7 @@ class ParticipantGroup:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Trigger:
     """A data container that represents the "Trigger" (1264) grouped AVP.
 
@@ -2083,7 +2247,7 @@ class Trigger:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Envelope:
     """A data container that represents the "Envelope" (1266) grouped AVP.
 
@@ -2107,7 +2271,7 @@ class Envelope:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TimeQuotaMechanism:
     """A data container that represents the "Time-Quota-Mechanism" (1270) grouped AVP.
 
@@ -2123,7 +2287,7 @@ class TimeQuotaMechanism:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SdpTimestamps:
     """A data container that represents the "SDP-Timestamps" (1273) grouped AVP.
 
@@ -2139,7 +2303,7 @@ class SdpTimestamps:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EarlyMediaDescription:
     """A data container that represents the "Early-Media-Description" (1272) grouped AVP.
 
@@ -2157,7 +2321,7 @@ class EarlyMediaDescription:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AfCorrelationInformation:
     """A data container that represents the "AF-Correlation-Information" (1276) grouped AVP.
 
@@ -2173,7 +2337,7 @@ class AfCorrelationInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RanSecondaryRatUsageReport:
     """A data container that represents the "RAN-Secondary-RAT-Usage-Report" (1302) grouped AVP.
 
@@ -2197,7 +2361,7 @@ class RanSecondaryRatUsageReport:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class WlanOperatorId:
     """A data container that represents the "WLAN-Operator-Id" (1306) grouped AVP.
 
@@ -2213,7 +2377,7 @@ class WlanOperatorId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class VolteInformation:
     """A data container that represents the "VoLTE-Information" (1323) grouped AVP.
 
@@ -2229,7 +2393,7 @@ class VolteInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AllocationRetentionPriority:
     """A data container that represents the "Allocation-Retention-Priority" (1034) grouped AVP."""
     priority_level: int = None
@@ -2244,7 +2408,7 @@ class AllocationRetentionPriority:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class DefaultEpsBearerQos:
     """A data container that represents the "Default-EPS-Bearer-QoS" (1435) grouped AVP."""
     qos_class_identifier: int = None
@@ -2257,7 +2421,7 @@ class DefaultEpsBearerQos:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EpsSubscribedQosProfile:
     """A data container that represents the "PS-Subscribed-QoS-Profile" (1431) grouped AVP.
 
@@ -2274,7 +2438,7 @@ class EpsSubscribedQosProfile:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Ambr:
     """A data container that represents the "AMBR" (1435) grouped AVP.
 
@@ -2295,7 +2459,7 @@ class Ambr:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SpecificApnInfo:
     """A data container that represents the "Specific-APN-Info" (1472) grouped AVP.
 
@@ -2314,7 +2478,7 @@ class SpecificApnInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class WlanOffloadability:
     """A data container that represents the "WLAN-offloadability" (1667) grouped AVP.
 
@@ -2331,7 +2495,7 @@ class WlanOffloadability:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RequestedEutranAuthenticationInfo:
     """A data container that represents the "Requested-EUTRAN-Authentication-Info" (1408) AVP.
 
@@ -2350,7 +2514,7 @@ class RequestedEutranAuthenticationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RequestedUtranGeranAuthenticationInfo:
     """A data container that represents the "Requested-UTRAN-GERAN-Authentication-Info" (1409) AVP.
 
@@ -2369,7 +2533,7 @@ class RequestedUtranGeranAuthenticationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EUtranVector:
     """A data container that represents the "E-UTRAN-Vector" (1414) AVP.
 
@@ -2392,7 +2556,7 @@ class EUtranVector:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UtranVector:
     """A data container that represents the "UTRAN-Vector" (1415) AVP.
 
@@ -2417,7 +2581,7 @@ class UtranVector:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class GeranVector:
     """A data container that represents the "GERAN-Vector" (1416) AVP.
 
@@ -2438,7 +2602,7 @@ class GeranVector:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AuthenticationInfo:
     """A data container that represents the "Authentication-Info" (1413) AVP.
 
@@ -2457,7 +2621,7 @@ class AuthenticationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ApnConfiguration:
     """A data container that represents the "APN-Configuration" (1430) grouped AVP.
 
@@ -2524,7 +2688,7 @@ class ApnConfiguration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ExternalClient:
     """A data container that represents the "External-Client" (1479) grouped AVP.
 
@@ -2543,7 +2707,7 @@ class ExternalClient:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ApnConfigurationProfile:
     """A data container that represents the "APN-Configuration-Profile" (1429) grouped AVP.
 
@@ -2566,7 +2730,7 @@ class ApnConfigurationProfile:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AreaScope:
     """A data container that represents the "Area-Scope" (1623) AVP.
 
@@ -2591,7 +2755,7 @@ class AreaScope:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MbsfnArea:
     """A data container that represents the "MBSFN-Area" (1694) AVP.
 
@@ -2608,7 +2772,7 @@ class MbsfnArea:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MdtConfiguration:
     """A data container that represents the "MDT-Configuration" (1622) AVP.
 
@@ -2661,7 +2825,7 @@ class MdtConfiguration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MdtConfigurationNr:
     """A data container that represents the "MDT-Configuration-NR" (1720) AVP.
 
@@ -2704,7 +2868,7 @@ class MdtConfigurationNr:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TraceData:
     """A data container that represents the "Trace-Data" (1458) AVP.
 
@@ -2737,7 +2901,7 @@ class TraceData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PdpContext:
     """A data container that represents the "PDP-Context" (1469) AVP.
 
@@ -2784,7 +2948,7 @@ class PdpContext:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LcsPrivacyException:
     """A data container that represents the "LCS-PrivacyException" (1475) grouped AVP.
 
@@ -2809,7 +2973,7 @@ class LcsPrivacyException:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MoLr:
     """A data container that represents the "MO-LR" (1485) grouped AVP.
 
@@ -2826,7 +2990,7 @@ class MoLr:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LcsInfo:
     """A data container that represents the "LCS-Info" (1473) grouped AVP.
 
@@ -2845,7 +3009,7 @@ class LcsInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TeleServiceList:
     """A data container that represents the "Teleservice-List" (1486) grouped AVP.
 
@@ -2860,7 +3024,7 @@ class TeleServiceList:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CallBarringInfo:
     """A data container that represents the "Call-Barring-Info" (1488) grouped AVP.
 
@@ -2877,7 +3041,7 @@ class CallBarringInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class GprsSubscriptionData:
     """A data container that represents the "GPRS-Subscription-Data" (1467) AVP.
 
@@ -2894,7 +3058,7 @@ class GprsSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CsgSubscriptionData:
     """A data container that represents the "CSG-Subscription-Data" (1436) AVP.
 
@@ -2915,7 +3079,7 @@ class CsgSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceType:
     """A data container that represents the "Service-Type" (1483) AVP.
 
@@ -2934,7 +3098,7 @@ class ServiceType:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MmeUserState:
     """A data container that represents the "MME-User-State" (1497) AVP.
 
@@ -2949,7 +3113,7 @@ class MmeUserState:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SgsnUserState:
     """A data container that represents the "SGSN-User-State" (1498) AVP.
 
@@ -2964,7 +3128,7 @@ class SgsnUserState:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EpsUserState:
     """A data container that represents the "EPS-User-State" (1495) AVP.
 
@@ -2981,7 +3145,7 @@ class EpsUserState:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UserCsgInformation:
     """A data container that represents the "User-CSG-Information" (2319) grouped AVP.
 
@@ -2999,7 +3163,7 @@ class UserCsgInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MmeLocationInformation:
     """A data container that represents the "MME-Location-Information" (1600) AVP.
 
@@ -3030,7 +3194,7 @@ class MmeLocationInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SgsnLocationInformation:
     """A data container that represents the "SGSN-Location-Information" (1601) AVP.
 
@@ -3061,7 +3225,7 @@ class SgsnLocationInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ActiveApn:
     """A data container that represents the "Active-APN" (1612) AVP.
 
@@ -3084,7 +3248,7 @@ class ActiveApn:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EquivalentPlmnList:
     """A data container that represents the "Equivalent-PLMN-List" (1637) AVP.
 
@@ -3099,7 +3263,7 @@ class EquivalentPlmnList:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class VplmnCsgSubscriptionData:
     """A data container that represents the "VPLMN-CSG-Subscription-Data" (1641) AVP.
 
@@ -3116,7 +3280,7 @@ class VplmnCsgSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LocalTimeZone:
     """A data container that represents the "Local-Time-Zone" (1649) AVP.
 
@@ -3133,7 +3297,7 @@ class LocalTimeZone:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AdjacentPlmns:
     """A data container that represents the "Adjacent-PLMNs" (1672) AVP.
 
@@ -3148,7 +3312,7 @@ class AdjacentPlmns:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AdjacentAccessRestrictionData:
     """A data container that represents the "Adjacent-Access-Restriction-Data" (1673) AVP.
 
@@ -3165,7 +3329,7 @@ class AdjacentAccessRestrictionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ImsiGroupId:
     """A data container that represents the "IMSI-Group-Id" (1675) AVP.
 
@@ -3184,7 +3348,7 @@ class ImsiGroupId:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EpsLocationInformation:
     """A data container that represents the "EPS-Location-Information" (1496) AVP.
 
@@ -3201,7 +3365,7 @@ class EpsLocationInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EmergencyInfo:
     """A data container that represents the "Emergency-Info" (1687) AVP.
 
@@ -3216,7 +3380,7 @@ class EmergencyInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class V2xSubscriptionData:
     """A data container that represents the "V2X-Subscription-Data" (1688) AVP.
 
@@ -3233,7 +3397,7 @@ class V2xSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EdrxCycleLength:
     """A data container that represents the "eDRX-Cycle-Length" (1691) AVP.
 
@@ -3250,7 +3414,7 @@ class EdrxCycleLength:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UeReachabilityConfiguration:
     """A data container that represents the "UE-Reachability-Configuration" (3129) AVP.
 
@@ -3267,7 +3431,7 @@ class UeReachabilityConfiguration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LocationInformationConfiguration:
     """A data container that represents the "Location-Information-Configuration" (3135) AVP.
 
@@ -3286,7 +3450,7 @@ class LocationInformationConfiguration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MtcProviderInfo:
     """A data container that represents the "MTC-Provider-Info" (3178) AVP.
 
@@ -3301,7 +3465,7 @@ class MtcProviderInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PdnConnectivityStatusConfiguration:
     """A data container that represents the "PDN-Connectivity-Status-Configuration" (3180) AVP.
 
@@ -3316,7 +3480,7 @@ class PdnConnectivityStatusConfiguration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PdnConnectivityStatusReport:
     """A data container that represents the "PDN-Connectivity-Status-Report" (3181) AVP.
 
@@ -3341,7 +3505,7 @@ class PdnConnectivityStatusReport:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MonitoringEventConfiguration:
     """A data container that represents the "Monitoring-Event-Configuration" (3122) AVP.
 
@@ -3384,7 +3548,7 @@ class MonitoringEventConfiguration:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceResult:
     """A data container that represents the "Service-Result" (3146) AVP.
 
@@ -3401,7 +3565,7 @@ class ServiceResult:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceReport:
     """A data container that represents the "Service-Report" (3152) AVP.
 
@@ -3418,7 +3582,7 @@ class ServiceReport:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MonitoringEventConfigStatus:
     """A data container that represents the "Monitoring-Event-Config-Status" (3142) AVP.
 
@@ -3437,7 +3601,7 @@ class MonitoringEventConfigStatus:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IdleStatusIndication:
     """A data container that represents the "Idle-Status-Indication" (4322) AVP.
 
@@ -3460,7 +3624,7 @@ class IdleStatusIndication:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ScheduledCommunicationTime:
     """A data container that represents the "Scheduled-communication-time" (3118) AVP.
 
@@ -3479,7 +3643,7 @@ class ScheduledCommunicationTime:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CommunicationPatternSet:
     """A data container that represents the "Communication-Pattern-Set" (3114) AVP.
 
@@ -3508,7 +3672,7 @@ class CommunicationPatternSet:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AeseCommunicationPattern:
     """A data container that represents the "AESE-Communication-Pattern" (3113) AVP.
 
@@ -3535,7 +3699,7 @@ class AeseCommunicationPattern:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MonitoringEventReport:
     """A data container that represents the "Monitoring-Event-Report" (3123) AVP.
 
@@ -3570,7 +3734,7 @@ class MonitoringEventReport:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SupportedServices:
     """A data container that represents the "Supported-Services" (3143) AVP.
 
@@ -3585,7 +3749,7 @@ class SupportedServices:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProseAllowedPlmn:
     """A data container that represents the "ProSe-Allowed-PLMN" (3703) AVP.
 
@@ -3604,7 +3768,7 @@ class ProseAllowedPlmn:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProSeSubscriptionData:
     """A data container that represents the "ProSe-Subscription-Data" (3701) AVP.
 
@@ -3623,7 +3787,7 @@ class ProSeSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Pc5FlowBitrates:
     """A data container that represents the "PC5-Flow-Bitrates" (1714) AVP.
 
@@ -3639,7 +3803,7 @@ class Pc5FlowBitrates:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class Pc5QosFlow:
     """A data container that represents the "PC5-QoS-Flow" (1712) AVP.
 
@@ -3658,7 +3822,7 @@ class Pc5QosFlow:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UePc5Qos:
     """A data container that represents the "UE-PC5-QoS" (1711) AVP.
 
@@ -3675,7 +3839,7 @@ class UePc5Qos:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class V2xSubscriptionData:
     """A data container that represents the "V2X-Subscription-Data" (1688) AVP.
 
@@ -3692,7 +3856,7 @@ class V2xSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class V2xSubscriptionDataNr:
     """A data container that represents the "V2X-Subscription-Data-Nr" (1710) AVP.
 
@@ -3711,7 +3875,7 @@ class V2xSubscriptionDataNr:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PagingTimeWindow:
     """A data container that represents the "Paging-Time-Window" (1701) AVP.
 
@@ -3728,7 +3892,7 @@ class PagingTimeWindow:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SubscriptionData:
     """A data container that represents the "Subscription-Data" (1400) grouped AVP.
 
@@ -3841,7 +4005,7 @@ class SubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SubscriptionDataDeletion:
     """A data container that represents the "Subscription-Data-Deletion" (1685) AVP.
 
@@ -3866,7 +4030,7 @@ class SubscriptionDataDeletion:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EdrxRelatedRat:
     """A data container that represents the "eDRX-Related-RAT" (1705) AVP.
 
@@ -3881,7 +4045,7 @@ class EdrxRelatedRat:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TerminalInformation:
     """A data container that represents the "Terminal-Information" (1401) grouped AVP.
 
@@ -3900,7 +4064,7 @@ class TerminalInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class DestinationInterface:
     """A data container that represents the "Destination-Interface" (2002) grouped AVP.
 
@@ -3920,7 +4084,7 @@ class DestinationInterface:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class OriginatorInterface:
     """A data container that represents the "Originator-Interface" (2009) grouped AVP.
 
@@ -3940,7 +4104,7 @@ class OriginatorInterface:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RemainingBalance:
     """A data container that represents the "Remaining-Balance" (2021) grouped AVP.
 
@@ -3956,7 +4120,7 @@ class RemainingBalance:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class OriginatorReceivedAddress:
     """A data container that represents the "Originator-Received-Address" (2027) grouped AVP.
 
@@ -3974,7 +4138,7 @@ class OriginatorReceivedAddress:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RecipientReceivedAddress:
     """A data container that represents the "Recipient-Received-Address" (2028) grouped AVP.
 
@@ -3992,7 +4156,7 @@ class RecipientReceivedAddress:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RecipientInfo:
     """A data container that represents the "Recipient-Info" (2026) grouped AVP.
 
@@ -4014,7 +4178,7 @@ class RecipientInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServingNode:
     """A data container that represents the "Serving-Node" (2401) grouped AVP.
 
@@ -4045,7 +4209,7 @@ class ServingNode:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class NniInformation:
     """A data container that represents the "NNI-Information" (2703) grouped AVP.
 
@@ -4065,7 +4229,7 @@ class NniInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AccessTransferInformation:
     """A data container that represents the "Access-Transfer-Information" (2709) grouped AVP.
 
@@ -4095,7 +4259,7 @@ class AccessTransferInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TwanUserLocationInfo:
     """A data container that represents the "TWAN-User-Location-Info" (2714) grouped AVP.
 
@@ -4117,7 +4281,7 @@ class TwanUserLocationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PresenceReportingAreaInformation:
     """A data container that represents the "Presence-Reporting-Area-Information" (2822) grouped AVP.
 
@@ -4136,7 +4300,7 @@ class PresenceReportingAreaInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PolicyCounterStatusReport:
     """A data container that represents the "Policy-Counter-Status-Report" (2903) grouped AVP.
 
@@ -4153,7 +4317,7 @@ class PolicyCounterStatusReport:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SmDeviceTriggerInformation:
     """A data container that represents the "SM-Device-Trigger-Information" (3405) grouped AVP.
 
@@ -4177,7 +4341,7 @@ class SmDeviceTriggerInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class EnhancedDiagnostics:
     """A data container that represents the "Enhanced-Diagnostics" (3901) grouped AVP.
 
@@ -4191,7 +4355,7 @@ class EnhancedDiagnostics:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class VariablePart:
     """A data container that represents the "Variable-Part" (3907) grouped AVP.
 
@@ -4209,7 +4373,7 @@ class VariablePart:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AnnouncementInformation:
     """A data container that represents the "Announcement-Information" (3904) grouped AVP.
 
@@ -4237,7 +4401,7 @@ class AnnouncementInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CalledIdentityChange:
     """A data container that represents the "Called-Identity-Change" (3917) grouped AVP.
 
@@ -4253,7 +4417,7 @@ class CalledIdentityChange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UwanUserLocationInfo:
     """A data container that represents the "UWAN-User-Location-Info" (3918) grouped AVP.
 
@@ -4279,7 +4443,7 @@ class UwanUserLocationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RelatedChangeConditionInformation:
     """A data container that represents the "Related-Change-Condition-Information" (3925) grouped AVP.
 
@@ -4307,7 +4471,7 @@ class RelatedChangeConditionInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ApnRateControlUplink:
     """A data container that represents the "APN-Rate-Control-Uplink" (3934) grouped AVP.
 
@@ -4325,7 +4489,7 @@ class ApnRateControlUplink:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ApnRateControlDownlink:
     """A data container that represents the "APN-Rate-Control-Downlink" (3935) grouped AVP.
 
@@ -4343,7 +4507,7 @@ class ApnRateControlDownlink:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ApnRateControl:
     """A data container that represents the "APN-Rate-Control" (3933) grouped AVP.
 
@@ -4359,7 +4523,7 @@ class ApnRateControl:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServingPlmnRateControl:
     """A data container that represents the "Serving-PLMN-Rate-Control" (4310) grouped AVP.
 
@@ -4376,7 +4540,7 @@ class ServingPlmnRateControl:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AccessNetworkInfoChange:
     """A data container that represents the "Access-Network-Info-Change" (4401) grouped AVP.
 
@@ -4394,7 +4558,7 @@ class AccessNetworkInfoChange:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceDataContainer:
     """A data container that represents the "Traffic-Data-Volumes" (2040) grouped AVP.
 
@@ -4472,7 +4636,7 @@ class ServiceDataContainer:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TrafficDataVolumes:
     """A data container that represents the "Traffic-Data-Volumes" (2046) grouped AVP.
 
@@ -4522,7 +4686,7 @@ class TrafficDataVolumes:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class FixedUserLocationInfo:
     """A data container that represents the "Fixed-User-Location-Info" (2825) grouped AVP.
 
@@ -4544,7 +4708,7 @@ class FixedUserLocationInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class BasicServiceCode:
     """A data container that represents the "Basic-Service-Code" (3411) grouped AVP.
 
@@ -4560,7 +4724,7 @@ class BasicServiceCode:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IsupCause:
     """A data container that represents the "ISUP-Cause" (3416) grouped AVP.
 
@@ -4578,7 +4742,7 @@ class IsupCause:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProSeDirectCommunicationTransmissionDataContainer:
     """A data container that represents the "ProSe-Direct-Communication-Transmission-Data-Container" (3441) grouped AVP.
 
@@ -4610,7 +4774,7 @@ class ProSeDirectCommunicationTransmissionDataContainer:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class LocationInfo:
     """A data container that represents the "Location-Info" (3460) grouped AVP.
 
@@ -4656,7 +4820,7 @@ as "LocationInfo" conflicts with a message command with the same name.
 """
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CoverageInfo:
     """A data container that represents the "Coverage-Info" (3459) grouped AVP.
 
@@ -4674,7 +4838,7 @@ class CoverageInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProSeDirectCommunicationReceptionDataContainer:
     """A data container that represents the "ProSe-Direct-Communication-Reception-Data-Container" (3461) grouped AVP.
 
@@ -4706,7 +4870,7 @@ class ProSeDirectCommunicationReceptionDataContainer:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RadioParameterSetInfo:
     """A data container that represents the "Radio-Parameter-Set-Values" (3463) grouped AVP.
 
@@ -4722,7 +4886,7 @@ class RadioParameterSetInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TransmitterInfo:
     """A data container that represents the "Transmitter-Info" (3468) grouped AVP.
 
@@ -4738,7 +4902,7 @@ class TransmitterInfo:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RelatedTrigger:
     """A data container that represents the "Related-Trigger" (3926) grouped AVP.
 
@@ -4752,7 +4916,7 @@ class RelatedTrigger:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class NiddSubmission:
     """A data container that represents the "NIDD-Submission" (3928) grouped AVP.
 
@@ -4775,7 +4939,7 @@ class NiddSubmission:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ScsAsAddress:
     """A data container that represents the "SCS-AS-Address" (3940) grouped AVP.
 
@@ -4791,7 +4955,7 @@ class ScsAsAddress:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RrcCauseCounter:
     """A data container that represents the "RRC-Cause-Counter" (4318) grouped AVP.
 
@@ -4808,7 +4972,7 @@ class RrcCauseCounter:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MultipleServicesCreditControl:
     """A data container that represents the "Multiple-Services-Credit-Control" (456) grouped AVP."""
     granted_service_unit: GrantedServiceUnit = None
@@ -4877,7 +5041,7 @@ class MultipleServicesCreditControl:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class OfflineCharging:
     """A data container that represents the "Offline-Charging" (1278) grouped AVP.
 
@@ -4898,7 +5062,7 @@ class OfflineCharging:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PsInformation:
     """A data container that represents the "PS-Information" (874) grouped AVP.
 
@@ -5056,7 +5220,7 @@ class PsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SmsInformation:
     """A data container that represents the "SMS-Information" (2000) grouped AVP.
 
@@ -5112,7 +5276,7 @@ class SmsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AccumulatedCost:
     """A data container that represents the "Accumulated-Digits" (2052) grouped AVP.
 
@@ -5128,7 +5292,7 @@ class AccumulatedCost:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class IncrementalCost:
     """A data container that represents the "Incremental-Cost" (2062) grouped AVP.
 
@@ -5144,7 +5308,7 @@ class IncrementalCost:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AocCostInformation:
     """A data container that represents the "AoC-Cost-Information" (2053) grouped AVP.
 
@@ -5162,7 +5326,7 @@ class AocCostInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class UnitCost:
     """A data container that represents the "Unit-Cost" (2061) grouped AVP.
 
@@ -5178,7 +5342,7 @@ class UnitCost:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RateElement:
     """A data container that represents the "Rate-Element" (2058) grouped AVP.
 
@@ -5200,7 +5364,7 @@ class RateElement:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ScaleFactor:
     """A data container that represents the "Scale-Factor" (2059) grouped AVP.
 
@@ -5216,7 +5380,7 @@ class ScaleFactor:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CurrentTariff:
     """A data container that represents the "Current-Tariff" (2056) grouped AVP.
 
@@ -5235,7 +5399,7 @@ class CurrentTariff:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class NextTariff:
     """A data container that represents the "Next-Tariff" (2057) grouped AVP.
 
@@ -5254,7 +5418,7 @@ class NextTariff:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class TariffInformation:
     """A data container that represents the "Tariff-Information" (2060) grouped AVP.
 
@@ -5272,7 +5436,7 @@ class TariffInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class RealTimeTariffInformation:
     """A data container that represents the "Real-Time-Tariff-Information" (2305) grouped AVP.
 
@@ -5288,7 +5452,7 @@ class RealTimeTariffInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AocService:
     """A data container that represents the "AoC-Service" (2311) grouped AVP.
 
@@ -5304,7 +5468,7 @@ class AocService:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AocSubscriptionInformation:
     """A data container that represents the "AoC-Subscription-Information" (2314) grouped AVP.
 
@@ -5322,7 +5486,7 @@ class AocSubscriptionInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class AocInformation:
     """A data container that represents the "AoC-Information" (2054) grouped AVP.
 
@@ -5340,7 +5504,7 @@ class AocInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class SupplementaryService:
     """A data container that represents the "Supplementary-Service" (2048) grouped AVP.
 
@@ -5372,7 +5536,7 @@ class SupplementaryService:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MmtelInformation:
     """A data container that represents the "MMTel-Information" (2030) grouped AVP.
 
@@ -5386,7 +5550,7 @@ class MmtelInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ImsInformation:
     """A data container that represents the "IMS-Information" (876) grouped AVP.
 
@@ -5504,7 +5668,7 @@ class ImsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MmsInformation:
     """A data container that represents the "Service-Information" (877) grouped AVP.
 
@@ -5556,7 +5720,7 @@ class MmsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class PocInformation:
     """A data container that represents the "PoC-Information" (879) grouped AVP.
 
@@ -5595,7 +5759,7 @@ class PocInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MbmsInformation:
     """A data container that represents the "MBMS-Information" (880) grouped AVP.
 
@@ -5637,7 +5801,7 @@ class MbmsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class M2mInformation:
     """A data container that represents the "M2M-Information" (1011) grouped AVP.
 
@@ -5698,7 +5862,7 @@ class M2mInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceGenericInformation:
     """A data container that represents the "Service-Generic-Information" (1256) grouped AVP.
 
@@ -5718,7 +5882,7 @@ class ServiceGenericInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ImInformation:
     """A data container that represents the "IM-Information" (2110) grouped AVP.
 
@@ -5738,7 +5902,7 @@ class ImInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class DcdInformation:
     """A data container that represents the "DCD-Information" (2115) grouped AVP.
 
@@ -5754,7 +5918,7 @@ class DcdInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class VcsInformation:
     """A data container that represents the "VCS-Information" (3410) grouped AVP.
 
@@ -5790,7 +5954,7 @@ class VcsInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProseInformation:
     """A data container that represents the "ProSe-Information" (3447) grouped AVP.
 
@@ -5902,7 +6066,7 @@ class ProseInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ProseSubscriptionData:
     """A data container that represents the "ProSe-Subscription-Data" (3701) AVP.
 
@@ -5917,7 +6081,7 @@ class ProseSubscriptionData:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class CpdtInformation:
     """A data container that represents the "CPDT-Information" (3927) grouped AVP.
 
@@ -5939,7 +6103,7 @@ class CpdtInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ServiceInformation:
     """A data container that represents the "Service-Information" (873) grouped AVP.
 
@@ -5986,7 +6150,7 @@ class ServiceInformation:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MediaSubComponent:
     """A data container that represents the "Media-Sub-Component" (1436) grouped AVP."""
     flow_description: list[bytes] = dataclasses.field(default_factory=list)
@@ -6003,7 +6167,7 @@ class MediaSubComponent:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class MediaComponentDescription:
     """A data container that represents the "Media-Component-Description" (1435) grouped AVP."""
     media_component_number: int = None
@@ -6026,7 +6190,7 @@ class MediaComponentDescription:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ChargingRuleInstall:
     """A data container that represents the "Charging-Rule-Install" (1001) grouped AVP."""
     charging_rule_base_name: list[Avp] = dataclasses.field(default_factory=list)
@@ -6039,7 +6203,7 @@ class ChargingRuleInstall:
     )
 
 
-@dataclasses.dataclass
+@_grouped_avp
 class ChargingRuleRemove:
     """A data container that represents the "Charging-Rule-Remove" (1002) grouped AVP."""
     charging_rule_base_name: list[Avp] = dataclasses.field(default_factory=list)
@@ -6050,3 +6214,29 @@ class ChargingRuleRemove:
         AvpGenDef("charging_rule_base_name", AVP_TGPP_CHARGING_RULE_BASE_NAME, VENDOR_TGPP),
         AvpGenDef("charging_rule_name", AVP_TGPP_CHARGING_RULE_NAME, VENDOR_TGPP),
     )
+
+
+# The declared classes are removed from the module namespace, until they
+# are built by `__getattr__`; a class may be declared under several names
+_declared_names: dict[type, list[str]] = {}
+for _name, _value in list(globals().items()):
+    if isinstance(_value, type) and _value in _declared:
+        _declared_names.setdefault(_value, []).append(_name)
+        del globals()[_name]
+_lazy_names: dict[str, type] = {
+    name: declared for declared, names in _declared_names.items()
+    for name in names}
+del _name, _value
+
+
+def __getattr__(name: str) -> type:
+    declared = _lazy_names.get(name)
+    if declared is None:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}")
+    with _build_lock:
+        return _build_grouped_avp(declared)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_names))
@@ -0,0 +1,139 @@
+"""
+Compiled AVP paths, for finding AVPs within messages and grouped AVPs.
+"""
+from __future__ import annotations
+
+import functools
+
+from .dictionary import AVP_DICTIONARY, AVP_VENDOR_DICTIONARY
+
+
+# AVP dictionary entries indexed by lowercase name and by lowercase name
+# abbreviation, built when a path is given as a string for the first time
+_names: dict[str, list[tuple[int, int]]] = {}
+_abbreviations: dict[str, list[tuple[int, int]]] = {}
+_indexed_count: int = 0
+
+
+def _abbreviate(name: str) -> str:
+    return "".join(word[0] for word in name.split("-") if word).lower()
+
+
+def _index_names():
+    global _indexed_count
+
+    dictionaries = [(0, AVP_DICTIONARY)] + list(AVP_VENDOR_DICTIONARY.items())
+    count = sum(len(d) for _, d in dictionaries)
+    if count == _indexed_count:
+        return
+
+    _names.clear()
+    _abbreviations.clear()
+    for vendor_id, dictionary in dictionaries:
+        for code, entry in dictionary.items():
+            _names.setdefault(entry["name"].lower(), []).append(
+                (code, vendor_id))
+            _abbreviations.setdefault(_abbreviate(entry["name"]), []).append(
+                (code, vendor_id))
+    _indexed_count = count
+
+
+def _resolve_name(name: str) -> tuple[int, int]:
+    name = name.strip()
+    code, _, vendor_id = name.partition(":")
+    if code.isdigit() and (not vendor_id or vendor_id.isdigit()):
+        return int(code), int(vendor_id or 0)
+
+    _index_names()
+    candidates = (_names.get(name.lower()) or
+                  _abbreviations.get(name.lower()))
+    if not candidates:
+        raise ValueError(f"AVP `{name}` is not known")
+    if len(candidates) > 1:
+        # base AVPs take precedence over any vendor specific AVP of the same
+        # name
+        base = [c for c in candidates if c[1] == 0]
+        if len(base) == 1:
+            return base[0]
+        names = ", ".join(f"{c}:{v}" for c, v in candidates)
+        raise ValueError(
+            f"AVP `{name}` is ambiguous, it can be any of {names}; use the "
+            f"code:vendor form instead")
+    return candidates[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(path: str) -> tuple[tuple[int, int], ...]:
+    return tuple(_resolve_name(name) for name in path.split("/"))
+
+
+class AvpPath(tuple):
+    """A chain of AVPs to follow, from the top level of a message down to
+    the AVPs to find.
+
+    A path is built once and can then be reused with any number of messages,
+    e.g. with [Message.find_avps][diameter.message.Message.find_avps]. It is
+    built either from AVP code and vendor ID pairs, or from a string of AVP
+    names, separated by forward slashes:
+
+        >>> path = AvpPath(
+        >>>     (AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        >>>     (AVP_USED_SERVICE_UNIT, 0),
+        >>>     (AVP_CC_TOTAL_OCTETS, 0))
+        >>> path = AvpPath("Multiple-Services-Credit-Control/Used-Service-Unit/CC-Total-Octets")
+        >>> path = AvpPath("MSCC/USU/CC-Total-Octets")
+        >>> for msg in messages:
+        >>>     octets = msg.find_avps(path)
+
+    Names are not case-sensitive and can also be given as abbreviations of
+    the first letter of each word in the name, e.g. "MSCC" for
+    "Multiple-Services-Credit-Control", as long as the abbreviation matches
+    only one AVP. An AVP can also be given directly by its code, or its code
+    and vendor ID, e.g. "456" or "874:10415". If a name matches both a base
+    AVP and vendor specific AVPs, the base AVP is used.
+
+    The path is a tuple of AVP code and vendor ID pairs, and can be used
+    anywhere where a chain of pairs is accepted.
+    """
+    __slots__ = ()
+
+    def __new__(cls, *path: str | tuple[int, int]) -> AvpPath:
+        """Create a new path.
+
+        Args:
+            path: Either AVP code and vendor ID pairs, or a single string of
+                AVP names, separated by forward slashes
+
+        Raises:
+            ValueError: If an AVP name is not known, or if it matches more
+                than one AVP.
+        """
+        if len(path) == 1 and isinstance(path[0], AvpPath):
+            return path[0]
+        if len(path) == 1 and isinstance(path[0], str):
+            return super().__new__(cls, _parse(path[0]))
+        if not path:
+            raise ValueError("an AVP path cannot be empty")
+        return super().__new__(
+            cls, ((int(code), int(vendor_id)) for code, vendor_id in path))
+
+    def __repr__(self) -> str:
+        return f"AvpPath({str(self)!r})"
+
+    def __str__(self) -> str:
+        names = []
+        for code, vendor_id in self:
+            if vendor_id == 0:
+                entry = AVP_DICTIONARY.get(code)
+            else:
+                entry = AVP_VENDOR_DICTIONARY.get(vendor_id, {}).get(code)
+            # names are used only if they would parse back to the same AVP
+            try:
+                if entry is not None and _resolve_name(
+                        entry["name"]) == (code, vendor_id):
+                    names.append(entry["name"])
+                    continue
+            except ValueError:
+                pass
+            names.append(f"{code}:{vendor_id}")
+        return "/".join(names)
@@ -0,0 +1,282 @@
+"""
+Columnar extraction of AVP values from large batches of encoded messages.
+
+Intended for offline processing of captured traffic, e.g. charging audits,
+where the same few AVPs are needed from every message in a batch. The AVP
+values are read directly from the encoded bytes, without producing any
+message or AVP instances, and are returned as numpy arrays, which allows them
+to be aggregated with vectorised numpy operations.
+
+Requires `numpy`, which is not a dependency of the `diameter` package and
+must be installed separately, e.g. with `pip install python-diameter[numpy]`.
+"""
+from __future__ import annotations
+
+import array
+import mmap
+import struct
+
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, TYPE_CHECKING
+
+from .avp import Avp, AvpDecodeError, AvpPath
+from .avp.avp import (AvpFloat32, AvpFloat64, AvpInteger32, AvpInteger64,
+                      AvpUnsigned32, AvpUnsigned64, get_avp_dictionary_entry)
+from .packer import CONVERSION_ERRORS, ConversionError
+
+if TYPE_CHECKING:
+    import numpy
+
+
+_HEADER_LENGTH = struct.Struct(">L")
+_AVP_HEADER = struct.Struct(">2L")
+_AVP_VENDOR_ID = struct.Struct(">L")
+
+# AVP types that are decoded straight into a typed array, with the array
+# typecode and the numpy dtype that they produce
+_NUMERIC_TYPES: dict[type[Avp], tuple[struct.Struct, str, str]] = {
+    AvpUnsigned32: (struct.Struct(">L"), "q", "int64"),
+    AvpInteger32: (struct.Struct(">l"), "q", "int64"),
+    AvpUnsigned64: (struct.Struct(">Q"), "Q", "uint64"),
+    AvpInteger64: (struct.Struct(">q"), "q", "int64"),
+    AvpFloat32: (struct.Struct(">f"), "d", "float64"),
+    AvpFloat64: (struct.Struct(">d"), "d", "float64"),
+}
+
+
+class AvpColumn(NamedTuple):
+    """Values of a single AVP path, extracted from a batch of messages.
+
+    The values of message `i` are `values[offsets[i]:offsets[i + 1]]`. Each
+    value is also tagged with the row that it was found in, where a row is
+    one occurrence of the first AVP in the path. E.g. for a path of
+    Multiple-Services-Credit-Control -> Used-Service-Unit -> CC-Total-Octets,
+    each Multiple-Services-Credit-Control AVP in the batch is one row. Rows
+    are numbered across the entire batch, and every column whose path starts
+    with the same AVP shares the same row numbers, which allows values from
+    different columns to be related to each other.
+    """
+    path: tuple[tuple[int, int], ...]
+    """The AVP path that the values were extracted from."""
+    values: numpy.ndarray
+    """Extracted values. Integer and float AVPs produce `int64`, `uint64`
+    or `float64` arrays, every other AVP type produces an `object` array of
+    the same python values that `Avp.value` returns."""
+    rows: numpy.ndarray
+    """For each value, the row number that the value was found in."""
+    offsets: numpy.ndarray
+    """For each message, the index of its first value, plus the total value
+    count as the last item."""
+    row_offsets: numpy.ndarray
+    """For each message, the number of its first row, plus the total row
+    count as the last item."""
+
+
+class _ColumnBuilder:
+    __slots__ = ("path", "decode", "typecode", "dtype", "values", "rows",
+                 "offsets", "row_offsets")
+
+    def __init__(self, path: tuple[tuple[int, int], ...]):
+        self.path = path
+        code, vendor_id = path[-1]
+        entry = get_avp_dictionary_entry(code, vendor_id)
+        avp_type = entry["type"] if entry is not None else Avp
+
+        numeric = None
+        for cls in avp_type.__mro__:
+            if cls in _NUMERIC_TYPES:
+                numeric = _NUMERIC_TYPES[cls]
+                break
+
+        if numeric is not None:
+            value_format, self.typecode, self.dtype = numeric
+            self.decode = _numeric_decoder(value_format)
+            self.values = array.array(self.typecode)
+        else:
+            self.typecode = None
+            self.dtype = "object"
+            self.decode = _object_decoder(avp_type, code, vendor_id)
+            self.values = []
+        self.rows = array.array("q")
+        self.offsets = array.array("q", [0])
+        self.row_offsets = array.array("q", [0])
+
+    def build(self, np) -> AvpColumn:
+        if self.typecode is not None:
+            values = np.frombuffer(self.values, dtype=self.dtype)
+        else:
+            values = np.empty(len(self.values), dtype=object)
+            values[:] = self.values
+        return AvpColumn(
+            self.path, values,
+            np.frombuffer(self.rows, dtype="int64"),
+            np.frombuffer(self.offsets, dtype="int64"),
+            np.frombuffer(self.row_offsets, dtype="int64"))
+
+
+def _numeric_decoder(value_format: struct.Struct
+                     ) -> Callable[[memoryview, int, int], Any]:
+    unpack_from = value_format.unpack_from
+
+    def decode(msg_data: memoryview, position: int, _length: int) -> Any:
+        return unpack_from(msg_data, position)[0]
+
+    return decode
+
+
+def _object_decoder(avp_type: type[Avp], code: int, vendor_id: int
+                    ) -> Callable[[memoryview, int, int], Any]:
+    def decode(msg_data: memoryview, position: int, length: int) -> Any:
+        avp = avp_type(code, vendor_id,
+                       bytes(msg_data[position:position + length]))
+        try:
+            return avp.value
+        except AvpDecodeError:
+            return None
+
+    return decode
+
+
+def _iter_avps(msg_data: memoryview, start: int, end: int
+               ) -> Iterator[tuple[int, int, int, int]]:
+    # Yields the code, vendor ID, payload position and payload length of each
+    # AVP between the start and end positions
+    position = start
+    while position < end:
+        code, flags_len = _AVP_HEADER.unpack_from(msg_data, position)
+        length = flags_len & 0x00ffffff
+        if length < 8:
+            raise ValueError(
+                f"AVP at position {position} has an invalid length {length}")
+        header_length = 8
+        vendor_id = 0
+        if (flags_len >> 24) & Avp.avp_flag_vendor:
+            header_length = 12
+            vendor_id = _AVP_VENDOR_ID.unpack_from(msg_data, position + 8)[0]
+        yield (code, vendor_id, position + header_length,
+               length - header_length)
+        position += (length + 3) & ~3
+
+
+def _collect(builder: _ColumnBuilder, msg_data: memoryview, start: int,
+             end: int, level: int, row: int):
+    code, vendor_id = builder.path[level]
+    is_leaf = level == len(builder.path) - 1
+    for avp_code, avp_vendor_id, position, length in _iter_avps(
+            msg_data, start, end):
+        if avp_code != code or avp_vendor_id != vendor_id:
+            continue
+        if is_leaf:
+            builder.values.append(builder.decode(msg_data, position, length))
+            builder.rows.append(row)
+        else:
+            _collect(builder, msg_data, position, position + length,
+                     level + 1, row)
+
+
+def _split_messages(buffer: bytes | bytearray | memoryview | mmap.mmap
+                    ) -> Iterator[memoryview]:
+    buffer = memoryview(buffer)
+    position = 0
+    while position < len(buffer):
+        length = _HEADER_LENGTH.unpack_from(buffer, position)[0] & 0x00ffffff
+        if length < 20:
+            raise ValueError(
+                f"message at position {position} has an invalid length "
+                f"{length}")
+        yield buffer[position:position + length]
+        position += length
+
+
+def extract_avp_columns(
+        messages: Iterable[bytes] | bytes | bytearray | memoryview | mmap.mmap,
+        *paths: tuple[int, int] | tuple[tuple[int, int], ...] | str
+) -> list[AvpColumn]:
+    """Extract the values of AVP paths from a batch of encoded messages.
+
+    Only AVP headers are read while scanning the messages, and only the AVPs
+    at the end of each path are decoded. Every AVP that matches a path is
+    extracted, e.g. each Used-Service-Unit within each
+    Multiple-Services-Credit-Control AVP.
+
+        >>> rating_group, total_octets = extract_avp_columns(
+        >>>     captured_messages,
+        >>>     ((AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        >>>      (AVP_RATING_GROUP, 0)),
+        >>>     ((AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        >>>      (AVP_USED_SERVICE_UNIT, 0),
+        >>>      (AVP_CC_TOTAL_OCTETS, 0)))
+        >>> # rating group of each MSCC row, then total octets by rating group
+        >>> row_rating_group = numpy.zeros(rating_group.row_offsets[-1], "int64")
+        >>> row_rating_group[rating_group.rows] = rating_group.values
+        >>> numpy.bincount(row_rating_group[total_octets.rows],
+        >>>                weights=total_octets.values)
+
+    Args:
+        messages: Either an iterable of individual encoded messages, or a
+            single buffer that contains any number of consecutive encoded
+            messages, such as a memory-mapped file
+        paths: AVP paths to extract. A path is either a single AVP code and
+            vendor ID pair, for top-level AVPs, a chain of pairs, an
+            [AvpPath][diameter.message.avp.path.AvpPath] or a string of AVP
+            names, in the same way as with
+            [Message.find_avps][diameter.message.Message.find_avps]
+
+    Returns:
+        A column for each path, in the same order as the paths were given.
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If an AVP name in a path is not known
+        ConversionError: If a message or an AVP header cannot be parsed
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "extract_avp_columns requires numpy, install it with "
+            "`pip install python-diameter[numpy]`") from None
+
+    builders = []
+    for path in paths:
+        if isinstance(path, str):
+            path = AvpPath(path)
+        elif isinstance(path[0], int):
+            path = (path, )
+        builders.append(_ColumnBuilder(tuple(path)))
+
+    # every column that starts with the same top level AVP shares its rows
+    by_first_avp: dict[tuple[int, int], list[_ColumnBuilder]] = {}
+    for builder in builders:
+        by_first_avp.setdefault(builder.path[0], []).append(builder)
+    row_counts = dict.fromkeys(by_first_avp, 0)
+
+    if isinstance(messages, (bytes, bytearray, memoryview, mmap.mmap)):
+        messages = _split_messages(messages)
+
+    try:
+        for msg_data in messages:
+            msg_data = memoryview(msg_data)
+            end = _HEADER_LENGTH.unpack_from(msg_data, 0)[0] & 0x00ffffff
+            for code, vendor_id, position, length in _iter_avps(
+                    msg_data, 20, min(end, len(msg_data))):
+                column_builders = by_first_avp.get((code, vendor_id))
+                if column_builders is None:
+                    continue
+                row = row_counts[(code, vendor_id)]
+                row_counts[(code, vendor_id)] = row + 1
+                for builder in column_builders:
+                    if len(builder.path) == 1:
+                        builder.values.append(
+                            builder.decode(msg_data, position, length))
+                        builder.rows.append(row)
+                    else:
+                        _collect(builder, msg_data, position,
+                                 position + length, 1, row)
+
+            for builder in builders:
+                builder.offsets.append(len(builder.values))
+                builder.row_offsets.append(row_counts[builder.path[0]])
+    except CONVERSION_ERRORS as e:
+        raise ConversionError(e.args[0]) from None
+
+    return [builder.build(np) for builder in builders]
@@ -2,48 +2,129 @@
 Placeholder classes that extend `Message`, but do not provide any direct
 python API for reading and setting AVPs.
 """
-from typing import Type
+import importlib
+import threading
 
-from .._base import Message, DefinedMessage, UndefinedMessage
+from types import ModuleType
+from typing import Any, Iterator, Type
+
+from .._base import Message, MessageHeader, DefinedMessage, UndefinedMessage
 
 # Message types that have "proper" implementations; Requests and Answers are
 # their own distinct classes and permit AVP values to be accessed as instance
-# attributes
-from .aa import *
-from .aa_mobile_node import *
-from .abort_session import *
-from .accounting import *
-from .authentication_information import *
-from .cancel_location import *
-from .cancel_vcsg_location import *
-from .capabilities_exchange import *
-from .credit_control import *
-from .device_watchdog import *
-from .delete_subscriber_data import *
-from .diameter_eap import *
-from .disconnect_peer import *
-from .home_agent_mip import *
-from .insert_subscriber_data import *
-from .location_info import *
-from .me_identity_check import *
-from .multimedia_auth import *
-from .notify import *
-from .purge_ue import *
-from .profile_update import *
-from .push_notification import *
-from .push_profile import *
-from .re_auth import *
-from .registration_termination import *
-from .reset import *
-from .server_assignment import *
-from .spending_limit import *
-from .spending_status_notification import *
-from .session_termination import *
-from .subscribe_notifications import *
-from .update_location import *
-from .update_vscg_location import *
-from .user_authorization import *
-from .user_data import *
+# attributes. Their modules are imported only once one of their classes is
+# accessed from this package, or once their command code is looked up from
+# `all_commands`. Each entry holds the module name and the names of the
+# classes in the module, with the command class first.
+_COMMAND_MODULES: dict[int, tuple[str, tuple[str, ...]]] = {
+    265: ("aa", ("Aa", "AaAnswer", "AaRequest")),
+    260: ("aa_mobile_node", (
+        "AaMobileNode", "AaMobileNodeAnswer", "AaMobileNodeRequest")),
+    274: ("abort_session", (
+        "AbortSession", "AbortSessionAnswer", "AbortSessionRequest")),
+    271: ("accounting", (
+        "Accounting", "AccountingAnswer", "AccountingRequest")),
+    318: ("authentication_information", (
+        "AuthenticationInformation", "AuthenticationInformationAnswer",
+        "AuthenticationInformationRequest")),
+    317: ("cancel_location", (
+        "CancelLocation", "CancelLocationAnswer", "CancelLocationRequest")),
+    8388642: ("cancel_vcsg_location", (
+        "CancelVcsgLocation", "CancelVcsgLocationAnswer",
+        "CancelVcsgLocationRequest")),
+    257: ("capabilities_exchange", (
+        "CapabilitiesExchange", "CapabilitiesExchangeAnswer",
+        "CapabilitiesExchangeRequest")),
+    272: ("credit_control", (
+        "CreditControl", "CreditControlAnswer", "CreditControlRequest")),
+    320: ("delete_subscriber_data", (
+        "DeleteSubscriberData", "DeleteSubscriberDataAnswer",
+        "DeleteSubscriberDataRequest")),
+    280: ("device_watchdog", (
+        "DeviceWatchdog", "DeviceWatchdogAnswer", "DeviceWatchdogRequest")),
+    268: ("diameter_eap", (
+        "DiameterEap", "DiameterEapAnswer", "DiameterEapRequest")),
+    282: ("disconnect_peer", (
+        "DisconnectPeer", "DisconnectPeerAnswer", "DisconnectPeerRequest")),
+    262: ("home_agent_mip", (
+        "HomeAgentMip", "HomeAgentMipAnswer", "HomeAgentMipRequest")),
+    319: ("insert_subscriber_data", (
+        "InsertSubscriberData", "InsertSubscriberDataAnswer",
+        "InsertSubscriberDataRequest")),
+    302: ("location_info", (
+        "LocationInfo", "LocationInfoAnswer", "LocationInfoRequest")),
+    324: ("me_identity_check", (
+        "MeIdentityCheck", "MeIdentityCheckAnswer", "MeIdentityCheckRequest")),
+    303: ("multimedia_auth", (
+        "MultimediaAuth", "MultimediaAuthAnswer", "MultimediaAuthRequest")),
+    323: ("notify", ("Notify", "NotifyAnswer", "NotifyRequest")),
+    307: ("profile_update", (
+        "ProfileUpdate", "ProfileUpdateAnswer", "ProfileUpdateRequest")),
+    321: ("purge_ue", ("PurgeUe", "PurgeUeAnswer", "PurgeUeRequest")),
+    309: ("push_notification", (
+        "PushNotification", "PushNotificationAnswer",
+        "PushNotificationRequest")),
+    305: ("push_profile", (
+        "PushProfile", "PushProfileAnswer", "PushProfileRequest")),
+    258: ("re_auth", ("ReAuth", "ReAuthAnswer", "ReAuthRequest")),
+    304: ("registration_termination", (
+        "RegistrationTermination", "RegistrationTerminationAnswer",
+        "RegistrationTerminationRequest")),
+    322: ("reset", ("Reset", "ResetAnswer", "ResetRequest")),
+    301: ("server_assignment", (
+        "ServerAssignment", "ServerAssignmentAnswer",
+        "ServerAssignmentRequest")),
+    275: ("session_termination", (
+        "SessionTermination", "SessionTerminationAnswer",
+        "SessionTerminationRequest")),
+    8388635: ("spending_limit", (
+        "SpendingLimit", "SpendingLimitAnswer", "SpendingLimitRequest")),
+    8388636: ("spending_status_notification", (
+        "SpendingStatusNotification", "SpendingStatusNotificationAnswer",
+        "SpendingStatusNotificationRequest")),
+    308: ("subscribe_notifications", (
+        "SubscribeNotifications", "SubscribeNotificationsAnswer",
+        "SubscribeNotificationsRequest")),
+    316: ("update_location", (
+        "UpdateLocation", "UpdateLocationAnswer", "UpdateLocationRequest")),
+    8388638: ("update_vscg_location", (
+        "UpdateVcsgLocation", "UpdateVcsgLocationAnswer",
+        "UpdateVcsgLocationRequest")),
+    300: ("user_authorization", (
+        "UserAuthorization", "UserAuthorizationAnswer",
+        "UserAuthorizationRequest")),
+    306: ("user_data", ("UserData", "UserDataAnswer", "UserDataRequest")),
+}
+
+_lazy_names: dict[str, int] = {
+    name: code for code, (_, names) in _COMMAND_MODULES.items()
+    for name in names}
+_lazy_modules: dict[str, int] = {
+    module_name: code
+    for code, (module_name, _) in _COMMAND_MODULES.items()}
+_import_lock = threading.RLock()
+
+
+def _import_command_module(code: int) -> ModuleType:
+    module_name, names = _COMMAND_MODULES[code]
+    with _import_lock:
+        module = importlib.import_module(f".{module_name}", __name__)
+        for name in names:
+            globals()[name] = getattr(module, name)
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_names:
+        _import_command_module(_lazy_names[name])
+        return globals()[name]
+    if name in _lazy_modules:
+        return _import_command_module(_lazy_modules[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_lazy_names) | set(_lazy_modules))
 
 
 # Remaining Message types that have no implementation (yet), either because
@@ -2145,11 +2226,133 @@ class MTData(UndefinedMessage):
         self.header.command_code = self.code
 
 
-all_commands: dict[int, Type[Message]] = {
-    m.code: m for m in Message.__subclasses__()}
-all_commands.update({
-    m.code: m for m in DefinedMessage.__subclasses__()
-})
+class CommandRegistry(dict):
+    """Message classes of every known command, indexed by command code.
+
+    Works as a regular dictionary, except that the module of each command
+    that has a python implementation is imported only when its command code
+    is accessed for the first time. Iterating through the registry imports
+    every command module.
+
+    The registry also holds the message class to create for received
+    messages, by command code and request flag, see `message_type`.
+    """
+    __slots__ = ("_pending", "message_types")
+
+    def __init__(self, pending: set[int], *args, **kwargs):
+        """Create a new command registry.
+
+        Args:
+            pending: Command codes from `_COMMAND_MODULES` that are to be
+                imported on first access. The set is not copied; a code is
+                removed from it once its module has been imported.
+        """
+        super().__init__(*args, **kwargs)
+        self._pending = pending
+        self.message_types: dict[tuple[int, bool], Type[Message]] = {}
+        """Message classes already resolved by `message_type`, indexed by
+        command code and request flag."""
+
+    def __missing__(self, code: int) -> Type[Message]:
+        self.load(code)
+        # may also have been loaded by another thread in the meantime
+        cmd_type = super().get(code)
+        if cmd_type is None:
+            raise KeyError(code)
+        return cmd_type
+
+    def __contains__(self, code: object) -> bool:
+        return super().__contains__(code) or code in self._pending
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._pending)
+
+    def __iter__(self) -> Iterator[int]:
+        self.load_all()
+        return super().__iter__()
+
+    def __setitem__(self, code: int, cmd_type: Type[Message]):
+        super().__setitem__(code, cmd_type)
+        self._pending.discard(code)
+        self._forget_message_types(code)
+
+    def __delitem__(self, code: int):
+        self._forget_message_types(code)
+        if code in self._pending:
+            self._pending.discard(code)
+            return
+        super().__delitem__(code)
+
+    def _forget_message_types(self, code: int):
+        self.message_types.pop((code, True), None)
+        self.message_types.pop((code, False), None)
+
+    def get(self, code: int, default: Any = None) -> Any:
+        if code in self:
+            return self[code]
+        return default
+
+    def update(self, *args, **kwargs):
+        for code, cmd_type in dict(*args, **kwargs).items():
+            self[code] = cmd_type
+
+    def keys(self):
+        self.load_all()
+        return super().keys()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+    def items(self):
+        self.load_all()
+        return super().items()
+
+    def load(self, code: int) -> bool:
+        """Import the module of a command, if it has not been imported yet.
+
+        Returns:
+            True if the module was imported, False if it had already been
+                imported, or if the command has no module of its own.
+        """
+        with _import_lock:
+            if code not in self._pending:
+                return False
+            module = _import_command_module(code)
+            _, names = _COMMAND_MODULES[code]
+            super().__setitem__(code, getattr(module, names[0]))
+            self._pending.discard(code)
+        return True
+
+    def load_all(self):
+        """Import every command module that has not been imported yet."""
+        for code in list(self._pending):
+            self.load(code)
+
+    def message_type(self, header: MessageHeader) -> Type[Message]:
+        """Find the message class to create for a received message.
+
+        The class is produced by the `type_factory` of the command, or is the
+        command class itself. If the command does not override
+        `type_factory`, the result depends only on the command code and the
+        request flag of the header, and it is kept in `message_types`, where
+        it can be looked up directly for any following message.
+
+        Returns:
+            A message class. `UndefinedMessage` for unknown command codes.
+        """
+        cmd_type = self.get(header.command_code)
+        if cmd_type is None:
+            return UndefinedMessage
+        msg_type = cmd_type.type_factory(header) or cmd_type
+        if cmd_type.type_factory.__func__ is Message.type_factory.__func__:
+            self.message_types[
+                (header.command_code, header.is_request)] = msg_type
+        return msg_type
+
+
+all_commands: dict[int, Type[Message]] = CommandRegistry(
+    set(_COMMAND_MODULES), {m.code: m for m in Message.__subclasses__()})
 all_commands.update({
     m.code: m for m in UndefinedMessage.__subclasses__()
 })
@@ -2162,7 +2365,9 @@ def register(cmd_class: Type[DefinedMessage]):
     to the internal registry of commands. Registered custom commands will be
     automatically recognised when parsing network-received bytes. If the command
     also implements a request and answer subclass, those are automatically
-    returned as well.
+    returned as well, when they have been declared with the `is_request`
+    class keyword, e.g. `class SpecialMessageRequest(SpecialMessage,
+    is_request=True)`.
 
     ```
     msg_bytes = "01000028c00003e70000000000000000000000000000010740000014686f73742e7265616c6d3b31"
@@ -2210,3 +2415,10 @@ def register(cmd_class: Type[DefinedMessage]):
                            f"not have a `code` attribute")
 
     all_commands[cmd_class.code] = cmd_class
+
+
+# every message class, including the ones that are not imported yet
+__all__ = sorted(
+    {name for name, value in globals().items()
+     if isinstance(value, type) and issubclass(value, Message)} |
+    set(_lazy_names) | {"all_commands", "register"})
@@ -4,13 +4,112 @@ Diameter Application Message subclasses.
 """
 from __future__ import annotations
 
+import dataclasses
+import inspect
 import logging
+import typing
 
-from ..avp import Avp, AvpDecodeError
-from ..avp.generator import AvpGenDef, AvpGenerator
+from typing import Callable, NamedTuple, TYPE_CHECKING
+
+from ..avp import Avp, AvpDecodeError, grouped
+from ..avp.generator import AvpGenDef, AvpGenerator, AvpGenType
+
+if TYPE_CHECKING:
+    from .._base import DefinedMessage
 
 logger = logging.getLogger("diameter.message.avp")
 
+_NOT_SET = object()
+
+
+class DecodeStep(NamedTuple):
+    """A single compiled entry of a `DecodePlan`."""
+    attr_name: str
+    """The class attribute name that receives the AVP value."""
+    type_class: type | None
+    """For grouped AVPs, the class to instantiate for the sub-AVPs."""
+    is_list: bool
+    """Indicates that the attribute holds a list, and that each AVP value is
+    appended to it, instead of overwriting the attribute."""
+    gen_def: AvpGenDef | None = None
+    """The `avp_def` entry that the step was compiled from."""
+
+
+class DecodePlan(NamedTuple):
+    """An `avp_def` tuple of a class, compiled for decoding received AVPs."""
+    avp_def: AvpGenType
+    """The `avp_def` that the plan was compiled from."""
+    steps: dict[tuple[int, int], DecodeStep]
+    """Decode steps, indexed by an AVP code and vendor ID pair."""
+    additional_avps_attr: str | None
+    """Name of the attribute that collects AVPs not present in `avp_def`, if
+    the class has one."""
+
+
+_decode_plans: dict[type, DecodePlan] = {}
+
+
+def compile_decode_plan(obj: AvpGenerator) -> DecodePlan:
+    """Compile the `avp_def` of an object into a decode plan.
+
+    Whether an attribute holds a list is determined from the class of the
+    object only, never from the values that an instance holds. For
+    dataclasses, it is taken from the field definitions, i.e. fields with a
+    `list` default factory, or fields marked with `{"is_list": True}`
+    metadata, as done for the lazily allocated lists of grouped AVPs. For
+    any other class, it is taken from the class annotations, where an
+    attribute annotated as `list[...]` holds a list.
+    """
+    list_attrs: set[str] = set()
+    if dataclasses.is_dataclass(obj):
+        list_attrs.update(
+            f.name for f in dataclasses.fields(obj)
+            if f.default_factory is list or f.metadata.get("is_list"))
+    else:
+        annotations = {}
+        for cls in reversed(obj.__class__.__mro__):
+            annotations.update(inspect.get_annotations(cls))
+        list_attrs.update(
+            name for name, annotation in annotations.items()
+            if _is_list_annotation(annotation))
+
+    steps = {}
+    for gen_def in obj.avp_def:
+        steps[(gen_def.avp_code, gen_def.vendor_id)] = DecodeStep(
+            gen_def.attr_name, gen_def.type_class,
+            gen_def.attr_name in list_attrs, gen_def)
+
+    additional_avps_attr = None
+    if hasattr(obj, "additional_avps"):
+        additional_avps_attr = "additional_avps"
+    elif hasattr(obj, "_additional_avps"):
+        additional_avps_attr = "_additional_avps"
+
+    return DecodePlan(obj.avp_def, steps, additional_avps_attr)
+
+
+def _is_list_annotation(annotation: str | type) -> bool:
+    # the command modules postpone the evaluation of annotations, which are
+    # not resolved, as the grouped AVP classes that they name are imported
+    # lazily
+    if isinstance(annotation, str):
+        return annotation == "list" or annotation.startswith("list[")
+    return annotation is list or typing.get_origin(annotation) is list
+
+
+def get_decode_plan(obj: AvpGenerator) -> DecodePlan:
+    """Retrieve the decode plan for an object's class.
+
+    The plan is compiled once per class, on first use, and recompiled only
+    if the `avp_def` of the object is no longer the one that the plan was
+    compiled from.
+    """
+    plan = _decode_plans.get(obj.__class__)
+    if plan is None or plan.avp_def is not obj.avp_def:
+        plan = compile_decode_plan(obj)
+        _decode_plans[obj.__class__] = plan
+    return plan
+
 
 def assign_attr_from_defs(obj: AvpGenerator, avp_list: list[Avp]):
     """Go through a tree of AVP attribute definitions and populate attributes.
@@ -22,44 +121,112 @@ def assign_attr_from_defs(obj: AvpGenerator, avp_list: list[Avp]):
     The purpose of this is to convert a "dumb" AVP list tree in a `Message`
     instance into easily accessible attributes.
     """
-    needed: dict[str, AvpGenDef] = {
-        f"{a.avp_code}-{a.vendor_id}": a for a in obj.avp_def}
+    plan = get_decode_plan(obj)
+    steps = plan.steps
+
+    for avp in avp_list:
+        step = steps.get((avp.code, avp.vendor_id))
+        if step is not None:
+            assign_attr_from_avp(obj, step, avp)
+        elif plan.additional_avps_attr is not None:
+            getattr(obj, plan.additional_avps_attr).append(avp)
+
+
+def assign_attr_from_avp(obj: AvpGenerator, step: DecodeStep, avp: Avp):
+    """Populate a single attribute from a single AVP.
+
+    If the attribute holds a list, the AVP value is appended to it, otherwise
+    the attribute value is overwritten. Grouped AVPs are converted to
+    instances of the `type_class` of the step, recursively.
+    """
+    if step.type_class is not None:
+        attr_value = step.type_class()
+        assign_attr_from_defs(attr_value, avp.value)
+    else:
+        attr_value = None
+        try:
+            attr_value = avp.value
+        except AvpDecodeError as e:
+            logger.warning(str(e))
+
+    if step.is_list:
+        # not every list attribute is set to an empty list up front
+        values = getattr(obj, step.attr_name, None)
+        if values is None:
+            setattr(obj, step.attr_name, [attr_value])
+        else:
+            values.append(attr_value)
+    else:
+        setattr(obj, step.attr_name, attr_value)
+
+
+def defer_attr_from_defs(obj: DefinedMessage, avp_list: list[Avp]):
+    """Go through a list of AVPs and prepare attributes for lazy population.
+
+    Works like `assign_attr_from_defs`, except that no AVP values are decoded
+    yet. Each received AVP is only matched against the `avp_def` of the
+    message, and set aside until the attribute that it maps to is accessed
+    for the first time, at which point `resolve_deferred_attr` decodes it.
+
+    Any value that the attribute already holds, e.g. an empty list set in
+    `__post_init__`, is removed from the instance and restored when the
+    attribute is resolved. AVPs that are not part of `avp_def` are added to
+    the custom AVP list of the message right away.
+
+    Grouped AVPs are decoded as a whole, when their top level attribute is
+    accessed. A non-empty received AVP list itself is kept as well, in its
+    original order, for validating the AVPs without decoding them.
+    """
+    steps = get_decode_plan(obj).steps
+    instance_attrs = obj.__dict__
+    deferred: dict[str, tuple[object, list[tuple[DecodeStep, Avp]]]] = {}
 
     for avp in avp_list:
-        avp_key = f"{avp.code}-{avp.vendor_id}"
-
-        if avp_key in needed:
-            attr_name = needed[avp_key].attr_name
-            has_attr = hasattr(obj, attr_name)
-            current_value = None
-            if has_attr:
-                current_value = getattr(obj, attr_name)
-
-            if needed[avp_key].type_class is not None:
-                attr_value = needed[avp_key].type_class()
-                assign_attr_from_defs(attr_value, avp.value)
-                if has_attr and isinstance(current_value, list):
-                    current_value.append(attr_value)
-                else:
-                    setattr(obj, attr_name, attr_value)
-
-            elif has_attr and isinstance(current_value, list):
-                avp_value = None
-                try:
-                    avp_value = avp.value
-                except AvpDecodeError as e:
-                    logger.warning(str(e))
-                current_value.append(avp_value)
-            else:
-                avp_value = None
-                try:
-                    avp_value = avp.value
-                except AvpDecodeError as e:
-                    logger.warning(str(e))
-                setattr(obj, attr_name, avp_value)
-
-        elif hasattr(obj, "additional_avps"):
-            getattr(obj, "additional_avps").append(avp)
-
-        elif hasattr(obj, "_additional_avps"):
-            getattr(obj, "_additional_avps").append(avp)
+        step = steps.get((avp.code, avp.vendor_id))
+        if step is None:
+            obj._additional_avps.append(avp)
+            continue
+
+        attr_name = step.attr_name
+        if attr_name not in deferred:
+            deferred[attr_name] = (
+                instance_attrs.pop(attr_name, _NOT_SET), [])
+        deferred[attr_name][1].append((step, avp))
+
+    instance_attrs["_deferred_attrs"] = deferred
+    if avp_list:
+        instance_attrs["_received_avps"] = avp_list
+
+
+def resolve_deferred_attr(obj: DefinedMessage, attr_name: str) -> bool:
+    """Populate an attribute from AVPs set aside by `defer_attr_from_defs`.
+
+    Returns:
+        True if the attribute had deferred AVPs and has now been populated,
+            False if there was nothing to resolve.
+    """
+    deferred = obj.__dict__.get("_deferred_attrs")
+    if not deferred or attr_name not in deferred:
+        return False
+
+    original_value, avps = deferred.pop(attr_name)
+    if original_value is not _NOT_SET:
+        setattr(obj, attr_name, original_value)
+    for step, avp in avps:
+        assign_attr_from_avp(obj, step, avp)
+    return True
+
+
+def grouped_avp_getattr(module_name: str) -> Callable[[str], type]:
+    """Produce a module `__getattr__` that returns grouped AVP classes.
+
+    Makes every grouped AVP class importable from a command module, without
+    building each one of them when the command module is imported.
+    """
+    def __getattr__(name: str) -> type:
+        try:
+            return getattr(grouped, name)
+        except AttributeError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}") from None
+    return __getattr__
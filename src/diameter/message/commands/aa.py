@@ -6,17 +6,20 @@ documented in rfc7155.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ChapAuth, FailedAvp, MediaComponentDescription,
+                           MediaSubComponent, ProxyInfo, SubscriptionId,
+                           SupportedFeatures, Tunneling)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["Aa", "AaAnswer", "AaRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class Aa(DefinedMessage):
     """An AA message.
@@ -77,14 +80,8 @@ class Aa(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return AaRequest
-        return AaAnswer
-
 
-class AaAnswer(Aa):
+class AaAnswer(Aa, is_request=False):
     """An AA-Answer message.
 
     !!! Note
@@ -251,11 +248,11 @@ class AaAnswer(Aa):
         setattr(self, "redirect_host", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class AaRequest(Aa):
+class AaRequest(Aa, is_request=True):
     """An AA-Request message."""
     session_id: str
     auth_application_id: int
@@ -387,7 +384,7 @@ class AaRequest(Aa):
         setattr(self, "specific_action", [])
         setattr(self, "subscription_id", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
     def add_subscription_id(self, subscription_id_type: int,
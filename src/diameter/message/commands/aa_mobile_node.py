@@ -6,17 +6,20 @@ AVPs documented in `rfc4004`.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (MipFaToHaMsa, MipFaToMnMsa, MipHaToMnMsa,
+                           MipHomeAgentHost, MipMnAaaAuth, MipMnToFaMsa,
+                           MipMnToHaMsa, MipOriginatingForeignAaa, ProxyInfo)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["AaMobileNode", "AaMobileNodeAnswer", "AaMobileNodeRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class AaMobileNode(DefinedMessage):
     """An AA-Mobile-Node base message.
@@ -79,14 +82,8 @@ class AaMobileNode(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return AaMobileNodeRequest
-        return AaMobileNodeAnswer
-
 
-class AaMobileNodeAnswer(AaMobileNode):
+class AaMobileNodeAnswer(AaMobileNode, is_request=False):
     """An AA-Mobile-Node-Answer message."""
     session_id: str
     auth_application_id: int
@@ -150,11 +147,11 @@ class AaMobileNodeAnswer(AaMobileNode):
         setattr(self, "mip_filter_rule", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class AaMobileNodeRequest(AaMobileNode):
+class AaMobileNodeRequest(AaMobileNode, is_request=True):
     """An AA-Mobile-Node-Request message."""
     session_id: str
     auth_application_id: int
@@ -214,5 +211,5 @@ class AaMobileNodeRequest(AaMobileNode):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,17 +6,18 @@ AVPs documented in `rfc6733`.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (FailedAvp, ProxyInfo)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["AbortSession", "AbortSessionAnswer", "AbortSessionRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class AbortSession(DefinedMessage):
     """An Abort-Session base message.
@@ -79,14 +80,8 @@ class AbortSession(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return AbortSessionRequest
-        return AbortSessionAnswer
-
 
-class AbortSessionAnswer(AbortSession):
+class AbortSessionAnswer(AbortSession, is_request=False):
     """An Abort-Session-Answer message."""
     # AVPs from rfc6733 (Diameter Base)
     session_id: str
@@ -135,11 +130,11 @@ class AbortSessionAnswer(AbortSession):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class AbortSessionRequest(AbortSession):
+class AbortSessionRequest(AbortSession, is_request=True):
     """An Abort-Session-Request message."""
     # AVPs from rfc6733 (Diameter Base)
     session_id: str
@@ -219,5 +214,5 @@ class AbortSessionRequest(AbortSession):
         setattr(self, "state_class", [])
         setattr(self, "reply_message", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -8,17 +8,21 @@ from __future__ import annotations
 
 import datetime
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ApplicationServerInformation, Cause, EventType,
+                           FailedAvp, InterOperatorIdentifier, ProxyInfo,
+                           SdpMediaComponent, ServerCapabilities, TimeStamps,
+                           TrunkGroupId, Tunneling, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["Accounting", "AccountingAnswer", "AccountingRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class Accounting(DefinedMessage):
     """An Accounting message.
@@ -81,14 +85,8 @@ class Accounting(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return AccountingRequest
-        return AccountingAnswer
-
 
-class AccountingAnswer(Accounting):
+class AccountingAnswer(Accounting, is_request=False):
     """An Accounting-Answer message."""
     # AVPs from rfc6733 (Diameter base)
     session_id: str
@@ -166,11 +164,11 @@ class AccountingAnswer(Accounting):
         setattr(self, "proxy_info", [])
         setattr(self, "state_class", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class AccountingRequest(Accounting):
+class AccountingRequest(Accounting, is_request=True):
     """An Accounting-Request message."""
     # AVPs from base rfc6733 (Diameter Base)
     session_id: str
@@ -403,5 +401,5 @@ class AccountingRequest(Accounting):
         setattr(self, "sdp_session_description", [])
         setattr(self, "sdp_media_component", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,12 +6,14 @@ implementing AVPs documented in 3GPP TS 29.727.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (AuthenticationInfo, ExperimentalResult, FailedAvp,
+                           Load, OcOlr, OcSupportedFeatures, ProxyInfo,
+                           RequestedEutranAuthenticationInfo,
+                           RequestedUtranGeranAuthenticationInfo,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +21,9 @@ __all__ = ["AuthenticationInformation",
            "AuthenticationInformationAnswer",
            "AuthenticationInformationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class AuthenticationInformation(DefinedMessage):
     """An Authentication-Information base message.
@@ -81,14 +86,8 @@ class AuthenticationInformation(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return AuthenticationInformationRequest
-        return AuthenticationInformationAnswer
-
 
-class AuthenticationInformationAnswer(AuthenticationInformation):
+class AuthenticationInformationAnswer(AuthenticationInformation, is_request=False):
     """An Authentication-Information-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -144,11 +143,11 @@ class AuthenticationInformationAnswer(AuthenticationInformation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class AuthenticationInformationRequest(AuthenticationInformation):
+class AuthenticationInformationRequest(AuthenticationInformation, is_request=True):
     """A Authentication-Information-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -200,5 +199,5 @@ class AuthenticationInformationRequest(AuthenticationInformation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,12 +6,11 @@ implementing AVPs documented in 3GPP TS 29.727.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, ProxyInfo,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +18,9 @@ __all__ = ["CancelLocation",
            "CancelLocationAnswer",
            "CancelLocationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class CancelLocation(DefinedMessage):
     """An Cancel-Location base message.
@@ -81,14 +83,8 @@ class CancelLocation(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return CancelLocationRequest
-        return CancelLocationAnswer
-
 
-class CancelLocationAnswer(CancelLocation):
+class CancelLocationAnswer(CancelLocation, is_request=False):
     """A Cancel-Location-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -131,11 +127,11 @@ class CancelLocationAnswer(CancelLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class CancelLocationRequest(CancelLocation):
+class CancelLocationRequest(CancelLocation, is_request=True):
     """A Cancel-Location-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -181,5 +177,5 @@ class CancelLocationRequest(CancelLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,12 +6,11 @@ implementing AVPs documented in 3GPP TS 29.272.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, ProxyInfo,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +18,9 @@ __all__ = ["CancelVcsgLocation",
            "CancelVcsgLocationAnswer",
            "CancelVcsgLocationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class CancelVcsgLocation(DefinedMessage):
     """A Cancel-VCSG-Location base message.
@@ -81,14 +83,8 @@ class CancelVcsgLocation(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return CancelVcsgLocationRequest
-        return CancelVcsgLocationAnswer
-
 
-class CancelVcsgLocationAnswer(CancelVcsgLocation):
+class CancelVcsgLocationAnswer(CancelVcsgLocation, is_request=False):
     """A Cancel-VCSG-Location-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -131,11 +127,11 @@ class CancelVcsgLocationAnswer(CancelVcsgLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class CancelVcsgLocationRequest(CancelVcsgLocation):
+class CancelVcsgLocationRequest(CancelVcsgLocation, is_request=True):
     """A Cancel-VCSG-Location-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -179,5 +175,5 @@ class CancelVcsgLocationRequest(CancelVcsgLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,18 +6,19 @@ implementing AVPs documented in rfc6733.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (FailedAvp, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["CapabilitiesExchange", "CapabilitiesExchangeAnswer",
            "CapabilitiesExchangeRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class CapabilitiesExchange(DefinedMessage):
     """A Capabilities-Exchange message.
@@ -79,14 +80,8 @@ class CapabilitiesExchange(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return CapabilitiesExchangeRequest
-        return CapabilitiesExchangeAnswer
-
 
-class CapabilitiesExchangeAnswer(CapabilitiesExchange):
+class CapabilitiesExchangeAnswer(CapabilitiesExchange, is_request=False):
     """A Capabilities-Exchange-Answer message."""
     result_code: int
     origin_host: bytes
@@ -134,11 +129,11 @@ class CapabilitiesExchangeAnswer(CapabilitiesExchange):
         setattr(self, "acct_application_id", [])
         setattr(self, "vendor_specific_application_id", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class CapabilitiesExchangeRequest(CapabilitiesExchange):
+class CapabilitiesExchangeRequest(CapabilitiesExchange, is_request=True):
     """A Capabilities-Exchange-Request message."""
     origin_host: bytes
     origin_realm: bytes
@@ -180,5 +175,5 @@ class CapabilitiesExchangeRequest(CapabilitiesExchange):
         setattr(self, "acct_application_id", [])
         setattr(self, "vendor_specific_application_id", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
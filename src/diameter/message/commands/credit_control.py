@@ -8,18 +8,28 @@ from __future__ import annotations
 
 import datetime
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
+from .._base import Message, DefinedMessage
 from ..avp import Avp
-from ..avp.grouped import *
+from ..avp.grouped import (ChargingRuleInstall, CostInformation,
+                           DefaultEpsBearerQos, FailedAvp, FinalUnitIndication,
+                           GrantedServiceUnit, GsuPoolReference,
+                           MultipleServicesCreditControl, OcOlr,
+                           OcSupportedFeatures, ProxyInfo,
+                           QosFinalUnitIndication, QosInformation,
+                           RemainingBalance, RequestedServiceUnit,
+                           ServiceInformation, ServiceParameterInfo,
+                           SubscriptionId, SupportedFeatures, UsedServiceUnit,
+                           UserEquipmentInfo, UserEquipmentInfoExtension)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["CreditControl", "CreditControlAnswer", "CreditControlRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class CreditControl(DefinedMessage):
     """A Credit-Control message.
@@ -82,14 +92,8 @@ class CreditControl(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return CreditControlRequest
-        return CreditControlAnswer
-
 
-class CreditControlAnswer(CreditControl):
+class CreditControlAnswer(CreditControl, is_request=False):
     """A Credit-Control-Answer message."""
     session_id: str
     result_code: int
@@ -182,7 +186,7 @@ class CreditControlAnswer(CreditControl):
         setattr(self, "route_record", [])
         setattr(self, "failed_avp", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
     def add_multiple_services_credit_control(
@@ -241,7 +245,7 @@ class CreditControlAnswer(CreditControl):
         ))
 
 
-class CreditControlRequest(CreditControl):
+class CreditControlRequest(CreditControl, is_request=True):
     """A Credit-Control-Request message."""
     session_id: str
     origin_host: bytes
@@ -366,7 +370,7 @@ class CreditControlRequest(CreditControl):
         setattr(self, "route_record", [])
         setattr(self, "event_trigger", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
     def add_subscription_id(self, subscription_id_type: int,
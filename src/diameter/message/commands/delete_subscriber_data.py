@@ -6,12 +6,12 @@ implementing AVPs documented in 3GPP TS 29.727.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (EdrxRelatedRat, ExperimentalResult, FailedAvp,
+                           ProxyInfo, SupportedFeatures,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +19,9 @@ __all__ = ["DeleteSubscriberData",
            "DeleteSubscriberDataAnswer",
            "DeleteSubscriberDataRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class DeleteSubscriberData(DefinedMessage):
     """An Delete-Subscriber-Data base message.
@@ -81,14 +84,8 @@ class DeleteSubscriberData(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return DeleteSubscriberDataRequest
-        return DeleteSubscriberDataAnswer
-
 
-class DeleteSubscriberDataAnswer(DeleteSubscriberData):
+class DeleteSubscriberDataAnswer(DeleteSubscriberData, is_request=False):
     """A Delete-Subscriber-Data-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -133,11 +130,11 @@ class DeleteSubscriberDataAnswer(DeleteSubscriberData):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class DeleteSubscriberDataRequest(DeleteSubscriberData):
+class DeleteSubscriberDataRequest(DeleteSubscriberData, is_request=True):
     """A Delete-Subscriber-Data-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -199,5 +196,5 @@ class DeleteSubscriberDataRequest(DeleteSubscriberData):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
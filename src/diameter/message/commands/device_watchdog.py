@@ -6,17 +6,18 @@ AVPs documented in rfc6733.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (FailedAvp)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["DeviceWatchdog", "DeviceWatchdogAnswer", "DeviceWatchdogRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class DeviceWatchdog(DefinedMessage):
     """A Device-Watchdog message.
@@ -79,14 +80,8 @@ class DeviceWatchdog(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return DeviceWatchdogRequest
-        return DeviceWatchdogAnswer
-
 
-class DeviceWatchdogAnswer(DeviceWatchdog):
+class DeviceWatchdogAnswer(DeviceWatchdog, is_request=False):
     """A Device-Watchdog-Answer message."""
     result_code: int
     origin_host: bytes
@@ -109,11 +104,11 @@ class DeviceWatchdogAnswer(DeviceWatchdog):
         self.header.is_request = False
         self.header.is_proxyable = False
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class DeviceWatchdogRequest(DeviceWatchdog):
+class DeviceWatchdogRequest(DeviceWatchdog, is_request=True):
     """A Device-Watchdog-Request message."""
     origin_host: bytes
     origin_realm: bytes
@@ -130,5 +125,5 @@ class DeviceWatchdogRequest(DeviceWatchdog):
         self.header.is_request = True
         self.header.is_proxyable = False
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
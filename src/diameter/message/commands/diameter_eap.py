@@ -6,17 +6,18 @@ AVPs documented in `rfc4072`.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (FailedAvp, ProxyInfo, Tunneling)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["DiameterEap", "DiameterEapAnswer", "DiameterEapRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class DiameterEap(DefinedMessage):
     """A Diameter-EAP base message.
@@ -79,14 +80,8 @@ class DiameterEap(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return DiameterEapRequest
-        return DiameterEapAnswer
-
 
-class DiameterEapAnswer(DiameterEap):
+class DiameterEapAnswer(DiameterEap, is_request=False):
     """A Diameter-EAP-Answer message.
 
     !!! Note
@@ -232,11 +227,11 @@ class DiameterEapAnswer(DiameterEap):
         setattr(self, "redirect_host", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class DiameterEapRequest(DiameterEap):
+class DiameterEapRequest(DiameterEap, is_request=True):
     """A Diameter-EAP-Request message."""
     session_id: str
     auth_application_id: int
@@ -330,5 +325,5 @@ class DiameterEapRequest(DiameterEap):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,17 +6,19 @@ AVPs documented in `rfc4004`.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (MipHaToFaMsa, MipHaToMnMsa, MipMnToFaMsa,
+                           MipMnToHaMsa, MipOriginatingForeignAaa, ProxyInfo)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["HomeAgentMip", "HomeAgentMipAnswer", "HomeAgentMipRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class HomeAgentMip(DefinedMessage):
     """A Home-Agent-MIP base message.
@@ -79,14 +81,8 @@ class HomeAgentMip(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return HomeAgentMipRequest
-        return HomeAgentMipAnswer
-
 
-class HomeAgentMipAnswer(HomeAgentMip):
+class HomeAgentMipAnswer(HomeAgentMip, is_request=False):
     """A Home-Agent-MIP-Answer message."""
     session_id: str
     auth_application_id: int
@@ -132,11 +128,11 @@ class HomeAgentMipAnswer(HomeAgentMip):
         setattr(self, "mip_filter_rule", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class HomeAgentMipRequest(HomeAgentMip):
+class HomeAgentMipRequest(HomeAgentMip, is_request=True):
     """A Home-Agent-MIP-Request message."""
     session_id: str
     auth_application_id: int
@@ -197,5 +193,5 @@ class HomeAgentMipRequest(HomeAgentMip):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
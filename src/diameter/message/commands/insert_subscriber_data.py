@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import datetime
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (EpsLocationInformation, EpsUserState,
+                           ExperimentalResult, FailedAvp, LocalTimeZone,
+                           MonitoringEventConfigStatus, MonitoringEventReport,
+                           ProxyInfo, SubscriptionData, SupportedFeatures,
+                           SupportedServices, VendorSpecificApplicationId,
+                           VplmnCsgSubscriptionData)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -21,6 +24,9 @@ __all__ = ["InsertSubscriberData",
            "InsertSubscriberDataAnswer",
            "InsertSubscriberDataRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class InsertSubscriberData(DefinedMessage):
     """An Insert-Subscriber-Data base message.
@@ -83,14 +89,8 @@ class InsertSubscriberData(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return InsertSubscriberDataRequest
-        return InsertSubscriberDataAnswer
-
 
-class InsertSubscriberDataAnswer(InsertSubscriberData):
+class InsertSubscriberDataAnswer(InsertSubscriberData, is_request=False):
     """An Insert-Subscriber-Data-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -155,11 +155,11 @@ class InsertSubscriberDataAnswer(InsertSubscriberData):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class InsertSubscriberDataRequest(InsertSubscriberData):
+class InsertSubscriberDataRequest(InsertSubscriberData, is_request=True):
     """An Insert-Subscriber-Data-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -215,5 +215,5 @@ class InsertSubscriberDataRequest(InsertSubscriberData):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
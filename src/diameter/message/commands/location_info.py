@@ -6,17 +6,21 @@ implementing AVPs documented in 3GPP TS 29.229.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, ServerCapabilities,
+                           SipAuthDataItem, SupportedFeatures,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["LocationInfo", "LocationInfoAnswer", "LocationInfoRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class LocationInfo(DefinedMessage):
     """A Location-Info base message.
@@ -79,14 +83,8 @@ class LocationInfo(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return LocationInfoRequest
-        return LocationInfoAnswer
-
 
-class LocationInfoAnswer(LocationInfo):
+class LocationInfoAnswer(LocationInfo, is_request=False):
     """A Location-Info-Answer message."""
     session_id: str
     drmp: int
@@ -138,11 +136,11 @@ class LocationInfoAnswer(LocationInfo):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class LocationInfoRequest(LocationInfo):
+class LocationInfoRequest(LocationInfo, is_request=True):
     """A Location-Info-Request message."""
     session_id: str
     drmp: int
@@ -191,5 +189,5 @@ class LocationInfoRequest(LocationInfo):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
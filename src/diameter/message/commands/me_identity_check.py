@@ -6,12 +6,11 @@ implementing AVPs documented in 3GPP TS 29.272.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, ProxyInfo,
+                           TerminalInformation, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +18,9 @@ __all__ = ["MeIdentityCheck",
            "MeIdentityCheckAnswer",
            "MeIdentityCheckRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class MeIdentityCheck(DefinedMessage):
     """An ME-Identity-Check base message.
@@ -80,14 +82,8 @@ class MeIdentityCheck(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return MeIdentityCheckRequest
-        return MeIdentityCheckAnswer
-
 
-class MeIdentityCheckAnswer(MeIdentityCheck):
+class MeIdentityCheckAnswer(MeIdentityCheck, is_request=False):
     """A ME-Identity-Check-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -129,11 +125,11 @@ class MeIdentityCheckAnswer(MeIdentityCheck):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class MeIdentityCheckRequest(MeIdentityCheck):
+class MeIdentityCheckRequest(MeIdentityCheck, is_request=True):
     """A ME-Identity-Check-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -174,5 +170,5 @@ class MeIdentityCheckRequest(MeIdentityCheck):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,17 +6,20 @@ implementing AVPs documented in 3GPP TS 29.229.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, SipAuthDataItem,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["MultimediaAuth", "MultimediaAuthAnswer", "MultimediaAuthRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class MultimediaAuth(DefinedMessage):
     """A Multimedia-Auth base message.
@@ -79,14 +82,8 @@ class MultimediaAuth(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return MultimediaAuthRequest
-        return MultimediaAuthAnswer
-
 
-class MultimediaAuthAnswer(MultimediaAuth):
+class MultimediaAuthAnswer(MultimediaAuth, is_request=False):
     """A Multimedia-Auth-Answer message."""
     session_id: str
     drmp: int
@@ -137,11 +134,11 @@ class MultimediaAuthAnswer(MultimediaAuth):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class MultimediaAuthRequest(MultimediaAuth):
+class MultimediaAuthRequest(MultimediaAuth, is_request=True):
     """A Multimedia-Auth-Request message."""
     session_id: str
     drmp: int
@@ -192,5 +189,5 @@ class MultimediaAuthRequest(MultimediaAuth):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
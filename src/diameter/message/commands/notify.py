@@ -8,12 +8,13 @@ from __future__ import annotations
 
 import datetime
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, Load, Mip6AgentInfo,
+                           MonitoringEventConfigStatus, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, SupportedFeatures,
+                           TerminalInformation, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -21,6 +22,9 @@ __all__ = ["Notify",
            "NotifyAnswer",
            "NotifyRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class Notify(DefinedMessage):
     """A Notify base message.
@@ -82,14 +86,8 @@ class Notify(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return NotifyRequest
-        return NotifyAnswer
-
 
-class NotifyAnswer(Notify):
+class NotifyAnswer(Notify, is_request=False):
     """A Notify-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -139,11 +137,11 @@ class NotifyAnswer(Notify):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class NotifyRequest(Notify):
+class NotifyRequest(Notify, is_request=True):
     """A Notify-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -212,5 +210,5 @@ class NotifyRequest(Notify):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
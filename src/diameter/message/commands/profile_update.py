@@ -6,12 +6,13 @@ implementing AVPs documented in 3GPP TS 29.329.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, Load, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, RepositoryDataId,
+                           SupportedFeatures, UserIdentity,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +20,9 @@ __all__ = ["ProfileUpdate",
            "ProfileUpdateAnswer",
            "ProfileUpdateRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class ProfileUpdate(DefinedMessage):
     """A Profile-Update base message.
@@ -81,14 +85,9 @@ class ProfileUpdate(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> "Type[_AnyMessageType] | None":
-        if header.is_request:
-            return ProfileUpdateRequest
-        return ProfileUpdateAnswer
 
 
-class ProfileUpdateAnswer(ProfileUpdate):
+class ProfileUpdateAnswer(ProfileUpdate, is_request=False):
     """A Profile-Update-Answer message.
 
     3GPP TS 29.329 version 17.0.0
@@ -145,11 +144,11 @@ class ProfileUpdateAnswer(ProfileUpdate):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class ProfileUpdateRequest(ProfileUpdate):
+class ProfileUpdateRequest(ProfileUpdate, is_request=True):
     """A Profile-Update-Request message.
 
     3GPP TS 29.329 version 17.0.0
@@ -204,5 +203,5 @@ class ProfileUpdateRequest(ProfileUpdate):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
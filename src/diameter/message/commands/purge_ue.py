@@ -6,12 +6,13 @@ documented in 3GPP TS 29.727.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (EpsLocationInformation, ExperimentalResult,
+                           FailedAvp, Load, OcOlr, OcSupportedFeatures,
+                           ProxyInfo, SupportedFeatures,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +20,9 @@ __all__ = ["PurgeUe",
            "PurgeUeAnswer",
            "PurgeUeRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class PurgeUe(DefinedMessage):
     """An Purge-UE base message.
@@ -80,14 +84,9 @@ class PurgeUe(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return PurgeUeRequest
-        return PurgeUeAnswer
 
 
-class PurgeUeAnswer(PurgeUe):
+class PurgeUeAnswer(PurgeUe, is_request=False):
     """A Purge-UE-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -139,11 +138,11 @@ class PurgeUeAnswer(PurgeUe):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class PurgeUeRequest(PurgeUe):
+class PurgeUeRequest(PurgeUe, is_request=True):
     """A Purge-UE-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -191,5 +190,5 @@ class PurgeUeRequest(PurgeUe):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,12 +6,12 @@ implementing AVPs documented in 3GPP TS 29.329.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, ProxyInfo,
+                           SupportedFeatures, UserIdentity,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +19,9 @@ __all__ = ["PushNotification",
            "PushNotificationAnswer",
            "PushNotificationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class PushNotification(DefinedMessage):
     """A Push-Notification base message.
@@ -81,14 +84,9 @@ class PushNotification(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> "Type[_AnyMessageType] | None":
-        if header.is_request:
-            return PushNotificationRequest
-        return PushNotificationAnswer
 
 
-class PushNotificationAnswer(PushNotification):
+class PushNotificationAnswer(PushNotification, is_request=False):
     """A Push-Notification-Answer message.
 
     3GPP TS 29.329 version 17.0.0
@@ -130,11 +128,11 @@ class PushNotificationAnswer(PushNotification):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class PushNotificationRequest(PushNotification):
+class PushNotificationRequest(PushNotification, is_request=True):
     """A Push-Notification-Request message.
 
     3GPP TS 29.329 version 17.0.0
@@ -184,5 +182,5 @@ class PushNotificationRequest(PushNotification):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,17 +6,21 @@ implementing AVPs documented in 3GPP TS 29.229.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (AllowedWafWwsfIdentities, ChargingInformation,
+                           ExperimentalResult, FailedAvp, ProxyInfo,
+                           SipAuthDataItem, SupportedFeatures,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["PushProfile", "PushProfileAnswer", "PushProfileRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class PushProfile(DefinedMessage):
     """A Push-Profile base message.
@@ -79,14 +83,9 @@ class PushProfile(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return PushProfileRequest
-        return PushProfileAnswer
 
 
-class PushProfileAnswer(PushProfile):
+class PushProfileAnswer(PushProfile, is_request=False):
     """A Push-Profile-Answer message."""
     session_id: str
     drmp: int
@@ -126,11 +125,11 @@ class PushProfileAnswer(PushProfile):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class PushProfileRequest(PushProfile):
+class PushProfileRequest(PushProfile, is_request=True):
     """A Push-Profile-Request message."""
     session_id: str
     drmp: int
@@ -177,5 +176,5 @@ class PushProfileRequest(PushProfile):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,17 +6,19 @@ AVPs documented in rfc6733.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ChargingRuleInstall, ChargingRuleRemove, FailedAvp,
+                           ProxyInfo)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["ReAuth", "ReAuthAnswer", "ReAuthRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class ReAuth(DefinedMessage):
     """A Re-Auth message.
@@ -77,14 +79,9 @@ class ReAuth(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return ReAuthRequest
-        return ReAuthAnswer
 
 
-class ReAuthAnswer(ReAuth):
+class ReAuthAnswer(ReAuth, is_request=False):
     """A Re-Auth-Answer message."""
     # AVPs from rfc6733 (Diameter Base)
     session_id: str
@@ -157,11 +154,11 @@ class ReAuthAnswer(ReAuth):
         setattr(self, "state_class", [])
         setattr(self, "reply_message", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class ReAuthRequest(ReAuth):
+class ReAuthRequest(ReAuth, is_request=True):
     """A Re-Auth-Request message."""
     # AVPs from rfc6733 (Diameter Base)
     session_id: str
@@ -257,5 +254,5 @@ class ReAuthRequest(ReAuth):
         setattr(self, "charging_rule_install", [])
         setattr(self, "charging_rule_remove", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
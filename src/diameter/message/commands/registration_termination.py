@@ -6,17 +6,21 @@ implementing AVPs documented in 3GPP TS 29.229.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (AssociatedIdentities, DeregistrationReason,
+                           ExperimentalResult, FailedAvp,
+                           IdentityWithEmergencyRegistration, ProxyInfo,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["RegistrationTermination", "RegistrationTerminationAnswer", "RegistrationTerminationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class RegistrationTermination(DefinedMessage):
     """A Registration-Termination base message.
@@ -79,14 +83,9 @@ class RegistrationTermination(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return RegistrationTerminationRequest
-        return RegistrationTerminationAnswer
 
 
-class RegistrationTerminationAnswer(RegistrationTermination):
+class RegistrationTerminationAnswer(RegistrationTermination, is_request=False):
     """A Registration-Termination-Answer message."""
     session_id: str
     drmp: int
@@ -131,11 +130,11 @@ class RegistrationTerminationAnswer(RegistrationTermination):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class RegistrationTerminationRequest(RegistrationTermination):
+class RegistrationTerminationRequest(RegistrationTermination, is_request=True):
     """A Registration-Termination-Request message."""
     session_id: str
     drmp: int
@@ -181,5 +180,5 @@ class RegistrationTerminationRequest(RegistrationTermination):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -18,12 +18,12 @@ documented in 3GPP TS 29.272.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, ProxyInfo,
+                           SubscriptionData, SubscriptionDataDeletion,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -31,6 +31,9 @@ __all__ = ["Reset",
            "ResetAnswer",
            "ResetRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class Reset(DefinedMessage):
     """A Reset base message.
@@ -92,14 +95,9 @@ class Reset(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return ResetRequest
-        return ResetAnswer
 
 
-class ResetAnswer(Reset):
+class ResetAnswer(Reset, is_request=False):
     """A Reset-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -142,11 +140,11 @@ class ResetAnswer(Reset):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class ResetRequest(Reset):
+class ResetRequest(Reset, is_request=True):
     """A Reset-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -196,5 +194,5 @@ class ResetRequest(Reset):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,17 +6,23 @@ implementing AVPs documented in 3GPP TS 29.229.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (AllowedWafWwsfIdentities, AssociatedIdentities,
+                           AssociatedRegisteredIdentities, ChargingInformation,
+                           ExperimentalResult, FailedAvp, OcOlr,
+                           OcSupportedFeatures, ProxyInfo,
+                           ScscfRestorationInfo, SupportedFeatures,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["ServerAssignment", "ServerAssignmentAnswer", "ServerAssignmentRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class ServerAssignment(DefinedMessage):
     """A Server-Assignment base message.
@@ -79,14 +85,9 @@ class ServerAssignment(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return ServerAssignmentRequest
-        return ServerAssignmentAnswer
 
 
-class ServerAssignmentAnswer(ServerAssignment):
+class ServerAssignmentAnswer(ServerAssignment, is_request=False):
     """A Server-Assignment-Answer message."""
     session_id: str
     drmp: int
@@ -151,11 +152,11 @@ class ServerAssignmentAnswer(ServerAssignment):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class ServerAssignmentRequest(ServerAssignment):
+class ServerAssignmentRequest(ServerAssignment, is_request=True):
     """A Server-Assignment-Request message."""
     session_id: str
     drmp: int
@@ -215,5 +216,5 @@ class ServerAssignmentRequest(ServerAssignment):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,18 +6,19 @@ implementing AVPs documented in rfc6733.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (FailedAvp, ProxyInfo)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["SessionTermination", "SessionTerminationAnswer",
            "SessionTerminationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class SessionTermination(DefinedMessage):
     """A Session-Termination message.
@@ -80,14 +81,9 @@ class SessionTermination(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return SessionTerminationRequest
-        return SessionTerminationAnswer
 
 
-class SessionTerminationAnswer(SessionTermination):
+class SessionTerminationAnswer(SessionTermination, is_request=False):
     """An Abort-Session-Answer message.
 
     !!! Note
@@ -143,11 +139,11 @@ class SessionTerminationAnswer(SessionTermination):
         setattr(self, "redirect_host", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class SessionTerminationRequest(SessionTermination):
+class SessionTerminationRequest(SessionTermination, is_request=True):
     """An Abort-Session-Request message."""
     # AVPs from rfc6733 (Diameter Base)
     session_id: str
@@ -193,5 +189,5 @@ class SessionTerminationRequest(SessionTermination):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
@@ -6,18 +6,20 @@ AVPs documented in 3GPP TS 29.219 version 11.2.0 Release 11.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp,
+                           PolicyCounterStatusReport, ProxyInfo, SubscriptionId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["SpendingLimit", "SpendingLimitAnswer",
            "SpendingLimitRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class SpendingLimit(DefinedMessage):
     """A Spending-Limit message.
@@ -77,14 +79,9 @@ class SpendingLimit(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return SpendingLimitRequest
-        return SpendingLimitAnswer
 
 
-class SpendingLimitAnswer(SpendingLimit):
+class SpendingLimitAnswer(SpendingLimit, is_request=False):
     """A Spending-Limit-Answer message."""
     session_id: str
     auth_application_id: int
@@ -129,11 +126,11 @@ class SpendingLimitAnswer(SpendingLimit):
         setattr(self, "redirect_host", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class SpendingLimitRequest(SpendingLimit):
+class SpendingLimitRequest(SpendingLimit, is_request=True):
     """A Spending-Limit-Request message."""
     session_id: str
     auth_application_id: int
@@ -178,5 +175,5 @@ class SpendingLimitRequest(SpendingLimit):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
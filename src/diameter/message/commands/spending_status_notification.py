@@ -6,18 +6,21 @@ AVPs documented in 3GPP TS 29.219 version 11.2.0 Release 11.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, OcOlr,
+                           OcSupportedFeatures, PolicyCounterStatusReport,
+                           ProxyInfo)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["SpendingStatusNotification", "SpendingStatusNotificationAnswer",
            "SpendingStatusNotificationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class SpendingStatusNotification(DefinedMessage):
     """A Spending-Status-Notification message.
@@ -77,14 +80,9 @@ class SpendingStatusNotification(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return SpendingStatusNotificationRequest
-        return SpendingStatusNotificationAnswer
 
 
-class SpendingStatusNotificationAnswer(SpendingStatusNotification):
+class SpendingStatusNotificationAnswer(SpendingStatusNotification, is_request=False):
     """A Spending-Status-Notification-Answer message."""
     session_id: str
     drmp: int
@@ -130,11 +128,11 @@ class SpendingStatusNotificationAnswer(SpendingStatusNotification):
         setattr(self, "redirect_host", [])
         setattr(self, "proxy_info", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class SpendingStatusNotificationRequest(SpendingStatusNotification):
+class SpendingStatusNotificationRequest(SpendingStatusNotification, is_request=True):
     """A Spending-Status-Notification-Request message."""
     session_id: str
     drmp: int
@@ -178,5 +176,5 @@ class SpendingStatusNotificationRequest(SpendingStatusNotification):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
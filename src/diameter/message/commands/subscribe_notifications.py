@@ -8,12 +8,12 @@ from __future__ import annotations
 
 import datetime
 
-from typing import Type
-
-from .._base import MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, Load, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, SupportedFeatures,
+                           UserIdentity, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -21,6 +21,9 @@ __all__ = ["SubscribeNotifications",
            "SubscribeNotificationsAnswer",
            "SubscribeNotificationsRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class SubscribeNotifications(DefinedMessage):
     """A Subscribe-Notifications base message.
@@ -83,14 +86,9 @@ class SubscribeNotifications(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> "Type[_AnyMessageType] | None":
-        if header.is_request:
-            return SubscribeNotificationsRequest
-        return SubscribeNotificationsAnswer
 
 
-class SubscribeNotificationsAnswer(SubscribeNotifications):
+class SubscribeNotificationsAnswer(SubscribeNotifications, is_request=False):
     """A Subscribe-Notifications-Answer message.
 
     3GPP TS 29.329 version 17.0.0
@@ -147,11 +145,11 @@ class SubscribeNotificationsAnswer(SubscribeNotifications):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class SubscribeNotificationsRequest(SubscribeNotifications):
+class SubscribeNotificationsRequest(SubscribeNotifications, is_request=True):
     """A Subscribe-Notifications-Request message.
 
     3GPP TS 29.329 version 17.0.0
@@ -223,5 +221,5 @@ class SubscribeNotificationsRequest(SubscribeNotifications):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
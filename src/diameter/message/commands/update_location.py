@@ -8,17 +8,22 @@ from __future__ import annotations
 
 import datetime
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ActiveApn, AdjacentPlmns, EquivalentPlmnList,
+                           ExperimentalResult, FailedAvp, Load, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, SubscriptionData,
+                           SupportedFeatures, SupportedServices,
+                           TerminalInformation, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["UpdateLocation", "UpdateLocationAnswer", "UpdateLocationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class UpdateLocation(DefinedMessage):
     """An Update-Location base message.
@@ -81,14 +86,9 @@ class UpdateLocation(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return UpdateLocationRequest
-        return UpdateLocationAnswer
 
 
-class UpdateLocationAnswer(UpdateLocation):
+class UpdateLocationAnswer(UpdateLocation, is_request=False):
     """A Update-Location-Answer message."""
     session_id: str
     drmp: int
@@ -142,11 +142,11 @@ class UpdateLocationAnswer(UpdateLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class UpdateLocationRequest(UpdateLocation):
+class UpdateLocationRequest(UpdateLocation, is_request=True):
     """A Update-Location-Request message."""
     session_id: str
     drmp: int
@@ -223,5 +223,5 @@ class UpdateLocationRequest(UpdateLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
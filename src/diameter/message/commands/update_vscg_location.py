@@ -6,12 +6,12 @@ implementing AVPs documented in 3GPP TS 29.272.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, ProxyInfo,
+                           SupportedFeatures, VendorSpecificApplicationId,
+                           VplmnCsgSubscriptionData)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +19,9 @@ __all__ = ["UpdateVcsgLocation",
            "UpdateVcsgLocationAnswer",
            "UpdateVcsgLocationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class UpdateVcsgLocation(DefinedMessage):
     """An Update-VCSG-Location base message.
@@ -81,14 +84,9 @@ class UpdateVcsgLocation(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return UpdateVcsgLocationRequest
-        return UpdateVcsgLocationAnswer
 
 
-class UpdateVcsgLocationAnswer(UpdateVcsgLocation):
+class UpdateVcsgLocationAnswer(UpdateVcsgLocation, is_request=False):
     """An Update-VCSG-Location-Answer message.
 
     3GPP TS 29.272 version 19.4.0
@@ -138,11 +136,11 @@ class UpdateVcsgLocationAnswer(UpdateVcsgLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class UpdateVcsgLocationRequest(UpdateVcsgLocation):
+class UpdateVcsgLocationRequest(UpdateVcsgLocation, is_request=True):
     """An Update-VCSG-Location-Request message.
 
     3GPP TS 29.272 version 19.4.0
@@ -190,5 +188,5 @@ class UpdateVcsgLocationRequest(UpdateVcsgLocation):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
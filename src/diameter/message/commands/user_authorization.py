@@ -6,17 +6,20 @@ implementing AVPs documented in 3GPP TS 29.229.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import Message, MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import Message, DefinedMessage
+from ..avp.grouped import (ExperimentalResult, FailedAvp, OcOlr,
+                           OcSupportedFeatures, ProxyInfo, ServerCapabilities,
+                           SupportedFeatures, VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
 __all__ = ["UserAuthorization", "UserAuthorizationAnswer", "UserAuthorizationRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class UserAuthorization(DefinedMessage):
     """A User-Authorization base message.
@@ -79,14 +82,9 @@ class UserAuthorization(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> Type[_AnyMessageType] | None:
-        if header.is_request:
-            return UserAuthorizationRequest
-        return UserAuthorizationAnswer
 
 
-class UserAuthorizationAnswer(UserAuthorization):
+class UserAuthorizationAnswer(UserAuthorization, is_request=False):
     """A User-Authorization-Answer message."""
     session_id: str
     drmp: int
@@ -134,11 +132,11 @@ class UserAuthorizationAnswer(UserAuthorization):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class UserAuthorizationRequest(UserAuthorization):
+class UserAuthorizationRequest(UserAuthorization, is_request=True):
     """A User-Authorization-Request message."""
     vendor_specific_application_id: VendorSpecificApplicationId
     auth_session_state: int
@@ -183,5 +181,5 @@ class UserAuthorizationRequest(UserAuthorization):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
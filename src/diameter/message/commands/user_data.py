@@ -6,12 +6,13 @@ implementing AVPs documented in 3GPP TS 29.329.
 """
 from __future__ import annotations
 
-from typing import Type
-
-from .._base import MessageHeader, DefinedMessage, _AnyMessageType
-from ..avp.grouped import *
+from .._base import DefinedMessage
+from ..avp.grouped import (CallReferenceInfo, ExperimentalResult, FailedAvp,
+                           Load, OcOlr, OcSupportedFeatures, ProxyInfo,
+                           SupportedFeatures, UserIdentity,
+                           VendorSpecificApplicationId)
 from ..avp.generator import AvpGenDef, AvpGenType
-from ._attributes import assign_attr_from_defs
+from ._attributes import defer_attr_from_defs, grouped_avp_getattr
 from ..constants import *
 
 
@@ -19,6 +20,9 @@ __all__ = ["UserData",
            "UserDataAnswer",
            "UserDataRequest"]
 
+# every other grouped AVP class can be imported from this module as well
+__getattr__ = grouped_avp_getattr(__name__)
+
 
 class UserData(DefinedMessage):
     """A User-Data base message.
@@ -81,14 +85,9 @@ class UserData(DefinedMessage):
         self.header.command_code = self.code
         super().__post_init__()
 
-    @classmethod
-    def type_factory(cls, header: MessageHeader) -> "Type[_AnyMessageType] | None":
-        if header.is_request:
-            return UserDataRequest
-        return UserDataAnswer
 
 
-class UserDataAnswer(UserData):
+class UserDataAnswer(UserData, is_request=False):
     """A User-Data-Answer message.
 
     3GPP TS 29.329 version 17.0.0
@@ -143,11 +142,11 @@ class UserDataAnswer(UserData):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
 
 
-class UserDataRequest(UserData):
+class UserDataRequest(UserData, is_request=True):
     """A User-Data-Request message.
 
     3GPP TS 29.329 version 17.0.0
@@ -229,5 +228,5 @@ class UserDataRequest(UserData):
         setattr(self, "proxy_info", [])
         setattr(self, "route_record", [])
 
-        assign_attr_from_defs(self, self._avps)
+        defer_attr_from_defs(self, self._avps)
         self._avps = []
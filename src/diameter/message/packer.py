@@ -3,12 +3,18 @@ Copied and updated from python 3.12 stdlib's xdrlib.
 
 As xdrlib will be removed in Python 3.13, this module preserves the Packer and
 Unpacker functionality from it, while making slight upgrades.
+
+The actual work is done by `RawPacker` and `RawUnpacker`, which write into a
+growable `bytearray` and read using precompiled `struct.Struct` instances.
+They do not translate errors; any `struct.error`, `EOFError`, `TypeError` or
+`ValueError` is raised as-is, and it is up to the caller to convert them, once,
+at a message or AVP boundary. The `Packer` and `Unpacker` classes retain the
+original xdrlib behaviour of raising `ConversionError` from every method.
 """
 from __future__ import annotations
 
 import struct
 
-from io import BytesIO
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
@@ -21,8 +27,22 @@ class ConversionError(Error):
     pass
 
 
+CONVERSION_ERRORS = (EOFError, TypeError, ValueError, struct.error)
+"""Exceptions raised by `RawPacker` and `RawUnpacker` that should be
+translated to a `ConversionError`, or to a more specific error, by the
+caller."""
+
 _CT = TypeVar("_CT")
 
+_UINT = struct.Struct(">L")
+_INT = struct.Struct(">l")
+_UHYPER = struct.Struct(">Q")
+_HYPER = struct.Struct(">q")
+_FLOAT = struct.Struct(">f")
+_DOUBLE = struct.Struct(">d")
+_CHAR = struct.Struct(">B")
+_PADDING = (b"", b"\0\0\0", b"\0\0", b"\0")
+
 
 def raise_conversion_error(function: Callable[..., _CT]) -> Callable[..., _CT]:
     """Wrap any raised `struct.errors` in a ConversionError."""
@@ -30,66 +50,71 @@ def raise_conversion_error(function: Callable[..., _CT]) -> Callable[..., _CT]:
     def result(self: Packer | Unpacker, *args: Any, **kwargs: Any):
         try:
             return function(self, *args, **kwargs)
-        except (EOFError, TypeError, ValueError, struct.error) as e:
+        except CONVERSION_ERRORS as e:
             raise ConversionError(e.args[0]) from None
     return result
 
 
-class Packer:
-    """Pack various data representations into a buffer."""
+class RawPacker:
+    """Pack various data representations into a growable buffer.
+
+    Does not translate any errors, see `Packer` for a variant that raises
+    `ConversionError` instead.
+    """
+    __slots__ = ("_buf",)
+
     def __init__(self):
-        self.reset()
+        self._buf: bytearray = bytearray()
 
     def reset(self):
-        self.__buf = BytesIO()
+        self._buf = bytearray()
 
     def get_buffer(self) -> bytes:
-        return self.__buf.getvalue()
+        return bytes(self._buf)
+
+    def get_bytearray(self) -> bytearray:
+        """Return the buffer itself, which can be appended to directly."""
+        return self._buf
+
+    def get_position(self) -> int:
+        return len(self._buf)
 
-    @raise_conversion_error
     def pack_uint(self, x: int):
-        self.__buf.write(struct.pack('>L', x))
+        self._buf += _UINT.pack(x)
+
+    def pack_uint_at(self, position: int, x: int):
+        """Overwrite an already packed unsigned integer at a given position."""
+        _UINT.pack_into(self._buf, position, x)
 
-    @raise_conversion_error
     def pack_int(self, x: int):
-        self.__buf.write(struct.pack('>l', x))
+        self._buf += _INT.pack(x)
 
     pack_enum = pack_int
 
     def pack_bool(self, x: bool):
         if x:
-            self.__buf.write(b'\0\0\0\1')
+            self._buf += b'\0\0\0\1'
         else:
-            self.__buf.write(b'\0\0\0\0')
+            self._buf += b'\0\0\0\0'
 
     def pack_uhyper(self, x: int):
-        try:
-            self.pack_uint(x >> 32 & 0xffffffff)
-        except (TypeError, struct.error) as e:
-            raise ConversionError(e.args[0]) from None
-        try:
-            self.pack_uint(x & 0xffffffff)
-        except (TypeError, struct.error) as e:
-            raise ConversionError(e.args[0]) from None
+        self._buf += _UHYPER.pack(x & 0xffffffffffffffff)
 
     pack_hyper = pack_uhyper
 
-    @raise_conversion_error
     def pack_float(self, x: float):
-        self.__buf.write(struct.pack('>f', x))
+        self._buf += _FLOAT.pack(x)
 
-    @raise_conversion_error
     def pack_double(self, x: float):
-        self.__buf.write(struct.pack('>d', x))
+        self._buf += _DOUBLE.pack(x)
 
-    @raise_conversion_error
     def pack_fstring(self, n: int, s: bytes):
         if n < 0:
             raise ValueError("fstring size must be nonnegative")
         data = s[:n]
-        n = ((n+3)//4)*4
-        data = data + (n - len(data)) * b'\0'
-        self.__buf.write(data)
+        buf = self._buf
+        buf += data
+        buf += bytes(((n + 3) & ~3) - len(data))
 
     pack_fopaque = pack_fstring
 
@@ -101,13 +126,18 @@ class Packer:
     pack_opaque = pack_string
     pack_bytes = pack_string
 
+    def pack_padded(self, s: bytes):
+        """Append bytes as-is, followed by padding up to a 4-byte boundary."""
+        buf = self._buf
+        buf += s
+        buf += _PADDING[len(s) & 3]
+
     def pack_list(self, item_list, pack_item):
         for item in item_list:
             self.pack_uint(1)
             pack_item(item)
         self.pack_uint(0)
 
-    @raise_conversion_error
     def pack_farray(self, n, item_list, pack_item):
         if len(item_list) != n:
             raise ValueError("wrong array size")
@@ -120,57 +150,52 @@ class Packer:
         self.pack_farray(n, item_list, pack_item)
 
 
-class Unpacker:
-    """Unpacks various data representations from the given buffer."""
+class RawUnpacker:
+    """Unpacks various data representations from the given buffer.
+
+    Does not translate any errors, see `Unpacker` for a variant that raises
+    `ConversionError` instead.
+    """
+    __slots__ = ("_buf", "_pos", "_end")
+
     def __init__(self, data: bytes):
         self.reset(data)
 
     def reset(self, data: bytes):
-        self.__buf: bytes = data
-        self.__pos: int = 0
+        self._buf: bytes = data
+        self._pos: int = 0
+        self._end: int = len(data)
 
     def get_position(self) -> int:
-        return self.__pos
+        return self._pos
 
     def set_position(self, position: int):
-        self.__pos = position
+        self._pos = position
 
     def get_buffer(self) -> bytes:
-        return self.__buf
+        return self._buf
 
     def done(self):
-        if self.__pos < len(self.__buf):
+        if self._pos < self._end:
             raise Error("unextracted data remains")
 
     def is_done(self):
-        return self.__pos >= len(self.__buf)
+        return self._pos >= self._end
 
-    @raise_conversion_error
     def unpack_char(self) -> int:
-        i = self.__pos
-        self.__pos = j = i+1
-        data = self.__buf[i:j]
-        if len(data) < 1:
-            raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">B", data)[0]
+        i = self._pos
+        self._pos = i + 1
+        return _CHAR.unpack_from(self._buf, i)[0]
 
-    @raise_conversion_error
     def unpack_uint(self) -> int:
-        i = self.__pos
-        self.__pos = j = i+4
-        data = self.__buf[i:j]
-        if len(data) < 4:
-            raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">L", data)[0]
+        i = self._pos
+        self._pos = i + 4
+        return _UINT.unpack_from(self._buf, i)[0]
 
-    @raise_conversion_error
     def unpack_int(self) -> int:
-        i = self.__pos
-        self.__pos = j = i+4
-        data = self.__buf[i:j]
-        if len(data) < 4:
-            raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack('>l', data)[0]
+        i = self._pos
+        self._pos = i + 4
+        return _INT.unpack_from(self._buf, i)[0]
 
     unpack_enum = unpack_int
 
@@ -178,44 +203,34 @@ class Unpacker:
         return bool(self.unpack_int())
 
     def unpack_uhyper(self) -> int:
-        hi = self.unpack_uint()
-        lo = self.unpack_uint()
-        return int(hi) << 32 | lo
+        i = self._pos
+        self._pos = i + 8
+        return _UHYPER.unpack_from(self._buf, i)[0]
 
     def unpack_hyper(self) -> int:
-        x = self.unpack_uhyper()
-        if x >= 0x8000000000000000:
-            x = x - 0x10000000000000000
-        return x
+        i = self._pos
+        self._pos = i + 8
+        return _HYPER.unpack_from(self._buf, i)[0]
 
-    @raise_conversion_error
     def unpack_float(self) -> float:
-        i = self.__pos
-        self.__pos = j = i+4
-        data = self.__buf[i:j]
-        if len(data) < 4:
-            raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">f", data)[0]
+        i = self._pos
+        self._pos = i + 4
+        return _FLOAT.unpack_from(self._buf, i)[0]
 
-    @raise_conversion_error
     def unpack_double(self) -> float:
-        i = self.__pos
-        self.__pos = j = i+8
-        data = self.__buf[i:j]
-        if len(data) < 8:
-            raise EOFError("Not enough bytes left to unpack")
-        return struct.unpack(">d", data)[0]
+        i = self._pos
+        self._pos = i + 8
+        return _DOUBLE.unpack_from(self._buf, i)[0]
 
-    @raise_conversion_error
     def unpack_fstring(self, n: int) -> bytes:
         if n < 0:
             raise ValueError("fstring size must be a positive value")
-        i = self.__pos
-        j = i + (n+3)//4*4
-        if j > len(self.__buf):
+        i = self._pos
+        j = i + ((n + 3) & ~3)
+        if j > self._end:
             raise EOFError("Not enough bytes left to unpack")
-        self.__pos = j
-        return self.__buf[i:i+n]
+        self._pos = j
+        return self._buf[i:i+n]
 
     unpack_fopaque = unpack_fstring
 
@@ -239,4 +254,44 @@ class Unpacker:
 
     def unpack_array(self, unpack_item) -> list:
         n = self.unpack_uint()
-        return self.unpack_farray(n, unpack_item)
\ No newline at end of file
+        return self.unpack_farray(n, unpack_item)
+
+
+class Packer(RawPacker):
+    """Pack various data representations into a buffer.
+
+    Every failure to pack a value is raised as a `ConversionError`.
+    """
+    __slots__ = ()
+
+    pack_uint = raise_conversion_error(RawPacker.pack_uint)
+    pack_uint_at = raise_conversion_error(RawPacker.pack_uint_at)
+    pack_int = raise_conversion_error(RawPacker.pack_int)
+    pack_enum = pack_int
+    pack_uhyper = raise_conversion_error(RawPacker.pack_uhyper)
+    pack_hyper = pack_uhyper
+    pack_float = raise_conversion_error(RawPacker.pack_float)
+    pack_double = raise_conversion_error(RawPacker.pack_double)
+    pack_fstring = raise_conversion_error(RawPacker.pack_fstring)
+    pack_fopaque = pack_fstring
+    pack_padded = raise_conversion_error(RawPacker.pack_padded)
+    pack_farray = raise_conversion_error(RawPacker.pack_farray)
+
+
+class Unpacker(RawUnpacker):
+    """Unpacks various data representations from the given buffer.
+
+    Every failure to unpack a value is raised as a `ConversionError`.
+    """
+    __slots__ = ()
+
+    unpack_char = raise_conversion_error(RawUnpacker.unpack_char)
+    unpack_uint = raise_conversion_error(RawUnpacker.unpack_uint)
+    unpack_int = raise_conversion_error(RawUnpacker.unpack_int)
+    unpack_enum = unpack_int
+    unpack_uhyper = raise_conversion_error(RawUnpacker.unpack_uhyper)
+    unpack_hyper = raise_conversion_error(RawUnpacker.unpack_hyper)
+    unpack_float = raise_conversion_error(RawUnpacker.unpack_float)
+    unpack_double = raise_conversion_error(RawUnpacker.unpack_double)
+    unpack_fstring = raise_conversion_error(RawUnpacker.unpack_fstring)
+    unpack_fopaque = unpack_fstring
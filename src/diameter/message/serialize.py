@@ -0,0 +1,374 @@
+"""
+Conversion of messages into plain python dictionaries and JSON, and back.
+
+Intended for logging decoded messages in a structured form, and for handing
+them over to other services. The produced structures contain only JSON
+compatible types, and they hold everything that is needed to reproduce the
+message, including unknown AVPs and the AVP flags, so that the output can also
+be used as a replay format.
+
+Messages that have a python implementation, i.e. instances of
+[DefinedMessage][diameter.message.DefinedMessage], are converted from their
+instance attributes, using the `avp_def` of the message class and the grouped
+AVP classes, into a dictionary of attribute names and values. Messages that
+have been received, and any other message, are converted from their list of
+AVPs, as the instance attributes do not hold the flags of received AVPs.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import socket
+import struct
+
+from typing import Any, IO, Iterable, Iterator
+
+from ._base import DefinedMessage, Message, MessageHeader, UndefinedMessage
+from .avp import Avp, AvpDecodeError, AvpGrouped
+from .avp.avp import (AvpAddress, AvpOctetString, AvpTime,
+                      get_avp_dictionary_entry)
+from .avp.generator import AvpGenerator
+
+
+_ADDRESS_FAMILY = struct.Struct(">H")
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), check_circular=False)
+
+
+def _time_to_json(value: datetime.datetime) -> str:
+    # naive values, as produced by `AvpTime`, are in local time
+    return value.astimezone(datetime.timezone.utc).isoformat()
+
+
+# Python values that are not JSON types and how they are converted; any other
+# value is used as it is
+_TO_JSON: dict[type, Any] = {
+    bytes: bytes.hex,
+    memoryview: memoryview.hex,
+    datetime.datetime: _time_to_json,
+    tuple: list,
+}
+
+
+def _address_from_json(value: list | str) -> tuple[int, str] | str:
+    # addresses are held either as set, as a plain string, or as decoded, as
+    # a tuple of the address family and the address
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+# AVP types whose values are not JSON types and how they are converted back
+_FROM_JSON: dict[type[Avp], Any] = {
+    AvpOctetString: bytes.fromhex,
+    AvpTime: datetime.datetime.fromisoformat,
+    AvpAddress: _address_from_json,
+}
+
+
+def _value_to_json(value: Any) -> Any:
+    convert = _TO_JSON.get(value.__class__)
+    if convert is None:
+        return value
+    return convert(value)
+
+
+def _address_payload(family: int, address: str) -> bytes:
+    # built directly instead of through `AvpAddress.value`, which does not
+    # accept the address family and cannot produce every family
+    if family == 1:
+        value = socket.inet_pton(socket.AF_INET, address)
+    elif family == 2:
+        value = socket.inet_pton(socket.AF_INET6, address)
+    elif family == 8:
+        value = address.encode("utf-8")
+    else:
+        value = bytes.fromhex(address)
+    return _ADDRESS_FAMILY.pack(family) + value
+
+
+def avp_to_dict(avp: Avp) -> dict[str, Any]:
+    """Convert a single AVP into a dictionary.
+
+    The dictionary contains the AVP `code` and `flags`, the `vendor` if the
+    AVP has a vendor ID set, and the AVP value as `value`. Values are
+    converted into JSON compatible types:
+
+     * OctetString values are hex strings
+     * Address values are lists of the address family and the address
+     * Time values are ISO 8601 strings in UTC
+     * Grouped values are lists of sub-AVP dictionaries
+
+    AVPs that are not in the AVP dictionary, and AVPs whose payload cannot be
+    decoded into a value, have a hex string of their payload as `payload`
+    instead of `value`:
+
+        >>> avp_to_dict(Avp.new(AVP_SESSION_ID, value="sess;1"))
+        {'code': 263, 'flags': 64, 'value': 'sess;1'}
+        >>> avp_to_dict(Avp(9999, 10415, b"\\x01"))
+        {'code': 9999, 'flags': 128, 'vendor': 10415, 'payload': '01'}
+
+    """
+    data = {"code": avp.code, "flags": avp.flags}
+    if avp.vendor_id:
+        data["vendor"] = avp.vendor_id
+
+    if avp.__class__ is not Avp:
+        try:
+            if isinstance(avp, AvpGrouped):
+                data["value"] = [avp_to_dict(a) for a in avp.value]
+            else:
+                data["value"] = _value_to_json(avp.value)
+            return data
+        except (AvpDecodeError, ValueError, OSError, struct.error):
+            pass
+
+    data["payload"] = avp.payload.hex()
+    return data
+
+
+def avp_from_dict(data: dict[str, Any]) -> Avp:
+    """Create an AVP from a dictionary produced by `avp_to_dict`.
+
+    If the dictionary has no `flags`, the flags are set based on the AVP
+    dictionary, in the same way as with `Avp.new`.
+
+    Raises:
+        ValueError: If the AVP has a `value`, but it is not in the AVP
+            dictionary, or if the value cannot be converted.
+        AvpEncodeError: If the value is not valid for the AVP type.
+    """
+    code = data["code"]
+    vendor_id = data.get("vendor", 0)
+    entry = get_avp_dictionary_entry(code, vendor_id)
+
+    if "payload" in data:
+        avp_type = Avp if entry is None else entry["type"]
+        avp = avp_type(code, vendor_id, bytes.fromhex(data["payload"]))
+    elif entry is None:
+        raise ValueError(
+            f"AVP {code} with vendor {vendor_id} is unknown and has no "
+            f"payload")
+    else:
+        avp_type = entry["type"]
+        avp = avp_type(code, vendor_id)
+        value = data["value"]
+        if issubclass(avp_type, AvpGrouped):
+            avp.value = [avp_from_dict(d) for d in value]
+        elif issubclass(avp_type, AvpAddress):
+            avp.payload = _address_payload(*value)
+        else:
+            convert = _FROM_JSON.get(avp_type)
+            avp.value = value if convert is None else convert(value)
+
+    if "flags" in data:
+        avp.flags = data["flags"]
+    elif entry is not None and entry.get("mandatory"):
+        avp.is_mandatory = True
+    return avp
+
+
+def _attrs_to_dict(obj: AvpGenerator) -> dict[str, Any]:
+    attrs = {}
+    for gen_def in obj.avp_def:
+        value = getattr(obj, gen_def.attr_name, None)
+        if value is None:
+            continue
+        if value.__class__ is list:
+            if not value:
+                continue
+            if gen_def.type_class:
+                value = [_attrs_to_dict(v) for v in value if v is not None]
+            else:
+                value = [_value_to_json(v) for v in value if v is not None]
+        elif gen_def.type_class:
+            value = _attrs_to_dict(value)
+        else:
+            value = _value_to_json(value)
+        attrs[gen_def.attr_name] = value
+
+    additional_avps = getattr(obj, "additional_avps", None)
+    if additional_avps:
+        attrs["additional_avps"] = [avp_to_dict(a) for a in additional_avps]
+    return attrs
+
+
+def _attrs_from_dict(obj: AvpGenerator, attrs: dict[str, Any]):
+    gen_defs = {gen_def.attr_name: gen_def for gen_def in obj.avp_def}
+    for attr_name, value in attrs.items():
+        if attr_name == "additional_avps":
+            setattr(obj, attr_name, [avp_from_dict(d) for d in value])
+            continue
+
+        gen_def = gen_defs.get(attr_name)
+        if gen_def is None:
+            raise ValueError(
+                f"{obj.__class__.__name__} has no attribute `{attr_name}`")
+
+        avp_type = None
+        if gen_def.type_class:
+            convert = _grouped_from_dict(gen_def.type_class)
+        else:
+            entry = get_avp_dictionary_entry(
+                gen_def.avp_code, gen_def.vendor_id)
+            if entry is not None:
+                avp_type = entry["type"]
+            convert = _FROM_JSON.get(avp_type)
+
+        if convert is not None:
+            # a single address value is a list of its own
+            if isinstance(value, list) and not (
+                    avp_type is AvpAddress and isinstance(value[0], int)):
+                value = [convert(v) for v in value]
+            else:
+                value = convert(value)
+        setattr(obj, attr_name, value)
+
+
+def _grouped_from_dict(type_class: type) -> Any:
+    def convert(attrs: dict[str, Any]) -> AvpGenerator:
+        grouped = type_class()
+        _attrs_from_dict(grouped, attrs)
+        return grouped
+    return convert
+
+
+def _received_avps(msg: DefinedMessage) -> list[Avp]:
+    # the AVPs as they are encoded, i.e. the received AVPs, with their own
+    # flags, of every attribute that has not been decoded since, and the
+    # AVPs of every other attribute generated from its value. If nothing has
+    # been decoded, these are all of the received AVPs, and their original
+    # order is kept as well
+    avps = msg.avps
+    received = msg.__dict__.get("_received_avps")
+    if (received is not None and len(received) == len(avps) and
+            set(map(id, received)) == set(map(id, avps))):
+        return received
+    return avps
+
+
+def message_to_dict(msg: Message) -> dict[str, Any]:
+    """Convert a message into a dictionary.
+
+    Same as calling [Message.to_dict][diameter.message.Message.to_dict].
+    """
+    hdr = msg.header
+    data = {
+        "name": msg.name,
+        "header": {
+            "version": hdr.version,
+            "flags": hdr.command_flags,
+            "command_code": hdr.command_code,
+            "application_id": hdr.application_id,
+            "hop_by_hop_identifier": hdr.hop_by_hop_identifier,
+            "end_to_end_identifier": hdr.end_to_end_identifier,
+        }
+    }
+    if (not isinstance(msg, DefinedMessage) or not msg.avp_def or
+            msg._avps):
+        avps = msg.avps
+    elif "_received_avps" in msg.__dict__ or msg._undecoded_avps():
+        data["received"] = True
+        avps = _received_avps(msg)
+    else:
+        data["attributes"] = _attrs_to_dict(msg)
+        avps = msg._additional_avps
+    if avps:
+        data["avps"] = [avp_to_dict(a) for a in avps]
+    return data
+
+
+def message_from_dict(data: dict[str, Any]) -> Message:
+    """Create a message from a dictionary produced by `message_to_dict`.
+
+    Same as calling [Message.from_dict][diameter.message.Message.from_dict].
+    """
+    hdr = data["header"]
+
+    def header() -> MessageHeader:
+        return MessageHeader(
+            version=hdr.get("version", 1),
+            command_flags=hdr.get("flags", 0),
+            command_code=hdr["command_code"],
+            application_id=hdr.get("application_id", 0),
+            hop_by_hop_identifier=hdr.get("hop_by_hop_identifier", 0),
+            end_to_end_identifier=hdr.get("end_to_end_identifier", 0))
+
+    msg_header = header()
+    avps = [avp_from_dict(d) for d in data.get("avps", ())]
+    cmd_type = all_commands.get(msg_header.command_code)
+
+    if "attributes" not in data:
+        if data.get("received"):
+            # created as if the AVPs had been received
+            msg_type = all_commands.message_type(msg_header)
+        else:
+            msg_type = cmd_type or UndefinedMessage
+        return msg_type(msg_header, avps)
+
+    if cmd_type is None or not issubclass(cmd_type, DefinedMessage):
+        raise ValueError(
+            f"command {msg_header.command_code} has no attributes")
+    msg_type = all_commands.message_type(msg_header)
+    msg = msg_type(msg_header)
+    # new messages may alter their header and set default attribute values
+    # in `__post_init__`; neither is wanted here
+    msg.header = header()
+    attrs = data["attributes"]
+    for gen_def in msg.avp_def:
+        if (gen_def.attr_name not in attrs and
+                getattr(msg, gen_def.attr_name, None).__class__ is not list):
+            setattr(msg, gen_def.attr_name, None)
+    _attrs_from_dict(msg, attrs)
+    msg.avps = avps
+    return msg
+
+
+def to_json(msg: Message) -> str:
+    """Convert a message into a compact JSON string.
+
+    The JSON document is the dictionary produced by
+    [Message.to_dict][diameter.message.Message.to_dict], without any
+    whitespace.
+    """
+    return _ENCODER.encode(message_to_dict(msg))
+
+
+def dump_json(messages: Iterable[Message], fp: IO[str]):
+    """Write messages into a file as JSON, one message per line.
+
+    Each message is converted and written as soon as it is received from the
+    iterable, so that any number of messages can be written without holding
+    more than one of them at a time.
+
+        >>> with open("capture.jsonl", "w") as f:
+        >>>     dump_json((msg for _, _, msg in read_pcap("capture.pcap")), f)
+
+    Args:
+        messages: Any iterable of messages
+        fp: A file-like object open for writing text
+    """
+    for msg in messages:
+        fp.write(to_json(msg))
+        fp.write("\n")
+
+
+def load_json(fp: IO[str]) -> Iterator[Message]:
+    """Read messages written by `dump_json` from a file, one at a time.
+
+        >>> with open("capture.jsonl") as f:
+        >>>     for msg in load_json(f):
+        >>>         node.send(msg.as_bytes())
+
+    Args:
+        fp: A file-like object open for reading text
+
+    Returns:
+        An iterator of messages. Empty lines are skipped.
+    """
+    for line in fp:
+        if line.strip():
+            yield message_from_dict(json.loads(line))
+
+
+from .commands import all_commands
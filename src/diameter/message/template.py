@@ -0,0 +1,287 @@
+"""
+Pre-encoded message templates, for producing large amounts of similar
+messages.
+
+A template is a message that has been encoded once. Selected AVPs in it are
+marked as slots, and new messages are produced by replacing only the slot
+AVPs in the encoded bytes, and fixing the lengths of the message and of every
+grouped AVP around them.
+"""
+from __future__ import annotations
+
+import struct
+
+from typing import Any, Callable, NamedTuple
+
+from ._base import Message, MessageHeader
+from .avp import Avp, AvpEncodeError, AvpPath
+from .avp.avp import get_avp_dictionary_entry
+from .avp.generator import get_value_encoder
+from .packer import _PADDING, _UINT, CONVERSION_ERRORS, ConversionError
+
+
+_AVP_HEADER = struct.Struct(">2L")
+
+
+class _Slot(NamedTuple):
+    name: str
+    offset: int
+    """Position of the AVP within the template bytes."""
+    length: int
+    """Length of the AVP in the template bytes, including padding."""
+    code: bytes
+    """Pre-packed AVP code."""
+    flags: int
+    """AVP flags, shifted to their place in the AVP header length field."""
+    vendor: bytes
+    """Pre-packed AVP vendor ID, or an empty byte string if no vendor."""
+    header_length: int
+    encode_value: Callable[[Any], bytes]
+
+
+class _LengthField(NamedTuple):
+    position: int
+    """Position of the length field within the template bytes."""
+    high_byte: int
+    """Either the message version or the AVP flags, shifted in place."""
+    length: int
+    """Length value in the template bytes."""
+    slots: tuple[int, ...]
+    """Indexes of the slots that are contained within the length."""
+
+
+def _find_avp(msg_data: bytes, start: int, end: int, code: int,
+              vendor_id: int) -> tuple[int, int, int] | None:
+    # Returns the position, unpadded length and header length of the first
+    # AVP with a matching code and vendor, between the start and end positions
+    position = start
+    while position < end:
+        avp_code, flags_len = _AVP_HEADER.unpack_from(msg_data, position)
+        avp_length = flags_len & 0x00ffffff
+        if avp_length < 8:
+            raise ValueError(
+                f"AVP at position {position} has an invalid length "
+                f"{avp_length}")
+        header_length = 8
+        avp_vendor_id = 0
+        if (flags_len >> 24) & Avp.avp_flag_vendor:
+            header_length = 12
+            avp_vendor_id = _UINT.unpack_from(msg_data, position + 8)[0]
+        if avp_code == code and avp_vendor_id == vendor_id:
+            return position, avp_length, header_length
+        position += (avp_length + 3) & ~3
+    return None
+
+
+class MessageTemplate:
+    """A message that has been encoded once, with replaceable AVP values.
+
+    The template is created from any message, e.g. a fully populated
+    `CreditControlRequest`, or an answer produced by
+    [Application.generate_answer][diameter.node.application.Application.generate_answer].
+    The AVPs that change between messages are named as slots, each slot
+    pointing to an AVP that must already be present in the message:
+
+        >>> ccr = CreditControlRequest()
+        >>> ccr.session_id = "node.example.com;1;1"
+        >>> ccr.cc_request_number = 0
+        >>> ...
+        >>> template = MessageTemplate(
+        >>>     ccr,
+        >>>     session_id=(AVP_SESSION_ID, 0),
+        >>>     request_number=(AVP_CC_REQUEST_NUMBER, 0),
+        >>>     used_octets=((AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        >>>                  (AVP_USED_SERVICE_UNIT, 0),
+        >>>                  (AVP_CC_TOTAL_OCTETS, 0)))
+        >>> msg_bytes = template.render(
+        >>>     session_id="node.example.com;1;2", request_number=1,
+        >>>     used_octets=8192, hop_by_hop_identifier=2,
+        >>>     end_to_end_identifier=2)
+
+    A slot is either a single AVP code and vendor ID pair, for top-level
+    AVPs, or a chain of pairs, an
+    [AvpPath][diameter.message.avp.path.AvpPath] or a string of AVP names,
+    in the same way as with
+    [Message.find_avps][diameter.message.Message.find_avps]. The chain is
+    followed to the first matching AVP at each level.
+
+    Rendering produces the same bytes as setting the same values in the
+    original message and encoding it with `Message.as_bytes`, without going
+    through any of the AVP encoding, except for the slot values themselves.
+    The flags of the slot AVPs are kept as they are in the template.
+    """
+
+    def __init__(self, message: Message | bytes,
+                 **slots: tuple[int, int] | tuple[tuple[int, int], ...] | str):
+        """Create a new template.
+
+        Args:
+            message: The message to use as a template, either as an instance
+                or as already encoded bytes
+            slots: The AVPs that can be replaced when rendering, as keyword
+                arguments of slot names and AVP code and vendor ID pairs,
+                chains of pairs or AVP paths
+
+        Raises:
+            ValueError: If a slot AVP is not present in the message, if a
+                slot is within another slot, if a slot AVP name is not known,
+                or if the message bytes cannot be parsed.
+        """
+        if isinstance(message, Message):
+            message = message.as_bytes()
+        self._template: bytes = bytes(message)
+        self.header: MessageHeader = MessageHeader.from_bytes(self._template)
+        """Message header, as it is in the template."""
+
+        found: list[tuple[_Slot, list[tuple[int, int]]]] = []
+        for name, path in slots.items():
+            if isinstance(path, str):
+                path = AvpPath(path)
+            elif isinstance(path[0], int):
+                path = (path, )
+            found.append(self._locate_slot(name, path))
+        found.sort(key=lambda s: s[0].offset)
+
+        for (slot, _), (next_slot, _) in zip(found, found[1:]):
+            if next_slot.offset < slot.offset + slot.length:
+                raise ValueError(
+                    f"slot `{next_slot.name}` is within slot `{slot.name}`")
+
+        self._slots: tuple[_Slot, ...] = tuple(s for s, _ in found)
+        self._slot_index: dict[str, int] = {
+            s.name: i for i, s in enumerate(self._slots)}
+
+        # static bytes between each slot
+        self._chunks: list[bytes] = []
+        position = 0
+        for slot in self._slots:
+            self._chunks.append(self._template[position:slot.offset])
+            position = slot.offset + slot.length
+        self._chunks.append(self._template[position:])
+
+        # every length field that has to grow or shrink along with a slot,
+        # i.e. the message header and every grouped AVP that contains a slot
+        enclosing: dict[int, tuple[int, int, list[int]]] = {
+            0: (self.header.version << 24, self.header.length, [])}
+        for index, (_, groups) in enumerate(found):
+            enclosing[0][2].append(index)
+            for position, flags_len in groups:
+                if position not in enclosing:
+                    enclosing[position] = (
+                        flags_len & 0xff000000, flags_len & 0x00ffffff, [])
+                enclosing[position][2].append(index)
+        self._length_fields: tuple[_LengthField, ...] = tuple(
+            _LengthField(position, high_byte, length, tuple(indexes))
+            for position, (high_byte, length, indexes) in enclosing.items())
+
+    def _locate_slot(self, name: str, path: tuple[tuple[int, int], ...]
+                     ) -> tuple[_Slot, list[tuple[int, int]]]:
+        msg_data = self._template
+        start = self.header.length_header
+        end = min(self.header.length, len(msg_data))
+        groups = []
+        try:
+            for level, (code, vendor_id) in enumerate(path):
+                match = _find_avp(msg_data, start, end, code, vendor_id)
+                if match is None:
+                    raise ValueError(
+                        f"slot `{name}` AVP {code}:{vendor_id} is not present "
+                        f"in the template message")
+                position, avp_length, header_length = match
+                if level < len(path) - 1:
+                    # the length field of the grouped AVP header
+                    groups.append((position + 4, _UINT.unpack_from(
+                        msg_data, position + 4)[0]))
+                    start = position + header_length
+                    end = position + avp_length
+        except CONVERSION_ERRORS as e:
+            raise ValueError(
+                f"slot `{name}` cannot be located: {e.args[0]}") from None
+
+        code, vendor_id = path[-1]
+        entry = get_avp_dictionary_entry(code, vendor_id)
+        avp_type = entry["type"] if entry is not None else Avp
+        flags = msg_data[position + 4] << 24
+
+        slot = _Slot(
+            name, position, (avp_length + 3) & ~3,
+            msg_data[position:position + 4], flags,
+            msg_data[position + 8:position + header_length], header_length,
+            get_value_encoder(avp_type, code, vendor_id))
+        return slot, groups
+
+    @property
+    def slot_names(self) -> list[str]:
+        """Names of the slots in the template, in the order of their
+        appearance in the message."""
+        return [s.name for s in self._slots]
+
+    def render(self, hop_by_hop_identifier: int = None,
+               end_to_end_identifier: int = None, **values: Any) -> bytes:
+        """Produce a new encoded message from the template.
+
+        Args:
+            hop_by_hop_identifier: A new hop-by-hop identifier, if not set,
+                the identifier in the template is kept
+            end_to_end_identifier: A new end-to-end identifier, if not set,
+                the identifier in the template is kept
+            values: New values for the slots, as keyword arguments of slot
+                names and python values. Slots that are not given a value
+                keep their value from the template
+
+        Returns:
+            An entire encoded message.
+
+        Raises:
+            ValueError: If a slot name is not known
+            AvpEncodeError: If a slot value cannot be encoded
+        """
+        slots = self._slots
+        avps: list[bytes | None] = [None] * len(slots)
+        for name, value in values.items():
+            index = self._slot_index.get(name)
+            if index is None:
+                raise ValueError(f"template has no slot named `{name}`")
+            slot = slots[index]
+            try:
+                payload = slot.encode_value(value)
+            except Exception as e:
+                raise AvpEncodeError(
+                    f"Failed to encode value for slot `{name}`: value "
+                    f"{value} is not valid: {e}") from None
+            avps[index] = b"".join((
+                slot.code,
+                _UINT.pack(slot.flags | (slot.header_length + len(payload))),
+                slot.vendor, payload, _PADDING[len(payload) & 3]))
+
+        chunks = self._chunks
+        parts = [chunks[0]]
+        deltas = []
+        for index, avp in enumerate(avps):
+            slot = slots[index]
+            if avp is None:
+                parts.append(self._template[
+                             slot.offset:slot.offset + slot.length])
+                deltas.append(0)
+            else:
+                parts.append(avp)
+                deltas.append(len(avp) - slot.length)
+            parts.append(chunks[index + 1])
+        msg = bytearray(b"".join(parts))
+
+        try:
+            if any(deltas):
+                for field in self._length_fields:
+                    shift = sum(delta for delta, slot in zip(deltas, slots)
+                                if slot.offset < field.position)
+                    grow = sum(deltas[i] for i in field.slots)
+                    _UINT.pack_into(msg, field.position + shift,
+                                    field.high_byte | (field.length + grow))
+            if hop_by_hop_identifier is not None:
+                _UINT.pack_into(msg, 12, hop_by_hop_identifier)
+            if end_to_end_identifier is not None:
+                _UINT.pack_into(msg, 16, end_to_end_identifier)
+        except CONVERSION_ERRORS as e:
+            raise ConversionError(e.args[0]) from None
+
+        return bytes(msg)
@@ -1,3 +1,5 @@
 from ._helpers import SequenceGenerator, SessionGenerator, DiameterUri
 from ._helpers import parse_diameter_uri, validate_message_avps
-from .node import Node, NodeError, NotRoutable, NodeStats, select_least_used_peer
+from ._helpers import AvpViolation, find_avp_violation
+from .node import AsyncNode, Node, NodeError, NotRoutable, NodeStats
+from .node import select_least_used_peer
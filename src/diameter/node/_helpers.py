@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import logging
 import random
+import struct
 import threading
 import time
 
-from typing import NamedTuple, TypeVar
+from collections import deque
+from typing import Callable, NamedTuple, TypeVar
 
-from ..message import Avp, Message
+from ..message import Avp, Message, constants
+from ..message.avp import AvpDecodeError
+from ..message.avp.generator import AvpGenerator, AvpGenType
+from ..message.commands._attributes import get_decode_plan
+from ..message.packer import CONVERSION_ERRORS, RawUnpacker
 
 
 _AnyMessageType = TypeVar("_AnyMessageType", bound=Message)
 
+_AVP_HEADER = struct.Struct(">2L")
+_AVP_VENDOR_ID = struct.Struct(">L")
+
 
 class DiameterUri(NamedTuple):
     scheme: str
@@ -62,6 +71,266 @@ def parse_diameter_uri(uri: str) -> DiameterUri:
     return DiameterUri(scheme, fqdn, port, params, scheme == "aaas")
 
 
+class AvpRule(NamedTuple):
+    """A single compiled occurrence constraint of an `AvpValidator`."""
+    attr_name: str
+    """The class attribute name that the AVP maps to."""
+    avp_code: int
+    """AVP code of the constrained AVP."""
+    vendor_id: int
+    """Vendor ID of the constrained AVP, zero if none."""
+    min_occurs: int
+    """The least number of times that the AVP must be present."""
+    max_occurs: int | None
+    """The most number of times that the AVP may be present, None if there is
+    no upper bound."""
+    grouped: AvpValidator | None
+    """For grouped AVPs, the validator of the sub-AVPs."""
+
+
+class AvpViolation(NamedTuple):
+    """The outcome of a failed AVP validation."""
+    result_code: int
+    """A `DIAMETER_*` result code to send back in the answer."""
+    error_message: str
+    """A human-readable error message to send back in the answer."""
+    failed_avp: list[Avp]
+    """AVPs to send back in the Failed-AVP AVP of the answer."""
+
+
+class AvpValidator:
+    """The ABNF of a message or a grouped AVP, compiled from its `avp_def`.
+
+    Every AVP in `avp_def` that is marked as required must be present at
+    least once, and every AVP whose attribute does not hold a list may be
+    present at most once. Session-Id, if part of the ABNF, must be the first
+    AVP. AVPs that are not in the ABNF are not constrained.
+
+    The validator reads only the AVP codes and vendor IDs of a list of AVPs,
+    and the sub-AVP headers of grouped AVPs straight from their payload; no
+    AVP value is decoded. Use `get_avp_validator` to retrieve the validator
+    of a class, as they are compiled only once per class.
+    """
+    __slots__ = ("avp_def", "rules", "required")
+
+    def __init__(self, avp_def: AvpGenType):
+        self.avp_def: AvpGenType = avp_def
+        self.rules: dict[int, AvpRule] = {}
+        """Rules indexed by `vendor_id << 32 | avp_code`."""
+        self.required: tuple[AvpRule, ...] = ()
+
+    def check(self, avps: list[Avp]) -> AvpViolation | None:
+        """Validate a list of AVPs, in the order they were received.
+
+        Returns:
+            The first violation found, or None if the AVPs are valid. AVPs
+                that occur too many times are reported before missing AVPs.
+
+        """
+        rules = self.rules
+        counts: dict[int, int] = {}
+
+        for position, avp in enumerate(avps):
+            key = avp.vendor_id << 32 | avp.code
+            rule = rules.get(key)
+            if rule is None:
+                continue
+            count = counts[key] = counts.get(key, 0) + 1
+            if rule.max_occurs is not None and count > rule.max_occurs:
+                return _too_many(avp)
+            if position and key == constants.AVP_SESSION_ID:
+                # the AVP that should have been at the first position is
+                # considered missing
+                return AvpViolation(
+                    constants.E_RESULT_CODE_DIAMETER_MISSING_AVP,
+                    "Session-Id is not the first AVP",
+                    [Avp.new(constants.AVP_SESSION_ID)])
+            if rule.grouped is not None:
+                violation = rule.grouped.check_grouped(avp)
+                if violation is not None:
+                    return violation
+
+        return self._missing(counts)
+
+    def check_grouped(self, avp: Avp) -> AvpViolation | None:
+        """Validate the sub-AVPs of a grouped AVP.
+
+        Unless the grouped AVP value has already been decoded, the sub-AVPs
+        are not decoded at all, only their headers are read from the AVP
+        payload.
+
+        Returns:
+            None if the sub-AVPs are valid, otherwise the first violation
+                found. The Failed-AVP contents of the violation are the
+                grouped AVP, which in turn contains only the offending AVP,
+                as suggested by rfc6733 7.5.
+
+        """
+        if getattr(avp, "_avps", None) is not None:
+            violation = self.check(avp.value)
+        else:
+            payload = avp.payload
+            try:
+                violation = self._check_payload(payload, 0, len(payload))
+            except (struct.error, ValueError, AvpDecodeError):
+                return AvpViolation(
+                    constants.E_RESULT_CODE_DIAMETER_INVALID_AVP_VALUE,
+                    f"AVP {avp.code}, vendor {avp.vendor_id} does not "
+                    f"contain valid sub-AVPs", [avp])
+        if violation is None:
+            return None
+        return violation._replace(failed_avp=[
+            Avp.new(avp.code, avp.vendor_id, value=violation.failed_avp)])
+
+    def _check_payload(self, payload: bytes, position: int, end: int
+                       ) -> AvpViolation | None:
+        rules = self.rules
+        counts: dict[int, int] = {}
+
+        while position < end:
+            code, flags_len = _AVP_HEADER.unpack_from(payload, position)
+            length = flags_len & 0x00ffffff
+            header_length = 8
+            key = code
+            if flags_len & _AVP_FLAG_VENDOR:
+                key |= _AVP_VENDOR_ID.unpack_from(payload, position + 8)[0] << 32
+                header_length = 12
+            if length < header_length:
+                raise ValueError(f"invalid AVP length {length}")
+            start = position
+            position += (length + 3) & ~3
+
+            rule = rules.get(key)
+            if rule is None:
+                continue
+            count = counts[key] = counts.get(key, 0) + 1
+            if rule.max_occurs is not None and count > rule.max_occurs:
+                return _too_many(_avp_at(payload, start))
+            if rule.grouped is not None:
+                violation = rule.grouped._check_payload(
+                    payload, start + header_length, start + length)
+                if violation is not None:
+                    return violation._replace(failed_avp=[
+                        Avp.new(rule.avp_code, rule.vendor_id,
+                                value=violation.failed_avp)])
+
+        return self._missing(counts)
+
+    def _missing(self, counts: dict[int, int]) -> AvpViolation | None:
+        missing = [Avp.new(rule.avp_code, rule.vendor_id)
+                   for rule in self.required
+                   if rule.vendor_id << 32 | rule.avp_code not in counts]
+        if missing:
+            return AvpViolation(constants.E_RESULT_CODE_DIAMETER_MISSING_AVP,
+                                "Mandatory AVPs missing", missing)
+        return None
+
+
+def _too_many(avp: Avp) -> AvpViolation:
+    return AvpViolation(
+        constants.E_RESULT_CODE_DIAMETER_AVP_OCCURS_TOO_MANY_TIMES,
+        f"AVP {avp.code}, vendor {avp.vendor_id} occurs too many times",
+        [avp])
+
+
+def _avp_at(payload: bytes, position: int) -> Avp:
+    unpacker = RawUnpacker(payload)
+    unpacker.set_position(position)
+    try:
+        return Avp.from_unpacker(unpacker)
+    except CONVERSION_ERRORS as e:
+        raise AvpDecodeError(str(e)) from None
+
+
+_AVP_FLAG_VENDOR = Avp.avp_flag_vendor << 24
+_validators: dict[type, AvpValidator] = {}
+
+
+def get_avp_validator(obj: AvpGenerator) -> AvpValidator:
+    """Retrieve the AVP validator for an object's class.
+
+    The validator is compiled once per class, on first use, together with
+    the validators of every grouped AVP that it contains, and recompiled
+    only if the `avp_def` of the object is no longer the one that the
+    validator was compiled from.
+    """
+    validator = _validators.get(obj.__class__)
+    if validator is None or validator.avp_def is not obj.avp_def:
+        compiled: dict[type, AvpValidator] = {}
+        validator = _compile_avp_validator(obj, compiled)
+        # published only once complete, as messages may be validated in
+        # several threads at once
+        _validators.update(compiled)
+    return validator
+
+
+def _compile_avp_validator(obj: AvpGenerator,
+                           compiled: dict[type, AvpValidator]
+                           ) -> AvpValidator:
+    validator = AvpValidator(obj.avp_def)
+    # registered before the rules are compiled, as grouped AVPs may contain
+    # themselves, directly or indirectly
+    compiled[obj.__class__] = validator
+
+    steps = get_decode_plan(obj).steps
+    rules = {}
+    for gen_def in obj.avp_def:
+        grouped = None
+        if gen_def.type_class is not None:
+            grouped = (compiled.get(gen_def.type_class) or
+                       _validators.get(gen_def.type_class))
+            if grouped is None:
+                grouped = _compile_avp_validator(
+                    gen_def.type_class(), compiled)
+        step = steps[(gen_def.avp_code, gen_def.vendor_id)]
+        rules[gen_def.vendor_id << 32 | gen_def.avp_code] = AvpRule(
+            gen_def.attr_name, gen_def.avp_code, gen_def.vendor_id,
+            1 if gen_def.is_required else 0,
+            None if step.is_list else 1,
+            grouped)
+
+    validator.rules = rules
+    validator.required = tuple(r for r in rules.values() if r.min_occurs)
+    return validator
+
+
+def _received_avps(msg: _AnyMessageType) -> list[Avp]:
+    # messages received from the network still have their AVPs in the
+    # original order, without any of them decoded
+    avps = msg.__dict__.get("_received_avps")
+    if avps is None:
+        avps = msg.avps
+    return avps
+
+
+def find_avp_violation(msg: _AnyMessageType) -> AvpViolation | None:
+    """Validate the AVPs of a message against the ABNF of its command.
+
+    Checks that every mandatory AVP is present, that no AVP occurs more
+    times than permitted, that Session-Id is the first AVP and that the same
+    holds for the sub-AVPs of every grouped AVP. For messages received from
+    the network, only the AVP headers are read, before any AVP value is
+    decoded.
+
+    The validation works only for the commands that have a python
+    implementation, containing an `avp_def` attribute. This is true for every
+    `message.commands.*` subclass. For any other message type, returns None.
+
+    Returns:
+        None if the message is valid, otherwise the first violation found,
+            with the result code, error message and Failed-AVP contents to
+            answer the message with.
+
+    """
+    if not hasattr(msg, "avp_def"):
+        return None
+    violation = get_avp_validator(msg).check(_received_avps(msg))
+    if violation is not None:
+        logging.getLogger("diameter.node").debug(
+            f"message failed AVP validation: {violation.error_message}")
+    return violation
+
+
 def validate_message_avps(msg: _AnyMessageType) -> list[Avp]:
     """Validate that a message has all the mandatory AVPs set.
 
@@ -70,26 +339,21 @@ def validate_message_avps(msg: _AnyMessageType) -> list[Avp]:
     AVPs. This is true for every `message.commands.*` subclass. For any other
     message type will return an empty list.
 
+    See [find_avp_violation][diameter.node.find_avp_violation] for a
+    validation that also checks the number of occurrences of each AVP.
+
     Returns:
         A list of `Avp` instances with the AVP code and vendor ID set, for
             every AVP that is missing in the message
 
     """
-    failed_avp = []
-
     if not hasattr(msg, "avp_def"):
-        return failed_avp
+        return []
 
-    logger = logging.getLogger("diameter.node")
-
-    for gen_def in msg.avp_def:
-        if gen_def.is_required and getattr(msg, gen_def.attr_name) is None:
-            logger.debug(
-                f"mandatory AVP {gen_def.avp_code}, vendor {gen_def.vendor_id} "
-                f"is not set")
-            failed_avp.append(Avp.new(gen_def.avp_code, gen_def.vendor_id))
-
-    return failed_avp
+    present = {(avp.code, avp.vendor_id) for avp in _received_avps(msg)}
+    return [Avp.new(rule.avp_code, rule.vendor_id)
+            for rule in get_avp_validator(msg).required
+            if (rule.avp_code, rule.vendor_id) not in present]
 
 
 class SecondSlotCounter:
@@ -326,3 +590,87 @@ class StoppableThread(threading.Thread):
     def is_stopped(self) -> bool:
         """Check if the thread is stopped."""
         return self._stop_event.is_set()
+
+
+class WorkerPool:
+    """A fixed set of threads that run work for any amount of connections.
+
+    Work is submitted as a callable and its arguments. Work submitted for
+    the same callable, e.g. the same bound method of one connection, runs
+    one at a time, in the order that it was submitted; work for different
+    callables runs in parallel, in as many threads as the pool has.
+    """
+    def __init__(self, size: int):
+        """Create a new worker pool.
+
+        Args:
+            size: Amount of worker threads to start
+
+        """
+        self.size: int = size
+        self._logger = logging.getLogger("diameter.node")
+        self._cond = threading.Condition()
+        # callables with queued work; a callable is also present while its
+        # work is being run, so that it is never picked by two workers
+        self._pending: dict[Callable, deque[tuple]] = {}
+        self._ready: deque[Callable] = deque()
+        self._threads: list[StoppableThread] = []
+
+    def _work(self, _thread: StoppableThread):
+        while True:
+            with self._cond:
+                while not self._ready and not _thread.is_stopped:
+                    self._cond.wait()
+                if _thread.is_stopped:
+                    return
+                func = self._ready.popleft()
+                work = self._pending[func]
+                self._pending[func] = deque()
+
+            for args in work:
+                try:
+                    func(*args)
+                except Exception as e:
+                    self._logger.error(f"worker failed to run {func}: {e}",
+                                       exc_info=True)
+
+            with self._cond:
+                if self._pending[func]:
+                    # more was submitted meanwhile; queue up behind others
+                    self._ready.append(func)
+                    self._cond.notify()
+                else:
+                    del self._pending[func]
+
+    def start(self):
+        """Start the worker threads."""
+        for _ in range(self.size):
+            thread = StoppableThread(target=self._work)
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop the worker threads.
+
+        Work that has not begun yet is discarded.
+
+        Args:
+            timeout: Time to wait for each thread to finish its current work
+
+        """
+        with self._cond:
+            for thread in self._threads:
+                thread.stop()
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def submit(self, func: Callable, *args):
+        """Run a callable with the given arguments in a worker thread."""
+        with self._cond:
+            if func in self._pending:
+                self._pending[func].append(args)
+                return
+            self._pending[func] = deque([args])
+            self._ready.append(func)
+            self._cond.notify()
@@ -11,6 +11,7 @@ which will cover the most scenarios without requiring any unnecessary setup.
 """
 from __future__ import annotations
 
+import asyncio
 import queue
 import logging
 import threading
@@ -444,6 +445,175 @@ class SimpleThreadingApplication(ThreadingApplication):
         return None
 
 
+class AsyncApplication(Application):
+    """A diameter application for an `AsyncNode`, that starts an asyncio task
+    for each request.
+
+    The asyncio counterpart of the `ThreadingApplication`. The implementing
+    party should override the `handle_request` coroutine and do the message
+    processing work within, returning a new answer. Requests are sent with
+    `await send_request()`, which suspends only the calling task until an
+    answer has been received.
+
+    ```
+    from diameter.message import Message
+    from diameter.message.constants import *
+    from diameter.node.application import AsyncApplication
+
+    class MyApplication(AsyncApplication):
+        async def handle_request(self, message: Message) -> Message:
+            return self.generate_answer(
+                message, result_code=E_RESULT_CODE_DIAMETER_SUCCESS)
+    ```
+
+    The application can only be added to an
+    [`AsyncNode`][diameter.node.AsyncNode], its methods must be called from
+    within the node's event loop.
+    """
+    def __init__(self, application_id: int = None,
+                 is_acct_application: bool = False,
+                 is_auth_application: bool = False,
+                 max_tasks: int = 0):
+        """Create a new asyncio diameter application.
+
+        Args:
+            application_id: Authentication application ID
+            is_acct_application: Flag the application as an accounting app
+            is_auth_application: Flag the application as an authorisation app
+            max_tasks: Maximum amount of requests to process simultaneously.
+                When the maximum is reached, any further requests are
+                answered immediately with DIAMETER_TOO_BUSY. If set to 0, the
+                amount of requests processed simultaneously is unlimited.
+
+        """
+        super().__init__(application_id, is_acct_application,
+                         is_auth_application)
+        self.is_ready: asyncio.Event = asyncio.Event()
+        self._answer_waiting: dict[int, asyncio.Future] = {}
+        self._max_tasks: int = max_tasks
+        self._request_tasks: set[asyncio.Task] = set()
+
+    async def _process_recv_msg(self, message: Message):
+        try:
+            answer = await self.handle_request(message)
+        except Exception as e:
+            logger.warning(f"{self} message handling failed: {repr(e)}")
+            answer = self.generate_answer(
+                message,
+                result_code=constants.E_RESULT_CODE_DIAMETER_UNABLE_TO_COMPLY)
+        if answer is None:
+            return
+        try:
+            self.send_answer(answer)
+        except NotRoutable as e:
+            logger.warning(f"{self} failed to send an answer: {e}")
+
+    async def handle_request(self, message: Message) -> Message | None:
+        """Called by diameter node every time a request message is received.
+
+        Like with the `ThreadingApplication`, the coroutine is expected to
+        return an answer, either `None` or a valid diameter Message, which is
+        sent automatically back towards the network. Any exceptions raised
+        result in a DIAMETER_UNABLE_TO_COMPLY result being returned to the
+        network.
+        """
+        raise NotImplementedError("handle_request must be overridden")
+
+    def receive_answer(self, message: Message):
+        waiting = self._answer_waiting.get(message.header.hop_by_hop_identifier)
+        if waiting is not None and not waiting.done():
+            waiting.set_result(message)
+        else:
+            logger.debug(
+                f"{self} received an answer message "
+                f"{hex(message.header.hop_by_hop_identifier)} with nobody "
+                f"expecting it")
+            self.handle_answer(message)
+
+    def receive_request(self, message: Message):
+        if self._max_tasks and len(self._request_tasks) >= self._max_tasks:
+            answer = self.generate_answer(
+                message,
+                result_code=constants.E_RESULT_CODE_DIAMETER_TOO_BUSY,
+                error_message="Insufficient resources to handle the request")
+            self.send_answer(answer)
+            return
+
+        task = asyncio.create_task(self._process_recv_msg(message))
+        self._request_tasks.add(task)
+        task.add_done_callback(self._request_tasks.discard)
+
+    async def send_request(self, message: Message, timeout: int = 30) -> Message:
+        """Send a request message.
+
+        Works as [`Application.send_request`][diameter.node.application.Application.send_request],
+        except that only the awaiting task is suspended while waiting for
+        the answer.
+
+        Args:
+            message: A diameter message to send
+            timeout: A timeout in seconds to wait for an answer
+
+        Returns:
+            A diameter answer message.
+
+        Raises:
+            TimeoutError: If no answer was received within the timeout
+            EmptyAnswer: If the application was stopped before an answer was
+                received
+
+        """
+        if not message.header.end_to_end_identifier:
+            message.header.end_to_end_identifier = self.node.end_to_end_seq.next_sequence()
+        if not message.header.application_id:
+            message.header.application_id = self.application_id
+        peer, _ = self.node.route_request(self, message)
+
+        hop_by_hop_identifier = message.header.hop_by_hop_identifier
+        waiting = asyncio.get_running_loop().create_future()
+        self._answer_waiting[hop_by_hop_identifier] = waiting
+        self.node.send_message(peer, message)
+
+        try:
+            async with asyncio.timeout(timeout):
+                answer = await waiting
+        except TimeoutError:
+            raise TimeoutError("Timed out waiting for answer") from None
+        finally:
+            del self._answer_waiting[hop_by_hop_identifier]
+
+        if answer is None:
+            raise EmptyAnswer("Response is None")
+        return answer
+
+    def stop(self):
+        for waiting in self._answer_waiting.values():
+            if not waiting.done():
+                waiting.set_result(None)
+        logger.info(f"{self} application stopped")
+
+    async def wait_for_ready(self, timeout: int = 30):
+        """Wait for application connectivity to become ready.
+
+        Works as [`Application.wait_for_ready`][diameter.node.application.Application.wait_for_ready],
+        suspending only the awaiting task.
+
+        Args:
+            timeout: Amount of time to wait, in seconds
+
+        Raises:
+            ApplicationError: If no peer becomes available before timeout
+
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self.is_ready.wait()
+        except TimeoutError:
+            raise ApplicationError(
+                "No connection available within timeout") from None
+        logger.info(f"{self} at least one peer has become available")
+
+
 class ApplicationError(Exception):
     """Base error class for all Application-raised errors."""
     pass
@@ -465,4 +635,4 @@ class WaitingMessage:
         self.answer: Message | None = None
 
 
-from .node import Node
+from .node import Node, NotRoutable
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
 import errno
 import json
 import logging
 import math
 import os
-import select
+import selectors
 import socket
 import struct
 import threading
@@ -21,16 +22,24 @@ from collections import deque
 from copy import deepcopy
 from typing import TypeVar, Callable
 
-from ..message import constants
-from ..message.commands import *
+from ..message import Message, constants
+from ..message.commands import (CapabilitiesExchangeAnswer,
+                                CapabilitiesExchangeRequest,
+                                DeviceWatchdogAnswer, DeviceWatchdogRequest,
+                                DisconnectPeerAnswer, DisconnectPeerRequest)
 from ..message.avp.grouped import FailedAvp
-from ._helpers import parse_diameter_uri, validate_message_avps
+from ._helpers import find_avp_violation, parse_diameter_uri
 from ._helpers import SequenceGenerator, SessionGenerator, StoppableThread
+from ._helpers import WorkerPool
 from .peer import *
 
 
 SOFT_SOCKET_FAILURES = (errno.EAGAIN, errno.EWOULDBLOCK, errno.ENOBUFS,
                         errno.ENOSR, errno.EINTR)
+# Most reads done for one socket in one wakeup, before moving on to others
+_MAX_READS_PER_EVENT = 16
+# Most buffers given to a single `sendmsg` call, the usual IOV_MAX
+_MAX_SEND_BUFFERS = 1024
 
 state_names = {
     PEER_CONNECTING: "CONNECTING", PEER_CONNECTED: "CONNECTED",
@@ -323,8 +332,19 @@ class Node:
         Enabling this may have a slight performance impact, as the main
         thread will block while the statistics are being gathered."""
         self.validate_received_request_avps: bool = True
-        """When enabled, validates presence of all required AVPs in all
-        received request messages."""
+        """When enabled, validates the AVPs of all received request messages
+        against the ABNF of their command; presence of all required AVPs,
+        the number of times each AVP occurs and the position of Session-Id.
+        The validation reads only the AVP headers, before any AVP value is
+        decoded."""
+        self.worker_threads: int = 4
+        """Amount of worker threads that decode received messages and encode
+        outgoing messages, shared by all peer connections; the amount of
+        threads does not grow with the amount of connected peers. Messages of
+        one connection are still decoded and encoded in order. If set to
+        zero, messages are decoded in the node's own connection thread and
+        encoded in whichever thread sends them. Must be set before the node
+        is started."""
 
         rp, wp = os.pipe()
         self.interrupt_read = rp
@@ -354,6 +374,9 @@ class Node:
 
         self.tcp_sockets: list[socket.socket] = []
         self.sctp_sockets: list[sctp.sctpsocket] = []
+        self._selector: selectors.BaseSelector | None = None
+        self._selector_lock = threading.Lock()
+        self._worker_pool: WorkerPool | None = None
         self._connection_thread: StoppableThread = StoppableThread(
             target=self._handle_connections)
         self._stat_collect_thread: StoppableThread = StoppableThread(
@@ -369,6 +392,21 @@ class Node:
         return set(a.application_id for a in self.applications
                    if a.is_acct_application)
 
+    def _accept_from_socket(self, listen_socket: socket.socket | sctp.sctpsocket,
+                            proto: int):
+        try:
+            clientsocket, (ip, port) = listen_socket.accept()
+            clientsocket.setblocking(False)
+        except Exception:
+            return
+
+        conn = PeerConnection(
+            ip, port, PEER_RECV, interrupt_fileno=self.interrupt_write,
+            worker_pool=self._worker_pool)
+        conn.state = PEER_CONNECTED
+
+        self._add_peer_connection(conn, clientsocket, proto)
+
     def _add_peer_connection(self, conn: PeerConnection,
                              peer_socket: socket.socket | sctp.sctpsocket,
                              proto: int) -> str | None:
@@ -410,6 +448,9 @@ class Node:
             self.connections[conn.ident] = conn
             self.peer_sockets[conn.ident] = peer_socket
             self.socket_peers[conn.socket_fileno] = conn
+            if conn.state != PEER_CONNECTING:
+                # outgoing sockets are observed once they have begun to connect
+                self._watch_socket(peer_socket, conn)
 
         peer = self._find_connection_peer(conn)
         if peer and not peer.connection:
@@ -531,18 +572,21 @@ class Node:
             peer_socket.setblocking(False)
 
             conn = PeerConnection(peer.ip_addresses, peer.port,
-                                  PEER_SEND, self.interrupt_write)
+                                  PEER_SEND, self.interrupt_write,
+                                  self._worker_pool)
             conn.state = PEER_CONNECTING
             conn.node_name = peer.node_name
             conn.origin_host = self.origin_host
-            self._add_peer_connection(conn, peer_socket, PEER_TRANSPORT_TCP)
+            if not self._add_peer_connection(conn, peer_socket,
+                                             PEER_TRANSPORT_TCP):
+                return
 
             try:
                 peer_socket.connect((peer.ip_addresses[0],
                                      peer.port))
             except socket.error as e:
                 if e.args[0] != errno.EINPROGRESS:
-                    self.remove_peer_connection(
+                    self.close_connection_socket(
                         conn, DISCONNECT_REASON_SOCKET_FAIL)
                     return
                 self.logger.warning(f"{conn} socket not yet ready, waiting")
@@ -557,11 +601,14 @@ class Node:
             peer_socket.setblocking(False)
 
             conn = PeerConnection(peer.ip_addresses, peer.port,
-                                  PEER_SEND, self.interrupt_write)
+                                  PEER_SEND, self.interrupt_write,
+                                  self._worker_pool)
             conn.state = PEER_CONNECTING
             conn.node_name = peer.node_name
             conn.origin_host = self.origin_host
-            self._add_peer_connection(conn, peer_socket, PEER_TRANSPORT_SCTP)
+            if not self._add_peer_connection(conn, peer_socket,
+                                             PEER_TRANSPORT_SCTP):
+                return
 
             connect_addr = [(ip, peer.port)
                             for ip in peer.ip_addresses]
@@ -569,7 +616,7 @@ class Node:
                 peer_socket.connectx(connect_addr)
             except socket.error as e:
                 if e.args[0] != errno.EINPROGRESS:
-                    self.remove_peer_connection(
+                    self.close_connection_socket(
                         conn, DISCONNECT_REASON_SOCKET_FAIL)
                     return
                 self.logger.warning(f"{conn} socket not yet ready, waiting")
@@ -579,6 +626,7 @@ class Node:
 
             conn.host_ip_address = [peer_socket.getsockname()[0]]
 
+        self._watch_socket(peer_socket, conn)
         if conn.state == PEER_CONNECTED:
             self.send_cer(conn)
         else:
@@ -635,20 +683,9 @@ class Node:
         return new_id
 
     def _handle_connections(self, _thread: StoppableThread):
-
-        def _valid_socket(sock):
-            try:
-                return sock is not None and sock.fileno() != -1
-            except Exception:
-                return False
-
+        next_timer_check = time.monotonic()
         while True:
 
-            if self.peers_logging:
-                self.stats_logger.log_peers()
-            if self.stats_logging:
-                self.stats_logger.log_stats()
-
             if _thread.is_stopped:
                 self.connection_logger.info(
                     "stop event received, closing all sockets")
@@ -658,217 +695,92 @@ class Node:
                     conn.close(signal_node=False)
                 return
 
-            # ----------------------------
-            # Build socket lists
-            # ----------------------------
-
-            r_list = []
-            w_list = []
-
-            # interrupt pipe
-            if _valid_socket(self.interrupt_read):
-                r_list.append(self.interrupt_read)
-
-            # listening sockets
-            for s in list(self.tcp_sockets):
-                if _valid_socket(s):
-                    r_list.append(s)
+            # Every socket is registered once, with write interest only while
+            # its connection has something to send; the cost of a wakeup does
+            # not depend on the amount of connections
+            timeout = max(0.0, next_timer_check - time.monotonic())
+            for key, events in self._selector.select(timeout):
+                if key.data is None:
+                    self._handle_interrupts()
+                elif not isinstance(key.data, PeerConnection):
+                    self._accept_from_socket(key.fileobj, key.data)
+                else:
+                    conn: PeerConnection = key.data
+                    if events & selectors.EVENT_READ:
+                        self._read_from_socket(key.fileobj, conn)
+                    if (events & selectors.EVENT_WRITE and
+                            self.peer_sockets.get(conn.ident) is key.fileobj):
+                        self._write_to_socket(key.fileobj, conn)
+
+            if time.monotonic() < next_timer_check:
+                continue
+            next_timer_check = time.monotonic() + self.wakeup_interval
 
-            for s in list(self.sctp_sockets):
-                if _valid_socket(s):
-                    r_list.append(s)
+            if self.peers_logging:
+                self.stats_logger.log_peers()
+            if self.stats_logging:
+                self.stats_logger.log_stats()
 
-            # peer sockets
-            for conn_id, conn_socket in list(self.peer_sockets.items()):
-                if not _valid_socket(conn_socket):
-                    continue
+            for conn in list(self.connections.values()):
+                self._check_timers(conn)
 
-                conn = self.connections.get(conn_id)
-                if not conn:
-                    continue
+            self._reconnect_peers()
 
-                if conn.state != PEER_CLOSED:
-                    r_list.append(conn_socket)
+    def _handle_interrupts(self):
+        """Act on every connection that has demanded attention.
 
-                if (
-                        conn.state == PEER_CONNECTING or
-                        (conn.state != PEER_CLOSED and len(conn.write_buffer) > 0)
-                ):
-                    w_list.append(conn_socket)
+        Each connection writes its 6-byte ID into the interrupt pipe every
+        time it has been closed, wants to be closed, or its write buffer has
+        gone from empty to non-empty.
+        """
+        try:
+            conn_ids = os.read(self.interrupt_read, 6 * 1024)
+        except OSError:
+            return
 
-            # If nothing valid, just continue loop
-            if not r_list and not w_list:
+        for pos in range(0, len(conn_ids), 6):
+            conn = self.connections.get(conn_ids[pos:pos + 6].hex())
+            if not conn:
                 continue
-
-            # ----------------------------
-            # SAFE SELECT (Windows proof)
-            # ----------------------------
-
+            self.connection_logger.debug(f"{conn} wants attention")
+            if conn.state == PEER_CLOSED:
+                self.close_connection_socket(
+                    conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
+            elif conn.has_out_bytes:
+                self._set_write_interest(conn, True)
+            elif conn.state == PEER_CLOSING:
+                self.close_connection_socket(
+                    conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
+
+    def _read_from_socket(self, peer_socket: socket.socket | sctp.sctpsocket,
+                          conn: PeerConnection):
+        # Received bytes go straight into the connection's read buffer and
+        # are framed and dispatched right away. A read that does not fill the
+        # space offered has emptied the socket; as the selector is level
+        # triggered, anything left after the last read is reported again
+        for _ in range(_MAX_READS_PER_EVENT):
+            in_buffer = conn.in_buffer()
             try:
-                ready_r, ready_w, _ = select.select(
-                    r_list, w_list, [], self.wakeup_interval)
-            except OSError:
-                # A socket was closed between validation and select (Windows race)
-                continue
-            except ValueError:
-                # Happens if a bad FD slips through
-                continue
-
-            # ----------------------------
-            # READABLE SOCKETS
-            # ----------------------------
-
-            for rsock in ready_r:
-
-                # interrupt pipe
-                if rsock == self.interrupt_read:
-                    try:
-                        conn_id = os.read(self.interrupt_read, 6).hex()
-                    except Exception:
-                        continue
-
-                    conn = self.connections.get(conn_id)
-                    if conn:
-                        self.connection_logger.debug(f"{conn} wants attention")
-                        if conn.state == PEER_CLOSED:
-                            self.close_connection_socket(
-                                conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
-                        elif len(conn.write_buffer) == 0 and conn.state == PEER_CLOSING:
-                            self.close_connection_socket(
-                                conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
-                    continue
-
-                # TCP accept
-                if rsock in self.tcp_sockets:
-                    try:
-                        clientsocket, (ip, port) = rsock.accept()
-                        clientsocket.setblocking(False)
-                    except Exception:
-                        continue
-
-                    conn = PeerConnection(
-                        ip, port, PEER_RECV,
-                        interrupt_fileno=self.interrupt_write)
-                    conn.state = PEER_CONNECTED
-
-                    self._add_peer_connection(
-                        conn, clientsocket, PEER_TRANSPORT_TCP)
-                    continue
-
-                # SCTP accept
-                if rsock in self.sctp_sockets:
-                    try:
-                        clientsocket, (ip, port) = rsock.accept()
-                        clientsocket.setblocking(False)
-                    except Exception:
-                        continue
-
-                    conn = PeerConnection(
-                        ip, port, PEER_RECV,
-                        interrupt_fileno=self.interrupt_write)
-                    conn.state = PEER_CONNECTED
-
-                    self._add_peer_connection(
-                        conn, clientsocket, PEER_TRANSPORT_SCTP)
-                    continue
-
-                # Peer data receive
-                try:
-                    fileno = rsock.fileno()
-                except Exception:
-                    continue
-
-                conn = self.socket_peers.get(fileno)
-                if not conn:
-                    continue
-
-                try:
-                    data = rsock.recv(2048)
-                except socket.error as e:
-                    if e.args and e.args[0] in SOFT_SOCKET_FAILURES:
-                        continue
-                    self.close_connection_socket(
-                        conn, DISCONNECT_REASON_SOCKET_FAIL)
-                    conn.close(signal_node=False)
-                    continue
-                except Exception:
-                    continue
-
-                if not data:
-                    self.close_connection_socket(
-                        conn, DISCONNECT_REASON_GONE_AWAY)
-                    conn.close(signal_node=False)
-                    continue
-
-                conn.add_in_bytes(data)
-
-            # ----------------------------
-            # WRITABLE SOCKETS
-            # ----------------------------
-
-            for wsock in ready_w:
-
-                try:
-                    fileno = wsock.fileno()
-                except Exception:
-                    continue
-
-                conn = self.socket_peers.get(fileno)
-                if not conn:
-                    continue
-
-                if conn.state == PEER_CONNECTING:
-                    try:
-                        socket_error = wsock.getsockopt(
-                            socket.SOL_SOCKET, socket.SO_ERROR)
-                    except Exception:
-                        continue
-
-                    if socket_error == 0:
-                        self._flag_peer_as_connected(conn)
-                        self.send_cer(conn)
-                    else:
-                        self.close_connection_socket(
-                            conn, DISCONNECT_REASON_FAILED_CONNECT)
-                        conn.close(signal_node=False)
-                    continue
-
-                if len(conn.write_buffer) == 0:
-                    if conn.state == PEER_CLOSING:
-                        self.close_connection_socket(
-                            conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
-                    continue
-
-                try:
-                    if conn.socket_proto == PEER_TRANSPORT_TCP:
-                        sent_bytes = wsock.send(conn.write_buffer)
-                    else:
-                        sent_bytes = wsock.sctp_send(
-                            conn.write_buffer,
-                            flags=sctp.MSG_UNORDERED)
-                except socket.error as e:
-                    if e.args and e.args[0] in SOFT_SOCKET_FAILURES:
-                        continue
-                    conn.close()
-                    continue
-                except Exception:
-                    continue
-
-                with conn.write_lock:
-                    conn.remove_out_bytes(sent_bytes)
-
-                    if len(conn.write_buffer) == 0 and conn.state == PEER_CLOSING:
-                        self.close_connection_socket(
-                            conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
-
-            # ----------------------------
-            # Timers + reconnect
-            # ----------------------------
+                read_len = peer_socket.recv_into(in_buffer)
+            except socket.error as e:
+                if e.args and e.args[0] in SOFT_SOCKET_FAILURES:
+                    return
+                self.close_connection_socket(
+                    conn, DISCONNECT_REASON_SOCKET_FAIL)
+                conn.close(signal_node=False)
+                return
+            except Exception:
+                return
 
-            for conn in list(self.connections.values()):
-                self._check_timers(conn)
+            if not read_len:
+                self.close_connection_socket(conn, DISCONNECT_REASON_GONE_AWAY)
+                conn.close(signal_node=False)
+                return
 
-            self._reconnect_peers()
+            conn.commit_in_bytes(read_len)
+            if (read_len < len(in_buffer) or
+                    self.peer_sockets.get(conn.ident) is not peer_socket):
+                return
 
     def _receive_message(self, conn: PeerConnection, msg: _AnyMessageType):
         if hasattr(msg, "origin_host"):
@@ -884,13 +796,16 @@ class Node:
             peer.statistics.add_received_req()
 
         if msg.header.is_request and self.validate_received_request_avps:
-            failed_avp = validate_message_avps(msg)
-            if failed_avp:
-                self.logger.warning(f"{conn} message failed AVP validation")
+            violation = find_avp_violation(msg)
+            if violation:
+                self.logger.warning(
+                    f"{conn} message failed AVP validation: "
+                    f"{violation.error_message}")
                 err = self._generate_answer(conn, msg)
-                err.result_code = constants.E_RESULT_CODE_DIAMETER_MISSING_AVP
-                err.error_message = "Mandatory AVPs missing"
-                err.failed_avp = FailedAvp(additional_avps=failed_avp)
+                err.result_code = violation.result_code
+                err.error_message = violation.error_message
+                err.failed_avp = FailedAvp(
+                    additional_avps=violation.failed_avp)
                 self.send_message(conn, err)
                 return
 
@@ -1102,6 +1017,103 @@ class Node:
         peer.counters.requests += cer + dwr + dpr + app_request
         peer.counters.answers += cea + dwa + dpa + app_answer
 
+    def _set_write_interest(self, conn: PeerConnection, enabled: bool):
+        peer_socket = self.peer_sockets.get(conn.ident)
+        if peer_socket is None:
+            return
+        events = selectors.EVENT_READ
+        if enabled:
+            events |= selectors.EVENT_WRITE
+        with self._selector_lock:
+            try:
+                key = self._selector.get_key(peer_socket)
+                if key.events != events:
+                    self._selector.modify(peer_socket, events, conn)
+            except (KeyError, ValueError, OSError):
+                pass
+
+    def _unwatch_socket(self, peer_socket: socket.socket | sctp.sctpsocket):
+        """Stop observing a socket, before it is closed."""
+        with self._selector_lock:
+            try:
+                self._selector.unregister(peer_socket)
+            except (KeyError, ValueError, OSError):
+                pass
+
+    def _watch_socket(self, peer_socket: socket.socket | sctp.sctpsocket,
+                      conn: PeerConnection):
+        """Start observing a peer connection socket.
+
+        The socket is registered for reading only, except while the
+        connection is still connecting, in which case it is observed for
+        writability as well.
+        """
+        events = selectors.EVENT_READ
+        if conn.state == PEER_CONNECTING:
+            events |= selectors.EVENT_WRITE
+        with self._selector_lock:
+            self._selector.register(peer_socket, events, conn)
+
+    def _write_to_socket(self, peer_socket: socket.socket | sctp.sctpsocket,
+                         conn: PeerConnection):
+        if conn.state == PEER_CONNECTING:
+            try:
+                socket_error = peer_socket.getsockopt(
+                    socket.SOL_SOCKET, socket.SO_ERROR)
+            except Exception:
+                return
+
+            if socket_error == 0:
+                self._set_write_interest(conn, False)
+                self._flag_peer_as_connected(conn)
+                self.send_cer(conn)
+            else:
+                self.close_connection_socket(
+                    conn, DISCONNECT_REASON_FAILED_CONNECT)
+                conn.close(signal_node=False)
+            return
+
+        with conn.write_lock:
+            if not conn.has_out_bytes:
+                if conn.state == PEER_CLOSING:
+                    self.close_connection_socket(
+                        conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
+                else:
+                    self._set_write_interest(conn, False)
+                return
+            out_buffers = conn.out_buffers(_MAX_SEND_BUFFERS)
+
+        # everything queued since the last write goes out in one call,
+        # without joining the messages together first
+        try:
+            if conn.socket_proto != PEER_TRANSPORT_TCP:
+                sent_bytes = peer_socket.sctp_send(
+                    b"".join(out_buffers), flags=sctp.MSG_UNORDERED)
+            elif len(out_buffers) == 1:
+                sent_bytes = peer_socket.send(out_buffers[0])
+            else:
+                sent_bytes = peer_socket.sendmsg(out_buffers)
+        except socket.error as e:
+            if e.args and e.args[0] in SOFT_SOCKET_FAILURES:
+                return
+            conn.close()
+            return
+        except Exception:
+            return
+
+        with conn.write_lock:
+            conn.send_calls += 1
+            conn.remove_out_bytes(sent_bytes)
+
+            # the write buffer is only ever refilled under the same lock, and
+            # the connection demands attention when that happens
+            if not conn.has_out_bytes:
+                if conn.state == PEER_CLOSING:
+                    self.close_connection_socket(
+                        conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
+                else:
+                    self._set_write_interest(conn, False)
+
     @property
     def statistics(self) -> NodeStats:
         """Calculated, cumulated and averaged statistics for the entire node."""
@@ -1291,6 +1303,7 @@ class Node:
                 peer_socket.setsockopt(
                     socket.SOL_SOCKET, socket.SO_LINGER,
                     struct.pack("ii", 1, 0))
+            self._unwatch_socket(peer_socket)
             peer_socket.close()
             conn.close(False)
 
@@ -1716,6 +1729,11 @@ class Node:
         if self._started:
             raise RuntimeError("Cannot start a node twice")
         self._started = True
+        if self.worker_threads > 0:
+            self._worker_pool = WorkerPool(self.worker_threads)
+            self._worker_pool.start()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.interrupt_read, selectors.EVENT_READ)
 
         if self.ip_addresses and self.tcp_port:
             for ip_addr in self.ip_addresses:
@@ -1725,6 +1743,8 @@ class Node:
                 tcp_socket.listen(128)
                 tcp_socket.setblocking(False)
                 self.tcp_sockets.append(tcp_socket)
+                self._selector.register(
+                    tcp_socket, selectors.EVENT_READ, PEER_TRANSPORT_TCP)
 
         if self.ip_addresses and self.sctp_port:
             if sctp is None:
@@ -1737,6 +1757,8 @@ class Node:
             sctp_socket.listen(128)
             sctp_socket.setblocking(False)
             self.sctp_sockets.append(sctp_socket)
+            self._selector.register(
+                sctp_socket, selectors.EVENT_READ, PEER_TRANSPORT_SCTP)
 
         self._stat_collect_thread.start()
         self._connection_thread.start()
@@ -1799,8 +1821,11 @@ class Node:
         self._connection_thread.join(self.wakeup_interval + 1)
         self._stat_collect_thread.stop()
         self._stat_collect_thread.join(2)
+        if self._worker_pool:
+            self._worker_pool.stop(2)
 
         self.logger.debug("closing listening sockets")
+        self._selector.close()
         for tcp_socket in self.tcp_sockets:
             tcp_socket.setsockopt(
                 socket.SOL_SOCKET, socket.SO_LINGER,
@@ -1816,4 +1841,339 @@ class Node:
             app.stop()
 
 
+class _PeerProtocol(asyncio.BufferedProtocol):
+    """Joins the asyncio transport of a connection socket with its
+    `AsyncPeerConnection`.
+
+    Takes the place of the connection socket in `AsyncNode.peer_sockets`, so
+    that the node can close it as it would close a socket.
+    """
+    def __init__(self, node: AsyncNode, sock: socket.socket = None):
+        self.node: AsyncNode = node
+        self.sock: socket.socket | None = sock
+        self.conn: AsyncPeerConnection | None = None
+        self.transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+        if self.sock is None:
+            self.sock = transport.get_extra_info("socket")
+        if self.conn is None:
+            self.node._accept_connection(self)
+        else:
+            self.conn.transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        # the transport reads straight into the connection's read buffer
+        return self.conn.in_buffer()
+
+    def buffer_updated(self, nbytes: int):
+        self.conn.commit_in_bytes(nbytes)
+
+    def connection_lost(self, exc: Exception | None):
+        self.node._connection_lost(self.conn, exc)
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.abort()
+        else:
+            self.sock.close()
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def setsockopt(self, *args):
+        self.sock.setsockopt(*args)
+
+
+class AsyncNode(Node):
+    """A diameter node that runs on an asyncio event loop.
+
+    Behaves like [`Node`][diameter.node.Node], with the same peer state
+    machine; CER/CEA, DWR/DWA and DPR/DPA handling, election, timers and
+    routing are all inherited from it. Instead of a socket thread and two
+    threads for every peer connection, the node runs entirely within the
+    event loop that it is started in; connection sockets are asyncio
+    transports, received messages are parsed and dispatched as soon as they
+    arrive and outgoing messages are written directly to the transports.
+
+    Applications are best subclassed from
+    [`AsyncApplication`][diameter.node.application.AsyncApplication], which
+    handles each received request in its own asyncio task and sends requests
+    with `await`:
+
+        >>> node = AsyncNode("peername.gy", "realm.net")
+        >>> peer = node.add_peer("aaa://dra1.gy", "realm.net", ["10.16.17.5"],
+        ...                      is_persistent=True)
+        >>> node.add_application(app, [peer])
+        >>> await node.start()
+        >>> await app.wait_for_ready()
+        >>> answer = await app.send_request(ccr)
+        >>> await node.stop()
+
+    The node supports only TCP transport. Its methods must be called from
+    within the event loop that the node was started in, with the exception of
+    sending messages; applications running in other threads, such as the
+    `ThreadingApplication`, can still send their answers and requests.
+    """
+    def __init__(self, origin_host: str, realm_name: str,
+                 ip_addresses: list[str] = None, tcp_port: int = None,
+                 vendor_ids: list[int] = None, application_id: int = None,
+                 supported_vendor_ids: list[int] = None, product_name: str = ""):
+        """Create a new asyncio diameter node.
+
+        Args:
+            origin_host: Our local node FQDN, must include the realm
+            realm_name: Realm FQDN
+            ip_addresses: An optional list of IP address that the node
+                will listen on for incoming requests. Must be set if the node
+                is to act as a server. When not set, the node will not
+                listen for any incoming connection attempts.
+            tcp_port: An optional TCP listen port, should be set if
+                `ip_addresses` is set
+            vendor_ids: List of supported vendor IDs. If not set, will default
+                to all known vendor IDs. The list of vendor IDs is only used
+                in advertising the node's capabilities in  CER/CEA
+
+        """
+        super().__init__(origin_host, realm_name, ip_addresses=ip_addresses,
+                         tcp_port=tcp_port, vendor_ids=vendor_ids,
+                         application_id=application_id,
+                         supported_vendor_ids=supported_vendor_ids,
+                         product_name=product_name)
+        # connections call the node directly, there is no select() to wake up
+        os.close(self.interrupt_read)
+        os.close(self.interrupt_write)
+        self.interrupt_read = self.interrupt_write = None
+
+        self._connections_closed = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._servers: list[asyncio.Server] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    def _accept_connection(self, protocol: _PeerProtocol):
+        ip, port = protocol.transport.get_extra_info("peername")[:2]
+        conn = AsyncPeerConnection(ip, port, PEER_RECV,
+                                   self._connection_wants_attention)
+        conn.state = PEER_CONNECTED
+        conn.transport = protocol.transport
+        protocol.conn = conn
+
+        self._add_peer_connection(conn, protocol, PEER_TRANSPORT_TCP)
+
+    def _connect_to_peer(self, peer: Peer):
+        """Establishes a connection to a known peer.
+
+        The connection is added immediately, in `PEER_CONNECTING` state; the
+        socket connects in a separate asyncio task.
+        """
+        if peer.connection:
+            self.logger.warning(
+                f"a connection to {peer.node_name} exists already")
+            return
+
+        if not peer.ip_addresses:
+            self.logger.warning(
+                f"{peer.node_name} has no socket configuration present")
+            return
+
+        peer_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        peer_socket.setblocking(False)
+        protocol = _PeerProtocol(self, peer_socket)
+
+        conn = AsyncPeerConnection(peer.ip_addresses, peer.port, PEER_SEND,
+                                   self._connection_wants_attention)
+        conn.state = PEER_CONNECTING
+        conn.node_name = peer.node_name
+        conn.origin_host = self.origin_host
+        protocol.conn = conn
+        if not self._add_peer_connection(conn, protocol, PEER_TRANSPORT_TCP):
+            return
+
+        self._create_task(self._open_connection(
+            conn, protocol, (peer.ip_addresses[0], peer.port)))
+
+    def _connection_lost(self, conn: AsyncPeerConnection,
+                         exc: Exception | None):
+        if self.connections.get(conn.ident) is not conn:
+            # closed by the node itself
+            return
+
+        if conn.state == PEER_CLOSING:
+            disconnect_reason = DISCONNECT_REASON_CLEAN_DISCONNECT
+        elif exc is None:
+            disconnect_reason = DISCONNECT_REASON_GONE_AWAY
+        else:
+            disconnect_reason = DISCONNECT_REASON_SOCKET_FAIL
+        self.connection_logger.info(f"{conn} socket has been closed")
+        conn.close(signal_node=False)
+        self.remove_peer_connection(conn, disconnect_reason)
+
+    def _connection_wants_attention(self, conn: AsyncPeerConnection):
+        if self.connections.get(conn.ident) is not conn:
+            return
+
+        self.connection_logger.debug(f"{conn} wants attention")
+        if conn.state == PEER_CLOSED:
+            self.close_connection_socket(
+                conn, DISCONNECT_REASON_CLEAN_DISCONNECT)
+        elif conn.state == PEER_CLOSING and conn.transport:
+            # the transport closes once its write buffer has been emptied
+            conn.transport.close()
+
+    def _create_task(self, coro) -> asyncio.Task:
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _open_connection(self, conn: AsyncPeerConnection,
+                               protocol: _PeerProtocol,
+                               address: tuple[str, int]):
+        try:
+            await self._loop.sock_connect(protocol.sock, address)
+            await self._loop.create_connection(lambda: protocol,
+                                               sock=protocol.sock)
+        except OSError as e:
+            self.logger.warning(f"{conn} failed to connect: {e}")
+            if self.connections.get(conn.ident) is conn:
+                self.close_connection_socket(
+                    conn, DISCONNECT_REASON_FAILED_CONNECT)
+            return
+
+        if self.connections.get(conn.ident) is not conn:
+            return
+        conn.host_ip_address = [protocol.sock.getsockname()[0]]
+        self._flag_peer_as_connected(conn)
+        self.send_cer(conn)
+
+    async def _record_statistics(self):
+        while True:
+            await asyncio.sleep(60)
+            stats_snapshot = dataclasses.asdict(self.statistics)
+            stats_snapshot["timestamp"] = int(time.time())
+            self.statistics_history.append(stats_snapshot)
+
+    def _unwatch_socket(self, peer_socket: _PeerProtocol):
+        pass
+
+    async def _watch_connections(self):
+        while True:
+            await asyncio.sleep(self.wakeup_interval)
+
+            if self.peers_logging:
+                self.stats_logger.log_peers()
+            if self.stats_logging:
+                self.stats_logger.log_stats()
+
+            for conn in list(self.connections.values()):
+                self._check_timers(conn)
+
+            self._reconnect_peers()
+
+    def _watch_socket(self, peer_socket: _PeerProtocol,
+                      conn: PeerConnection):
+        pass
+
+    def add_peer(self, peer_uri: str, realm_name: str = None,
+                 ip_addresses: list[str] = None,
+                 is_persistent: bool = False,
+                 is_default: bool = False) -> Peer:
+        uri = parse_diameter_uri(peer_uri)
+        if uri.params.get("transport", "tcp").lower() == "sctp":
+            raise RuntimeError("AsyncNode supports only TCP transport")
+        return super().add_peer(peer_uri, realm_name, ip_addresses,
+                                is_persistent, is_default)
+
+    def remove_peer_connection(self, conn: PeerConnection,
+                               disconnect_reason: int = DISCONNECT_REASON_UNKNOWN):
+        super().remove_peer_connection(conn, disconnect_reason)
+        if self._stopping and not self.connections:
+            self._connections_closed.set()
+
+    async def start(self):
+        """Start the node.
+
+        Must be awaited once after the node has been created, from within
+        the event loop that the node is to run in. At startup, the node will
+        create the local listening sockets, start its timers and connect to
+        any peers that have persistent connections enabled.
+        """
+        if self._started:
+            raise RuntimeError("Cannot start a node twice")
+        self._started = True
+        self._loop = asyncio.get_running_loop()
+
+        if self.ip_addresses and self.tcp_port:
+            for ip_addr in self.ip_addresses:
+                tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                tcp_socket.bind((ip_addr, self.tcp_port))
+                tcp_socket.listen(128)
+                tcp_socket.setblocking(False)
+                self.tcp_sockets.append(tcp_socket)
+                self._servers.append(await self._loop.create_server(
+                    lambda: _PeerProtocol(self), sock=tcp_socket))
+
+        self._create_task(self._watch_connections())
+        self._create_task(self._record_statistics())
+
+        for peer in self.peers.values():
+            if peer.persistent:
+                self.logger.info(f"auto-connecting to {peer.node_name}")
+                self._connect_to_peer(peer)
+
+    async def stop(self, wait_timeout: int = 180, force: bool = False):
+        """Stop node.
+
+        Follows the same procedure as [`Node.stop`][diameter.node.Node.stop];
+        a DPR is sent to every connected peer and the node waits for the
+        connections to close, after which the listening sockets are closed
+        and the applications are stopped.
+
+        Args:
+            wait_timeout: Set a timeout for the DPR/DPA procedure to complete
+            force: Optionally skip DPR/DPA procedure and just close each peer
+                connection immediately
+
+        """
+        if not self._started:
+            raise RuntimeError("Cannot stop a node that has not been started")
+        if self._stopping:
+            raise RuntimeError("Node is already stopping")
+
+        self.logger.info("stopping node")
+        self._stopping = True
+
+        if force:
+            self.logger.warning("forced close, sockets may not close cleanly")
+        elif self.connections:
+            for conn in list(self.connections.values()):
+                if conn.state in PEER_READY_STATES:
+                    self.send_dpr(conn)
+            try:
+                async with asyncio.timeout(wait_timeout):
+                    await self._connections_closed.wait()
+            except TimeoutError:
+                self.logger.error(
+                    "shutdown timeout reached, forcing connections to close")
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        self.connection_logger.info("closing all sockets")
+        for conn in list(self.connections.values()):
+            self.close_connection_socket(
+                conn, DISCONNECT_REASON_NODE_SHUTDOWN)
+
+        self.logger.debug("closing listening sockets")
+        for server in self._servers:
+            server.close()
+
+        self.logger.debug("stopping applications")
+        for app in self.applications:
+            app.stop()
+
+
 from .application import Application
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import itertools
 import logging
 import math
 import os
-import queue
 import threading
 import time
 
@@ -13,7 +14,7 @@ from typing import Callable, TypeVar
 
 from ..message import constants
 from ..message import MessageHeader, Message, dump
-from ._helpers import SecondSlotCounter, SequenceGenerator, StoppableThread
+from ._helpers import SecondSlotCounter, SequenceGenerator, WorkerPool
 
 
 __all__ = ["PEER_RECV", "PEER_SEND", "PEER_TRANSPORT_TCP",
@@ -25,7 +26,13 @@ __all__ = ["PEER_RECV", "PEER_SEND", "PEER_TRANSPORT_TCP",
            "DISCONNECT_REASON_GONE_AWAY", "DISCONNECT_REASON_FAILED_CONNECT",
            "DISCONNECT_REASON_FAILED_CONNECT_CE", "DISCONNECT_REASON_UNKNOWN",
            "DISCONNECT_REASON_CER_REJECTED", "DISCONNECT_REASON_DWA_TIMEOUT",
-           "Peer", "PeerConnection", "PeerCounters", "PeerStats"]
+           "AsyncPeerConnection", "Peer", "PeerConnection", "PeerCounters",
+           "PeerStats"]
+
+# Initial size of a connection's read buffer, and the least amount of free
+# space offered for a single socket read
+_READ_BUFFER_SIZE = 16384
+_READ_MIN_SPACE = 4096
 
 
 PEER_RECV = 0x01
@@ -306,7 +313,8 @@ class PeerConnection:
     Connections are created and closed by the parent governing diameter node.
     """
     def __init__(self, peer_ip: list[str] | str, peer_port: int,
-                 peer_direction: int, interrupt_fileno: int):
+                 peer_direction: int, interrupt_fileno: int,
+                 worker_pool: WorkerPool | None = None):
         """Create a new connection.
 
         Args:
@@ -321,20 +329,31 @@ class PeerConnection:
                 attention. This occurs most often when the connection has
                 something to write and needs to wake up the parent node's
                 `select` sleep.
+            worker_pool: An optional pool of worker threads, shared with other
+                connections, that decodes received and encodes outgoing
+                messages. Messages are still decoded and encoded in the order
+                that they were received or added. If not set, received
+                messages are decoded in the thread that received them and
+                outgoing messages in the thread that added them.
 
         """
         self._direction: int = peer_direction
         self._interrupt_fileno: int = interrupt_fileno
+        self._worker_pool: WorkerPool | None = worker_pool
         self._last_msg: int = 0
         self._last_read: int = 0
         # timestamp of last DWR sent, cleared after DWA
         self._last_dwr: int = 0
-        self._read_buffer: bytes = b""
-        self._read_buffer_queue: queue.Queue = queue.Queue()
-        self._read_thread = StoppableThread(target=self.work_read_queue)
-        self._write_buffer: bytes = b""
-        self._write_msg_queue: queue.Queue = queue.Queue()
-        self._write_thread = StoppableThread(target=self.work_write_queue)
+        # received bytes are framed in place; the bytes not yet consumed are
+        # always `_read_buffer[_read_start:_read_end]`
+        self._read_buffer: bytearray = bytearray(_READ_BUFFER_SIZE)
+        self._read_view: memoryview = memoryview(self._read_buffer)
+        self._read_start: int = 0
+        self._read_end: int = 0
+        # encoded outgoing messages in order; the first `_write_offset` bytes
+        # of the first one have already been sent
+        self._write_buffers: deque[bytes] = deque()
+        self._write_offset: int = 0
 
         self.logger: logging.LoggerAdapter = PeerLogAdapter(
             logging.getLogger("diameter.peer"), extra={"peer": self})
@@ -376,6 +395,10 @@ class PeerConnection:
         AVP."""
         self.port: int = peer_port
         """The peer connection socket port."""
+        self.send_calls: int = 0
+        """Amount of socket send calls made to write outgoing messages."""
+        self.sent_messages: int = 0
+        """Amount of outgoing messages that have been written in full."""
         self.socket_fileno: int = 0
         """The ID of the underlying socket. The peer does not hold the socket 
         itself, only the ID. The sockets are tracked by the parent node."""
@@ -389,8 +412,6 @@ class PeerConnection:
 
         self.reset_last_message()
         self.reset_last_read()
-        self._read_thread.start()
-        self._write_thread.start()
 
     def __str__(self):
         return f"<PeerConnection({self.ident}, {self.node_name}>"
@@ -449,9 +470,22 @@ class PeerConnection:
         """Seconds since bytes were last receveid from the network."""
         return int(time.time()) - self._last_read
 
+    @property
+    def has_out_bytes(self) -> bool:
+        """Indicates that there are bytes waiting to be sent."""
+        return bool(self._write_buffers)
+
+    @property
+    def send_calls_per_message(self) -> float:
+        """Average amount of socket send calls made per sent message."""
+        if not self.sent_messages:
+            return 0.0
+        return self.send_calls / self.sent_messages
+
     @property
     def write_buffer(self) -> bytes:
-        return self._write_buffer
+        """A copy of all bytes waiting to be sent."""
+        return b"".join(self._write_buffers)[self._write_offset:]
 
     def add_in_bytes(self, read_bytes: bytes):
         """Add network-received bytes to parse and handle.
@@ -462,7 +496,9 @@ class PeerConnection:
                 until at least one valid message has been received
 
         """
-        self._read_buffer_queue.put(read_bytes)
+        read_len = len(read_bytes)
+        self.in_buffer(read_len)[:read_len] = read_bytes
+        self.commit_in_bytes(read_len)
 
     def add_out_msg(self, out_msg: _AnyMessageType):
         """Add an outgoing Diameter message to send to network.
@@ -473,14 +509,17 @@ class PeerConnection:
                 are processed in the order that they were added.
 
         """
-        self._write_msg_queue.put(out_msg)
+        if self._worker_pool:
+            self._worker_pool.submit(self._encode_out_msg, out_msg)
+        else:
+            self._encode_out_msg(out_msg)
 
     def close(self, signal_node: bool = True):
         """Close the peer connection.
 
         Sets peer connection state as closed and signals parent Node to close
-        the underlying socket. Also stops processing input and output bytes
-        immediately.
+        the underlying socket. Also stops decoding received and encoding
+        outgoing messages that are still waiting for a worker.
 
         Args:
             signal_node: Send a signal to parent node so that it knows that the
@@ -490,18 +529,95 @@ class PeerConnection:
 
         """
         self.state = PEER_CLOSED
-        self._read_thread.stop()
-        self._write_thread.stop()
         if signal_node:
             self.demand_attention()
 
+    def commit_in_bytes(self, read_len: int):
+        """Parse and handle bytes that have been received into `in_buffer`.
+
+        Every complete message is dispatched immediately, in the calling
+        thread.
+
+        Args:
+            read_len: Amount of bytes that were written to the start of the
+                view last returned by `in_buffer`
+
+        """
+        self._read_end += read_len
+        self.reset_last_read()
+        self.logger.debug(f"read {read_len} bytes")
+        self._process_read_buffer()
+
     def demand_attention(self):
         """Signal parent node that data can be sent or read for this peer."""
         os.write(self._interrupt_fileno, bytes.fromhex(self.ident))
 
-    def remove_out_bytes(self, sent_bytes: int):
-        """Remove a given amount of bytes from outgoing buffer."""
-        self._write_buffer = self._write_buffer[sent_bytes:]
+    def in_buffer(self, size: int = _READ_MIN_SPACE) -> memoryview:
+        """Get a writable view to the free space in the read buffer.
+
+        Intended to be passed to `socket.recv_into`, followed by a call to
+        `commit_in_bytes` with the amount of bytes received. Any bytes not
+        yet consumed are moved to the start of the buffer when the free space
+        runs low, and the buffer grows when a message would not fit in it.
+
+        Args:
+            size: The least amount of free space to return
+
+        """
+        start, end = self._read_start, self._read_end
+        pending = end - start
+        if pending >= 20:
+            # make room for the rest of the message that has begun
+            msg_len = int.from_bytes(self._read_view[start + 1:start + 4],
+                                     "big")
+            size = max(size, msg_len - pending)
+
+        if len(self._read_buffer) - end >= size:
+            return self._read_view[end:]
+
+        if pending + size > len(self._read_buffer):
+            read_buffer = bytearray(max(pending + size,
+                                        len(self._read_buffer) * 2))
+            read_buffer[:pending] = self._read_view[start:end]
+            self._read_buffer = read_buffer
+            self._read_view = memoryview(read_buffer)
+        elif pending:
+            self._read_buffer[:pending] = self._read_view[start:end]
+        self._read_start = 0
+        self._read_end = pending
+        return self._read_view[pending:]
+
+    def out_buffers(self, max_count: int = 1024) -> list[bytes | memoryview]:
+        """Get the buffers waiting to be sent, one for each message, in order.
+
+        Intended to be passed as-is to `socket.sendmsg`, followed by a call to
+        `remove_out_bytes` with the amount of bytes sent. A message that has
+        been partially sent is returned as a view to its remaining bytes.
+
+        Args:
+            max_count: The most buffers to return
+
+        """
+        buffers = list(itertools.islice(self._write_buffers, max_count))
+        if buffers and self._write_offset:
+            buffers[0] = memoryview(buffers[0])[self._write_offset:]
+        return buffers
+
+    def remove_out_bytes(self, sent_bytes: int) -> int:
+        """Remove a given amount of bytes from outgoing buffer.
+
+        Returns:
+            The amount of messages that have now been sent in full.
+
+        """
+        sent_messages = 0
+        sent_bytes += self._write_offset
+        while self._write_buffers and sent_bytes >= len(self._write_buffers[0]):
+            sent_bytes -= len(self._write_buffers.popleft())
+            sent_messages += 1
+        self._write_offset = sent_bytes
+        self.sent_messages += sent_messages
+        return sent_messages
 
     def reset_last_message(self):
         """Mark that a full diameter message has been received.
@@ -538,87 +654,174 @@ class PeerConnection:
             self.state = PEER_READY_WAITING_DWA
         self._last_dwr = int(time.time())
 
-    def work_read_queue(self, _thread: StoppableThread):
-        while True:
-            if _thread.is_stopped:
-                break
-            try:
-                new_buffer: bytes = self._read_buffer_queue.get(True, 5)
-                self.logger.debug(f"read {len(new_buffer)} bytes")
-                self._read_buffer += new_buffer
-                self.reset_last_read()
-            except queue.Empty:
-                continue
-
-            if len(self._read_buffer) < 20:
-                self.logger.debug(
-                    f"message incomplete (received {len(self._read_buffer)} "
-                    f"bytes so far), waiting")
-                continue
-
-            resume_waiting = False
-            while len(self._read_buffer) > 0 and resume_waiting is False:
-                msg_header = message = None
-                try:
-                    msg_header = MessageHeader.from_bytes(self._read_buffer)
-                    self.logger.debug(
-                        f"expecting a message with command code "
-                        f"{msg_header.command_code}, length {msg_header.length}")
-                    if len(self._read_buffer) < msg_header.length:
-                        self.logger.debug(
-                            f"message incomplete (received "
-                            f"{len(self._read_buffer)} bytes so far), waiting")
-                        resume_waiting = True
-                    else:
-                        message = Message.from_bytes(
-                            self._read_buffer[:msg_header.length])
-                        self.reset_last_message()
-                        self._read_buffer = self._read_buffer[msg_header.length:]
-
-                except Exception as e:
-                    if msg_header and len(self._read_buffer) >= msg_header.length:
-                        self.logger.warning(
-                            f"received garbage: {e}, discarding {msg_header.length} "
-                            f"bytes")
-                        self._read_buffer = self._read_buffer[msg_header.length:]
-                        continue
-                    else:
-                        self.logger.warning(
-                            f"queue contains only garbage: {e}, closing connection")
-                        self.close()
-                        return
-
-                if message:
-                    self.msg_dump.received(message)
-                    self.logger.info(f"received a message: {message}")
-
-                    self.__dispatch_message(message)
-
-                # stop consuming buffer if we do not have enough bytes left for
-                # a message header
-                if 0 < len(self._read_buffer) < 20:
+    def _process_read_buffer(self):
+        """Parse and dispatch every complete message in the read buffer.
+
+        Leaves any trailing, incomplete message in the buffer. Closes the
+        connection if the buffer does not begin with a valid message header.
+        """
+        view = self._read_view
+        while self.state != PEER_CLOSED:
+            start = self._read_start
+            pending = self._read_end - start
+            if pending < 20:
+                if pending:
                     self.logger.debug(
-                        f"message incomplete (buffer has only "
-                        f"{len(self._read_buffer)} bytes left), waiting")
-                    resume_waiting = True
-
-    def work_write_queue(self, _thread: StoppableThread):
-        while True:
-            if _thread.is_stopped:
-                break
-            try:
-                new_msg: Message = self._write_msg_queue.get(True, 5)
-            except queue.Empty:
-                continue
-
-            try:
-                with self.write_lock:
-                    self._write_buffer += new_msg.as_bytes()
-                self.demand_attention()
-
-                self.msg_dump.sent(new_msg)
-                self.logger.debug(f"sent diameter message {new_msg}")
-            except Exception as e:
+                        f"message incomplete (received {pending} bytes so "
+                        f"far), waiting")
+                else:
+                    # nothing left, begin again from the start of the buffer
+                    self._read_start = self._read_end = 0
+                return
+
+            msg_header = MessageHeader.from_bytes(view[start:start + 20])
+            if msg_header.length < 20:
                 self.logger.warning(
-                    f"failed to encode a queued diameter message as bytes: "
-                    f"{e}; message discarded")
+                    f"queue contains only garbage: message length "
+                    f"{msg_header.length} is too short, closing connection")
+                self.close()
+                return
+            if pending < msg_header.length:
+                self.logger.debug(
+                    f"message incomplete (received {pending} of "
+                    f"{msg_header.length} bytes so far), waiting")
+                return
+
+            end = start + msg_header.length
+            self._read_start = end
+            # the buffer is reused for the following reads; the message gets
+            # a copy of its own bytes
+            if self._worker_pool:
+                self._worker_pool.submit(
+                    self._decode_in_msg, bytes(view[start:end]))
+            else:
+                self._decode_in_msg(bytes(view[start:end]))
+
+    def _decode_in_msg(self, msg_bytes: bytes):
+        if self.state == PEER_CLOSED:
+            return
+        try:
+            message = Message.from_bytes(msg_bytes)
+        except Exception as e:
+            self.logger.warning(
+                f"received garbage: {e}, discarding {len(msg_bytes)} bytes")
+            return
+
+        self.reset_last_message()
+        self.msg_dump.received(message)
+        self.logger.info(f"received a message: {message}")
+
+        self.__dispatch_message(message)
+
+    def _encode_out_msg(self, out_msg: _AnyMessageType):
+        if self.state == PEER_CLOSED:
+            return
+        try:
+            out_bytes = out_msg.as_bytes()
+        except Exception as e:
+            self.logger.warning(
+                f"failed to encode a queued diameter message as bytes: "
+                f"{e}; message discarded")
+            return
+
+        with self.write_lock:
+            was_empty = not self._write_buffers
+            self._write_buffers.append(out_bytes)
+        # the node observes the socket for writability only while there is
+        # something to write
+        if was_empty:
+            self.demand_attention()
+
+        self.msg_dump.sent(out_msg)
+        self.logger.debug(f"sent diameter message {out_msg}")
+
+
+class AsyncPeerConnection(PeerConnection):
+    """A connection with another diameter node, driven by an asyncio loop.
+
+    Used by [`AsyncNode`][diameter.node.AsyncNode] in place of
+    `PeerConnection`. The connection starts no threads of its own; received
+    bytes are parsed and dispatched as soon as they arrive, and outgoing
+    messages are encoded and written straight to the connection's asyncio
+    transport, all within the event loop that created the connection.
+
+    Messages may still be added from other threads, e.g. by a
+    `ThreadingApplication`; they are then handed over to the event loop.
+    """
+    def __init__(self, peer_ip: list[str] | str, peer_port: int,
+                 peer_direction: int,
+                 attention_handler: Callable[[AsyncPeerConnection], None]):
+        """Create a new connection.
+
+        Must be called from within a running event loop.
+
+        Args:
+            peer_ip: Either a list of possible IP addresses to connect to, or
+                an individual IP address that the connection socket is already
+                connected with.
+            peer_port: Peer connection port number
+            peer_direction: Indicates whether the connection is either a
+                receiving or a sending instance
+            attention_handler: A callback that is called with the connection
+                every time it needs attention from the parent node, i.e.
+                when it has been closed, or wants to be closed
+
+        """
+        self._attention_handler = attention_handler
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        self._loop_thread_id: int = threading.get_ident()
+        self.transport: asyncio.Transport | None = None
+        """The asyncio transport of the connection socket, set once the
+        socket has connected."""
+        super().__init__(peer_ip, peer_port, peer_direction, -1)
+
+    def add_out_msg(self, out_msg: _AnyMessageType):
+        if threading.get_ident() != self._loop_thread_id:
+            self._loop.call_soon_threadsafe(self.add_out_msg, out_msg)
+            return
+
+        if self.transport is None or self.transport.is_closing():
+            self.logger.warning(
+                f"connection is not writable, discarded message {out_msg}")
+            return
+        try:
+            out_bytes = out_msg.as_bytes()
+        except Exception as e:
+            self.logger.warning(
+                f"failed to encode a diameter message as bytes: {e}; "
+                f"message discarded")
+            return
+
+        # messages added within the same event loop iteration are handed to
+        # the transport together, in one write
+        if not self._write_buffers:
+            self._loop.call_soon(self._flush_out_bytes)
+        self._write_buffers.append(out_bytes)
+
+        self.msg_dump.sent(out_msg)
+        self.logger.debug(f"sent diameter message {out_msg}")
+
+    def _flush_out_bytes(self):
+        if not self._write_buffers:
+            return
+        buffers = list(self._write_buffers)
+        self._write_buffers.clear()
+        if self.transport is None or self.transport.is_closing():
+            self.logger.warning(
+                f"connection is not writable, discarded {len(buffers)} "
+                f"messages")
+            return
+
+        self.transport.writelines(buffers)
+        self.send_calls += 1
+        self.sent_messages += len(buffers)
+        if self.state == PEER_CLOSING:
+            self.demand_attention()
+
+    def demand_attention(self):
+        if threading.get_ident() != self._loop_thread_id:
+            self._loop.call_soon_threadsafe(self.demand_attention)
+        else:
+            # anything still waiting to be written goes out first
+            self._flush_out_bytes()
+            self._attention_handler(self)
@@ -0,0 +1,461 @@
+"""
+Reading diameter messages from packet capture files.
+
+Supports both the classic pcap and the pcapng file formats, with Ethernet,
+Linux cooked capture, BSD loopback and raw IP link layers. Diameter messages
+are extracted from TCP streams; each direction of each TCP connection is
+reassembled separately, and split into messages using the length in the
+diameter message header.
+
+The capture file is memory-mapped and read one packet at a time, so that
+the memory used does not depend on the size of the capture.
+
+    >>> from diameter.pcap import read_pcap
+    >>> for timestamp, flow, msg in read_pcap("capture.pcapng"):
+    >>>     print(timestamp, flow, msg)
+"""
+from __future__ import annotations
+
+import ipaddress
+import logging
+import mmap
+import struct
+
+from typing import Iterator, NamedTuple
+
+from .message import Message
+from .message.packer import ConversionError
+
+
+logger = logging.getLogger("diameter.pcap")
+
+_PCAP_MAGIC = {
+    0xa1b2c3d4: ("<", 1e-6),
+    0xd4c3b2a1: (">", 1e-6),
+    0xa1b23c4d: ("<", 1e-9),
+    0x4d3cb2a1: (">", 1e-9),
+}
+_PCAPNG_SECTION_HEADER = 0x0a0d0d0a
+_PCAPNG_BYTE_ORDER_MAGIC = 0x1a2b3c4d
+_PCAPNG_INTERFACE_DESCRIPTION = 1
+_PCAPNG_SIMPLE_PACKET = 3
+_PCAPNG_ENHANCED_PACKET = 6
+
+_LINKTYPE_NULL = 0
+_LINKTYPE_ETHERNET = 1
+_LINKTYPE_RAW = (12, 101, 228, 229)
+_LINKTYPE_LOOP = 108
+_LINKTYPE_LINUX_SLL = 113
+_LINKTYPE_LINUX_SLL2 = 276
+
+_ETHERTYPE_IPV4 = 0x0800
+_ETHERTYPE_IPV6 = 0x86dd
+_ETHERTYPE_VLAN = (0x8100, 0x88a8, 0x9100)
+
+_IPPROTO_TCP = 6
+_IPV6_EXTENSION_HEADERS = (0, 43, 60)
+
+_TCP_FIN = 0x01
+_TCP_SYN = 0x02
+_TCP_RST = 0x04
+
+_UINT16 = struct.Struct(">H")
+_TCP_HEADER = struct.Struct(">HHLLBB")
+
+MAX_PENDING_SEGMENTS = 256
+"""Maximum amount of out-of-order TCP segments held per stream, while
+waiting for a missing segment. Once exceeded, the missing data is assumed to
+be lost from the capture, and the stream continues from the next segment
+that was received."""
+
+
+class Flow(NamedTuple):
+    """One direction of a TCP connection."""
+    src_ip: str
+    src_port: int
+    dst_ip: str
+    dst_port: int
+
+    def __str__(self) -> str:
+        return f"{self.src_ip}:{self.src_port} -> {self.dst_ip}:{self.dst_port}"
+
+
+class _Packet(NamedTuple):
+    timestamp: float
+    link_type: int
+    start: int
+    end: int
+
+
+class _Segment(NamedTuple):
+    key: bytes
+    src_ip: bytes
+    src_port: int
+    dst_ip: bytes
+    dst_port: int
+    seq: int
+    flags: int
+    payload: bytes
+
+
+def _iter_pcap(data: mmap.mmap) -> Iterator[_Packet]:
+    byte_order, resolution = _PCAP_MAGIC[struct.unpack_from("<L", data)[0]]
+    (link_type, ) = struct.unpack_from(f"{byte_order}L", data, 20)
+    record = struct.Struct(f"{byte_order}4L")
+
+    position = 24
+    size = len(data)
+    while position + record.size <= size:
+        ts_sec, ts_frac, incl_len, _ = record.unpack_from(data, position)
+        start = position + record.size
+        position = start + incl_len
+        if position > size:
+            logger.warning(f"capture truncated at position {start}")
+            return
+        yield _Packet(ts_sec + ts_frac * resolution, link_type, start, position)
+
+
+def _pcapng_ts_resolution(data: mmap.mmap, byte_order: str, start: int,
+                          end: int) -> float:
+    option = struct.Struct(f"{byte_order}HH")
+    position = start
+    while position + 4 <= end:
+        code, length = option.unpack_from(data, position)
+        if code == 0:
+            break
+        if code == 9 and length >= 1:
+            value = data[position + 4]
+            if value & 0x80:
+                return 2.0 ** -(value & 0x7f)
+            return 10.0 ** -value
+        position += 4 + ((length + 3) & ~3)
+    return 1e-6
+
+
+def _iter_pcapng(data: mmap.mmap) -> Iterator[_Packet]:
+    byte_order = "<"
+    interfaces: list[tuple[int, float]] = []
+
+    position = 0
+    size = len(data)
+    while position + 12 <= size:
+        block_type = struct.unpack_from("<L", data, position)[0]
+        if block_type == _PCAPNG_SECTION_HEADER:
+            magic = struct.unpack_from("<L", data, position + 8)[0]
+            byte_order = "<" if magic == _PCAPNG_BYTE_ORDER_MAGIC else ">"
+            interfaces = []
+        block_type, block_length = struct.unpack_from(
+            f"{byte_order}LL", data, position)
+        block_end = position + block_length
+        if block_length < 12 or block_end > size:
+            logger.warning(f"capture truncated at position {position}")
+            return
+
+        if block_type == _PCAPNG_INTERFACE_DESCRIPTION:
+            (link_type, ) = struct.unpack_from(
+                f"{byte_order}H", data, position + 8)
+            interfaces.append((link_type, _pcapng_ts_resolution(
+                data, byte_order, position + 16, block_end - 4)))
+
+        elif block_type == _PCAPNG_ENHANCED_PACKET:
+            interface_id, ts_high, ts_low, cap_len = struct.unpack_from(
+                f"{byte_order}4L", data, position + 8)
+            link_type, resolution = interfaces[interface_id]
+            start = position + 28
+            yield _Packet(((ts_high << 32) | ts_low) * resolution,
+                          link_type, start, start + cap_len)
+
+        elif block_type == _PCAPNG_SIMPLE_PACKET:
+            (orig_len, ) = struct.unpack_from(
+                f"{byte_order}L", data, position + 8)
+            link_type, _ = interfaces[0]
+            start = position + 12
+            yield _Packet(0.0, link_type, start,
+                          start + min(orig_len, block_length - 16))
+
+        position = block_end
+
+
+def _iter_packets(data: mmap.mmap) -> Iterator[_Packet]:
+    magic = struct.unpack_from("<L", data)[0]
+    if magic in _PCAP_MAGIC:
+        return _iter_pcap(data)
+    if magic == _PCAPNG_SECTION_HEADER:
+        return _iter_pcapng(data)
+    raise ValueError(f"not a pcap or pcapng file, magic 0x{magic:08x}")
+
+
+def _ip_start(data: mmap.mmap, link_type: int, start: int,
+              end: int) -> int | None:
+    # Returns the position of the IP header, or None if the packet does not
+    # carry IP
+    if link_type == _LINKTYPE_ETHERNET:
+        position = start + 12
+        while position + 2 <= end:
+            (ethertype, ) = _UINT16.unpack_from(data, position)
+            if ethertype not in _ETHERTYPE_VLAN:
+                break
+            position += 4
+        else:
+            return None
+        if ethertype in (_ETHERTYPE_IPV4, _ETHERTYPE_IPV6):
+            return position + 2
+        return None
+    if link_type == _LINKTYPE_LINUX_SLL:
+        return start + 16
+    if link_type == _LINKTYPE_LINUX_SLL2:
+        return start + 20
+    if link_type in (_LINKTYPE_NULL, _LINKTYPE_LOOP):
+        return start + 4
+    if link_type in _LINKTYPE_RAW:
+        return start
+    return None
+
+
+def _parse_tcp(data: mmap.mmap, link_type: int, start: int,
+               end: int) -> _Segment | None:
+    position = _ip_start(data, link_type, start, end)
+    if position is None or position + 20 > end:
+        return None
+
+    version = data[position] >> 4
+    if version == 4:
+        header_length = (data[position] & 0x0f) * 4
+        (total_length, ) = _UINT16.unpack_from(data, position + 2)
+        (fragment, ) = _UINT16.unpack_from(data, position + 6)
+        if fragment & 0x3fff or data[position + 9] != _IPPROTO_TCP:
+            # fragmented packets are not reassembled
+            return None
+        src_ip = data[position + 12:position + 16]
+        dst_ip = data[position + 16:position + 20]
+        end = min(end, position + total_length)
+        position += header_length
+
+    elif version == 6:
+        if position + 40 > end:
+            return None
+        (payload_length, ) = _UINT16.unpack_from(data, position + 4)
+        next_header = data[position + 6]
+        src_ip = data[position + 8:position + 24]
+        dst_ip = data[position + 24:position + 40]
+        end = min(end, position + 40 + payload_length)
+        position += 40
+        while next_header in _IPV6_EXTENSION_HEADERS and position + 2 <= end:
+            next_header = data[position]
+            position += (data[position + 1] + 1) * 8
+        if next_header != _IPPROTO_TCP:
+            return None
+
+    else:
+        return None
+
+    if position + 20 > end:
+        return None
+    src_port, dst_port, seq, _, offset, flags = _TCP_HEADER.unpack_from(
+        data, position)
+    payload = data[position + (offset >> 4) * 4:end]
+    key = src_ip + _UINT16.pack(src_port) + dst_ip + _UINT16.pack(dst_port)
+    return _Segment(key, src_ip, src_port, dst_ip, dst_port, seq, flags,
+                    payload)
+
+
+def _looks_like_message(buffer: bytearray, position: int) -> bool:
+    # Checks whether a position looks like the beginning of a diameter
+    # message, i.e. version 1, a sane length and no reserved flags set, and
+    # that every AVP header received so far within the message is sane too.
+    # Messages longer than 64KB are not considered, as their length would
+    # make almost any byte sequence look like a message.
+    if buffer[position] != 1 or buffer[position + 1] != 0:
+        return False
+    length = int.from_bytes(buffer[position + 1:position + 4], "big")
+    if length < 20 or length & 3 or buffer[position + 4] & 0x0f:
+        return False
+
+    msg_end = position + length
+    end = min(msg_end, len(buffer))
+    avp_position = position + 20
+    while avp_position + 8 <= end:
+        avp_flags = buffer[avp_position + 4]
+        avp_length = int.from_bytes(
+            buffer[avp_position + 5:avp_position + 8], "big")
+        if (avp_flags & 0x1f or avp_length < 8 or
+                (avp_flags & 0x80 and avp_length < 12) or
+                avp_position + avp_length > msg_end):
+            return False
+        avp_position += (avp_length + 3) & ~3
+    return True
+
+
+def _find_header(buffer: bytearray) -> int:
+    # Finds the first position that looks like the beginning of a diameter
+    # message
+    position = buffer.find(b"\x01")
+    while 0 <= position <= len(buffer) - 20:
+        if _looks_like_message(buffer, position):
+            return position
+        position = buffer.find(b"\x01", position + 1)
+    return -1
+
+
+class _Stream:
+    """Reassembles one direction of a TCP connection into diameter messages."""
+    __slots__ = ("flow", "next_seq", "buffer", "pending", "synced")
+
+    def __init__(self, flow: Flow):
+        self.flow = flow
+        self.next_seq: int | None = None
+        self.buffer = bytearray()
+        self.pending: dict[int, bytes] = {}
+        # whether the beginning of the buffer is the beginning of a message
+        self.synced = False
+
+    def add(self, seq: int, flags: int, payload: bytes):
+        if flags & _TCP_SYN:
+            self.next_seq = (seq + 1) & 0xffffffff
+            self.buffer.clear()
+            self.pending.clear()
+            self.synced = True
+            return
+        if not payload:
+            return
+        if self.next_seq is None:
+            # stream was already open when the capture started
+            self.next_seq = seq
+
+        diff = ((seq - self.next_seq + 0x80000000) & 0xffffffff) - 0x80000000
+        if diff > 0:
+            self.pending[seq] = payload
+            if len(self.pending) > MAX_PENDING_SEGMENTS:
+                self._skip_gap()
+            return
+        if diff < 0:
+            # retransmission, possibly with some new data at the end
+            if len(payload) <= -diff:
+                return
+            payload = payload[-diff:]
+
+        self._append(payload)
+        while self.next_seq in self.pending:
+            self._append(self.pending.pop(self.next_seq))
+
+    def _append(self, payload: bytes):
+        self.buffer += payload
+        self.next_seq = (self.next_seq + len(payload)) & 0xffffffff
+
+    def _skip_gap(self):
+        logger.warning(f"{self.flow} missing TCP data, skipping ahead")
+        self.buffer.clear()
+        self.synced = False
+        self.next_seq = min(
+            self.pending,
+            key=lambda s: (s - self.next_seq) & 0xffffffff)
+        while self.next_seq in self.pending:
+            self._append(self.pending.pop(self.next_seq))
+
+    def messages(self) -> Iterator[bytes]:
+        buffer = self.buffer
+        while True:
+            if not self.synced:
+                position = _find_header(buffer)
+                if position < 0:
+                    # keep just enough for a header that is split between
+                    # segments
+                    del buffer[:-19]
+                    return
+                del buffer[:position]
+                self.synced = True
+
+            if len(buffer) < 20:
+                return
+            length = int.from_bytes(buffer[1:4], "big")
+            if buffer[0] != 1 or length < 20 or length & 3:
+                logger.warning(
+                    f"{self.flow} stream is not at a diameter message "
+                    f"boundary, searching for the next message")
+                del buffer[:1]
+                self.synced = False
+                continue
+            if len(buffer) < length:
+                return
+
+            msg_data = bytes(buffer[:length])
+            del buffer[:length]
+            yield msg_data
+
+
+def _flow(segment: _Segment) -> Flow:
+    return Flow(str(ipaddress.ip_address(segment.src_ip)), segment.src_port,
+                str(ipaddress.ip_address(segment.dst_ip)), segment.dst_port)
+
+
+def read_pcap(filename: str, decode: bool = True,
+              command_codes: set[int] | None = None,
+              application_ids: set[int] | None = None
+              ) -> Iterator[tuple[float, Flow, Message | bytes]]:
+    """Read diameter messages from a pcap or pcapng file.
+
+    Produces a generator, that reads the capture file lazily, one packet at
+    a time, and yields each diameter message as soon as it has been
+    completely received.
+
+    TCP segments that arrive out of order are buffered until the missing
+    segments arrive, and retransmitted data is discarded. If a TCP stream
+    was already open when the capture started, or if data has been lost from
+    the capture, the stream is searched for the next position that looks
+    like the beginning of a diameter message. Fragmented IP packets and
+    other transport protocols, including SCTP, are not supported.
+
+    Args:
+        filename: Path to a capture file
+        decode: If set to False, the messages are not decoded, and each
+            message is returned as bytes instead
+        command_codes: If set, only messages with one of these command codes
+            are returned, others are skipped without being decoded
+        application_ids: If set, only messages with one of these application
+            IDs are returned, others are skipped without being decoded
+
+    Returns:
+        A generator of tuples that contain the timestamp of the packet that
+            completed the message, the flow that the message was sent in,
+            and the message itself. If a message cannot be decoded, the
+            message bytes are returned instead.
+
+    Raises:
+        ValueError: If the file is not a pcap or a pcapng file
+    """
+    streams: dict[bytes, _Stream] = {}
+
+    with open(filename, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for packet in _iter_packets(data):
+            segment = _parse_tcp(data, packet.link_type, packet.start,
+                                 packet.end)
+            if segment is None:
+                continue
+
+            stream = streams.get(segment.key)
+            if stream is None:
+                stream = streams[segment.key] = _Stream(_flow(segment))
+            stream.add(segment.seq, segment.flags, segment.payload)
+
+            for msg_data in stream.messages():
+                if (command_codes is not None and int.from_bytes(
+                        msg_data[5:8], "big") not in command_codes):
+                    continue
+                if (application_ids is not None and int.from_bytes(
+                        msg_data[8:12], "big") not in application_ids):
+                    continue
+                if not decode:
+                    yield packet.timestamp, stream.flow, msg_data
+                    continue
+                try:
+                    msg = Message.from_bytes(msg_data)
+                except ConversionError as e:
+                    logger.warning(
+                        f"{stream.flow} failed to decode a message: {e}")
+                    yield packet.timestamp, stream.flow, msg_data
+                else:
+                    yield packet.timestamp, stream.flow, msg
+
+            if segment.flags & (_TCP_FIN | _TCP_RST):
+                del streams[segment.key]
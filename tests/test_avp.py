@@ -65,6 +65,197 @@ def test_decode_from_avp():
     assert a1.value == a2.value
 
 
+def test_copy():
+    proxy_info = avp.Avp.new(constants.AVP_PROXY_INFO, value=[
+        avp.Avp.new(constants.AVP_PROXY_HOST, value=b"dra.mno.net"),
+        avp.Avp.new(constants.AVP_PROXY_STATE, value=b"\x01")])
+    proxy_info.name = "Proxy"
+    received = avp.Avp.from_bytes(proxy_info.as_bytes())
+
+    # undecoded grouped AVPs are copied without being decoded
+    copy = received.copy(deep=True)
+    assert copy.__class__ is avp.AvpGrouped
+    assert copy.payload is received.payload
+    assert received._avps is None and copy._avps is None
+    assert copy.as_bytes() == proxy_info.as_bytes()
+    assert avp.Avp.from_avp(received).as_bytes() == proxy_info.as_bytes()
+
+    shallow = proxy_info.copy()
+    assert shallow.name == "Proxy"
+    assert shallow.value is not proxy_info.value
+    assert shallow.value[0] is proxy_info.value[0]
+
+    deep = proxy_info.copy(deep=True)
+    assert deep.value[0] is not proxy_info.value[0]
+    assert deep.value[0].payload is proxy_info.value[0].payload
+    deep.value[0].value = b"other.mno.net"
+    deep.is_mandatory = False
+    assert proxy_info.value[0].value == b"dra.mno.net"
+    assert proxy_info.is_mandatory is True
+
+
+def test_grouped_payload_follows_sub_avps():
+    proxy_host = avp.Avp.new(constants.AVP_PROXY_HOST, value=b"dra.mno.net")
+    proxy_info = avp.Avp.new(constants.AVP_PROXY_INFO, value=[proxy_host])
+    unchanged = proxy_info.payload
+    assert proxy_info.payload is unchanged
+
+    # changes to the sub-AVPs are picked up without setting the value again
+    proxy_host.value = b"other.mno.net"
+    proxy_info.value.append(
+        avp.Avp.new(constants.AVP_PROXY_STATE, value=b"\x01"))
+    expected = avp.Avp.new(constants.AVP_PROXY_INFO, value=[
+        avp.Avp.new(constants.AVP_PROXY_HOST, value=b"other.mno.net"),
+        avp.Avp.new(constants.AVP_PROXY_STATE, value=b"\x01")])
+    assert proxy_info.as_bytes() == expected.as_bytes()
+    assert proxy_info.length == expected.length
+
+    # also when nested and when decoded from bytes, along the changed path
+    # only; an unchanged payload is not packed again
+    outer = avp.Avp.new(constants.AVP_TGPP_SERVICE_INFORMATION,
+                        constants.VENDOR_TGPP, value=[proxy_info])
+    received = avp.Avp.from_bytes(outer.as_bytes())
+    received.as_bytes()
+    received_proxy_info = received.value[0]
+    untouched = received_proxy_info.payload
+    received.value.append(avp.Avp.new(constants.AVP_ROUTE_RECORD, value=b"x"))
+    received.as_bytes()
+    assert received_proxy_info.payload is untouched
+
+    received_proxy_info.value[0].value = b"dra.mno.net"
+    proxy_host.value = b"dra.mno.net"
+    outer.value.append(avp.Avp.new(constants.AVP_ROUTE_RECORD, value=b"x"))
+    assert received.as_bytes() == outer.as_bytes()
+    assert avp.Avp.from_avp(received).as_bytes() == outer.as_bytes()
+    assert received.copy().as_bytes() == outer.as_bytes()
+
+    # setting the payload replaces the sub-AVPs
+    received.payload = expected.payload
+    assert [a.code for a in received.value] == [
+        constants.AVP_PROXY_HOST, constants.AVP_PROXY_STATE]
+
+
+def test_grouped_changes_tracked():
+    def proxy_info(host: bytes, state: bytes) -> avp.AvpGrouped:
+        return avp.Avp.new(constants.AVP_PROXY_INFO, value=[
+            avp.Avp.new(constants.AVP_PROXY_HOST, value=host),
+            avp.Avp.new(constants.AVP_PROXY_STATE, value=state)])
+
+    def service_info(*sub_avps: avp.Avp) -> avp.AvpGrouped:
+        return avp.Avp.new(constants.AVP_TGPP_SERVICE_INFORMATION,
+                           constants.VENDOR_TGPP, value=list(sub_avps))
+
+    outer = avp.Avp.from_bytes(service_info(
+        proxy_info(b"a", b"\x01"), proxy_info(b"b", b"\x02")).as_bytes())
+    first, second = outer.value
+    assert isinstance(outer.value, avp.AvpList)
+
+    # only the grouped AVPs along the path of a change are packed again
+    outer.as_bytes()
+    second_payload = second.payload
+    first.value[0].is_mandatory = False
+    changed_host = avp.Avp.new(constants.AVP_PROXY_HOST, value=b"a",
+                               is_mandatory=False)
+    expected_first = avp.Avp.new(constants.AVP_PROXY_INFO, value=[
+        changed_host, avp.Avp.new(constants.AVP_PROXY_STATE, value=b"\x01")])
+    assert outer.as_bytes() == service_info(
+        expected_first, proxy_info(b"b", b"\x02")).as_bytes()
+    assert second.payload is second_payload
+    outer_payload = outer.payload
+    assert outer.payload is outer_payload
+
+    # changes made through the list are tracked as well
+    state = second.value.pop()
+    second.value.insert(0, state)
+    second.value.reverse()
+    second.value.sort(key=lambda a: a.code)
+    del second.value[1]
+    second.value += (a for a in [state])
+    second.value[0:1] = [avp.Avp.new(constants.AVP_PROXY_HOST, value=b"c")]
+    assert outer.as_bytes() == service_info(
+        expected_first, proxy_info(b"c", b"\x02")).as_bytes()
+    second.value[1].code = constants.AVP_PROXY_HOST
+    second.value[1].vendor_id = constants.VENDOR_TGPP
+    assert outer.value[1].as_bytes() == avp.Avp.new(
+        constants.AVP_PROXY_INFO, value=[
+            avp.Avp.new(constants.AVP_PROXY_HOST, value=b"c"),
+            avp.Avp(constants.AVP_PROXY_HOST, constants.VENDOR_TGPP,
+                    b"\x02", state.flags)]).as_bytes()
+
+    # a sub-AVP held by two grouped AVPs, or by a shallow copy, keeps both
+    # of them up to date
+    shared = avp.Avp.new(constants.AVP_PROXY_HOST, value=b"a")
+    one = avp.Avp.new(constants.AVP_PROXY_INFO, value=[shared])
+    other = service_info(avp.Avp.new(constants.AVP_PROXY_INFO, value=[shared]))
+    copy = one.copy()
+    for grouped in (one, other, copy):
+        grouped.as_bytes()
+    shared.value = b"b"
+    expected = avp.Avp.new(constants.AVP_PROXY_INFO, value=[
+        avp.Avp.new(constants.AVP_PROXY_HOST, value=b"b")])
+    assert one.as_bytes() == copy.as_bytes() == expected.as_bytes()
+    assert other.as_bytes() == service_info(expected).as_bytes()
+
+    deep = one.copy(deep=True)
+    deep.value[0].value = b"c"
+    assert one.as_bytes() == expected.as_bytes()
+    assert deep.value[0].value == b"c"
+    assert deep.as_bytes() != expected.as_bytes()
+
+def test_decode_from_bytes_compact():
+    # decoded AVPs hold no instance dict, and refer to the name, code and
+    # vendor held by the AVP dictionary entry
+    avp_bytes = bytes.fromhex("0000040ac000000c000028af")
+    a = avp.Avp.from_bytes(avp_bytes)
+    entry = avp.avp.get_avp_dictionary_entry(
+        constants.AVP_TGPP_ALLOCATION_RETENTION_PRIORITY, constants.VENDOR_TGPP)
+
+    assert not hasattr(a, "__dict__")
+    assert a.name == "Allocation-Retention-Priority"
+    assert a.name is entry["name"]
+    assert a.code is entry["code"]
+    assert a.vendor_id is entry["vendor"]
+
+
+def test_dictionary_vendor_tables():
+    # vendor tables are built on first access, and every table, including
+    # ones set or modified later on, is reachable through a single lookup
+    from diameter.message.avp.dictionary import VendorDictionary
+
+    vendors = VendorDictionary({
+        99901: lambda: {10: {"name": "A", "type": avp.Avp}}})
+    assert 99901 in vendors
+    assert vendors.load(99901) is True
+    assert vendors.load(99901) is False
+    assert vendors[99901][10]["code"] == 10
+
+    vendors[99902] = {20: {"name": "B", "type": avp.Avp}}
+    assert sorted(vendors) == [99901, 99902]
+    assert avp.avp.get_avp_dictionary_entry(20, 99902)["name"] == "B"
+    vendors[99902][21] = {"name": "C", "type": avp.Avp}
+    assert avp.avp.get_avp_dictionary_entry(21, 99902)["name"] == "C"
+    del vendors[99902]
+    assert avp.avp.get_avp_dictionary_entry(20, 99902) is None
+    assert vendors.pop(99901)[10]["name"] == "A"
+    assert avp.avp.get_avp_dictionary_entry(10, 99901) is None
+
+    entry = avp.avp.get_avp_dictionary_entry(
+        constants.AVP_TGPP_3GPP_IMSI, constants.VENDOR_TGPP)
+    assert entry["name"] == "3GPP-IMSI"
+    assert avp.avp.get_avp_dictionary_entry(
+        constants.AVP_TGPP_3GPP_IMSI, 99999) is None
+
+
+def test_avp_name():
+    a = avp.Avp.new(constants.AVP_ORIGIN_HOST, value=b"dra4.gy.mvno.net")
+    assert a.name == "Origin-Host"
+
+    a.name = "Custom-Origin-Host"
+    assert a.name == "Custom-Origin-Host"
+
+    assert avp.Avp(code=9999999).name == "Unknown"
+
+
 def test_create_address_type():
     # create an "Address" type AVP
     a = avp.AvpAddress(constants.AVP_TGPP_SGSN_ADDRESS)
@@ -359,9 +550,11 @@ def test_error_grouped_type():
 
     # assign an AVP with a junk payload, grouped AVP value must always be a
     # list that contains AVP instances
-    at.payload = "invalid"
+    junk = avp.AvpUnsigned32(constants.AVP_SUBSCRIPTION_ID_TYPE)
+    junk.payload = "invalid"
     with pytest.raises(avp.AvpEncodeError):
-        ag.value = [at]
+        ag.value = [junk]
+    assert ag.value == [at]
 
     # inject junk into the grouped AVP portion
     new_ag = avp.Avp.from_bytes(ag.as_bytes()[:-6] + b"00" + ag.as_bytes()[-6:])
@@ -0,0 +1,101 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import pytest
+
+from diameter.message import Message, constants
+from diameter.message.avp.grouped import (MultipleServicesCreditControl,
+                                          SubscriptionId, UsedServiceUnit)
+from diameter.message.columns import extract_avp_columns
+from diameter.message.commands import CreditControlRequest
+from diameter.message.packer import ConversionError
+
+np = pytest.importorskip("numpy")
+
+
+RATING_GROUP = (
+    (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+    (constants.AVP_RATING_GROUP, 0))
+TOTAL_OCTETS = (
+    (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+    (constants.AVP_USED_SERVICE_UNIT, 0),
+    (constants.AVP_CC_TOTAL_OCTETS, 0))
+
+
+def _ccr(number: int, usage: dict[int, list[int]]) -> bytes:
+    ccr = CreditControlRequest()
+    ccr.session_id = f"pgw.example.com;1;{number}"
+    ccr.origin_host = b"pgw.example.com"
+    ccr.origin_realm = b"example.com"
+    ccr.destination_realm = b"ocs.example.com"
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = number
+    ccr.subscription_id = [SubscriptionId(
+        constants.E_SUBSCRIPTION_ID_TYPE_END_USER_E164, f"4850891638{number}")]
+    for rating_group, octets in usage.items():
+        ccr.multiple_services_credit_control.append(
+            MultipleServicesCreditControl(
+                rating_group=rating_group,
+                used_service_unit=[
+                    UsedServiceUnit(cc_total_octets=o) for o in octets]))
+    return ccr.as_bytes()
+
+
+def test_extract_columns():
+    messages = [
+        _ccr(1, {100: [10, 20], 200: [5]}),
+        _ccr(2, {}),
+        _ccr(3, {200: [1000]}),
+    ]
+    rating_group, total_octets, request_number, msisdn = extract_avp_columns(
+        messages, RATING_GROUP, TOTAL_OCTETS,
+        (constants.AVP_CC_REQUEST_NUMBER, 0),
+        ((constants.AVP_SUBSCRIPTION_ID, 0),
+         (constants.AVP_SUBSCRIPTION_ID_DATA, 0)))
+
+    assert rating_group.values.tolist() == [100, 200, 200]
+    assert rating_group.rows.tolist() == [0, 1, 2]
+    assert rating_group.offsets.tolist() == [0, 2, 2, 3]
+    assert rating_group.row_offsets.tolist() == [0, 2, 2, 3]
+
+    assert total_octets.values.dtype == np.uint64
+    assert total_octets.values.tolist() == [10, 20, 5, 1000]
+    assert total_octets.rows.tolist() == [0, 0, 1, 2]
+    assert total_octets.offsets.tolist() == [0, 3, 3, 4]
+
+    assert request_number.values.tolist() == [1, 2, 3]
+    assert msisdn.values.tolist() == [
+        "48508916381", "48508916382", "48508916383"]
+
+    # usage summed per rating group
+    row_rating_group = np.zeros(rating_group.row_offsets[-1], dtype="int64")
+    row_rating_group[rating_group.rows] = rating_group.values
+    usage = np.bincount(row_rating_group[total_octets.rows],
+                        weights=total_octets.values)
+    assert usage[100] == 30
+    assert usage[200] == 1005
+
+    # values are the same as when decoding the messages
+    msg = Message.from_bytes(messages[0])
+    assert [u.cc_total_octets
+            for m in msg.multiple_services_credit_control
+            for u in m.used_service_unit] == total_octets.values[:3].tolist()
+
+
+def test_extract_columns_from_buffer():
+    messages = [_ccr(n, {100: [n]}) for n in range(5)]
+    columns = extract_avp_columns(
+        b"".join(messages), TOTAL_OCTETS, (constants.AVP_SESSION_ID, 0))
+
+    assert columns[0].values.tolist() == [0, 1, 2, 3, 4]
+    assert columns[1].values[4] == "pgw.example.com;1;4"
+    assert columns[1].offsets.tolist() == [0, 1, 2, 3, 4, 5]
+
+
+def test_extract_columns_invalid():
+    msg_bytes = bytearray(_ccr(1, {100: [1]}))
+    msg_bytes[25:28] = b"\0\0\0"
+    with pytest.raises(ConversionError):
+        extract_avp_columns([bytes(msg_bytes)], TOTAL_OCTETS)
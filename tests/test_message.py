@@ -2,11 +2,33 @@
 Run from package root:
 ~# python3 -m pytest -vv
 """
+import subprocess
+import sys
+
 import pytest
 
-from diameter.message import Message, constants
-from diameter.message.avp import Avp
+from diameter.message import (DefinedMessage, Message, MessageHeader,
+                              UndefinedMessage, constants, peek_avps)
+from diameter.message.avp import (Avp, AvpEncodeError, AvpPath,
+                                  AvpUnsigned32)
+from diameter.message import _base
+from diameter.message.avp import avp as avp_module
+from diameter.message.avp.generator import (clear_encode_plans,
+                                            generate_avps_from_defs)
+from diameter.message.avp.grouped import (AllocationRetentionPriority,
+                                          ApnConfiguration,
+                                          ApnConfigurationProfile,
+                                          EpsSubscribedQosProfile,
+                                          MultipleServicesCreditControl,
+                                          SubscriptionData, SupportedFeatures,
+                                          UsedServiceUnit)
 from diameter.message.commands import CapabilitiesExchangeRequest, CapabilitiesExchangeAnswer
+from diameter.message.commands import CreditControlRequest, UpdateLocationAnswer
+from diameter.message.commands import (CreditControlAnswer, all_commands,
+                                       register)
+from diameter.message.packer import ConversionError
+from diameter.message.commands._attributes import (assign_attr_from_defs,
+                                                   get_decode_plan)
 
 cer = ("010000b48000010100000000b237ee976801428f00000108400000216472612e73776c"
        "61622e726f616d2e7365727665722e6e6574000000000001284000001d73776c61622e"
@@ -147,6 +169,100 @@ def test_find_avp_multiple_chain():
     assert avps[1].value == 2
 
 
+def test_find_avp_path():
+    path = AvpPath("Supported-Features/Feature-List-ID")
+    assert path == (
+        (constants.AVP_TGPP_SUPPORTED_FEATURES, constants.VENDOR_TGPP),
+        (constants.AVP_TGPP_FEATURE_LIST_ID, constants.VENDOR_TGPP))
+    assert AvpPath("mscc/usu/cc-total-octets") == (
+        (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        (constants.AVP_USED_SERVICE_UNIT, 0),
+        (constants.AVP_CC_TOTAL_OCTETS, 0))
+    assert AvpPath("Filter-Id/3805:10415") == ((11, 0), (3805, 10415))
+    assert str(AvpPath((11, 0), (3805, 10415))) == "Filter-Id/3805:10415"
+
+    msg = Message.from_bytes(bytes.fromhex(ulr))
+    avps = msg.find_avps(path)
+    assert [a.value for a in avps] == [1, 2]
+    assert msg.find_avps("Supported-Features/Feature-List-ID") == avps
+
+    with pytest.raises(ValueError):
+        AvpPath("Not-An-AVP")
+    with pytest.raises(ValueError):
+        # matches more than one vendor specific AVP
+        AvpPath("Originator")
+
+
+def test_find_avp_index_invalidated():
+    msg = Message()
+    msg.avps = [Avp.new(constants.AVP_SESSION_ID, value="sess;1"),
+                Avp.new(constants.AVP_USER_NAME, value="228650000023349")]
+    assert msg.find_avps((constants.AVP_USER_NAME, 0))[0].value == \
+           "228650000023349"
+
+    msg.append_avp(Avp.new(constants.AVP_USER_NAME, value="228650000000000"))
+    assert len(msg.find_avps((constants.AVP_USER_NAME, 0))) == 2
+
+    msg.avps.append(Avp.new(constants.AVP_USER_NAME, value="228650000000001"))
+    assert len(msg.find_avps((constants.AVP_USER_NAME, 0))) == 3
+
+    msg.avps = []
+    assert msg.find_avps((constants.AVP_USER_NAME, 0)) == []
+
+    # messages built from attributes are searched as they currently are
+    cer = CapabilitiesExchangeRequest()
+    cer.vendor_id = 1
+    assert cer.find_avps((constants.AVP_VENDOR_ID, 0))[0].value == 1
+    cer.vendor_id = 2
+    assert cer.find_avps((constants.AVP_VENDOR_ID, 0))[0].value == 2
+
+    # received messages are searched without decoding or encoding anything
+    # other than the attributes on the path
+    ulr_msg = Message.from_bytes(bytes.fromhex(ulr))
+    assert ulr_msg.find_avps((constants.AVP_USER_NAME, 0))[0].value == \
+           "228650000023349"
+    ulr_msg.user_name = "228650000000000"
+    assert ulr_msg.find_avps((constants.AVP_USER_NAME, 0))[0].value == \
+           "228650000000000"
+    assert len(ulr_msg.find_avps(
+        (constants.AVP_TGPP_SUPPORTED_FEATURES, constants.VENDOR_TGPP))) == 2
+
+
+def test_find_avp_index_replaced_in_place():
+    msg = Message.from_bytes(bytes.fromhex(ulr), plain_msg=True)
+    assert msg.find_avps((constants.AVP_SESSION_ID, 0))[0].value.startswith(
+        "ix1cmm212")
+
+    position = msg.avps.index(msg.find_avps((constants.AVP_SESSION_ID, 0))[0])
+    msg.avps[position] = Avp.new(constants.AVP_SESSION_ID, value="sess;1")
+    assert [a.value for a in msg.find_avps((constants.AVP_SESSION_ID, 0))] == [
+        "sess;1"]
+
+    msg.avps[position] = Avp.new(constants.AVP_USER_NAME, value="user")
+    assert msg.find_avps((constants.AVP_SESSION_ID, 0)) == []
+
+    msg.avps.insert(0, Avp.new(constants.AVP_USER_NAME, value="first"))
+    msg.avps.sort(key=lambda a: a.code)
+    assert [a.value for a in msg.find_avps((constants.AVP_USER_NAME, 0))] == [
+        "first", "user", "228650000023349"]
+    msg.avps.reverse()
+    assert [a.value for a in msg.find_avps((constants.AVP_USER_NAME, 0))] == [
+        "228650000023349", "user", "first"]
+
+    # custom AVPs of defined messages are indexed the same way
+    cer = CapabilitiesExchangeRequest()
+    cer.origin_host = b"dra1.mvno.net"
+    cer.append_avp(Avp.new(constants.AVP_USER_NAME, value="user"))
+    assert cer.find_avps((constants.AVP_USER_NAME, 0))[0].value == "user"
+    index = cer._avp_index
+    assert cer.find_avps((constants.AVP_ORIGIN_HOST, 0))[0].value == (
+        b"dra1.mvno.net")
+    assert cer._avp_index is index
+    cer.avps = [Avp.new(constants.AVP_USER_NAME, value="other")]
+    assert [a.value for a in cer.find_avps((constants.AVP_USER_NAME, 0))] == [
+        "other"]
+
+
 def test_create_new_plain_defaults():
     msg = Message()
     assert msg.header.version == 1
@@ -200,3 +316,568 @@ def test_answer_from_request():
     assert ans.header.hop_by_hop_identifier == req.header.hop_by_hop_identifier
     assert ans.header.end_to_end_identifier == req.header.end_to_end_identifier
     assert ans.header.is_proxyable == req.header.is_proxyable
+
+
+def test_answer_from_decoded_request():
+    ccr = CreditControlRequest()
+    ccr.session_id = "sess;1"
+    req = Message.from_bytes(ccr.as_bytes())
+
+    assert isinstance(req, CreditControlRequest)
+    assert all_commands.message_types[(272, True)] is CreditControlRequest
+    assert isinstance(req.to_answer(), CreditControlAnswer)
+    # answers and plain command instances answer with their own class
+    assert req.to_answer().to_answer().__class__ is CreditControlAnswer
+    plain = Message.from_bytes(ccr.as_bytes(), plain_msg=True)
+    assert plain.to_answer().__class__ is plain.__class__
+
+
+def test_copy_message():
+    ccr = CreditControlRequest()
+    ccr.session_id = "sess;1"
+    ccr.route_record = [b"dra1.mno.net"]
+    ccr.add_multiple_services_credit_control(
+        rating_group=100, used_service_unit=UsedServiceUnit(cc_total_octets=1))
+    ccr_bytes = ccr.as_bytes()
+
+    shallow = ccr.copy()
+    assert shallow.header is not ccr.header
+    shallow.header.hop_by_hop_identifier = 99
+    shallow.route_record.append(b"dra2.mno.net")
+    assert ccr.route_record == [b"dra1.mno.net"]
+    assert (shallow.multiple_services_credit_control[0] is
+            ccr.multiple_services_credit_control[0])
+
+    deep = ccr.copy(deep=True)
+    mscc = deep.multiple_services_credit_control[0]
+    mscc.used_service_unit[0].cc_total_octets = 2
+    mscc.rating_group = 200
+    ccr.invalidate()
+    assert ccr.as_bytes() == ccr_bytes
+
+    # received messages are copied without decoding their attributes
+    received = Message.from_bytes(ccr_bytes)
+    copy = received.copy(deep=True)
+    assert "session_id" not in copy.__dict__
+    assert "multiple_services_credit_control" not in copy.__dict__
+    copy.route_record.append(b"dra2.mno.net")
+    assert received.route_record == [b"dra1.mno.net"]
+    assert copy.route_record == [b"dra1.mno.net", b"dra2.mno.net"]
+    assert received.copy().as_bytes() == ccr_bytes
+
+    undefined = Message.from_bytes(ccr_bytes, plain_msg=True).copy(deep=True)
+    assert undefined.as_bytes() == ccr_bytes
+
+
+def test_encode_after_changes():
+    ccr = CreditControlRequest()
+    ccr.session_id = "sess;1"
+    ccr.route_record = [b"dra1.mno.net"]
+    ccr.add_multiple_services_credit_control(
+        rating_group=100, used_service_unit=UsedServiceUnit(cc_total_octets=1))
+    ccr_bytes = ccr.as_bytes()
+
+    # received attributes that are not accessed are encoded as received,
+    # without being decoded
+    received = Message.from_bytes(ccr_bytes)
+    received.header.is_retransmit = True
+    assert received.as_bytes()[20:] == ccr_bytes[20:]
+    received.header.is_retransmit = False
+    assert "multiple_services_credit_control" not in received.__dict__
+    received.route_record.append(b"dra2.mno.net")
+    # a value changed in place is noticed only once the message is told,
+    # unless the attribute had not been decoded yet
+    ccr.route_record.append(b"dra2.mno.net")
+    ccr.invalidate()
+    assert received.as_bytes() == ccr.as_bytes()
+    assert "multiple_services_credit_control" not in received.__dict__
+
+    # changes made to received AVPs that have not been decoded are included
+    used_service_unit = received.find_avps(
+        (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        (constants.AVP_USED_SERVICE_UNIT, 0))[0]
+    used_service_unit.value[0].value = 2
+    ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = 2
+    ccr.invalidate()
+    assert received.as_bytes() == ccr.as_bytes()
+
+    # messages of AVPs re-use their packed AVPs until an AVP changes
+    plain = Message.from_bytes(ccr.as_bytes(), plain_msg=True)
+    plain_bytes = plain.as_bytes()
+    assert plain.as_bytes() == plain_bytes
+    plain.find_avps(
+        (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        (constants.AVP_USED_SERVICE_UNIT, 0),
+        (constants.AVP_CC_TOTAL_OCTETS, 0))[0].value = 3
+    ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = 3
+    ccr.invalidate()
+    assert plain.as_bytes() == ccr.as_bytes()
+
+
+def test_encode_unchanged_not_packed_again():
+    ccr = CreditControlRequest()
+    ccr.session_id = "sess;1"
+    ccr.add_multiple_services_credit_control(
+        rating_group=100, used_service_unit=UsedServiceUnit(cc_total_octets=1))
+    plain = Message.from_bytes(ccr.as_bytes(), plain_msg=True)
+    used_service_unit = plain.find_avps(
+        (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        (constants.AVP_USED_SERVICE_UNIT, 0))[0]
+
+    plain.as_bytes()
+    packed_avps = plain._packed_avps
+    plain.as_bytes()
+    assert plain._packed_avps is packed_avps
+
+    # a change to a sub-AVP that was decoded after the message was encoded
+    # marks the message as changed
+    used_service_unit.value[0].value = 2
+    ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = 2
+    ccr.invalidate()
+    assert plain.as_bytes() == ccr.as_bytes()
+    assert plain._packed_avps is not packed_avps
+
+    # AVPs shared by two messages keep both of them up to date
+    copy = plain.copy()
+    copy.as_bytes()
+    used_service_unit.value[0].value = 3
+    ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = 3
+    ccr.invalidate()
+    assert plain.as_bytes() == copy.as_bytes() == ccr.as_bytes()
+
+
+def test_encode_defined_unchanged_not_packed_again(monkeypatch):
+    calls = []
+    generator_pack = _base.pack_avps_from_defs
+
+    def pack_avps_from_defs(*args, **kwargs):
+        calls.append(args[0])
+        return generator_pack(*args, **kwargs)
+
+    monkeypatch.setattr(_base, "pack_avps_from_defs", pack_avps_from_defs)
+
+    ccr = CreditControlRequest()
+    ccr.session_id = "sess;1"
+    ccr.add_multiple_services_credit_control(
+        rating_group=100, used_service_unit=UsedServiceUnit(cc_total_octets=1))
+    ccr_bytes = ccr.as_bytes()
+    ccr.header.is_retransmit = True
+    assert ccr.as_bytes()[20:] == ccr_bytes[20:]
+    assert calls == [ccr]
+
+    # setting an attribute, adding a custom AVP or changing one packs the
+    # message again; a value changed in place only once the message is told
+    ccr.cc_request_number = 1
+    ccr.as_bytes()
+    assert len(calls) == 2
+    custom = Avp.new(constants.AVP_ROUTE_RECORD, value=b"dra1.mno.net")
+    ccr.append_avp(custom)
+    ccr.as_bytes()
+    custom.value = b"dra2.mno.net"
+    assert ccr.as_bytes().endswith(b"dra2.mno.net")
+    ccr.multiple_services_credit_control[0].rating_group = 200
+    ccr.as_bytes()
+    assert len(calls) == 4
+    ccr.invalidate()
+    expected = ccr.copy()
+    assert ccr.as_bytes() == expected.as_bytes()
+    assert len(calls) == 6
+
+    # received AVPs that are packed as they are mark the message as changed
+    received = Message.from_bytes(ccr.as_bytes())
+    received.as_bytes()
+    received.find_avps(
+        (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+        (constants.AVP_USED_SERVICE_UNIT, 0),
+        (constants.AVP_CC_TOTAL_OCTETS, 0))[0].value = 2
+    ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = 2
+    ccr.invalidate()
+    assert received.as_bytes() == ccr.as_bytes()
+
+
+class _Probe(DefinedMessage):
+    code: int = 9990
+    name: str = "Probe"
+
+    def __post_init__(self):
+        self.header.command_code = self.code
+        super().__post_init__()
+
+
+class _ProbeQuery(_Probe, is_request=True):
+    pass
+
+
+class _ProbeReply(_Probe, is_request=False):
+    pass
+
+
+class _LegacyProbe(DefinedMessage):
+    code: int = 9990
+    name: str = "Legacy-Probe"
+
+    def __post_init__(self):
+        self.header.command_code = self.code
+        super().__post_init__()
+
+    @classmethod
+    def type_factory(cls, header: MessageHeader):
+        if header.is_request:
+            return _ProbeQuery
+        return None
+
+
+def test_dispatch_custom_command():
+    req = _ProbeQuery()
+    req.header.is_request = True
+    ans = req.to_answer()
+    assert ans.__class__ is _ProbeReply
+    ans.header.is_request = False
+
+    register(_Probe)
+    try:
+        assert Message.from_bytes(req.as_bytes()).__class__ is _ProbeQuery
+        assert Message.from_bytes(ans.as_bytes()).__class__ is _ProbeReply
+        assert (9990, False) in all_commands.message_types
+
+        # registering another command forgets the resolved classes, and a
+        # command with its own type factory is asked for every message
+        register(_LegacyProbe)
+        assert (9990, False) not in all_commands.message_types
+        assert Message.from_bytes(req.as_bytes()).__class__ is _ProbeQuery
+        assert Message.from_bytes(ans.as_bytes()).__class__ is _LegacyProbe
+        assert (9990, True) not in all_commands.message_types
+    finally:
+        del all_commands[9990]
+    assert Message.from_bytes(req.as_bytes()).__class__ is UndefinedMessage
+
+
+class Special(DefinedMessage):
+    code: int = 9991
+    name: str = "Special"
+
+
+class SpecialRequest(Special):
+    pass
+
+
+class SpecialAnswer(Special):
+    pass
+
+
+class Lonely(DefinedMessage):
+    code: int = 9992
+    name: str = "Lonely"
+
+
+class LonelyRequest(Lonely):
+    pass
+
+
+class OrphanRequest(Message):
+    pass
+
+
+def test_answer_from_unregistered_custom_command():
+    # commands that do not declare their request and answer classes find
+    # their answer class by name
+    assert SpecialRequest().to_answer().__class__ is SpecialAnswer
+    assert SpecialAnswer().to_answer().__class__ is SpecialAnswer
+    # and never answer with a request class
+    assert LonelyRequest().to_answer().__class__ is Lonely
+    assert OrphanRequest().to_answer().__class__ is Message
+
+
+def test_decode_from_bytes_zero_copy():
+    msg = Message()
+    msg.header.command_code = 280
+    msg.avps = [
+        Avp.new(constants.AVP_ORIGIN_HOST, value=b"dra2.gy.mvno.net"),
+        Avp.new(constants.AVP_TGPP_SERVICE_INFORMATION, constants.VENDOR_TGPP, value=[
+            Avp.new(constants.AVP_TGPP_PS_INFORMATION, constants.VENDOR_TGPP, value=[
+                Avp.new(constants.AVP_CALLED_STATION_ID, value="internet" * 20),
+                Avp.new(constants.AVP_TGPP_3GPP_NSAPI, constants.VENDOR_TGPP, value=b"5"),
+            ])
+        ])
+    ]
+    msg_bytes = msg.as_bytes()
+
+    msg = Message.from_bytes(msg_bytes, plain_msg=True, zero_copy=True)
+    service_information = msg.avps[1]
+    ps_information = service_information.value[0]
+    called_station_id, nsapi = ps_information.value
+
+    # large payloads are views into the original buffer, short ones copies
+    assert isinstance(service_information._payload, memoryview)
+    assert isinstance(ps_information._payload, memoryview)
+    assert isinstance(called_station_id._payload, memoryview)
+    assert isinstance(nsapi._payload, bytes)
+    assert called_station_id._payload.obj is msg_bytes
+
+    assert msg.as_bytes() == msg_bytes
+    assert called_station_id.value == "internet" * 20
+    assert nsapi.value == b"5"
+
+    # reading a payload turns it into bytes
+    assert isinstance(ps_information.payload, bytes)
+    assert isinstance(ps_information._payload, bytes)
+
+
+def test_decode_from_bytes_zero_copy_to_command():
+    msg = Message.from_bytes(bytes.fromhex(ulr), zero_copy=True)
+    reference = Message.from_bytes(bytes.fromhex(ulr))
+
+    assert msg.session_id == reference.session_id
+    assert msg.supported_features == reference.supported_features
+    assert msg.as_bytes() == reference.as_bytes()
+
+
+def test_decode_attributes_lazily():
+    msg = Message.from_bytes(bytes.fromhex(ulr))
+
+    # nothing has been decoded yet
+    assert "session_id" not in vars(msg)
+    assert "supported_features" not in vars(msg)
+
+    assert msg.session_id == ("ix1cmm212.epc.mnc003.mcc228.3gppnetwork.org;"
+                              "02472683;449d027e;13a0091b")
+    assert "session_id" in vars(msg)
+    assert "supported_features" not in vars(msg)
+
+    # lists are still lists, even when decoded on access
+    assert len(msg.supported_features) == 2
+    assert msg.supported_features[1].feature_list_id == 2
+    assert len(msg.route_record) == 2
+
+    # defined but not received
+    assert msg.sgsn_number is None
+
+
+def test_decode_attributes_lazily_overwritten():
+    msg = Message.from_bytes(bytes.fromhex(ulr))
+    msg.session_id = "overwritten;1"
+    msg_bytes = msg.as_bytes()
+
+    new_msg = Message.from_bytes(msg_bytes)
+    assert new_msg.session_id == "overwritten;1"
+    assert new_msg.supported_features == msg.supported_features
+
+
+def test_decode_undefined_attributes_lazily():
+    msg_bytes = bytes.fromhex(
+        "01000028c00003e70000000000000000000000000000010740000014686f73742e"
+        "7265616c6d3b31")
+    msg = Message.from_bytes(msg_bytes)
+
+    assert "session_id" not in vars(msg)
+    assert msg.session_id == "host.realm;1"
+    with pytest.raises(AttributeError):
+        _ = msg.origin_host
+
+
+def test_decode_plan_compiled_once_per_class():
+    msg = Message.from_bytes(bytes.fromhex(ulr))
+    plan = get_decode_plan(msg)
+    assert get_decode_plan(Message.from_bytes(bytes.fromhex(ulr))) is plan
+
+    step = plan.steps[(constants.AVP_TGPP_SUPPORTED_FEATURES,
+                       constants.VENDOR_TGPP)]
+    assert step.attr_name == "supported_features"
+    assert step.type_class is SupportedFeatures
+    assert step.is_list is True
+    assert plan.steps[(constants.AVP_SESSION_ID, 0)].is_list is False
+    assert plan.additional_avps_attr == "_additional_avps"
+
+    grouped_plan = get_decode_plan(MultipleServicesCreditControl())
+    assert grouped_plan.additional_avps_attr == "additional_avps"
+    assert grouped_plan.steps[(constants.AVP_SERVICE_IDENTIFIER, 0)].is_list
+    assert not grouped_plan.steps[(constants.AVP_RATING_GROUP, 0)].is_list
+
+
+def test_decode_plan_unknown_avps():
+    avps = [
+        Avp(constants.AVP_VENDOR_ID, constants.VENDOR_TGPP, b"\0\0\0\1"),
+        Avp.new(constants.AVP_TGPP_FEATURE_LIST_ID, constants.VENDOR_TGPP, value=2),
+        Avp.new(constants.AVP_TGPP_FEATURE_LIST, constants.VENDOR_TGPP, value=3),
+        Avp.new(constants.AVP_USER_NAME, value="user")]
+    supported_features = SupportedFeatures()
+    assign_attr_from_defs(supported_features, avps)
+
+    assert supported_features.feature_list_id == 2
+    assert supported_features.feature_list == 3
+    # vendor ID is defined without a vendor, so the vendor-specific AVP with
+    # the same code is an unknown AVP
+    assert supported_features.vendor_id is None
+    assert supported_features.additional_avps == [avps[0], avps[3]]
+
+
+def test_grouped_lazy_lists():
+    mscc = MultipleServicesCreditControl(rating_group=1)
+    assert not hasattr(mscc, "__dict__")
+    assert mscc.rating_group == 1
+    # list attributes are allocated on first access, and then kept
+    assert mscc.used_service_unit == []
+    mscc.used_service_unit.append(UsedServiceUnit(cc_total_octets=10))
+    assert mscc.used_service_unit[0].cc_total_octets == 10
+    assert mscc == MultipleServicesCreditControl(
+        rating_group=1,
+        used_service_unit=[UsedServiceUnit(cc_total_octets=10)])
+    with pytest.raises(AttributeError):
+        getattr(mscc, "no_such_attribute")
+
+    assert get_decode_plan(mscc).steps[
+        (constants.AVP_USED_SERVICE_UNIT, 0)].is_list
+
+
+def test_encode_plan_matches_object_path():
+    msg = Message.from_bytes(bytes.fromhex(ulr))
+    msg.append_avp(Avp.new(constants.AVP_USER_NAME, value="user"))
+
+    object_avps = generate_avps_from_defs(msg) + msg._additional_avps
+    assert [a.as_bytes() for a in msg.avps] == [
+        a.as_bytes() for a in object_avps]
+    assert [a.name for a in msg.avps] == [a.name for a in object_avps]
+    assert msg.as_bytes()[20:] == b"".join(a.as_bytes() for a in object_avps)
+
+
+def test_encode_plan_avps_from_attributes():
+    msg = UpdateLocationAnswer()
+    msg.session_id = "hss1.epc.python-diameter.org;1;2;3"
+    msg.supported_features = [SupportedFeatures(
+        vendor_id=constants.VENDOR_TGPP, feature_list_id=1, feature_list=3)]
+    msg.append_avp(Avp.new(constants.AVP_USER_NAME, value="user"))
+
+    avps = msg.avps
+    assert b"".join(a.as_bytes() for a in avps) == msg.as_bytes()[20:]
+    assert [a.name for a in avps] == [
+        "Session-Id", "Supported-Features", "User-Name"]
+    features = avps[1]
+    created = Avp.new(constants.AVP_TGPP_SUPPORTED_FEATURES,
+                      constants.VENDOR_TGPP)
+    assert features.flags == created.flags
+    assert [a.value for a in features.value] == [constants.VENDOR_TGPP, 1, 3]
+
+    # every read produces a new list
+    assert msg.avps is not avps
+    msg.session_id = "hss1.epc.python-diameter.org;1;2;4"
+    assert msg.avps[0].value == "hss1.epc.python-diameter.org;1;2;4"
+
+
+def test_encode_plan_invalid_value():
+    msg = CapabilitiesExchangeRequest()
+    msg.origin_host = b"dra1.mvno.net"
+    msg.origin_state_id = -1
+
+    with pytest.raises(AvpEncodeError, match="origin_state_id"):
+        msg.as_bytes()
+
+    msg.origin_state_id = 1
+    msg.origin_realm = "mvno.net"
+    with pytest.raises(AvpEncodeError, match="origin_realm"):
+        msg.as_bytes()
+
+
+def test_encode_plan_recompiled_on_register():
+    msg = CapabilitiesExchangeRequest()
+    msg.origin_state_id = 1
+    assert msg.avps[0].is_mandatory is True
+
+    original = avp_module.AVP_DICTIONARY[constants.AVP_ORIGIN_STATE_ID]
+    try:
+        avp_module.register(constants.AVP_ORIGIN_STATE_ID, "Origin-State-Id",
+                            AvpUnsigned32, mandatory=False)
+        assert msg.avps[0].is_mandatory is False
+    finally:
+        avp_module.AVP_DICTIONARY[constants.AVP_ORIGIN_STATE_ID] = original
+        clear_encode_plans()
+
+
+def test_encode_nested_grouped_lengths():
+    msg = UpdateLocationAnswer()
+    msg.session_id = "hss1.epc.python-diameter.org;1;2;3"
+    msg.subscription_data = SubscriptionData(
+        apn_configuration_profile=ApnConfigurationProfile(
+            context_identifier=1,
+            apn_configuration=[ApnConfiguration(
+                context_identifier=1,
+                service_selection="internet",
+                eps_subscribed_qos_profile=EpsSubscribedQosProfile(
+                    qos_class_identifier=9,
+                    allocation_retention_priority=AllocationRetentionPriority(
+                        priority_level=8)))]))
+    msg_bytes = msg.as_bytes()
+    assert len(msg_bytes) == msg.header.length
+
+    plain = Message.from_bytes(msg_bytes, plain_msg=True)
+    assert plain.as_bytes() == msg_bytes
+    subscription_data = plain.find_avps(
+        (constants.AVP_TGPP_SUBSCRIPTION_DATA, constants.VENDOR_TGPP))[0]
+    qos_profile = plain.find_avps(
+        (constants.AVP_TGPP_SUBSCRIPTION_DATA, constants.VENDOR_TGPP),
+        (constants.AVP_TGPP_APN_CONFIGURATION_PROFILE, constants.VENDOR_TGPP),
+        (constants.AVP_TGPP_APN_CONFIGURATION, constants.VENDOR_TGPP),
+        (constants.AVP_TGPP_EPS_SUBSCRIBED_QOS_PROFILE, constants.VENDOR_TGPP))[0]
+    assert subscription_data.length == 12 + len(subscription_data.payload)
+    assert qos_profile.value[0].value == 9
+    assert qos_profile.value[1].value[0].value == 8
+
+
+def test_peek_avps():
+    header, values = peek_avps(
+        bytes.fromhex(ulr),
+        (constants.AVP_SESSION_ID, 0),
+        (constants.AVP_DESTINATION_REALM, 0),
+        (constants.AVP_TGPP_SUPPORTED_FEATURES, constants.VENDOR_TGPP),
+        (constants.AVP_RESULT_CODE, 0))
+
+    assert header.command_code == constants.CMD_3GPP_UPDATE_LOCATION
+    assert header.is_request is True
+    assert values[(constants.AVP_SESSION_ID, 0)] == (
+        "ix1cmm212.epc.mnc003.mcc228.3gppnetwork.org;02472683;449d027e;13a0091b")
+    assert values[(constants.AVP_DESTINATION_REALM, 0)] == (
+        b"epc.mnc065.mcc228.3gppnetwork.org")
+    # only the first occurrence is returned, grouped AVPs as AVP lists
+    features = values[
+        (constants.AVP_TGPP_SUPPORTED_FEATURES, constants.VENDOR_TGPP)]
+    assert features[1].value == 1
+    assert (constants.AVP_RESULT_CODE, 0) not in values
+
+
+def test_peek_avps_invalid():
+    msg_bytes = bytearray.fromhex(ulr)
+    # zero length for the first AVP
+    msg_bytes[25:28] = b"\0\0\0"
+    with pytest.raises(ConversionError):
+        peek_avps(bytes(msg_bytes), (constants.AVP_ORIGIN_HOST, 0))
+
+    with pytest.raises(ConversionError):
+        peek_avps(bytes.fromhex(ulr)[:10], (constants.AVP_ORIGIN_HOST, 0))
+
+
+_LAZY_LOADING_SCRIPT = """
+import sys
+from diameter.message import Message
+from diameter.message.avp import grouped
+from diameter.message.commands import all_commands
+
+module = "diameter.message.commands.credit_control"
+assert module not in sys.modules
+assert "ServiceInformation" not in vars(grouped)
+assert 272 in all_commands
+assert module not in sys.modules
+
+msg = Message.from_bytes(bytes.fromhex(sys.argv[1]))
+assert msg.__class__.__name__ == "CreditControlRequest"
+assert module in sys.modules
+assert "ServiceInformation" in vars(grouped)
+"""
+
+
+def test_commands_loaded_on_first_use():
+    # command modules and grouped AVP classes are not loaded at import, run
+    # in a new interpreter, as every other test has already loaded them
+    ccr = CreditControlRequest()
+    ccr.session_id = "sess;1"
+    subprocess.run(
+        [sys.executable, "-c", _LAZY_LOADING_SCRIPT, ccr.as_bytes().hex()],
+        check=True)
@@ -0,0 +1,215 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import asyncio
+import functools
+import socket
+import threading
+
+from diameter.message import constants
+from diameter.message.avp import Avp
+from diameter.message.commands import (CreditControlRequest,
+                                       DeviceWatchdogRequest)
+from diameter.node import AsyncNode, Node
+from diameter.node._helpers import WorkerPool
+from diameter.node.application import (AsyncApplication,
+                                       SimpleThreadingApplication)
+from diameter.node.peer import (DISCONNECT_REASON_CLEAN_DISCONNECT,
+                                DISCONNECT_REASON_DPR, PEER_READY, PEER_RECV,
+                                PeerConnection)
+
+
+class CreditControlServer(AsyncApplication):
+    async def handle_request(self, message):
+        if message.cc_request_number == 0:
+            raise ValueError("no handling for initial requests")
+        return self.generate_answer(
+            message, result_code=constants.E_RESULT_CODE_DIAMETER_SUCCESS)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _ccr(node: AsyncNode, request_number: int) -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.session_id = node.session_generator.next_id()
+    ccr.origin_host = node.origin_host.encode()
+    ccr.origin_realm = node.realm_name.encode()
+    ccr.destination_realm = b"realm.net"
+    ccr.auth_application_id = constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = request_number
+    return ccr
+
+
+async def _async_node_exchange():
+    port = _free_port()
+    server = AsyncNode("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                       tcp_port=port)
+    server_peer = server.add_peer("aaa://client.gy", "realm.net")
+    server_app = CreditControlServer(
+        constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION,
+        is_auth_application=True)
+    server.add_application(server_app, [server_peer])
+
+    client = AsyncNode("client.gy", "realm.net")
+    client_peer = client.add_peer(f"aaa://server.gy:{port}", "realm.net",
+                                  ["127.0.0.1"], is_persistent=True)
+    client_app = AsyncApplication(
+        constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION,
+        is_auth_application=True)
+    client.add_application(client_app, [client_peer])
+
+    await server.start()
+    await client.start()
+    await client_app.wait_for_ready(5)
+
+    answers = await asyncio.gather(
+        *(client_app.send_request(_ccr(client, i), timeout=5)
+          for i in range(1, 51)))
+    failed = await client_app.send_request(_ccr(client, 0), timeout=5)
+
+    await client.stop(wait_timeout=5)
+    await server.stop(wait_timeout=5)
+    return answers, failed, client_peer, server_peer, server
+
+
+def test_async_node_exchange():
+    answers, failed, client_peer, server_peer, server = asyncio.run(
+        _async_node_exchange())
+
+    assert len({a.header.hop_by_hop_identifier for a in answers}) == 50
+    assert {a.result_code for a in answers} == {
+        constants.E_RESULT_CODE_DIAMETER_SUCCESS}
+    assert failed.result_code == (
+        constants.E_RESULT_CODE_DIAMETER_UNABLE_TO_COMPLY)
+
+    # CER/CEA and DPR/DPA were exchanged, both sides disconnected cleanly
+    assert server_peer.last_connect is not None
+    assert server_peer.counters.dpr == 1
+    assert client_peer.disconnect_reason == DISCONNECT_REASON_CLEAN_DISCONNECT
+    assert server_peer.disconnect_reason == DISCONNECT_REASON_DPR
+    assert not server.connections
+
+
+def test_node_exchange():
+    port = _free_port()
+    server = Node("server.gy", "realm.net", ip_addresses=["127.0.0.1"],
+                  tcp_port=port)
+    server_peer = server.add_peer("aaa://client.gy", "realm.net")
+    server_app = SimpleThreadingApplication(
+        constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION,
+        is_auth_application=True,
+        request_handler=lambda app, message: app.generate_answer(
+            message, result_code=constants.E_RESULT_CODE_DIAMETER_SUCCESS))
+    server.add_application(server_app, [server_peer])
+
+    client = Node("client.gy", "realm.net")
+    client_peer = client.add_peer(f"aaa://server.gy:{port}", "realm.net",
+                                  ["127.0.0.1"], is_persistent=True)
+    client_app = SimpleThreadingApplication(
+        constants.APP_DIAMETER_CREDIT_CONTROL_APPLICATION,
+        is_auth_application=True)
+    client.add_application(client_app, [client_peer])
+
+    for node in (server, client):
+        node.wakeup_interval = 1
+        node.start()
+    client_app.wait_for_ready(5)
+
+    answers = [client_app.send_request(_ccr(client, i), timeout=5)
+               for i in range(1, 21)]
+
+    client.stop(wait_timeout=5)
+    server.stop(wait_timeout=5)
+
+    assert {a.result_code for a in answers} == {
+        constants.E_RESULT_CODE_DIAMETER_SUCCESS}
+    assert client_peer.disconnect_reason == DISCONNECT_REASON_CLEAN_DISCONNECT
+    assert server_peer.disconnect_reason == DISCONNECT_REASON_DPR
+    assert not server.connections
+
+
+def test_peer_connection_framing():
+    messages = []
+    for i in range(1, 51):
+        dwr = DeviceWatchdogRequest()
+        dwr.header.hop_by_hop_identifier = i
+        dwr.origin_host = b"peer.gy"
+        dwr.origin_realm = b"realm.net"
+        if i % 10 == 0:
+            # larger than the initial read buffer
+            dwr.append_avp(Avp.new(constants.AVP_CLASS, value=b"x" * 70000))
+        messages.append(dwr.as_bytes())
+    stream = b"".join(messages)
+
+    received = []
+    conn = PeerConnection("127.0.0.1", 3868, PEER_RECV, -1)
+    conn.state = PEER_READY
+    conn.message_handler = lambda c, m: received.append(m)
+
+    pos = 0
+    for chunk_len in (7, 13, 2048, 19, 20, 1, 65536, 4000) * 100:
+        if pos >= len(stream):
+            break
+        in_buffer = conn.in_buffer()
+        chunk = stream[pos:pos + min(chunk_len, len(in_buffer))]
+        in_buffer[:len(chunk)] = chunk
+        conn.commit_in_bytes(len(chunk))
+        pos += len(chunk)
+    conn.add_in_bytes(stream[:20])
+    conn.close(signal_node=False)
+
+    assert pos == len(stream)
+    assert [m.header.hop_by_hop_identifier for m in received] == list(
+        range(1, 51))
+    assert [m.as_bytes() for m in received] == messages
+    # the incomplete header remains buffered
+    assert conn._read_end - conn._read_start == 20
+
+
+def test_peer_connection_partial_writes():
+    conn = PeerConnection("127.0.0.1", 3868, PEER_RECV, -1)
+    conn.close(signal_node=False)
+    conn._write_buffers.extend([b"a" * 30, b"b" * 20, b"c" * 10])
+
+    assert conn.remove_out_bytes(25) == 0
+    buffers = conn.out_buffers()
+    assert [bytes(b) for b in buffers] == [b"a" * 5, b"b" * 20, b"c" * 10]
+    assert isinstance(buffers[0], memoryview)
+    assert len(conn.out_buffers(2)) == 2
+
+    assert conn.remove_out_bytes(30) == 2
+    assert conn.write_buffer == b"c" * 5
+    assert conn.remove_out_bytes(5) == 1
+    assert not conn.has_out_bytes
+    assert conn.sent_messages == 3
+
+
+def test_worker_pool_ordering():
+    pool = WorkerPool(4)
+    pool.start()
+    results = {key: [] for key in range(20)}
+    done = threading.Event()
+
+    def work(key: int, value: int):
+        results[key].append(value)
+        if sum(len(r) for r in results.values()) == 20 * 200:
+            done.set()
+
+    # every key is its own callable, as every connection has its own
+    # bound methods
+    funcs = [functools.partial(work, key) for key in range(20)]
+    for value in range(200):
+        for func in funcs:
+            pool.submit(func, value)
+
+    assert done.wait(10)
+    pool.stop(2)
+    assert all(r == list(range(200)) for r in results.values())
+    assert not any(t.is_alive() for t in pool._threads)
@@ -0,0 +1,72 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import pytest
+
+from diameter.message import Message
+from diameter.message.packer import ConversionError, Packer, Unpacker
+from diameter.message.packer import RawPacker, RawUnpacker
+
+
+def test_pack_unpack_values():
+    packer = Packer()
+    packer.pack_uint(0xffffffff)
+    packer.pack_int(-2)
+    packer.pack_uhyper(0x0102030405060708)
+    packer.pack_hyper(-1)
+    packer.pack_double(1.5)
+    packer.pack_fopaque(5, b"abcde")
+    packer.pack_string(b"xyz")
+
+    unpacker = Unpacker(packer.get_buffer())
+    assert unpacker.unpack_uint() == 0xffffffff
+    assert unpacker.unpack_int() == -2
+    assert unpacker.unpack_uhyper() == 0x0102030405060708
+    assert unpacker.unpack_hyper() == -1
+    assert unpacker.unpack_double() == 1.5
+    assert unpacker.unpack_fopaque(5) == b"abcde"
+    assert unpacker.unpack_string() == b"xyz"
+    assert unpacker.is_done()
+
+
+def test_pack_padded():
+    packer = RawPacker()
+    packer.pack_padded(b"abcde")
+    assert packer.get_buffer() == b"abcde\0\0\0"
+    assert packer.get_position() == 8
+
+
+def test_pack_uint_at():
+    packer = RawPacker()
+    packer.pack_uint(0)
+    packer.pack_uint(7)
+    packer.pack_uint_at(0, 42)
+
+    unpacker = RawUnpacker(packer.get_buffer())
+    assert unpacker.unpack_uint() == 42
+    assert unpacker.unpack_uint() == 7
+
+
+def test_error_conversion():
+    with pytest.raises(ConversionError):
+        Packer().pack_uint(-1)
+
+    with pytest.raises(ConversionError):
+        Unpacker(b"\0\0").unpack_uint()
+
+    with pytest.raises(ConversionError):
+        Unpacker(b"\0\0\0\0").unpack_fopaque(8)
+
+
+def test_error_raw_not_converted():
+    with pytest.raises(EOFError):
+        RawUnpacker(b"\0\0\0\0").unpack_fopaque(8)
+
+
+def test_error_message_boundary():
+    msg_bytes = bytes.fromhex(
+        "01000028c00003e70000000000000000000000000000010740000014686f73742e"
+        "7265616c6d3b31")
+    with pytest.raises(ConversionError):
+        Message.from_bytes(msg_bytes[:-6])
@@ -0,0 +1,151 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import ipaddress
+import struct
+
+import pytest
+
+from diameter.message import constants
+from diameter.message.commands import (CapabilitiesExchangeRequest,
+                                       CreditControlRequest,
+                                       DeviceWatchdogRequest)
+from diameter.pcap import Flow, read_pcap
+
+
+def _tcp(src: str, dst: str, sport: int, dport: int, seq: int,
+         payload: bytes = b"", flags: int = 0x18) -> bytes:
+    tcp = struct.pack(">HHLLBBHHH", sport, dport, seq, 0, 5 << 4, flags,
+                      65535, 0, 0) + payload
+    src_ip = ipaddress.ip_address(src)
+    dst_ip = ipaddress.ip_address(dst)
+    if src_ip.version == 4:
+        ip = struct.pack(">BBHHHBBH4s4s", 0x45, 0, 20 + len(tcp), 0, 0x4000,
+                         64, 6, 0, src_ip.packed, dst_ip.packed)
+        ethertype = 0x0800
+    else:
+        ip = struct.pack(">LHBB16s16s", 6 << 28, len(tcp), 6, 64,
+                         src_ip.packed, dst_ip.packed)
+        ethertype = 0x86dd
+    return b"\0" * 12 + struct.pack(">H", ethertype) + ip + tcp
+
+
+def _pcap(packets: list[bytes]) -> bytes:
+    data = struct.pack("<LHHlLLL", 0xa1b2c3d4, 2, 4, 0, 0, 65535, 1)
+    for number, packet in enumerate(packets):
+        data += struct.pack("<4L", 1700000000 + number, 500000,
+                            len(packet), len(packet)) + packet
+    return data
+
+
+def _pcapng(packets: list[bytes]) -> bytes:
+    def block(block_type: int, body: bytes) -> bytes:
+        body += b"\0" * (-len(body) % 4)
+        length = 12 + len(body)
+        return struct.pack("<LL", block_type, length) + body + struct.pack(
+            "<L", length)
+
+    data = block(0x0a0d0d0a, struct.pack("<LHHq", 0x1a2b3c4d, 1, 0, -1))
+    # if_tsresol of 10^-3
+    data += block(1, struct.pack("<HHL", 1, 0, 65535) +
+                  struct.pack("<HHB3x", 9, 1, 3) + struct.pack("<HH", 0, 0))
+    for number, packet in enumerate(packets):
+        ts = (1700000000 + number) * 1000
+        data += block(6, struct.pack(
+            "<5L", 0, ts >> 32, ts & 0xffffffff, len(packet), len(packet)
+        ) + packet)
+    return data
+
+
+def _messages() -> list[bytes]:
+    cer = CapabilitiesExchangeRequest()
+    cer.origin_host = b"client.example.com"
+    cer.origin_realm = b"example.com"
+    cer.host_ip_address = "10.0.0.1"
+    cer.vendor_id = 99999
+    cer.product_name = "test"
+
+    ccr = CreditControlRequest()
+    ccr.session_id = "client.example.com;1;1"
+    ccr.origin_host = b"client.example.com"
+    ccr.origin_realm = b"example.com"
+    ccr.destination_realm = b"example.com"
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_INITIAL_REQUEST
+    ccr.cc_request_number = 0
+
+    dwr = DeviceWatchdogRequest()
+    dwr.origin_host = b"client.example.com"
+    dwr.origin_realm = b"example.com"
+
+    return [cer.as_bytes(), ccr.as_bytes(), dwr.as_bytes()]
+
+
+def _client_packets(src: str, dst: str) -> list[bytes]:
+    cer, ccr, dwr = _messages()
+    stream = cer + ccr + dwr
+    seq = 1000
+    packets = [_tcp(src, dst, 40000, 3868, seq, flags=0x02)]
+    seq += 1
+    # CER and first half of CCR, the rest of CCR, and DWR delivered out of
+    # order, then retransmitted
+    cut = len(cer) + len(ccr) // 2
+    first = _tcp(src, dst, 40000, 3868, seq, stream[:cut])
+    second = _tcp(src, dst, 40000, 3868, seq + cut,
+                  stream[cut:len(cer) + len(ccr)])
+    third = _tcp(src, dst, 40000, 3868, seq + len(cer) + len(ccr), dwr)
+    packets += [first, third, second, third]
+    return packets
+
+
+@pytest.mark.parametrize("writer, src, dst", [
+    (_pcap, "10.0.0.1", "10.0.0.2"),
+    (_pcapng, "2001:db8::1", "2001:db8::2"),
+])
+def test_read_pcap(tmp_path, writer, src, dst):
+    capture = tmp_path / "capture"
+    capture.write_bytes(writer(_client_packets(src, dst)))
+
+    result = list(read_pcap(str(capture)))
+    assert [type(msg) for _, _, msg in result] == [
+        CapabilitiesExchangeRequest, CreditControlRequest,
+        DeviceWatchdogRequest]
+    assert result[0][1] == Flow(src, 40000, dst, 3868)
+    assert result[1][2].session_id == "client.example.com;1;1"
+    # CCR is completed by the fourth packet, with out-of-order DWR
+    assert result[1][0] == pytest.approx(1700000003)
+    assert result[2][0] == pytest.approx(1700000003)
+
+
+def test_read_pcap_filtered(tmp_path):
+    capture = tmp_path / "capture.pcap"
+    capture.write_bytes(_pcap(_client_packets("10.0.0.1", "10.0.0.2")))
+
+    result = list(read_pcap(
+        str(capture), decode=False,
+        command_codes={constants.CMD_CREDIT_CONTROL}))
+    assert len(result) == 1
+    assert result[0][2] == _messages()[1]
+
+
+def test_read_pcap_mid_stream(tmp_path):
+    cer, ccr, dwr = _messages()
+    # capture starts in the middle of the CER, with no SYN
+    packets = [
+        _tcp("10.0.0.1", "10.0.0.2", 40000, 3868, 5000, cer[30:]),
+        _tcp("10.0.0.1", "10.0.0.2", 40000, 3868, 5000 + len(cer) - 30,
+             ccr + dwr)]
+    capture = tmp_path / "capture.pcap"
+    capture.write_bytes(_pcap(packets))
+
+    result = list(read_pcap(str(capture)))
+    assert [type(msg) for _, _, msg in result] == [
+        CreditControlRequest, DeviceWatchdogRequest]
+
+
+def test_read_pcap_invalid(tmp_path):
+    capture = tmp_path / "capture.pcap"
+    capture.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        list(read_pcap(str(capture)))
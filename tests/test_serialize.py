@@ -0,0 +1,205 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import datetime
+import io
+import json
+
+import pytest
+
+from diameter.message import Message, constants
+from diameter.message.avp import Avp, AvpAddress
+from diameter.message.avp.grouped import (PsInformation, ServiceInformation,
+                                          UsedServiceUnit)
+from diameter.message.commands import (CreditControlRequest,
+                                       SipUserAuthorization)
+from diameter.message.serialize import (avp_from_dict, avp_to_dict,
+                                        dump_json, load_json, to_json)
+
+
+def _ccr() -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.header.hop_by_hop_identifier = 1
+    ccr.header.end_to_end_identifier = 2
+    ccr.session_id = "pgw.example.com;1;1"
+    ccr.origin_host = b"pgw.example.com"
+    ccr.origin_realm = b"example.com"
+    ccr.destination_realm = b"ocs.example.com"
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = 1
+    ccr.event_timestamp = datetime.datetime(2024, 3, 1, 12, 30, 5)
+    ccr.add_multiple_services_credit_control(
+        rating_group=100,
+        used_service_unit=UsedServiceUnit(cc_total_octets=1024),
+        avp=[Avp(9999, 10415, b"\x01\x02", Avp.avp_flag_private)])
+    ccr.service_information = ServiceInformation(
+        ps_information=PsInformation(
+            called_station_id="internet",
+            sgsn_address=["10.0.0.1", "2001:db8::1"]))
+    ccr.append_avp(Avp(9998, 0, b"unknown", Avp.avp_flag_mandatory))
+    return ccr
+
+
+def test_to_dict():
+    data = _ccr().to_dict()
+
+    assert data["name"] == "Credit-Control"
+    assert data["header"] == {
+        "version": 1, "flags": 0xc0, "command_code": 272,
+        "application_id": 0, "hop_by_hop_identifier": 1,
+        "end_to_end_identifier": 2}
+
+    attrs = data["attributes"]
+    assert attrs["session_id"] == "pgw.example.com;1;1"
+    assert attrs["origin_host"] == b"pgw.example.com".hex()
+    assert attrs["event_timestamp"] == datetime.datetime(
+        2024, 3, 1, 12, 30, 5).astimezone(datetime.timezone.utc).isoformat()
+    assert "user_name" not in attrs
+    assert "subscription_id" not in attrs
+
+    mscc = attrs["multiple_services_credit_control"]
+    assert mscc[0]["rating_group"] == 100
+    assert mscc[0]["used_service_unit"] == [{"cc_total_octets": 1024}]
+    assert mscc[0]["additional_avps"] == [
+        {"code": 9999, "flags": 0xa0, "vendor": 10415, "payload": "0102"}]
+
+    assert data["avps"] == [
+        {"code": 9998, "flags": 0x40, "payload": b"unknown".hex()}]
+
+    # output must be plain JSON
+    assert json.loads(to_json(_ccr())) == data
+
+
+def test_round_trip():
+    ccr = _ccr()
+    ccr_bytes = ccr.as_bytes()
+
+    msg = Message.from_dict(json.loads(to_json(ccr)))
+    assert isinstance(msg, CreditControlRequest)
+    assert msg.as_bytes() == ccr_bytes
+    assert msg.origin_host == b"pgw.example.com"
+    assert msg.event_timestamp.timestamp() == ccr.event_timestamp.timestamp()
+    assert msg.multiple_services_credit_control[0].additional_avps[0].flags == 0xa0
+
+    # received messages are converted from their AVPs, whether decoded or not
+    received = Message.from_bytes(ccr_bytes)
+    assert "attributes" not in received.to_dict()
+    assert Message.from_dict(received.to_dict()).as_bytes() == ccr_bytes
+    assert received.origin_host == b"pgw.example.com"
+    received.cc_request_number = 2
+    msg = Message.from_dict(received.to_dict())
+    assert isinstance(msg, CreditControlRequest)
+    assert msg.cc_request_number == 2
+    assert msg.as_bytes() == received.as_bytes()
+
+    # and plain messages from their AVPs
+    plain = Message.from_bytes(ccr_bytes, plain_msg=True)
+    data = plain.to_dict()
+    assert "attributes" not in data
+    assert len(data["avps"]) == len(plain.avps)
+    msg = Message.from_dict(data)
+    assert msg.__class__ is plain.__class__
+    assert msg.as_bytes() == ccr_bytes
+
+
+def test_round_trip_received_flags():
+    ccr_bytes = bytearray(_ccr().as_bytes())
+    # clear the M bit of Service-Context-Id
+    service_context_id = Avp.new(
+        constants.AVP_SERVICE_CONTEXT_ID,
+        value=constants.SERVICE_CONTEXT_PS_CHARGING).as_bytes()
+    position = ccr_bytes.index(service_context_id)
+    ccr_bytes[position + 4] &= ~Avp.avp_flag_mandatory
+    ccr_bytes = bytes(ccr_bytes)
+
+    received = Message.from_bytes(ccr_bytes)
+    data = json.loads(to_json(received))
+    assert {"code": constants.AVP_SERVICE_CONTEXT_ID, "flags": 0,
+            "value": constants.SERVICE_CONTEXT_PS_CHARGING} in data["avps"]
+
+    msg = Message.from_dict(data)
+    assert isinstance(msg, CreditControlRequest)
+    assert msg.as_bytes() == ccr_bytes
+    assert msg.service_context_id == constants.SERVICE_CONTEXT_PS_CHARGING
+    # the received AVPs are kept in their original order
+    assert [avp_to_dict(a) for a in msg._received_avps] == data["avps"]
+
+
+def test_round_trip_cleared_defaults():
+    ccr = _ccr()
+    ccr.auth_application_id = None
+    ccr_bytes = ccr.as_bytes()
+
+    assert Message.from_dict(ccr.to_dict()).as_bytes() == ccr_bytes
+
+
+def test_round_trip_undefined():
+    msg = SipUserAuthorization()
+    msg.header.is_request = True
+    msg.avps = [
+        Avp.new(constants.AVP_SESSION_ID, value="sess;1"),
+        Avp.new(constants.AVP_HOST_IP_ADDRESS, value="10.0.0.1"),
+        Avp.new(constants.AVP_PROXY_INFO, value=[
+            Avp.new(constants.AVP_PROXY_HOST, value=b"proxy"),
+            Avp.new(constants.AVP_PROXY_STATE, value=b"\x00")])]
+    msg_bytes = msg.as_bytes()
+
+    data = msg.to_dict()
+    assert data["avps"][1]["value"] == [1, "10.0.0.1"]
+    assert data["avps"][2]["value"][0] == {
+        "code": constants.AVP_PROXY_HOST, "flags": 0x40,
+        "value": b"proxy".hex()}
+
+    copy = Message.from_dict(data)
+    assert isinstance(copy, SipUserAuthorization)
+    assert copy.as_bytes() == msg_bytes
+
+
+def test_avp_round_trip():
+    avps = [
+        Avp.new(constants.AVP_SUBSCRIPTION_ID_DATA, value="485089163847"),
+        Avp.new(constants.AVP_CC_TOTAL_OCTETS, value=2 ** 63),
+        Avp.new(constants.AVP_TGPP_PDP_ADDRESS, constants.VENDOR_TGPP,
+                value="2001:db8::1"),
+        Avp.new(constants.AVP_EVENT_TIMESTAMP,
+                value=datetime.datetime(2036, 2, 7, 6, 28, 17)),
+        # an address family that the address type cannot set
+        AvpAddress(constants.AVP_HOST_IP_ADDRESS, payload=b"\x00\x05\xab"),
+        # a payload that does not decode as its type
+        Avp.new(constants.AVP_USER_NAME),
+    ]
+    avps[-1].payload = b"\xff\xfe"
+
+    for avp in avps:
+        copy = avp_from_dict(json.loads(json.dumps(avp_to_dict(avp))))
+        assert copy.__class__ is avp.__class__
+        assert copy.as_bytes() == avp.as_bytes()
+    assert "payload" in avp_to_dict(avps[-1])
+
+    assert avp_from_dict({"code": constants.AVP_SESSION_ID,
+                          "value": "sess"}).is_mandatory is True
+    with pytest.raises(ValueError):
+        avp_from_dict({"code": 9999, "value": 1})
+
+
+def test_from_dict_invalid_attribute():
+    data = _ccr().to_dict()
+    data["attributes"]["not_an_attribute"] = 1
+    with pytest.raises(ValueError):
+        Message.from_dict(data)
+
+
+def test_dump_and_load_json():
+    messages = [_ccr(), _ccr().to_answer()]
+    messages[1].session_id = "pgw.example.com;1;1"
+    messages[1].result_code = constants.E_RESULT_CODE_DIAMETER_SUCCESS
+
+    fp = io.StringIO()
+    dump_json(messages, fp)
+    assert fp.getvalue().count("\n") == 2
+
+    fp.seek(0)
+    loaded = list(load_json(fp))
+    assert [m.as_bytes() for m in loaded] == [m.as_bytes() for m in messages]
@@ -0,0 +1,106 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import pytest
+
+from diameter.message import Message, MessageTemplate, constants
+from diameter.message.avp import AvpEncodeError
+from diameter.message.avp.grouped import (PsInformation, ServiceInformation,
+                                          UsedServiceUnit)
+from diameter.message.commands import CreditControlRequest
+
+
+MSCC_USU_OCTETS = (
+    (constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+    (constants.AVP_USED_SERVICE_UNIT, 0),
+    (constants.AVP_CC_TOTAL_OCTETS, 0))
+
+
+def _ccr() -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.header.hop_by_hop_identifier = 1
+    ccr.header.end_to_end_identifier = 1
+    ccr.session_id = "pgw.example.com;1;1"
+    ccr.origin_host = b"pgw.example.com"
+    ccr.origin_realm = b"example.com"
+    ccr.destination_realm = b"ocs.example.com"
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = 1
+    ccr.add_multiple_services_credit_control(
+        rating_group=100,
+        used_service_unit=UsedServiceUnit(cc_total_octets=0))
+    ccr.service_information = ServiceInformation(
+        ps_information=PsInformation(called_station_id="internet"))
+    return ccr
+
+
+def test_render_unchanged():
+    ccr = _ccr()
+    template = MessageTemplate(
+        ccr, session_id=(constants.AVP_SESSION_ID, 0),
+        octets=MSCC_USU_OCTETS)
+
+    assert template.slot_names == ["session_id", "octets"]
+    assert template.render() == ccr.as_bytes()
+
+
+def test_render_matches_as_bytes():
+    ccr = _ccr()
+    template = MessageTemplate(
+        ccr,
+        session_id=(constants.AVP_SESSION_ID, 0),
+        request_number=(constants.AVP_CC_REQUEST_NUMBER, 0),
+        octets=MSCC_USU_OCTETS,
+        apn=((constants.AVP_TGPP_SERVICE_INFORMATION, constants.VENDOR_TGPP),
+             (constants.AVP_TGPP_PS_INFORMATION, constants.VENDOR_TGPP),
+             (constants.AVP_CALLED_STATION_ID, 0)))
+
+    msg_bytes = template.render(
+        session_id="pgw.example.com;1;1000001", request_number=7,
+        octets=2 ** 40, apn="ims", hop_by_hop_identifier=0x1234,
+        end_to_end_identifier=0x5678)
+
+    ccr.session_id = "pgw.example.com;1;1000001"
+    ccr.cc_request_number = 7
+    ccr.multiple_services_credit_control[0].used_service_unit[0].cc_total_octets = 2 ** 40
+    ccr.service_information.ps_information.called_station_id = "ims"
+    ccr.header.hop_by_hop_identifier = 0x1234
+    ccr.header.end_to_end_identifier = 0x5678
+    assert msg_bytes == ccr.as_bytes()
+
+    msg = Message.from_bytes(msg_bytes)
+    assert msg.header.length == len(msg_bytes)
+    assert msg.service_information.ps_information.called_station_id == "ims"
+
+
+def test_template_from_bytes():
+    msg_bytes = _ccr().as_bytes()
+    template = MessageTemplate(
+        msg_bytes, request_number=(constants.AVP_CC_REQUEST_NUMBER, 0))
+
+    msg = Message.from_bytes(template.render(request_number=3))
+    assert msg.cc_request_number == 3
+    assert msg.session_id == "pgw.example.com;1;1"
+
+    template = MessageTemplate(msg_bytes, octets="MSCC/USU/CC-Total-Octets")
+    msg = Message.from_bytes(template.render(octets=1024))
+    assert msg.find_avps(*MSCC_USU_OCTETS)[0].value == 1024
+
+
+def test_template_invalid_slots():
+    ccr = _ccr()
+    with pytest.raises(ValueError):
+        MessageTemplate(ccr, user_name=(constants.AVP_USER_NAME, 0))
+    with pytest.raises(ValueError):
+        MessageTemplate(
+            ccr, mscc=(constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL, 0),
+            octets=MSCC_USU_OCTETS)
+
+    template = MessageTemplate(
+        ccr, request_number=(constants.AVP_CC_REQUEST_NUMBER, 0))
+    with pytest.raises(ValueError):
+        template.render(session_id="pgw.example.com;1;2")
+    with pytest.raises(AvpEncodeError):
+        template.render(request_number="one")
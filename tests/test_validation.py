@@ -0,0 +1,179 @@
+"""
+Run from package root:
+~# python3 -m pytest -vv
+"""
+import sys
+import threading
+
+from diameter.message import Message, constants
+from diameter.message.avp import Avp
+from diameter.message.avp.grouped import (MultipleServicesCreditControl,
+                                          UsedServiceUnit)
+from diameter.message.commands import CreditControlRequest, ReAuthRequest
+from diameter.node import find_avp_violation, validate_message_avps
+from diameter.node import _helpers
+
+
+def _ccr() -> CreditControlRequest:
+    ccr = CreditControlRequest()
+    ccr.session_id = "pgw.example.com;1;1"
+    ccr.origin_host = b"pgw.example.com"
+    ccr.origin_realm = b"example.com"
+    ccr.destination_realm = b"ocs.example.com"
+    ccr.service_context_id = constants.SERVICE_CONTEXT_PS_CHARGING
+    ccr.cc_request_type = constants.E_CC_REQUEST_TYPE_UPDATE_REQUEST
+    ccr.cc_request_number = 1
+    ccr.add_multiple_services_credit_control(
+        rating_group=100,
+        used_service_unit=UsedServiceUnit(cc_total_octets=1024))
+    return ccr
+
+
+def _received(ccr: CreditControlRequest, *extra: Avp) -> Message:
+    ccr.avps = list(extra)
+    return Message.from_bytes(ccr.as_bytes())
+
+
+def test_valid_message():
+    msg = _received(_ccr())
+
+    assert find_avp_violation(msg) is None
+    assert validate_message_avps(msg) == []
+    # validation does not decode any attribute
+    assert "session_id" not in msg.__dict__
+    assert "multiple_services_credit_control" not in msg.__dict__
+
+
+def test_missing_avp():
+    ccr = _ccr()
+    ccr.origin_realm = None
+    ccr.cc_request_number = None
+    msg = _received(ccr)
+
+    violation = find_avp_violation(msg)
+    assert violation.result_code == constants.E_RESULT_CODE_DIAMETER_MISSING_AVP
+    assert [a.code for a in violation.failed_avp] == [
+        constants.AVP_ORIGIN_REALM, constants.AVP_CC_REQUEST_NUMBER]
+    assert [a.code for a in validate_message_avps(msg)] == [
+        constants.AVP_ORIGIN_REALM, constants.AVP_CC_REQUEST_NUMBER]
+
+    # locally created messages are validated as well
+    assert find_avp_violation(ccr).failed_avp[0].code == constants.AVP_ORIGIN_REALM
+
+
+def test_avp_occurs_too_many_times():
+    extra = Avp.new(constants.AVP_CC_REQUEST_NUMBER, value=2)
+    msg = _received(_ccr(), extra)
+
+    violation = find_avp_violation(msg)
+    assert violation.result_code == (
+        constants.E_RESULT_CODE_DIAMETER_AVP_OCCURS_TOO_MANY_TIMES)
+    assert len(violation.failed_avp) == 1
+    assert violation.failed_avp[0].as_bytes() == extra.as_bytes()
+
+    # AVPs that map to a list may occur any number of times
+    ccr = _ccr()
+    ccr.add_multiple_services_credit_control(rating_group=200)
+    assert find_avp_violation(_received(ccr)) is None
+
+
+def test_session_id_not_first():
+    ccr = _ccr()
+    msg = Message.from_bytes(ccr.as_bytes())
+    avps = msg.__dict__["_received_avps"]
+    avps.append(avps.pop(0))
+
+    violation = find_avp_violation(msg)
+    assert violation.result_code == constants.E_RESULT_CODE_DIAMETER_MISSING_AVP
+    assert violation.failed_avp[0].code == constants.AVP_SESSION_ID
+
+
+def test_grouped_avp_violation():
+    ccr = _ccr()
+    ccr.multiple_services_credit_control[0].additional_avps.append(
+        Avp.new(constants.AVP_RATING_GROUP, value=101))
+    msg = _received(ccr)
+
+    violation = find_avp_violation(msg)
+    assert violation.result_code == (
+        constants.E_RESULT_CODE_DIAMETER_AVP_OCCURS_TOO_MANY_TIMES)
+    # the grouped AVP is returned, containing only the offending AVP
+    failed = violation.failed_avp[0]
+    assert failed.code == constants.AVP_MULTIPLE_SERVICES_CREDIT_CONTROL
+    assert [(a.code, a.value) for a in failed.value] == [
+        (constants.AVP_RATING_GROUP, 101)]
+
+    mscc = MultipleServicesCreditControl(
+        used_service_unit=[UsedServiceUnit(cc_total_octets=1)])
+    mscc.additional_avps.append(
+        Avp.new(constants.AVP_USED_SERVICE_UNIT, value=[]))
+    ccr = _ccr()
+    ccr.multiple_services_credit_control = [mscc]
+    assert find_avp_violation(_received(ccr)) is None
+
+
+def test_validator_compiled_concurrently():
+    ccr = CreditControlRequest()
+    ccr.session_id = "pgw.example.com;1;1"
+    msg_bytes = ccr.as_bytes()
+
+    # switch threads often enough for them to see each other compiling
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(50):
+            # every thread finds the validator missing, or being compiled
+            _helpers._validators.clear()
+            barrier = threading.Barrier(8)
+            violations = []
+
+            def validate():
+                msg = Message.from_bytes(msg_bytes)
+                barrier.wait()
+                violations.append(find_avp_violation(msg))
+
+            threads = [threading.Thread(target=validate) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(violations) == 8
+            assert None not in violations
+            assert {v.result_code for v in violations} == {
+                constants.E_RESULT_CODE_DIAMETER_MISSING_AVP}
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_repeated_avps_of_list_attributes():
+    # attributes annotated as lists may repeat, whether or not the message
+    # sets them to an empty list when created
+    rar = ReAuthRequest()
+    rar.session_id = "pcrf.example.com;1;1"
+    rar.origin_host = b"pcrf.example.com"
+    rar.origin_realm = b"example.com"
+    rar.destination_realm = b"example.com"
+    rar.re_auth_request_type = constants.E_RE_AUTH_REQUEST_TYPE_AUTHORIZE_ONLY
+    rar.state_class = [b"class-1", b"class-2"]
+    msg = Message.from_bytes(rar.as_bytes())
+    assert find_avp_violation(msg) is None
+    assert msg.state_class == [b"class-1", b"class-2"]
+
+    ccr = _ccr()
+    ccr.framed_ipv6_prefix = [b"\x00\x40\x20\x01\x0d\xb8\x00\x00\x00\x01",
+                              b"\x00\x40\x20\x01\x0d\xb8\x00\x00\x00\x02"]
+    msg = Message.from_bytes(ccr.as_bytes())
+    assert find_avp_violation(msg) is None
+    assert msg.framed_ipv6_prefix == ccr.framed_ipv6_prefix
+
+    # and attributes annotated as a single value may not
+    ccr = _ccr()
+    ccr.event_trigger = None
+    msg = _received(ccr, *(
+        Avp.new(constants.AVP_TGPP_EVENT_TRIGGER, constants.VENDOR_TGPP,
+                value=trigger) for trigger in (1, 2)))
+    violation = find_avp_violation(msg)
+    assert violation.result_code == (
+        constants.E_RESULT_CODE_DIAMETER_AVP_OCCURS_TOO_MANY_TIMES)
+    assert violation.failed_avp[0].code == constants.AVP_TGPP_EVENT_TRIGGER